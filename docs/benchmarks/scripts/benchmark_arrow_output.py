@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Copy-volume benchmark: NumPy-backed vs Arrow-backed get_data() output.
+
+This script runs get_data() end to end against a temporary cache and compares
+the two pandas output modes:
+1. dtype_backend="numpy": the classic path (cache coverage check, merge,
+   standardize_columns(), reindex)
+2. dtype_backend="pyarrow": coverage from the cached open_time values only,
+   one Arrow-backed conversion of the pipeline output (pd.ArrowDtype)
+
+For each request size it reports, per call:
+- Execution time of get_data()
+- Bytes allocated by NumPy/Python (tracemalloc peak)
+- Bytes allocated by Arrow (pyarrow.total_allocated_bytes() delta)
+- Cached frame size, for reference (the copy volume of a single full copy)
+"""
+
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+import polars as pl
+import pyarrow as pa
+
+# Set environment variables BEFORE importing CKVD
+os.environ["CKVD_LOG_LEVEL"] = "ERROR"  # Suppress logs during benchmarks
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.core.sync.ckvd_types import DataSource
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+MINUTES_PER_DAY = 1_440
+
+
+class CopyResult(NamedTuple):
+    """Result from a single benchmark run."""
+
+    scenario: str
+    backend: str
+    rows: int
+    time_seconds: float
+    numpy_mb: float
+    arrow_mb: float
+    frame_mb: float
+
+
+def create_day(day_start: datetime) -> pl.DataFrame:
+    """Create one full day of 1-minute klines.
+
+    Args:
+        day_start: Midnight (UTC) of the day
+
+    Returns:
+        Full-width kline frame with 1,440 rows
+    """
+    open_time = pl.datetime_range(
+        day_start,
+        day_start + timedelta(minutes=MINUTES_PER_DAY - 1),
+        interval="1m",
+        time_zone="UTC",
+        eager=True,
+    )
+    values = pl.int_range(MINUTES_PER_DAY, eager=True).cast(pl.Float64)
+    return pl.DataFrame(
+        {
+            "open_time": open_time,
+            "open": values,
+            "high": values + 1,
+            "low": values - 1,
+            "close": values + 0.5,
+            "volume": values * 2,
+            "close_time": open_time + timedelta(seconds=59, milliseconds=999),
+            "quote_asset_volume": values * 3,
+            "count": pl.int_range(MINUTES_PER_DAY, eager=True),
+            "taker_buy_volume": values,
+            "taker_buy_quote_volume": values * 1.5,
+        }
+    )
+
+
+def create_cache(cache_dir: Path, num_days: int) -> float:
+    """Write ``num_days`` days of BTCUSDT 1m klines to a cache root.
+
+    Args:
+        cache_dir: Cache root
+        num_days: Number of days to write
+
+    Returns:
+        Size of the cached data in MB
+    """
+    frame_mb = 0.0
+    for day in range(num_days):
+        df = create_day(BASE_TIME + timedelta(days=day))
+        frame_mb += df.estimated_size("mb")
+        save_to_cache(df.to_pandas(), "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, cache_dir)
+    return frame_mb
+
+
+def run_benchmark(cache_dir: Path, num_days: int, frame_mb: float, backend: str, scenario_name: str, num_iterations: int = 3) -> CopyResult:
+    """Measure one get_data() output mode.
+
+    Args:
+        cache_dir: Cache root holding the test data
+        num_days: Number of cached days to request
+        frame_mb: Size of the cached data in MB
+        backend: "numpy" or "pyarrow"
+        scenario_name: Name for this scenario
+        num_iterations: Number of iterations to average
+
+    Returns:
+        CopyResult with timing and per-call allocation volume
+    """
+    manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+    end_time = BASE_TIME + timedelta(days=num_days)
+
+    times, numpy_mb, arrow_mb = [], [], []
+    rows = 0
+    for _ in range(num_iterations):
+        gc.collect()
+        arrow_before = pa.total_allocated_bytes()
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        df = manager.get_data("BTCUSDT", BASE_TIME, end_time, Interval.MINUTE_1, enforce_source=DataSource.CACHE, dtype_backend=backend)
+
+        elapsed = time.perf_counter() - start
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        times.append(elapsed)
+        numpy_mb.append(peak / 1024 / 1024)
+        arrow_mb.append(max(pa.total_allocated_bytes() - arrow_before, 0) / 1024 / 1024)
+        rows = len(df)
+        del df
+
+    manager.close()
+    return CopyResult(
+        scenario=scenario_name,
+        backend=backend,
+        rows=rows,
+        time_seconds=sum(times) / len(times),
+        numpy_mb=sum(numpy_mb) / len(numpy_mb),
+        arrow_mb=sum(arrow_mb) / len(arrow_mb),
+        frame_mb=frame_mb,
+    )
+
+
+def format_results(results: list[CopyResult]) -> str:
+    """Format benchmark results as a table."""
+    lines = [
+        "",
+        "=" * 100,
+        "COPY-VOLUME BENCHMARK: NumPy-backed vs Arrow-backed get_data() output",
+        "=" * 100,
+        "",
+        f"{'Scenario':<16} {'Backend':<9} {'Rows':>10} {'Time (ms)':>11} {'NumPy MB':>10} {'Arrow MB':>10} {'Frame MB':>10} {'Copies':>8}",
+        "-" * 100,
+    ]
+    for r in results:
+        copies = (r.numpy_mb + r.arrow_mb) / r.frame_mb if r.frame_mb else 0.0
+        lines.append(
+            f"{r.scenario:<16} {r.backend:<9} {r.rows:>10,} {r.time_seconds * 1000:>11.2f} "
+            f"{r.numpy_mb:>10.2f} {r.arrow_mb:>10.2f} {r.frame_mb:>10.2f} {copies:>7.2f}x"
+        )
+    lines.append("-" * 100)
+    lines.append("Copies = (NumPy MB + Arrow MB) / Frame MB, i.e. full-frame copies made per call.")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run all benchmark scenarios."""
+    scenarios = [
+        ("1 day (1m)", 1),
+        ("30 days (1m)", 30),
+        ("365 days (1m)", 365),
+    ]
+
+    results = []
+    for name, num_days in scenarios:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            frame_mb = create_cache(cache_dir, num_days)
+            for backend in ("numpy", "pyarrow"):
+                results.append(run_benchmark(cache_dir, num_days, frame_mb, backend, name))
+
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark: cost of disabled debug logging on the FCP hot path.
+
+Measures, per call:
+- A bare debug call at the default level: eager f-string through loguru
+  (the previous wrapper) vs the level-gated wrapper with {} arguments
+- process_timestamp_columns / merge_dataframes / collect_pandas with DEBUG
+  diagnostics enabled (to a discarding sink) vs the default level, i.e. the
+  row dumps and value_counts that are now skipped when DEBUG is off
+
+Usage:
+    python docs/benchmarks/scripts/benchmark_lazy_logging.py [--rows 1440] [--repeat 200]
+"""
+
+import argparse
+import os
+import timeit
+
+import numpy as np
+import pandas as pd
+
+# Set environment variables BEFORE importing CKVD
+os.environ["CKVD_LOG_LEVEL"] = "WARNING"  # The manager's default level
+
+import ckvd.core  # noqa: F401 - loads core before utils (core <-> utils import cycle)
+from ckvd.utils.for_core.ckvd_time_range_utils import merge_dataframes
+from ckvd.utils.for_core.vision_timestamp import process_timestamp_columns
+from ckvd.utils.internal.polars_pipeline import PolarsDataPipeline
+from ckvd.utils.loguru_setup import _loguru_logger, logger
+
+
+def make_raw(rows: int) -> pd.DataFrame:
+    """Raw Vision CSV frame: millisecond timestamps, as read from the zip."""
+    start_ms = 1_704_067_200_000
+    open_ms = start_ms + np.arange(rows, dtype=np.int64) * 60_000
+    return pd.DataFrame(
+        {
+            "open_time": open_ms,
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": np.linspace(1, 2, rows),
+            "volume": 1.0,
+            "close_time": open_ms + 59_999,
+        }
+    )
+
+
+def make_sources(rows: int) -> list[pd.DataFrame]:
+    """Cache and REST frames overlapping by half."""
+    times = pd.date_range("2024-01-01", periods=rows, freq="1min", tz="UTC")
+    half = rows // 2
+    cache = pd.DataFrame({"open_time": times[:half], "close": 1.0, "_data_source": "CACHE"})
+    rest = pd.DataFrame({"open_time": times[half // 2 :], "close": 2.0, "_data_source": "REST"})
+    return [cache, rest]
+
+
+def per_call_us(func, repeat: int) -> float:
+    """Best-of-5 mean microseconds per call."""
+    return min(timeit.repeat(func, number=repeat, repeat=5)) / repeat * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1440, help="Rows per frame (default: one day of 1m klines)")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per timing run")
+    args = parser.parse_args()
+
+    raw = make_raw(args.rows)
+    sources = make_sources(args.rows)
+    ts = pd.Timestamp("2024-01-01", tz="UTC")
+
+    def collect() -> pd.DataFrame:
+        pipeline = PolarsDataPipeline()
+        for df in sources:
+            pipeline.add_pandas(df, df["_data_source"].iloc[0])
+        return pipeline.collect_pandas()
+
+    cases = {
+        "debug call (eager f-string)": lambda: _loguru_logger.opt(depth=1).debug(f"Fetched {len(raw)} rows at {ts} for {'BTCUSDT'}"),
+        "debug call (gated, {} args)": lambda: logger.debug("Fetched {} rows at {} for {}", len(raw), ts, "BTCUSDT"),
+        "process_timestamp_columns": lambda: process_timestamp_columns(raw.copy(), "1m"),
+        "merge_dataframes": lambda: merge_dataframes([df.copy() for df in sources]),
+        "PolarsDataPipeline.collect_pandas": collect,
+    }
+
+    default = {name: per_call_us(func, args.repeat) for name, func in cases.items()}
+    sink = _loguru_logger.add(lambda _message: None, level="DEBUG")
+    try:
+        debug = {name: per_call_us(func, args.repeat) for name, func in cases.items()}
+    finally:
+        _loguru_logger.remove(sink)
+
+    print(f"{args.rows} rows per frame, per-call microseconds (best of 5 x {args.repeat})\n")
+    print(f"{'case':<36} {'DEBUG sink':>12} {'default':>12} {'saved':>12}")
+    for name in cases:
+        print(f"{name:<36} {debug[name]:>12.1f} {default[name]:>12.1f} {debug[name] - default[name]:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,20 @@ Arrow Cache Builder Script (Synchronous Version)
 This script builds a local Arrow cache of market data from Binance Vision API using direct file operations.
 It avoids async operations entirely to prevent hanging issues.
 
+Prefer the packaged ``ckvd backfill`` command for warming the library cache: it
+uses the library's own clients and cache writer (so files land where the FCP
+cache step reads them) and resumes from a checkpoint. This script writes its
+own layout and is kept for existing workflows.
+
 Usage:
     # Small footprint test (3 symbols, 5m interval, recent data)
     python scripts/arrow_cache/cache_builder_sync.py --symbols BTCUSDT,ETHUSDT,BNBUSDT --intervals 5m --start-date 2024-01-01
 
     # Specific symbols and intervals
     python scripts/arrow_cache/cache_builder_sync.py --symbols BTCUSDT,ETHUSDT --intervals 1m,5m --start-date 2024-01-01
+
+    # ZSTD-compressed cache files (persisted for the cache root)
+    python scripts/arrow_cache/cache_builder_sync.py --symbols BTCUSDT --intervals 1m --start-date 2024-01-01 --compression zstd
 """
 
 import argparse
@@ -31,7 +39,9 @@ from pathlib import Path
 import pandas as pd
 import pyarrow as pa
 
-from ckvd.utils.config import HTTP_NOT_FOUND, SMALL_FILE_SIZE
+from ckvd.utils.cache.compression import get_cache_compression, set_cache_compression, write_ipc_table
+from ckvd.utils.cache.index import CacheIndex, CacheIndexEntry
+from ckvd.utils.config import CACHE_COMPRESSION_CODECS, HTTP_NOT_FOUND, SMALL_FILE_SIZE
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import Interval, MarketType
 
@@ -75,7 +85,7 @@ SHUTDOWN_STATE = ShutdownState()  # Replace global with instance
 MAX_WORKERS = 10  # Maximum number of concurrent downloads
 CHECKSUM_FAILURES_DIR = Path("./logs/checksum_failures")
 CACHE_INDEX_FILE = Path("./logs/cache_index.json")  # Legacy JSON file, for backward compatibility
-CACHE_INDEX_DB = Path("./logs/cache_index.db")  # SQLite database file
+CACHE_INDEX_DB = CacheIndex.for_cache_dir(CACHE_DIR).db_path  # Same index the library reads and writes
 LOGS_DIR = Path("./logs")
 
 # Timestamp format detection thresholds
@@ -88,51 +98,21 @@ CHECKSUM_FAILURES_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def initialize_cache_db():
-    """Initialize the SQLite database for cache index if it doesn't exist."""
-    try:
-        # Create directory if needed
-        if not CACHE_INDEX_DB.parent.exists():
-            CACHE_INDEX_DB.parent.mkdir(parents=True, exist_ok=True)
-            logger.debug(f"Created directory for cache DB: {CACHE_INDEX_DB.parent}")
-
-        # Connect to the database (will create if it doesn't exist)
-        conn = sqlite3.connect(CACHE_INDEX_DB)
-        cursor = conn.cursor()
-
-        # Create tables if they don't exist
-        cursor.execute(
-            """
-        CREATE TABLE IF NOT EXISTS cache_metadata (
-            key TEXT PRIMARY KEY,
-            value TEXT
-        )
-        """
-        )
+    """Initialize the SQLite database for cache index if it doesn't exist.
 
-        cursor.execute(
-            """
-        CREATE TABLE IF NOT EXISTS cache_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            symbol TEXT,
-            interval TEXT,
-            date TEXT,
-            file_size INTEGER,
-            num_records INTEGER,
-            last_updated TEXT,
-            path TEXT,
-            UNIQUE(symbol, interval, date)
-        )
-        """
-        )
+    Uses the same schema (WAL mode) as the library's per-cache-root index, so
+    ArrowCacheReader reads both; older databases are migrated in place.
+    """
+    try:
+        # Create (or migrate) the schema
+        conn = CacheIndex.for_cache_dir(CACHE_DIR).connect()
 
         # Set the last_update metadata if it doesn't exist
-        cursor.execute(
-            "INSERT OR IGNORE INTO cache_metadata (key, value) VALUES (?, ?)",
-            ("last_update", datetime.now().isoformat()),
-        )
-
-        # Commit changes and close connection
-        conn.commit()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO cache_metadata (key, value) VALUES (?, ?)",
+                ("last_update", datetime.now().isoformat()),
+            )
         conn.close()
 
         logger.info(f"Initialized cache index database at {CACHE_INDEX_DB}")
@@ -188,8 +168,8 @@ def migrate_json_to_sqlite():
                             cursor.execute(
                                 """
                             INSERT OR REPLACE INTO cache_entries
-                            (symbol, interval, date, file_size, num_records, last_updated, path)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            (provider, chart_type, market_type, symbol, interval, date, file_size, num_records, last_updated, path)
+                            VALUES ('BINANCE', 'KLINES', 'SPOT', ?, ?, ?, ?, ?, ?, ?)
                             """,
                                 (
                                     symbol,
@@ -222,8 +202,7 @@ def update_cache_index(
     symbol,
     interval_str,
     date,
-    file_size,
-    num_records,
+    table,
     market_type="spot",
     data_provider="BINANCE",
     chart_type="KLINES",
@@ -234,8 +213,7 @@ def update_cache_index(
         symbol: Symbol name
         interval_str: Interval string
         date: Date of the data
-        file_size: Size of the file in bytes
-        num_records: Number of records in the file
+        table: Arrow table that was written to the cache file
         market_type: Market type (spot, futures_usdt, futures_coin)
         data_provider: Data provider (default: BINANCE)
         chart_type: Chart type (default: KLINES)
@@ -244,51 +222,19 @@ def update_cache_index(
         # Initialize database if needed
         initialize_cache_db()
 
-        # Convert date to string
-        date_str = date.strftime("%Y-%m-%d")
-
-        # Connect to the database
-        conn = sqlite3.connect(CACHE_INDEX_DB)
-        cursor = conn.cursor()
-
-        # Update or insert entry
-        cursor.execute(
-            """
-        INSERT OR REPLACE INTO cache_entries
-        (symbol, interval, date, file_size, num_records, last_updated, path)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                symbol,
-                interval_str,
-                date_str,
-                file_size,
-                num_records,
-                datetime.now().isoformat(),
-                str(
-                    get_cache_path(
-                        symbol,
-                        interval_str,
-                        date,
-                        market_type,
-                        data_provider,
-                        chart_type,
-                    )
-                ),
-            ),
-        )
-
-        # Update last_update metadata
-        cursor.execute(
-            "UPDATE cache_metadata SET value = ? WHERE key = ?",
-            (datetime.now().isoformat(), "last_update"),
+        entry = CacheIndexEntry.from_file(
+            get_cache_path(symbol, interval_str, date, market_type, data_provider, chart_type),
+            market_type=market_type,
+            symbol=symbol,
+            interval=interval_str,
+            day=date,
+            chart_type=chart_type,
+            provider=data_provider,
+            table=table,
         )
+        CacheIndex.for_cache_dir(CACHE_DIR).record_files([entry])
 
-        # Commit changes and close connection
-        conn.commit()
-        conn.close()
-
-        logger.debug(f"Updated cache index for {symbol}/{interval_str}/{date_str}")
+        logger.debug(f"Updated cache index for {symbol}/{interval_str}/{date.strftime('%Y-%m-%d')}")
     except Exception as e:
         logger.error(f"Error updating cache index: {e}")
 
@@ -875,9 +821,8 @@ def save_to_arrow_cache(df, symbol, interval_str, date):
         # Convert to Arrow table
         table = pa.Table.from_pandas(save_df)
 
-        # Write to Arrow file - Convert path to string
-        with pa.OSFile(str(file_path), "wb") as f, pa.RecordBatchFileWriter(f, table.schema) as writer:
-            writer.write_table(table)
+        # Write to Arrow file with the cache root's IPC codec
+        write_ipc_table(table, file_path, get_cache_compression(CACHE_DIR))
 
         logger.info(f"Saved {len(df)} records to {file_path}")
         return True
@@ -1193,8 +1138,7 @@ def process_date(
 
             # Convert to Arrow table and save
             table = pa.Table.from_pandas(data)
-            with pa.OSFile(str(cache_path), "wb") as f, pa.RecordBatchFileWriter(f, table.schema) as writer:
-                writer.write_table(table)
+            write_ipc_table(table, cache_path, get_cache_compression(CACHE_DIR))
 
             # Get file size
             file_size = cache_path.stat().st_size
@@ -1204,8 +1148,7 @@ def process_date(
                 symbol,
                 interval_str,
                 date,
-                file_size,
-                num_records,
+                table,
                 market_type,
                 data_provider,
                 chart_type,
@@ -1392,6 +1335,11 @@ def setup_argparse():
         help="Chart type (default: KLINES)",
         default="KLINES",
     )
+    parser.add_argument(
+        "--compression",
+        help="Arrow IPC compression for this cache root, persisted in its settings (default: keep current setting)",
+        choices=["none", *CACHE_COMPRESSION_CODECS],
+    )
     return parser
 
 
@@ -1419,6 +1367,11 @@ def main():
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     CHECKSUM_FAILURES_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Persist the IPC codec for this cache root so every writer uses it
+    if args.compression:
+        set_cache_compression(CACHE_DIR, args.compression)
+    logger.info(f"Cache IPC compression: {get_cache_compression(CACHE_DIR) or 'none'}")
+
     # Log a test warning and error to verify error logging
     if args.error_log:
         logger.debug("Debug message - should not appear in error log")
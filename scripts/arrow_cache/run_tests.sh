@@ -105,7 +105,7 @@ check_cache() {
     fi
     
     # Check the cache index database
-    CACHE_DB="${BASE_DIR}/logs/cache_index.db"
+    CACHE_DB="${BASE_DIR}/cache/cache_index.db"
     if [ -f "$CACHE_DB" ]; then
         echo -e "\n${GREEN}Cache index exists (SQLite database)${NC}"
         
@@ -164,7 +164,7 @@ run_incremental_test() {
     # Clear existing cache for this test
     print_header "Clearing existing cache"
     rm -rf "${BASE_DIR}/cache/${DATA_PROVIDER}/${CHART_TYPE}/${MARKET_TYPE}/${SYMBOL}/${INTERVAL}"
-    rm -f "${BASE_DIR}/logs/cache_index.db"
+    rm -f "${BASE_DIR}/cache/cache_index.db"
     print_info "Cache cleared"
     
     # Initial run - download all data
@@ -235,7 +235,7 @@ clean_cache_index_files() {
     print_header "CLEANING CACHE INDEX FILES"
     
     # Check for existing SQLite database
-    CACHE_DB="${BASE_DIR}/logs/cache_index.db"
+    CACHE_DB="${BASE_DIR}/cache/cache_index.db"
     CACHE_INDEX="${BASE_DIR}/logs/cache_index.json"
     BACKUP_DIR="${BASE_DIR}/logs/cache_index_backups"
     mkdir -p "$BACKUP_DIR"
@@ -711,7 +711,7 @@ if $RUN_CACHE_TESTS; then
     print_header "PREPARING TEST ENVIRONMENT"
     print_info "Clearing all cache data..."
     rm -rf "${BASE_DIR}/cache/${DATA_PROVIDER}/${CHART_TYPE}/${MARKET_TYPE}"
-    rm -f "${BASE_DIR}/logs/cache_index.db"
+    rm -f "${BASE_DIR}/cache/cache_index.db"
     rm -f "${BASE_DIR}/logs/cache_index.json"  # Remove legacy file if it exists
     rm -f "${BASE_DIR}/logs/checksum_failures/registry.json"
     print_info "Cache cleared"
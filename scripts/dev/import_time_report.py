@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Report where cold-import time goes, using ``python -X importtime``.
+
+Runs the statement in a fresh interpreter, parses the importtime trace and prints
+the slowest modules by cumulative and by self time. Use it to find dependencies
+worth deferring to first use (see tests/unit/test_import_time.py for the budget).
+
+Usage:
+    ./scripts/dev/import_time_report.py [--stmt "from ckvd import CryptoKlineVisionData"] [--top 25] [--prefix ckvd]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$")
+
+
+def profile(stmt: str) -> list[tuple[str, int, int]]:
+    """Run ``stmt`` under ``-X importtime``.
+
+    Args:
+        stmt: Python statement to import-profile
+
+    Returns:
+        (module, self_us, cumulative_us) per imported module, in import order
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", stmt], capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> None:
+    """Print the import-time report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stmt", default="from ckvd import CryptoKlineVisionData", help="Statement to profile")
+    parser.add_argument("--top", type=int, default=25, help="Rows per table")
+    parser.add_argument("--prefix", help="Only show modules starting with this prefix (e.g. ckvd)")
+    args = parser.parse_args()
+
+    rows = profile(args.stmt)
+    total_us = sum(self_us for _, self_us, _ in rows)
+    # A module can appear more than once when a parent package re-enters it; keep the largest entry
+    modules: dict[str, tuple[int, int]] = {}
+    for module, self_us, cumulative_us in rows:
+        if not args.prefix or module.startswith(args.prefix):
+            modules[module] = max(modules.get(module, (0, 0)), (cumulative_us, self_us))
+
+    print(f"{args.stmt!r}: {len(rows)} modules, {total_us / 1000:.1f} ms total\n")
+    # Top-level packages are the usual candidates for deferral
+    for title, key, only_packages in (
+        ("Cumulative, top-level packages", 0, True),
+        ("Cumulative, all modules", 0, False),
+        ("Self", 1, False),
+    ):
+        print(f"{title}:")
+        candidates = [(module, times) for module, times in modules.items() if not only_packages or "." not in module]
+        for module, (cumulative_us, self_us) in sorted(candidates, key=lambda item: item[1][key], reverse=True)[: args.top]:
+            print(f"  {cumulative_us / 1000:9.1f} ms cumulative  {self_us / 1000:8.1f} ms self  {module}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
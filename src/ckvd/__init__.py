@@ -50,6 +50,10 @@ def __getattr__(name: str) -> Any:
         from .core.sync.crypto_kline_vision_data import CryptoKlineVisionData
 
         return CryptoKlineVisionData
+    if name == "AsyncCryptoKlineVisionData":
+        from .core.aio.crypto_kline_vision_data import AsyncCryptoKlineVisionData
+
+        return AsyncCryptoKlineVisionData
     if name == "DataSource":
         from .core.sync.crypto_kline_vision_data import DataSource
 
@@ -86,6 +90,7 @@ def __getattr__(name: str) -> Any:
 
 
 __all__ = [
+    "AsyncCryptoKlineVisionData",
     "CKVDConfig",
     "ChartType",
     "CryptoKlineVisionData",
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Command-line interface for crypto-kline-vision-data.
+
+Installed as the ``ckvd`` console script (also ``python -m ckvd.cli``).
+Each subcommand lives in its own module and registers itself through
+``register(subparsers)``:
+
+- ``ckvd backfill``: warm a cache root for a symbol × interval × day grid
+- ``ckvd export``: write cached klines as a hive-partitioned Parquet dataset
+- ``ckvd reindex``: rebuild a cache root's index from the files on disk
+- ``ckvd serve``: serve ``get_data`` to local processes over a Unix socket
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import argparse
+from collections.abc import Sequence
+
+from ckvd.cli import backfill, export, reindex, serve
+
+__all__ = [
+    "build_parser",
+    "main",
+]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``ckvd`` argument parser with all subcommands."""
+    parser = argparse.ArgumentParser(prog="ckvd", description="Crypto Kline Vision Data command-line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+    backfill.register(subparsers)
+    export.register(subparsers)
+    reindex.register(subparsers)
+    serve.register(subparsers)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``ckvd`` command line.
+
+    Args:
+        argv: Arguments without the program name (default: sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
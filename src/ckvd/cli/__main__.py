@@ -0,0 +1,8 @@
+#!/usr/bin/env python
+"""Allow ``python -m ckvd.cli``."""
+
+import sys
+
+from ckvd.cli import main
+
+sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""``ckvd backfill``: parallel, resumable cache warm-up.
+
+Example:
+    ckvd backfill --symbols BTCUSDT,ETHUSDT --intervals 1m 1h --from 2024-01-01 --to 2024-06-30 --market-type um
+
+Re-running the same command resumes from the checkpoint; ``--force`` refetches
+days that are already cached and ``--dry-run`` only prints the plan.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import argparse
+from datetime import date
+from pathlib import Path
+
+from ckvd.utils.config import BACKFILL_DOWNLOAD_WORKERS, BACKFILL_MAX_PENDING_DAYS, BACKFILL_WRITE_WORKERS
+
+__all__ = [
+    "register",
+    "run",
+]
+
+
+def _split_list(values: list[str]) -> list[str]:
+    """Accept both ``A B`` and ``A,B`` forms."""
+    return [item for value in values for item in value.split(",") if item]
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    """Add the ``backfill`` subcommand.
+
+    Args:
+        subparsers: Subparsers of the ``ckvd`` parser
+    """
+    parser = subparsers.add_parser(
+        "backfill",
+        help="Warm the cache for symbols x intervals x days",
+        description="Fetch daily kline files (Vision, REST for recent days) into the cache, resumably.",
+    )
+    parser.add_argument("--symbols", nargs="+", required=True, help="Symbols (space- or comma-separated)")
+    parser.add_argument("--intervals", nargs="+", required=True, help="Kline intervals, e.g. 1m 1h (up to 1d)")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, required=True, help="First day, YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, required=True, help="Last day (inclusive), YYYY-MM-DD")
+    parser.add_argument("--market-type", default="spot", help="spot, um (USDT-margined) or cm (coin-margined); default spot")
+    parser.add_argument("--cache-dir", type=Path, help="Cache root (default: the library's cache directory)")
+    parser.add_argument("--download-workers", type=int, default=BACKFILL_DOWNLOAD_WORKERS, help="Concurrent day downloads")
+    parser.add_argument("--write-workers", type=int, default=BACKFILL_WRITE_WORKERS, help="Concurrent cache writers")
+    parser.add_argument("--max-pending", type=int, default=BACKFILL_MAX_PENDING_DAYS, help="Days in flight at once")
+    parser.add_argument("--checkpoint", type=Path, help="Checkpoint file (default: <cache-dir>/backfill_checkpoint.jsonl)")
+    parser.add_argument("--no-resume", dest="resume", action="store_false", help="Ignore the checkpoint")
+    parser.add_argument("--force", action="store_true", help="Refetch days that are already cached")
+    parser.add_argument("--no-rest-fallback", dest="rest_fallback", action="store_false", help="Only use Vision files")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan and exit")
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run ``ckvd backfill``.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        0 on success, 1 if any day failed, 2 on invalid arguments
+    """
+    from ckvd.core.sync.backfill import BackfillEngine
+    from ckvd.utils.market_constraints import MarketType
+
+    try:
+        market_type = MarketType.from_string(args.market_type)
+        engine = BackfillEngine(
+            market_type,
+            args.cache_dir,
+            download_workers=args.download_workers,
+            write_workers=args.write_workers,
+            max_pending=args.max_pending,
+            checkpoint_path=args.checkpoint,
+            rest_fallback=args.rest_fallback,
+        )
+        with engine:
+            plan = engine.plan(
+                _split_list(args.symbols),
+                _split_list(args.intervals),
+                args.start,
+                args.end,
+                resume=args.resume,
+                force=args.force,
+            )
+            print(
+                f"Plan: {len(plan.tasks)} of {plan.grid_size} days to fetch "
+                f"({plan.cached} already cached, {plan.checkpointed} checkpointed) into {engine.cache_dir}"
+            )
+            if args.dry_run or not plan.tasks:
+                return 0
+            report = engine.run(plan)
+    except ValueError as e:
+        print(f"ckvd backfill: {e}")
+        return 2
+
+    print(report.summary())
+    for task, error in report.failures:
+        print(f"  failed: {task.symbol} {task.interval} {task.day}: {error}")
+    return 1 if report.failed else 0
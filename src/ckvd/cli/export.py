@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""``ckvd export``: incremental hive-partitioned Parquet export of the cache.
+
+Example:
+    ckvd export --symbols BTCUSDT,ETHUSDT --intervals 1m 1h --from 2024-01-01 --to 2024-06-30 --output ./dataset
+
+Writes ``symbol=/interval=/date=`` partitions from the cache files; re-running
+skips partitions whose cache file is unchanged and ``--force`` rewrites them.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import argparse
+from datetime import date
+from pathlib import Path
+
+from ckvd.utils.config import EXPORT_PARQUET_COMPRESSION
+
+__all__ = [
+    "register",
+    "run",
+]
+
+
+def _split_list(values: list[str]) -> list[str]:
+    """Accept both ``A B`` and ``A,B`` forms."""
+    return [item for value in values for item in value.split(",") if item]
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    """Add the ``export`` subcommand.
+
+    Args:
+        subparsers: Subparsers of the ``ckvd`` parser
+    """
+    parser = subparsers.add_parser(
+        "export",
+        help="Export cached klines to a hive-partitioned Parquet dataset",
+        description="Stream cache files into symbol=/interval=/date= Parquet partitions, skipping unchanged ones.",
+    )
+    parser.add_argument("--symbols", nargs="+", required=True, help="Symbols (space- or comma-separated)")
+    parser.add_argument("--intervals", nargs="+", required=True, help="Kline intervals, e.g. 1m 1h")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat, required=True, help="First day, YYYY-MM-DD")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat, required=True, help="Last day (inclusive), YYYY-MM-DD")
+    parser.add_argument("--output", type=Path, required=True, help="Dataset root (partitioned by market type)")
+    parser.add_argument("--market-type", default="spot", help="spot, um (USDT-margined) or cm (coin-margined); default spot")
+    parser.add_argument("--cache-dir", type=Path, help="Cache root (default: the library's cache directory)")
+    parser.add_argument("--compression", default=EXPORT_PARQUET_COMPRESSION, help="Parquet codec (default: %(default)s)")
+    parser.add_argument("--force", action="store_true", help="Rewrite partitions whose cache file is unchanged")
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run ``ckvd export``.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        0 on success, 1 if any partition failed, 2 on invalid arguments
+    """
+    from ckvd.core.sync.export import export_parquet_dataset
+    from ckvd.utils.market_constraints import MarketType
+
+    try:
+        report = export_parquet_dataset(
+            args.output,
+            _split_list(args.symbols),
+            _split_list(args.intervals),
+            args.start,
+            args.end,
+            MarketType.from_string(args.market_type),
+            args.cache_dir,
+            force=args.force,
+            compression=args.compression,
+        )
+    except ValueError as e:
+        print(f"ckvd export: {e}")
+        return 2
+
+    print(report.summary())
+    for partition, error in report.failures:
+        print(f"  failed: {partition}: {error}")
+    return 1 if report.failed else 0
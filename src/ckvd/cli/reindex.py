@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""``ckvd reindex``: rebuild a cache root's index from the files on disk.
+
+Example:
+    ckvd reindex --cache-dir ./cache
+
+Cache writes only index the files they write, so a root populated before the
+index existed (or by tools that skip it) is read by probing each day's path
+until it is re-indexed. The rebuild walks the whole root, which is why it is
+a separate command rather than part of ``get_data``.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import argparse
+from pathlib import Path
+
+__all__ = [
+    "register",
+    "run",
+]
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    """Add the ``reindex`` subcommand.
+
+    Args:
+        subparsers: Subparsers of the ``ckvd`` parser
+    """
+    parser = subparsers.add_parser(
+        "reindex",
+        help="Rebuild the cache index from the files on disk",
+        description="Scan a cache root and replace its index with one row per cache file (no checksums).",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="Cache root (default: the library's cache directory)")
+    parser.set_defaults(func=run)
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run ``ckvd reindex``.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        0 on success, 1 if the index could not be written
+    """
+    import sqlite3
+
+    from ckvd.utils.app_paths import get_cache_dir
+    from ckvd.utils.cache.index import CacheIndex
+
+    cache_dir = args.cache_dir if args.cache_dir is not None else get_cache_dir() / "data"
+    index = CacheIndex.for_cache_dir(cache_dir)
+    try:
+        indexed = index.rebuild_from_disk()
+    except (sqlite3.Error, OSError) as e:
+        print(f"ckvd reindex: {e}")
+        return 1
+    print(f"Indexed {indexed} cache files into {index.db_path}")
+    return 0
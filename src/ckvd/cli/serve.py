@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""``ckvd serve``: local data server shared by all processes on the machine.
+
+Example:
+    ckvd serve --cache-dir ./cache --socket /tmp/ckvd.sock
+
+Clients (``ckvd.core.sync.server.KlineClient``) send ``get_data`` requests
+over the Unix socket and receive Arrow IPC results, sharing one warm cache,
+one REST weight budget and coalesced Vision downloads. Stop with Ctrl-C or
+SIGTERM; the socket file is removed on exit.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import argparse
+import signal
+from pathlib import Path
+
+__all__ = [
+    "register",
+    "run",
+]
+
+
+def register(subparsers: argparse._SubParsersAction) -> None:
+    """Add the ``serve`` subcommand.
+
+    Args:
+        subparsers: Subparsers of the ``ckvd`` parser
+    """
+    parser = subparsers.add_parser(
+        "serve",
+        help="Serve get_data to local processes over a Unix socket",
+        description="Own the cache and FCP pipeline and answer get_data requests from local clients with Arrow IPC results.",
+    )
+    parser.add_argument("--socket", type=Path, help="Unix socket path (default: $CKVD_SERVER_SOCKET or <cache dir>/ckvd.sock)")
+    parser.add_argument("--cache-dir", type=Path, help="Cache root (default: the library's cache directory)")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="Serve without reading or writing the cache")
+    parser.add_argument("--shm-dir", type=Path, help="Directory for shared-memory results (default: /dev/shm)")
+    parser.set_defaults(func=run)
+
+
+def _interrupt(_signum: int, _frame: object) -> None:
+    """Stop on SIGTERM the same way as on Ctrl-C."""
+    raise KeyboardInterrupt
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run ``ckvd serve`` until interrupted.
+
+    Args:
+        args: Parsed arguments
+
+    Returns:
+        0 after a clean shutdown, 1 if the socket is already served
+    """
+    from ckvd.core.sync.server import KlineServer
+
+    server = KlineServer(args.socket, args.cache_dir, use_cache=args.use_cache, shm_dir=args.shm_dir)
+    try:
+        server.bind()
+    except RuntimeError as e:
+        print(f"ckvd serve: {e}")
+        return 1
+
+    print(f"ckvd serve: listening on {server.socket_path}")
+    signal.signal(signal.SIGTERM, _interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("ckvd serve: stopped")
+    return 0
@@ -0,0 +1,5 @@
+"""Asyncio data source management implementation."""
+
+from .crypto_kline_vision_data import AsyncCryptoKlineVisionData
+
+__all__ = ["AsyncCryptoKlineVisionData"]
@@ -0,0 +1,651 @@
+#!/usr/bin/env python
+# polars-exception: Async FCP returns the same pandas/Polars results as CryptoKlineVisionData
+"""Asyncio interface to the Failover Control Protocol (FCP).
+
+``AsyncCryptoKlineVisionData`` runs the same Cache → Vision → REST protocol as
+``CryptoKlineVisionData`` without tying up a thread per request:
+
+1. Cache: Arrow reads run in a small thread pool
+2. Vision: daily archives are downloaded over one shared ``httpx.AsyncClient``
+   and decoded in the thread pool
+3. REST: chunks of a missing range are requested concurrently instead of one
+   after another
+
+Validation, merging and the final standardization are shared with the sync
+manager, so both return identical frames for the same inputs. A single event
+loop can drive hundreds of concurrent ``get_data`` calls; cancelling one
+cancels its downloads and waits at most ``TASK_CANCEL_WAIT_TIMEOUT`` for them.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+
+Example:
+    >>> import asyncio
+    >>> from ckvd import AsyncCryptoKlineVisionData, DataProvider, MarketType, Interval
+    >>>
+    >>> async def main():
+    ...     async with AsyncCryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT) as manager:
+    ...         df = await manager.get_data("BTCUSDT", start, end, Interval.HOUR_1)
+    ...         frames = await manager.get_data_many(["BTCUSDT", "ETHUSDT"], start, end, Interval.HOUR_1)
+    >>>
+    >>> asyncio.run(main())
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, TypeVar
+
+import httpx
+import pandas as pd
+import polars as pl
+
+from ckvd.core.providers.binance.rest_data_client import RestDataClient
+from ckvd.core.providers.binance.vision_data_client import decode_day_archive, download_day_archive
+from ckvd.core.sync.ckvd_types import DataSource, FCPRequest
+from ckvd.core.sync.crypto_kline_vision_data import CryptoKlineVisionData
+from ckvd.utils.config import (
+    ASYNC_EXECUTOR_WORKERS,
+    ASYNC_HTTP_MAX_CONNECTIONS,
+    ASYNC_REST_CONCURRENCY,
+    ASYNC_VISION_CONCURRENCY,
+    DEFAULT_USER_AGENT,
+    REST_CHUNK_SIZE,
+    REST_MAX_CHUNKS,
+    REST_MAX_RATE_LIMIT_WAITS,
+    TASK_CANCEL_WAIT_TIMEOUT,
+    VISION_USE_LISTING,
+    create_empty_dataframe,
+)
+from ckvd.utils.dataframe_types import TimestampedDataFrame
+from ckvd.utils.dataframe_utils import ensure_open_time_as_column, project_columns, resolve_columns
+from ckvd.utils.for_core.ckvd_fcp_utils import handle_error, process_rest_step, process_vision_step, validate_interval
+from ckvd.utils.for_core.ckvd_time_range_utils import merge_adjacent_ranges, standardize_columns
+from ckvd.utils.for_core.rest_client_utils import calculate_chunks, fetch_chunk_async, get_interval_ms
+from ckvd.utils.for_core.rest_data_processing import process_kline_data
+from ckvd.utils.for_core.rest_exceptions import RateLimitError, RestAPIError
+from ckvd.utils.for_core.rest_scheduler import RestResumeToken, get_rest_scheduler
+from ckvd.utils.for_core.vision_exceptions import VisionAPIError
+from ckvd.utils.for_core.vision_listing import VISION_LISTINGS
+from ckvd.utils.internal.polars_pipeline import DtypeBackend, PolarsDataPipeline, SchemaProfile
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
+from ckvd.utils.time_utils import align_time_boundaries, datetime_to_milliseconds, filter_dataframe_by_time
+
+__all__ = [
+    "AsyncCryptoKlineVisionData",
+]
+
+T = TypeVar("T")
+
+# Fetched frames (or the error to raise) per missing range, replayed into the FCP steps
+_RangeResults = dict[tuple[datetime, datetime], pd.DataFrame | BaseException]
+
+
+async def _gather_or_cancel(awaitables: Iterable[Awaitable[T]], return_exceptions: bool = False) -> list[T]:
+    """Run awaitables concurrently; on cancellation or failure cancel the rest.
+
+    Cancelled children get ``TASK_CANCEL_WAIT_TIMEOUT`` seconds to unwind
+    before the error propagates, so no task outlives its caller.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    except BaseException:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending, timeout=TASK_CANCEL_WAIT_TIMEOUT)
+        raise
+
+
+def _replay(results: _RangeResults) -> Callable[..., pd.DataFrame]:
+    """Fetch function for the FCP steps that returns already-fetched ranges."""
+
+    def fetch(_symbol: str, start_time: datetime, end_time: datetime, _interval: Interval) -> pd.DataFrame:
+        result = results.get((start_time, end_time))
+        if isinstance(result, BaseException):
+            raise result
+        return result if result is not None else create_empty_dataframe()
+
+    return fetch
+
+
+def _save_rest_progress(resume_token: RestResumeToken, chunks: list[tuple[tuple[int, int], list]], rate_limited: bool) -> None:
+    """Record newly fetched REST chunks, or drop the token once the range is complete (thread pool)."""
+    if not rate_limited:
+        resume_token.clear()
+        return
+    for (chunk_start, chunk_end), rows in chunks:
+        resume_token.record(chunk_start, chunk_end, rows)
+
+
+class AsyncCryptoKlineVisionData:
+    """Asyncio manager for market data with the Failover Control Protocol.
+
+    Wraps a ``CryptoKlineVisionData`` (configuration, cache and provider
+    clients) and replaces its blocking network steps with async HTTP.
+    Concurrent requests for the same Vision day share one download.
+
+    Attributes:
+        manager: The underlying synchronous manager
+    """
+
+    def __init__(
+        self,
+        manager: CryptoKlineVisionData,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        vision_concurrency: int = ASYNC_VISION_CONCURRENCY,
+        rest_concurrency: int = ASYNC_REST_CONCURRENCY,
+        executor_workers: int = ASYNC_EXECUTOR_WORKERS,
+    ) -> None:
+        """Initialize the async manager.
+
+        Args:
+            manager: Synchronous manager providing configuration, cache and clients
+            http_client: Async HTTP client to use (default: one owned by this manager)
+            vision_concurrency: Vision day downloads in flight at once
+            rest_concurrency: REST chunk requests in flight at once
+            executor_workers: Threads for cache I/O, decoding and DataFrame work
+
+        Raises:
+            ValueError: If a concurrency or worker count is below 1
+        """
+        if min(vision_concurrency, rest_concurrency, executor_workers) < 1:
+            raise ValueError("vision_concurrency, rest_concurrency and executor_workers must be at least 1")
+        self.manager = manager
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._vision_semaphore = asyncio.Semaphore(vision_concurrency)
+        self._rest_semaphore = asyncio.Semaphore(rest_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=executor_workers, thread_name_prefix="ckvd-aio")
+        self._day_downloads: dict[tuple, asyncio.Task] = {}
+        self._day_waiters: dict[asyncio.Task, int] = {}
+
+    @classmethod
+    def create(
+        cls,
+        provider: DataProvider | None = None,
+        market_type: MarketType | None = None,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        vision_concurrency: int = ASYNC_VISION_CONCURRENCY,
+        rest_concurrency: int = ASYNC_REST_CONCURRENCY,
+        executor_workers: int = ASYNC_EXECUTOR_WORKERS,
+        **kwargs: Any,
+    ) -> "AsyncCryptoKlineVisionData":
+        """Create an async manager (same arguments as ``CryptoKlineVisionData.create``).
+
+        Args:
+            provider: Data provider (e.g., BINANCE)
+            market_type: Market type (SPOT, FUTURES_USDT, FUTURES_COIN)
+            http_client: Async HTTP client to use (default: one owned by this manager)
+            vision_concurrency: Vision day downloads in flight at once
+            rest_concurrency: REST chunk requests in flight at once
+            executor_workers: Threads for cache I/O, decoding and DataFrame work
+            **kwargs: Passed to ``CryptoKlineVisionData.create`` (cache_dir, use_cache, ...)
+
+        Returns:
+            AsyncCryptoKlineVisionData instance
+        """
+        return cls(
+            CryptoKlineVisionData.create(provider, market_type, **kwargs),
+            http_client=http_client,
+            vision_concurrency=vision_concurrency,
+            rest_concurrency=rest_concurrency,
+            executor_workers=executor_workers,
+        )
+
+    @property
+    def market_type(self) -> MarketType:
+        """Market type of the underlying manager."""
+        return self.manager.market_type
+
+    async def __aenter__(self) -> "AsyncCryptoKlineVisionData":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, _exc_type: type | None, _exc_val: BaseException | None, _exc_tb: Any) -> None:
+        """Async context manager exit; closes the manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Cancel outstanding downloads and release HTTP, thread and manager resources."""
+        downloads = [task for task in self._day_downloads.values() if not task.done()]
+        for task in downloads:
+            task.cancel()
+        if downloads:
+            await asyncio.wait(downloads, timeout=TASK_CANCEL_WAIT_TIMEOUT)
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.manager.close()
+
+    def _client(self) -> httpx.AsyncClient:
+        """Shared async HTTP client, created on first use."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                headers={"User-Agent": DEFAULT_USER_AGENT, "Accept": "application/json, application/zip"},
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=ASYNC_HTTP_MAX_CONNECTIONS),
+            )
+        return self._http_client
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run blocking work (cache I/O, decoding, pandas) in the thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def get_data(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        chart_type: ChartType | None = None,
+        include_source_info: bool = True,
+        enforce_source: DataSource = DataSource.AUTO,
+        auto_reindex: bool = True,
+        return_polars: bool = False,
+        columns: Sequence[str] | None = None,
+        dtype_backend: DtypeBackend = "numpy",
+        schema_profile: SchemaProfile = "standard",
+    ) -> pd.DataFrame | pl.DataFrame:
+        """Retrieve market data using the FCP without blocking the event loop.
+
+        Arguments, results and errors are those of ``CryptoKlineVisionData.get_data``.
+        Funding rates are fetched by the sync client in the thread pool.
+
+        Args:
+            symbol: Trading pair symbol (e.g., "BTCUSDT")
+            start_time: Start time for data retrieval (timezone-aware)
+            end_time: End time for data retrieval (timezone-aware)
+            interval: Time interval between data points
+            chart_type: Chart type (default: the manager's chart type)
+            include_source_info: Whether to include the ``_data_source`` column
+            enforce_source: Force a specific data source (AUTO, REST, VISION, CACHE)
+            auto_reindex: Whether to reindex to a complete time series
+            return_polars: Return a Polars DataFrame instead of pandas
+            columns: Optional column projection (``open_time`` is always included)
+            dtype_backend: "numpy" (default) or "pyarrow" for Arrow-backed pandas output
+            schema_profile: "standard" (default) or "compact" (float32/int32, millisecond times)
+
+        Returns:
+            DataFrame with market data
+
+        Raises:
+            ValueError: If parameters are invalid
+            RuntimeError: If no source returned any data
+            asyncio.CancelledError: If the request is cancelled
+        """
+        if chart_type is None:
+            chart_type = self.manager.chart_type
+        if chart_type == ChartType.FUNDING_RATE:
+            return await self._run(
+                self.manager.get_data,
+                symbol,
+                start_time,
+                end_time,
+                interval,
+                chart_type=chart_type,
+                return_polars=return_polars,
+                columns=columns,
+                schema_profile=schema_profile,
+            )
+
+        columns = resolve_columns(columns)
+        result_df = pd.DataFrame()
+
+        try:
+            validate_interval(self.market_type, interval)
+            logger.debug(f"[FCP:async] get_data {symbol} {interval.value} {start_time.isoformat()} to {end_time.isoformat()}")
+
+            request = await self._run(
+                self.manager._prepare_request,
+                symbol,
+                start_time,
+                end_time,
+                interval,
+                chart_type,
+                include_source_info=include_source_info,
+                enforce_source=enforce_source,
+                auto_reindex=auto_reindex,
+                return_polars=return_polars,
+                columns=columns,
+                dtype_backend=dtype_backend,
+                schema_profile=schema_profile,
+            )
+            plan = await self._run(self.manager._build_plan, request)
+            polars_pipeline = PolarsDataPipeline(schema_profile=request.schema_profile)
+
+            # STEP 1: Local cache, read in the thread pool
+            result_df, missing_ranges = await self._run(self.manager._read_cache, plan, polars_pipeline)
+
+            # STEP 2: Vision, all missing ranges and their days downloaded concurrently
+            if plan.use_vision and missing_ranges:
+                fetched = await self._fetch_ranges(self._fetch_vision_range, request, missing_ranges)
+                result_df, missing_ranges = await self._run(
+                    process_vision_step,
+                    fetch_from_vision_func=_replay(fetched),
+                    symbol=request.symbol,
+                    missing_ranges=missing_ranges,
+                    interval=interval,
+                    include_source_info=include_source_info,
+                    result_df=result_df,
+                    columns=columns,
+                )
+                self.manager._track_source(polars_pipeline, result_df, "VISION")
+
+            # STEP 3: REST, chunks of every remaining range requested concurrently
+            if missing_ranges and plan.use_rest:
+                missing_ranges = merge_adjacent_ranges(missing_ranges, interval)
+                fetched = await self._fetch_ranges(self._fetch_rest_range, request, missing_ranges)
+                result_df = await self._run(
+                    process_rest_step,
+                    fetch_from_rest_func=_replay(fetched),
+                    symbol=request.symbol,
+                    missing_ranges=missing_ranges,
+                    interval=interval,
+                    include_source_info=include_source_info,
+                    result_df=result_df,
+                    save_to_cache_func=self.manager._save_to_cache if self.manager.use_cache else None,
+                    columns=columns,
+                )
+                self.manager._track_source(polars_pipeline, result_df, "REST")
+
+            return await self._run(self.manager._finalize_result, request, result_df, polars_pipeline, missing_ranges)
+
+        except (
+            VisionAPIError,
+            RestAPIError,
+            ValueError,
+            TypeError,
+            KeyError,
+            OSError,
+            pd.errors.ParserError,
+        ) as e:
+            # Preserve partial data on rate limit instead of destroying it
+            if isinstance(e, RateLimitError) and not result_df.empty:
+                logger.warning(f"[FCP:async] Rate limited but returning {len(result_df)} partial records")
+                if request.pipeline_output:
+                    # The cache step only kept open_time in result_df; the cached rows are in the pipeline
+                    result_df = polars_pipeline.collect_pandas(use_streaming=True, columns=columns)
+                result_df.attrs["_rate_limited"] = True
+                return project_columns(standardize_columns(result_df, columns=columns), columns)
+
+            handle_error(e)
+            return None  # unreachable, handle_error always raises
+
+    async def get_data_many(
+        self,
+        symbols: Sequence[str],
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, pd.DataFrame | pl.DataFrame | BaseException]:
+        """Retrieve the same range for many symbols concurrently.
+
+        Args:
+            symbols: Trading pair symbols
+            start_time: Start time for data retrieval (timezone-aware)
+            end_time: End time for data retrieval (timezone-aware)
+            interval: Time interval between data points
+            return_exceptions: Return a symbol's exception as its result instead
+                of cancelling the other fetches and raising it
+            **kwargs: Other ``get_data`` arguments
+
+        Returns:
+            Dictionary mapping each symbol to its DataFrame (or exception)
+        """
+        results = await _gather_or_cancel(
+            (self.get_data(symbol, start_time, end_time, interval, **kwargs) for symbol in symbols),
+            return_exceptions=return_exceptions,
+        )
+        return dict(zip(symbols, results, strict=True))
+
+    async def _fetch_ranges(
+        self,
+        fetch: Callable[[FCPRequest, datetime, datetime], Awaitable[pd.DataFrame]],
+        request: FCPRequest,
+        ranges: list[tuple[datetime, datetime]],
+    ) -> _RangeResults:
+        """Fetch every range concurrently, keeping a rate-limit error as its range's result."""
+
+        async def fetch_one(start: datetime, end: datetime) -> pd.DataFrame | BaseException:
+            try:
+                return await fetch(request, start, end)
+            except RateLimitError as e:
+                return e
+
+        results = await _gather_or_cancel(fetch_one(start, end) for start, end in ranges)
+        return dict(zip(ranges, results, strict=True))
+
+    # ------------------------------------------------------------------
+    # Vision
+    # ------------------------------------------------------------------
+
+    async def _fetch_vision_range(self, request: FCPRequest, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Fetch one range from Vision, caching the full days it touches."""
+        if self.manager.vision_client is None:
+            logger.debug(f"Provider {self.manager.provider.name} does not have Vision API, returning empty DataFrame")
+            return create_empty_dataframe()
+
+        aligned_start, aligned_end = align_time_boundaries(start_time, end_time, request.interval)
+        first_day = datetime.combine(aligned_start.date(), datetime.min.time(), tzinfo=timezone.utc)
+        days = [first_day + timedelta(days=i) for i in range((aligned_end.date() - aligned_start.date()).days + 1)]
+        if VISION_USE_LISTING:
+            # One listing request per month; days that are not published are not requested
+            listed = await VISION_LISTINGS.available_days_async(
+                self._client(), request.symbol, request.interval.value, self.market_type.name, days[0].date(), days[-1].date()
+            )
+            if listed is not None:
+                days = [day for day in days if day.date() in listed]
+
+        # Cache files must hold every column, so only project at decode time when not caching
+        decode_columns = None if self.manager.use_cache else request.columns
+        frames = await _gather_or_cancel(self._vision_day(request.symbol, request.interval, day, decode_columns) for day in days)
+        frames = [df for df in frames if df is not None]
+        if not frames:
+            logger.info(f"Vision API returned no data for {request.symbol} from {aligned_start} to {aligned_end}")
+            return create_empty_dataframe()
+        return await self._run(self._assemble_vision, request, frames, aligned_start, aligned_end)
+
+    async def _vision_day(self, symbol: str, interval: Interval, day: datetime, columns: Sequence[str] | None) -> pd.DataFrame | None:
+        """Download and decode one day, sharing the download with concurrent callers.
+
+        The download is cancelled once every caller waiting for it is cancelled.
+        """
+        key = (self.market_type.name, symbol, interval.value, day.date().isoformat(), tuple(columns) if columns else None)
+        task = self._day_downloads.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self._download_vision_day(symbol, interval, day, columns))
+            self._day_downloads[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if self._day_downloads.get(key) is done:
+                    del self._day_downloads[key]
+
+            task.add_done_callback(forget)
+
+        self._day_waiters[task] = self._day_waiters.get(task, 0) + 1
+        try:
+            # Shielded so one caller's cancellation doesn't fail the others sharing the download
+            df = await asyncio.shield(task)
+        finally:
+            self._day_waiters[task] -= 1
+            if not self._day_waiters[task]:
+                del self._day_waiters[task]
+                if not task.done():
+                    self._day_downloads.pop(key, None)
+                    task.cancel()
+        return df.copy() if shared and df is not None else df
+
+    async def _download_vision_day(
+        self, symbol: str, interval: Interval, day: datetime, columns: Sequence[str] | None
+    ) -> pd.DataFrame | None:
+        """Download one day's archive and decode it in the thread pool."""
+        async with self._vision_semaphore:
+            try:
+                archive = await download_day_archive(self._client(), symbol, interval.value, self.market_type.name, day)
+            except httpx.HTTPError as e:
+                logger.warning(f"Vision download failed for {symbol} {interval.value} {day.date()}: {e}")
+                return None
+        if archive is None:
+            return None
+        content, expected_checksum = archive
+        return await self._run(decode_day_archive, content, expected_checksum, interval.value, day, columns)
+
+    def _assemble_vision(
+        self,
+        request: FCPRequest,
+        frames: list[pd.DataFrame],
+        aligned_start: datetime,
+        aligned_end: datetime,
+    ) -> pd.DataFrame:
+        """Merge downloaded days, cache them whole and cut the requested range (thread pool)."""
+        df = pd.concat(frames, ignore_index=True, copy=False, sort=False)
+        if not df["open_time"].is_monotonic_increasing:
+            df = df.sort_values("open_time").reset_index(drop=True)
+        df = ensure_open_time_as_column(TimestampedDataFrame(df.set_index("open_time")))
+        df["_data_source"] = "VISION"
+
+        # Save the entire days to cache before filtering to the requested range
+        if self.manager.use_cache:
+            self.manager._save_to_cache(df, request.symbol, request.interval, source="VISION")
+
+        filtered_df = project_columns(filter_dataframe_by_time(df, aligned_start, aligned_end, "open_time"), request.columns)
+        logger.info(f"Retrieved {len(filtered_df)} records from Vision API (after filtering to requested range)")
+        return filtered_df
+
+    # ------------------------------------------------------------------
+    # REST
+    # ------------------------------------------------------------------
+
+    async def _fetch_rest_range(self, request: FCPRequest, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+        """Fetch one range from REST with its chunks requested concurrently.
+
+        Honours the wrapped manager's ``wait_on_rate_limit`` (see ``_rest_chunk``)
+        and ``rest_resume_dir``: chunks recorded in the range's resume token are
+        not requested again, and the token is kept until the range completes.
+        """
+        # REST results are cached with every column, so only project when not caching
+        columns = None if self.manager.use_cache else request.columns
+        rest_client = self.manager.rest_client
+        if not isinstance(rest_client, RestDataClient):
+            # Providers without an async REST path use their sync client in the pool
+            return await self._run(self.manager._fetch_from_rest, request.symbol, start_time, end_time, request.interval, columns)
+
+        aligned_start, aligned_end = align_time_boundaries(start_time, end_time, request.interval)
+        start_ms, end_ms = datetime_to_milliseconds(aligned_start), datetime_to_milliseconds(aligned_end)
+        chunks = calculate_chunks(start_ms, end_ms, get_interval_ms(request.interval), REST_CHUNK_SIZE, REST_MAX_CHUNKS)
+
+        # Same token file and request description as RestDataClient.fetch, so a
+        # fetch interrupted by either manager resumes in the other
+        token_path = self.manager._rest_resume_token(request.symbol, start_time, end_time, request.interval)
+        resume_token = RestResumeToken(token_path) if token_path is not None else None
+        completed: dict[tuple[int, int], list] = {}
+        if resume_token:
+            token_request = {
+                "endpoint": rest_client._endpoint,
+                "symbol": request.symbol,
+                "interval": request.interval.value,
+                "start": start_ms,
+                "end": end_ms,
+            }
+            completed = await self._run(resume_token.resume, token_request)
+
+        pending = [chunk for chunk in chunks if chunk not in completed]
+        fetched = await _gather_or_cancel(
+            (self._rest_chunk(rest_client, request, chunk_start, chunk_end) for chunk_start, chunk_end in pending),
+            return_exceptions=True,
+        )
+        results = {**completed, **dict(zip(pending, fetched, strict=True))}
+
+        # Keep chunks up to the first rate limit so partial data stays contiguous
+        rows: list[list[Any]] = []
+        rate_limit: RateLimitError | None = None
+        for chunk in chunks:
+            result = results[chunk]
+            if isinstance(result, RateLimitError):
+                rate_limit = result
+                break
+            if isinstance(result, BaseException):
+                if not isinstance(result, (RestAPIError, httpx.HTTPError)):
+                    raise result
+                logger.error(f"Error fetching chunk for {request.symbol}: {type(result).__name__}: {result}")
+                continue
+            rows.extend(result)
+
+        if resume_token:
+            # Chunks fetched after the rate limit are recorded too, so the restart skips them
+            fetched_chunks = [(chunk, results[chunk]) for chunk in pending if isinstance(results[chunk], list) and results[chunk]]
+            await self._run(_save_rest_progress, resume_token, fetched_chunks, rate_limit is not None)
+
+        if rate_limit is not None and not rows:
+            raise RateLimitError(
+                retry_after=getattr(rate_limit, "retry_after", 60),
+                message=f"Rate limited fetching {request.symbol} with no partial data to return",
+            )
+        return await self._run(self._assemble_rest, request, rows, aligned_start, aligned_end, columns, rate_limit is not None)
+
+    async def _rest_chunk(self, rest_client: RestDataClient, request: FCPRequest, start_ms: int, end_ms: int) -> list[list[Any]]:
+        """Request one REST chunk.
+
+        With the manager's ``wait_on_rate_limit`` the request waits out the host's
+        rate limit and a rejected chunk is requested again, up to
+        ``REST_MAX_RATE_LIMIT_WAITS`` times (like ``RestDataClient._fetch_chunk_scheduled``).
+        """
+        params = {
+            "symbol": request.symbol,
+            "interval": request.interval.value,
+            "startTime": start_ms,
+            "endTime": end_ms,
+            "limit": REST_CHUNK_SIZE,
+        }
+        wait_on_rate_limit = self.manager.wait_on_rate_limit
+        waits = 0
+        async with self._rest_semaphore:
+            while True:
+                try:
+                    return (
+                        await fetch_chunk_async(
+                            self._client(), rest_client._endpoint, params, rest_client.fetch_timeout, wait_on_block=wait_on_rate_limit
+                        )
+                        or []
+                    )
+                except RateLimitError as e:
+                    waits += 1
+                    if not wait_on_rate_limit or waits > REST_MAX_RATE_LIMIT_WAITS:
+                        raise
+                    scheduler = get_rest_scheduler(rest_client._endpoint)
+                    if scheduler.delay() == 0:  # not yet recorded from the response headers
+                        scheduler.record_rate_limit(e.retry_after)
+                    logger.warning(f"Rate limited fetching {request.symbol}, resuming the same chunk after the pause")
+
+    @staticmethod
+    def _assemble_rest(
+        request: FCPRequest,
+        rows: list[list[Any]],
+        aligned_start: datetime,
+        aligned_end: datetime,
+        columns: Sequence[str] | None,
+        rate_limited: bool,
+    ) -> pd.DataFrame:
+        """Turn REST rows into the frame ``fetch_from_rest`` returns (thread pool)."""
+        if not rows:
+            logger.critical(f"REST API returned no data for {request.symbol}")
+            raise RuntimeError(f"CRITICAL: REST API returned no data for {request.symbol}")
+        df = filter_dataframe_by_time(process_kline_data(rows, columns=columns), aligned_start, aligned_end, "open_time")
+        df["_data_source"] = "REST"
+        if rate_limited:
+            df.attrs["_rate_limited"] = True
+        logger.info(f"Retrieved {len(df)} records from REST API")
+        return df
@@ -16,9 +16,10 @@ Usage:
     >>> print(clients.cache)   # Cache manager
 """
 
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from ckvd.utils.market_constraints import DataProvider, MarketType
 
@@ -136,10 +137,14 @@ class CacheManager(Protocol):
 # =============================================================================
 
 
-@dataclass
 class ProviderClients:
     """Container for provider-specific clients.
 
+    Clients are either passed ready-made or built on first access from the
+    zero-argument factories given to :meth:`lazy`. Building them lazily keeps
+    manager construction cheap: a manager that is only read from the cache
+    never imports or instantiates its Vision and REST clients.
+
     Attributes:
         vision: Vision API client (None for providers without bulk historical API)
         rest: REST API client
@@ -148,11 +153,115 @@ class ProviderClients:
         market_type: Market type enum
     """
 
-    vision: VisionClient | None
-    rest: RestClient
-    cache: CacheManager
-    provider: DataProvider
-    market_type: MarketType
+    _ROLES = ("vision", "rest", "cache")
+
+    def __init__(
+        self,
+        vision: VisionClient | None,
+        rest: RestClient,
+        cache: CacheManager,
+        provider: DataProvider,
+        market_type: MarketType,
+    ) -> None:
+        """Initialize with ready-made clients."""
+        self.provider = provider
+        self.market_type = market_type
+        self._clients: dict[str, Any] = {"vision": vision, "rest": rest, "cache": cache}
+        self._factories: dict[str, Callable[[], Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def lazy(
+        cls,
+        provider: DataProvider,
+        market_type: MarketType,
+        *,
+        vision: Callable[[], VisionClient] | None,
+        rest: Callable[[], RestClient],
+        cache: Callable[[], CacheManager],
+    ) -> "ProviderClients":
+        """Create a container whose clients are built on first access.
+
+        Args:
+            provider: Data provider enum
+            market_type: Market type enum
+            vision: Factory for the Vision client, or None if the provider has none
+            rest: Factory for the REST client
+            cache: Factory for the cache manager
+
+        Returns:
+            ProviderClients that calls each factory at most once
+        """
+        clients = cls(None, None, None, provider, market_type)
+        clients._factories = {role: factory for role, factory in (("vision", vision), ("rest", rest), ("cache", cache)) if factory}
+        return clients
+
+    def _get(self, role: str) -> Any:
+        if role in self._factories:
+            with self._lock:
+                factory = self._factories.pop(role, None)
+                if factory is not None:
+                    self._clients[role] = factory()
+        return self._clients[role]
+
+    def _set(self, role: str, client: Any) -> None:
+        with self._lock:
+            self._factories.pop(role, None)
+            self._clients[role] = client
+
+    def is_created(self, role: str) -> bool:
+        """Whether the client for ``role`` exists (False while its factory has not run).
+
+        Args:
+            role: "vision", "rest" or "cache"
+
+        Returns:
+            True if the client was passed in or already built
+        """
+        return role not in self._factories and self._clients[role] is not None
+
+    def has(self, role: str) -> bool:
+        """Whether the provider has a client for ``role``, without building it.
+
+        Args:
+            role: "vision", "rest" or "cache"
+
+        Returns:
+            True if the client exists or has a factory (False e.g. for Vision on OKX)
+        """
+        return role in self._factories or self._clients[role] is not None
+
+    @property
+    def vision(self) -> VisionClient | None:
+        """Vision API client, built on first access."""
+        return self._get("vision")
+
+    @vision.setter
+    def vision(self, client: VisionClient | None) -> None:
+        self._set("vision", client)
+
+    @property
+    def rest(self) -> RestClient:
+        """REST API client, built on first access."""
+        return self._get("rest")
+
+    @rest.setter
+    def rest(self, client: RestClient) -> None:
+        self._set("rest", client)
+
+    @property
+    def cache(self) -> CacheManager:
+        """Cache manager, built on first access."""
+        return self._get("cache")
+
+    @cache.setter
+    def cache(self, client: CacheManager) -> None:
+        self._set("cache", client)
+
+    def __repr__(self) -> str:
+        """Show which clients have been built."""
+        built = ", ".join(f"{role}={'built' if self.is_created(role) else 'pending'}" for role in self._ROLES)
+        return f"ProviderClients({self.provider.name}, {self.market_type.name}, {built})"
 
 
 # =============================================================================
@@ -269,46 +378,40 @@ class BinanceProviderFactory:
         Returns:
             ProviderClients with Binance implementations
         """
-        # Import here to avoid circular imports and allow lazy loading
-        from ckvd.core.providers.binance.cache_manager import (
-            UnifiedCacheManager,
-        )
-        from ckvd.core.providers.binance.rest_data_client import (
-            RestDataClient,
-        )
-        from ckvd.core.providers.binance.vision_data_client import (
-            VisionDataClient,
-        )
         from ckvd.utils.app_paths import get_cache_dir
 
         # Use default cache directory if not specified
         if cache_dir is None:
             cache_dir = get_cache_dir() / "data"
 
-        # Create Vision client (Binance Vision API on AWS S3)
+        # Clients are built on first use: each one pulls in its own HTTP/S3/Arrow stack
         # VisionDataClient is initialized with defaults; symbol/interval are passed per fetch() call
-        vision_client = VisionDataClient(
-            symbol="BTCUSDT",  # Default, overridden per fetch() call
-            interval="1h",  # Default, overridden per fetch() call
-            market_type=market_type,
-            cache_dir=cache_dir,
-        )
+        def create_vision_client() -> VisionClient:
+            from ckvd.core.providers.binance.vision_data_client import VisionDataClient
 
-        # Create REST client
-        rest_client = RestDataClient(
-            market_type=market_type,
-            retry_count=retry_count,
-        )
+            return VisionDataClient(
+                symbol="BTCUSDT",  # Default, overridden per fetch() call
+                interval="1h",  # Default, overridden per fetch() call
+                market_type=market_type,
+                cache_dir=cache_dir,
+            )
+
+        def create_rest_client() -> RestClient:
+            from ckvd.core.providers.binance.rest_data_client import RestDataClient
 
-        # Create cache manager
-        cache_manager = UnifiedCacheManager(cache_dir=cache_dir)
+            return RestDataClient(market_type=market_type, retry_count=retry_count)
 
-        return ProviderClients(
-            vision=vision_client,
-            rest=rest_client,
-            cache=cache_manager,
-            provider=DataProvider.BINANCE,
-            market_type=market_type,
+        def create_cache_manager() -> CacheManager:
+            from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
+
+            return UnifiedCacheManager(cache_dir=cache_dir)
+
+        return ProviderClients.lazy(
+            DataProvider.BINANCE,
+            market_type,
+            vision=create_vision_client,
+            rest=create_rest_client,
+            cache=create_cache_manager,
         )
 
 
@@ -348,37 +451,30 @@ class OKXProviderFactory:
         Returns:
             ProviderClients with OKX implementations (vision=None)
         """
-        # Import here to avoid circular imports and allow lazy loading
-        from ckvd.core.providers.binance.cache_manager import (
-            UnifiedCacheManager,
-        )
-        from ckvd.core.providers.okx.okx_rest_client import (
-            OKXRestClient,
-        )
         from ckvd.utils.app_paths import get_cache_dir
 
         # Use default cache directory if not specified
         if cache_dir is None:
             cache_dir = get_cache_dir() / "data"
 
-        # OKX has no Vision API - all historical data via REST
-        vision_client = None
+        def create_rest_client() -> RestClient:
+            from ckvd.core.providers.okx.okx_rest_client import OKXRestClient
 
-        # Create OKX REST client
-        rest_client = OKXRestClient(
-            market_type=market_type,
-            retry_count=retry_count,
-        )
+            return OKXRestClient(market_type=market_type, retry_count=retry_count)
 
-        # Use shared cache manager (provider-agnostic cache paths)
-        cache_manager = UnifiedCacheManager(cache_dir=cache_dir)
+        def create_cache_manager() -> CacheManager:
+            # Shared cache manager (provider-agnostic cache paths)
+            from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
 
-        return ProviderClients(
-            vision=vision_client,
-            rest=rest_client,
-            cache=cache_manager,
-            provider=DataProvider.OKX,
-            market_type=market_type,
+            return UnifiedCacheManager(cache_dir=cache_dir)
+
+        # OKX has no Vision API - all historical data via REST
+        return ProviderClients.lazy(
+            DataProvider.OKX,
+            market_type,
+            vision=None,
+            rest=create_rest_client,
+            cache=create_cache_manager,
         )
 
 
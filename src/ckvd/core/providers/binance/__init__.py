@@ -1,9 +1,27 @@
-"""Binance data provider implementation."""
+"""Binance data provider implementation.
+
+Clients are imported on first attribute access so that importing one of them
+(e.g. the funding rate client) does not pull in the HTTP, S3 and cache stacks
+of the others.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "DataClientInterface": ".data_client_interface",
+    "RestDataClient": ".rest_data_client",
+    "UnifiedCacheManager": ".cache_manager",
+    "VisionDataClient": ".vision_data_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for Binance client exports."""
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-from .cache_manager import UnifiedCacheManager
-from .rest_data_client import RestDataClient
-from .vision_data_client import VisionDataClient
-from .data_client_interface import DataClientInterface
 
 __all__ = [
     "DataClientInterface",
@@ -6,12 +6,11 @@
 
 import os
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pandas as pd
 
-from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
 from ckvd.core.providers.binance.data_client_interface import DataClientInterface
 from ckvd.utils.config import (
     FUNDING_RATE_DTYPES,
@@ -19,10 +18,10 @@ from ckvd.utils.config import (
     MIN_FUNDING_RATE,
     create_empty_funding_rate_dataframe,
 )
+from ckvd.utils.for_core.rest_scheduler import get_rest_scheduler, request_weight
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
 from ckvd.utils.market_utils import get_market_type_str
-from ckvd.utils.network_utils import create_client
 from ckvd.utils.time_utils import filter_dataframe_by_time
 
 
@@ -67,7 +66,9 @@ class BinanceFundingRateClient(DataClientInterface):
         if market_type not in (MarketType.FUTURES_USDT, MarketType.FUTURES_COIN):
             raise ValueError(f"Invalid market type for funding rate: {market_type}. Must be FUTURES_USDT or FUTURES_COIN.")
 
-        # Set up client
+        # Set up client (HTTP stack imported on first use, not with this module)
+        from ckvd.utils.network_utils import create_client
+
         self._client = create_client()
 
         # Set up cache if enabled
@@ -79,6 +80,8 @@ class BinanceFundingRateClient(DataClientInterface):
         if self._use_cache:
             if cache_dir is None:
                 cache_dir = Path("./cache")
+            from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
+
             self._cache_manager = UnifiedCacheManager(cache_dir=cache_dir)
         else:
             self._cache_manager = None
@@ -294,7 +297,9 @@ class BinanceFundingRateClient(DataClientInterface):
                 market_type=self._get_market_type_str(),
             )
 
-            if cached_df is not None:
+            # The cache is keyed on the start day only: a frame cached for a
+            # shorter range is refetched instead of returning truncated rates
+            if cached_df is not None and self._covers(cached_df, start_time, end_time, interval_obj):
                 # Filter to the requested time range
                 filtered_df = filter_dataframe_by_time(cached_df, start_time, end_time, "funding_time")
                 if not filtered_df.empty:
@@ -317,6 +322,21 @@ class BinanceFundingRateClient(DataClientInterface):
 
         return df
 
+    @staticmethod
+    def _covers(df: pd.DataFrame, start_time: datetime, end_time: datetime, interval: Interval) -> bool:
+        """Whether cached funding rates span ``[start_time, end_time)``.
+
+        Rates are published once per funding interval, so the first one may
+        lie up to one interval after ``start_time`` and the last up to one
+        interval before ``end_time`` (or now, for ranges reaching the future).
+        """
+        if df.empty or "funding_time" not in df.columns:
+            return False
+        times = pd.to_datetime(df["funding_time"], utc=True)
+        step = timedelta(seconds=interval.to_seconds())
+        last_due = min(pd.to_datetime(end_time, utc=True), pd.Timestamp.now(tz=timezone.utc)) - step
+        return times.min() <= pd.to_datetime(start_time, utc=True) + step and times.max() >= last_due
+
     def _get_market_type_str(self) -> str:
         """Get the market type as a string.
 
@@ -371,8 +391,13 @@ class BinanceFundingRateClient(DataClientInterface):
                     "limit": limit,
                 }
 
-                # Make the request with explicit timeout
+                # Make the request with explicit timeout, within the host-wide weight budget
+                scheduler = get_rest_scheduler(endpoint)
+                scheduler.acquire(request_weight(endpoint, params))
                 response = self._client.get(endpoint, params=params, timeout=10.0)
+                scheduler.observe(response.headers)
+                if response.status_code in (418, 429):
+                    scheduler.record_rate_limit(float(response.headers.get("retry-after", 60)))
                 response.raise_for_status()
                 data = response.json()
 
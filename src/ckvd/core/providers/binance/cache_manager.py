@@ -4,18 +4,18 @@
 # Refactoring: Fix silent failure patterns (BLE001)
 """Unified cache manager for market data."""
 
-import json
-import time
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
 
 import pandas as pd
-import polars as pl
 import pyarrow as pa
 import pyarrow.ipc
 
-from ckvd.utils.config import MIN_CACHE_KEY_COMPONENTS
+from ckvd.utils.cache.compression import get_cache_compression, read_ipc_polars, write_ipc_table
+from ckvd.utils.cache.index import CacheIndex, CacheIndexEntry
+from ckvd.utils.cache.metadata_store import CacheMetadataStore
+from ckvd.utils.config import CACHE_METADATA_FILENAME, MIN_CACHE_KEY_COMPONENTS
 from ckvd.utils.loguru_setup import logger
 
 
@@ -27,9 +27,13 @@ class UnifiedCacheManager:
 
     Features:
     - Consistent cache key generation
-    - Metadata storage
+    - Metadata storage (incremental SQLite store, batched access-time updates)
     - Integrity validation
     - Cache invalidation
+    - Optional LZ4/ZSTD IPC compression, configured per cache root
+      (see ``ckvd.utils.cache.compression.set_cache_compression``)
+    - Writes recorded in the cache root's SQLite index
+      (see ``ckvd.utils.cache.index.CacheIndex``)
     """
 
     def __init__(self, cache_dir: Path, create_dirs: bool = True) -> None:
@@ -40,8 +44,6 @@ class UnifiedCacheManager:
             create_dirs: Whether to create cache directory structure
         """
         self.cache_dir = Path(cache_dir)
-        self.metadata: dict[str, dict[str, Any]] = {}
-        self._metadata_dirty = False  # Track if metadata needs saving
 
         # Create directories if needed
         if create_dirs:
@@ -51,113 +53,30 @@ class UnifiedCacheManager:
             except OSError as e:
                 logger.error(f"Failed to create cache directory: {e}")
 
-        # Load existing metadata
-        try:
-            self._load_metadata()
-        except (OSError, json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"Failed to load cache metadata, starting fresh: {e}")
+        # IPC codec for new files; existing files may use any codec
+        self.compression = get_cache_compression(self.cache_dir)
+
+        # Shared index of cache files (also maintained by ckvd_cache_utils.save_to_cache)
+        self.index = CacheIndex.for_cache_dir(self.cache_dir)
+
+        # Per-key metadata (SQLite, opened lazily; imports a legacy cache_metadata.json)
+        self.metadata = CacheMetadataStore(self._get_metadata_path(), legacy_json_path=self.cache_dir / "cache_metadata.json")
 
     def _get_metadata_path(self) -> Path:
-        """Get path to metadata file.
+        """Get path to metadata store.
 
         Returns:
-            Path to metadata file
+            Path to metadata database
         """
-        return self.cache_dir / "cache_metadata.json"
+        return self.cache_dir / CACHE_METADATA_FILENAME
 
-    def _load_metadata(self) -> None:
-        """Load metadata from file."""
-        metadata_path = self._get_metadata_path()
-        if metadata_path.exists():
-            try:
-                with open(metadata_path) as f:
-                    self.metadata = json.load(f)
-                logger.debug(f"Loaded cache metadata: {len(self.metadata)} entries")
-            except (OSError, json.JSONDecodeError, ValueError) as e:
-                logger.error(f"Failed to load metadata: {e}")
-                self.metadata = {}
-        else:
-            logger.debug("No metadata file found, starting fresh")
-            self.metadata = {}
-
-    def _save_metadata(self, force: bool = False) -> None:
-        """Save metadata to file.
+    def flush_metadata(self) -> None:
+        """Write buffered last-access times to the metadata store.
 
-        Args:
-            force: If True, save even if metadata hasn't changed
+        Buffered updates are also flushed in batches and when the manager is
+        garbage collected; call this before handing the cache to another process.
         """
-        # Skip save if not dirty and not forced
-        if not self._metadata_dirty and not force:
-            logger.debug("_save_metadata skipped (no changes)")
-            return
-
-        logger.debug(f"_save_metadata starting with {len(self.metadata)} entries")
-        try:
-            metadata_path = self._get_metadata_path()
-            file_size_before = metadata_path.stat().st_size if metadata_path.exists() else 0
-            logger.debug(f"Metadata will be saved to {metadata_path} (current size: {file_size_before} bytes)")
-
-            # Serialize metadata to JSON
-            logger.debug("Serializing metadata to JSON")
-            json_start = time.time()
-            try:
-                json_data = json.dumps(self.metadata, indent=2)
-                json_size = len(json_data)
-                json_elapsed = time.time() - json_start
-                logger.debug(f"JSON serialization completed in {json_elapsed:.4f}s for {json_size} bytes")
-
-                # Log warning if JSON size is very large
-                if json_size > 10 * 1024 * 1024:  # 10MB
-                    logger.warning(f"Metadata JSON is extremely large: {json_size / (1024 * 1024):.2f} MB")
-            except (TypeError, ValueError) as json_err:
-                logger.error(f"JSON serialization failed: {json_err}")
-                return
-
-            # Write to temporary file first
-            temp_path = metadata_path.with_suffix(".tmp")
-            logger.debug(f"Writing metadata to temporary file at {temp_path}")
-            write_start = time.time()
-
-            try:
-                with open(temp_path, "w") as f:
-                    f.write(json_data)
-
-                write_elapsed = time.time() - write_start
-                logger.debug(f"Temporary metadata file write completed in {write_elapsed:.4f}s")
-
-                # Verify the file was written correctly
-                if not temp_path.exists():
-                    logger.error(f"Temporary metadata file was not created: {temp_path}")
-                    return
-
-                temp_size = temp_path.stat().st_size
-                if temp_size == 0:
-                    logger.error("Temporary metadata file is empty")
-                    return
-
-                # Rename temporary file to actual metadata file (atomic operation)
-                logger.debug(f"Renaming temporary file to {metadata_path}")
-                temp_path.replace(metadata_path)
-
-            except OSError as write_err:
-                logger.error(f"Metadata file write failed: {write_err}")
-                return
-
-            # Report detailed stats
-            total_elapsed = json_elapsed + write_elapsed
-            logger.debug(f"Saved cache metadata: {len(self.metadata)} entries in {total_elapsed:.4f}s total")
-
-            # Check file size after write
-            if metadata_path.exists():
-                file_size_after = metadata_path.stat().st_size
-                logger.debug(f"Final metadata file size: {file_size_after} bytes (change: {file_size_after - file_size_before} bytes)")
-
-            # Reset dirty flag after successful save
-            self._metadata_dirty = False
-
-        except OSError as e:
-            logger.error(f"Error saving metadata: {e}")
-            return
+        self.metadata.flush()
 
     def get_cache_key(
         self,
@@ -308,9 +227,10 @@ class UnifiedCacheManager:
             return None
 
         # Check if entry is marked as invalid in metadata
-        if cache_key in self.metadata and self.metadata[cache_key].get("is_invalid", False):
-            invalid_reason = self.metadata[cache_key].get("invalid_reason", "Unknown reason")
-            invalidated_at = self.metadata[cache_key].get("invalidated_at", "Unknown time")
+        entry = self.metadata.get(cache_key)
+        if entry is not None and entry.get("is_invalid", False):
+            invalid_reason = entry.get("invalid_reason", "Unknown reason")
+            invalidated_at = entry.get("invalidated_at", "Unknown time")
             logger.error(
                 f"Invalid cache entry detected - Key: {cache_key}, Path: {cache_path}, "
                 f"Reason: {invalid_reason}, Invalidated at: {invalidated_at}"
@@ -321,8 +241,8 @@ class UnifiedCacheManager:
             # Log the loading attempt
             logger.debug(f"Loading cache file: {cache_path}")
 
-            # Read the Arrow IPC file using Polars for zero-copy
-            df_pl = pl.read_ipc(cache_path, memory_map=True)
+            # Read the Arrow IPC file (zero-copy mmap when uncompressed)
+            df_pl = read_ipc_polars(cache_path)
 
             # Basic validation on the returned data
             if len(df_pl) == 0:
@@ -339,11 +259,9 @@ class UnifiedCacheManager:
                 self._mark_cache_invalid(cache_key, "Empty DataFrame")
                 return None
 
-            # Update last access time in metadata (mark dirty but don't save immediately)
-            # Deferring saves reduces I/O overhead - metadata saved when cache is written to
-            if cache_key in self.metadata:
-                self.metadata[cache_key]["last_accessed"] = datetime.now(timezone.utc).isoformat()
-                self._metadata_dirty = True
+            # Update last access time (buffered; written to the store in batches)
+            if entry is not None:
+                self.metadata.touch(cache_key)
 
             logger.debug(f"Successfully loaded {len(df)} rows from {cache_path}")
             return df
@@ -431,21 +349,34 @@ class UnifiedCacheManager:
             table = pa.Table.from_pandas(df)
 
             # Write to file using Arrow IPC format (not Parquet)
-            with pa.OSFile(str(cache_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
-                writer.write_table(table)
+            write_ipc_table(table, cache_path, self.compression)
 
-            # Update metadata
+            # Update metadata (single-row write)
             metadata_entry["file_size_bytes"] = cache_path.stat().st_size
-            self.metadata[cache_key] = metadata_entry
-            self._metadata_dirty = True
+            self.metadata.put(cache_key, metadata_entry)
 
-            # Save metadata (force save on cache write operations)
-            self._save_metadata(force=True)
+            try:
+                self.index.record_files(
+                    [
+                        CacheIndexEntry.from_file(
+                            cache_path,
+                            market_type=market_type,
+                            symbol=symbol,
+                            interval=interval,
+                            day=date,
+                            chart_type=chart_type,
+                            provider=provider,
+                            table=table,
+                        )
+                    ]
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Cached {cache_key} but cache index not updated: {e}")
 
             logger.debug(f"Successfully cached {len(df)} rows to {cache_path} ({metadata_entry['file_size_bytes'] / 1024 / 1024:.2f} MB)")
             return True
 
-        except (pa.ArrowInvalid, pa.ArrowIOError, OSError, TypeError) as e:
+        except (pa.ArrowInvalid, pa.ArrowIOError, OSError, TypeError, sqlite3.Error) as e:
             logger.error(f"Error saving to cache for {cache_key}: {e}")
             return False
 
@@ -456,15 +387,13 @@ class UnifiedCacheManager:
             cache_key: Cache key
             reason: Reason for invalidation
         """
-        if cache_key in self.metadata:
-            self.metadata[cache_key]["is_invalid"] = True
-            self.metadata[cache_key]["invalid_reason"] = reason
-            self.metadata[cache_key]["invalidated_at"] = datetime.now(timezone.utc).isoformat()
-
+        updated = self.metadata.update(
+            cache_key,
+            is_invalid=True,
+            invalid_reason=reason,
+            invalidated_at=datetime.now(timezone.utc).isoformat(),
+        )
+        if updated:
             # Log cache invalidation as ERROR to ensure it's prominently noticed
             cache_path = self._get_cache_path(cache_key)
             logger.error(f"Cache entry invalidated - Key: {cache_key}, Path: {cache_path}, Reason: {reason}")
-
-            # Force save on cache invalidation (important for data integrity)
-            self._metadata_dirty = True
-            self._save_metadata(force=True)
@@ -14,6 +14,7 @@ from ckvd.core.providers.binance.data_client_interface import DataClientInterfac
 from ckvd.utils.config import (
     DEFAULT_HTTP_TIMEOUT_SECONDS,
     REST_MAX_CHUNKS,
+    REST_MAX_RATE_LIMIT_WAITS,
 )
 from ckvd.utils.for_core.rest_client_utils import (
     calculate_chunks,
@@ -36,6 +37,7 @@ from ckvd.utils.for_core.rest_exceptions import (
     RateLimitError,
     RestAPIError,
 )
+from ckvd.utils.for_core.rest_scheduler import RestResumeToken, get_rest_scheduler
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import (
     ChartType,
@@ -96,7 +98,7 @@ class RestDataClient(DataClientInterface):
         # Set up proper endpoint based on market type
         self._endpoint = self._get_klines_endpoint()
 
-        logger.debug(f"Initialized RestDataClient with market_type={market_type.name}, retry_count={retry_count}")
+        logger.debug("Initialized RestDataClient with market_type={}, retry_count={}", market_type.name, retry_count)
 
     def _get_klines_endpoint(self):
         """Get the appropriate endpoint URL for klines data based on market type.
@@ -178,7 +180,7 @@ class RestDataClient(DataClientInterface):
         try:
             data = self._fetch_chunk(self._endpoint, params, self.retry_count)
             if not data:
-                logger.debug(f"No data returned for {symbol} in range {start_ms} to {end_ms}")
+                logger.debug("No data returned for {} in range {} to {}", symbol, start_ms, end_ms)
                 return []
             return data
         except RateLimitError:
@@ -193,6 +195,35 @@ class RestDataClient(DataClientInterface):
             logger.error(f"Data processing error for {symbol}: {e}", exc_info=True)
             return []
 
+    def _fetch_chunk_scheduled(self, symbol: str, interval: Interval, start_ms: int, end_ms: int) -> list[list[Any]]:
+        """Fetch a chunk, pausing for the rate limit and retrying the same chunk when rejected.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval
+            start_ms: Start time in milliseconds
+            end_ms: End time in milliseconds
+
+        Returns:
+            List of kline data
+
+        Raises:
+            RateLimitError: If still rate limited after REST_MAX_RATE_LIMIT_WAITS pauses
+        """
+        scheduler = get_rest_scheduler(self._endpoint)
+        waits = 0
+        while True:
+            scheduler.wait()
+            try:
+                return self._fetch_chunk_data(symbol, interval, start_ms, end_ms)
+            except RateLimitError as e:
+                waits += 1
+                if waits > REST_MAX_RATE_LIMIT_WAITS:
+                    raise
+                if scheduler.delay() == 0:  # not yet recorded from the response headers
+                    scheduler.record_rate_limit(e.retry_after)
+                logger.warning(f"Rate limited fetching {symbol}, resuming the same chunk after the pause")
+
     def _calculate_chunks(self, start_ms: int, end_ms: int, interval: Interval) -> list[tuple[int, int]]:
         """Calculate chunk boundaries for a time range.
 
@@ -229,7 +260,13 @@ class RestDataClient(DataClientInterface):
             interval: Time interval string (e.g., "1m", "1h") - must be a valid Interval value
             start_time: Start time for data retrieval (timezone-aware datetime)
             end_time: End time for data retrieval (timezone-aware datetime)
-            **kwargs: Additional parameters (unused, for interface compatibility)
+            **kwargs: Additional parameters. ``columns`` restricts the output to a
+                column projection; ``log_metrics`` logs REST metrics after the fetch.
+                ``wait_on_rate_limit`` pauses for the rate limit (``Retry-After``,
+                used-weight headers) and resumes from the rejected chunk instead of
+                returning partial data. ``resume_token`` is a file path where
+                completed chunks are persisted, so a restarted fetch with the same
+                token only fetches the remaining chunks.
 
         Returns:
             DataFrame with kline data indexed by open_time
@@ -250,7 +287,9 @@ class RestDataClient(DataClientInterface):
         # Align time boundaries
         aligned_start, aligned_end = align_time_boundaries(start_time, end_time, interval_enum)
 
-        logger.info(f"Fetching {interval_enum.value} data for {symbol} from {aligned_start.isoformat()} to {aligned_end.isoformat()}")
+        logger.info(
+            "Fetching {} data for {} from {} to {}", interval_enum.value, symbol, aligned_start.isoformat(), aligned_end.isoformat()
+        )
 
         # Convert times to milliseconds
         start_ms = datetime_to_milliseconds(aligned_start)
@@ -266,18 +305,39 @@ class RestDataClient(DataClientInterface):
             "total_data_points": 0,
         }
 
+        # Chunks completed by an earlier run with the same resume token
+        wait_on_rate_limit = kwargs.get("wait_on_rate_limit", False)
+        resume_token = RestResumeToken(kwargs["resume_token"]) if kwargs.get("resume_token") else None
+        completed = {}
+        if resume_token:
+            request = {"endpoint": self._endpoint, "symbol": symbol, "interval": interval_enum.value, "start": start_ms, "end": end_ms}
+            completed = resume_token.resume(request)
+
         # Fetch data in chunks, preserving partial data on rate limit
         all_data = []
         rate_limited = False
         for i, (chunk_start, chunk_end) in enumerate(chunks):
+            if (chunk_start, chunk_end) in completed:
+                chunk_data = completed[(chunk_start, chunk_end)]
+                all_data.extend(chunk_data)
+                stats["successful_chunks"] += 1
+                stats["total_data_points"] += len(chunk_data)
+                continue
+
             logger.debug(
-                f"Fetching chunk {i + 1}/{len(chunks)} for {symbol}: "
-                f"{milliseconds_to_datetime(chunk_start).isoformat()} to "
-                f"{milliseconds_to_datetime(chunk_end).isoformat()}"
+                "Fetching chunk {}/{} for {}: {} to {}",
+                i + 1,
+                len(chunks),
+                symbol,
+                milliseconds_to_datetime(chunk_start).isoformat(),
+                milliseconds_to_datetime(chunk_end).isoformat(),
             )
 
             try:
-                chunk_data = self._fetch_chunk_data(symbol, interval_enum, chunk_start, chunk_end)
+                if wait_on_rate_limit:
+                    chunk_data = self._fetch_chunk_scheduled(symbol, interval_enum, chunk_start, chunk_end)
+                else:
+                    chunk_data = self._fetch_chunk_data(symbol, interval_enum, chunk_start, chunk_end)
             except RateLimitError as e:
                 logger.warning(f"Rate limited at chunk {i + 1}/{len(chunks)} for {symbol}, returning {len(all_data)} partial records")
                 rate_limited = True
@@ -288,10 +348,16 @@ class RestDataClient(DataClientInterface):
                 all_data.extend(chunk_data)
                 stats["successful_chunks"] += 1
                 stats["total_data_points"] += len(chunk_data)
-                logger.debug(f"Retrieved {len(chunk_data)} records for chunk {i + 1}")
+                logger.debug("Retrieved {} records for chunk {}", len(chunk_data), i + 1)
+                if resume_token:
+                    resume_token.record(chunk_start, chunk_end, chunk_data)
             else:
                 logger.warning(f"No data returned for chunk {i + 1}")
 
+        # A completed fetch no longer needs its token; a partial one keeps it for the restart
+        if resume_token and not rate_limited:
+            resume_token.clear()
+
         # If rate limited with no data collected, propagate the error
         if rate_limited and not all_data:
             raise RateLimitError(
@@ -305,7 +371,7 @@ class RestDataClient(DataClientInterface):
             return create_empty_dataframe()
 
         # Process the data into a DataFrame
-        df = process_kline_data(all_data)
+        df = process_kline_data(all_data, columns=kwargs.get("columns"))
 
         # Filter to requested time range
         filtered_df = filter_dataframe_by_time(df, aligned_start, aligned_end, "open_time")
@@ -447,7 +513,7 @@ class RestDataClient(DataClientInterface):
             try:
                 index, df = future.result()
                 results[index] = df
-                logger.debug(f"Completed range {index + 1}/{len(date_ranges)}: {len(df)} rows")
+                logger.debug("Completed range {}/{}: {} rows", index + 1, len(date_ranges), len(df))
             except RateLimitError:
                 for f in futures:
                     f.cancel()
@@ -494,7 +560,7 @@ class RestDataClient(DataClientInterface):
             raise ValueError("max_workers must be at least 1")
 
         effective_workers = min(max_workers, len(date_ranges), 5)
-        logger.info(f"Fetching {len(date_ranges)} ranges in parallel (workers={effective_workers}) for {symbol}")
+        logger.info("Fetching {} ranges in parallel (workers={}) for {}", len(date_ranges), effective_workers, symbol)
 
         if self._client is None:
             self._client = create_optimized_client()
@@ -507,6 +573,6 @@ class RestDataClient(DataClientInterface):
             results, errors = self._collect_parallel_results(futures, date_ranges)
 
         total_rows = sum(len(df) for df in results.values())
-        logger.info(f"Parallel fetch complete: {len(results)} ranges, {total_rows} rows, {len(errors)} errors")
+        logger.info("Parallel fetch complete: {} ranges, {} rows, {} errors", len(results), total_rows, len(errors))
 
         return [results[i] for i in range(len(date_ranges))]
@@ -21,13 +21,17 @@ directly with this client.
 # Refactoring: Fix silent failure patterns (BLE001)
 """
 
+import hashlib
+import io
 import re
 import tempfile
+import uuid
 import zipfile
+from collections.abc import Sequence
 from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import Any, BinaryIO, Generic, TypeVar
 
 import httpx
 import pandas as pd
@@ -42,6 +46,7 @@ from ckvd.core.providers.binance.data_client_interface import DataClientInterfac
 from ckvd.core.providers.binance.vision_path_mapper import (
     FSSpecVisionHandler,
 )
+from ckvd.utils.cache.single_flight import SingleFlight
 from ckvd.utils.config import (
     CONCURRENT_DOWNLOADS_LIMIT_1S,
     HTTP_NOT_FOUND,
@@ -50,11 +55,21 @@ from ckvd.utils.config import (
     LARGE_REQUEST_DAYS,
     MAXIMUM_CONCURRENT_DOWNLOADS,
     MIN_CHECKSUM_SIZE,
+    VISION_ADAPTIVE_INITIAL_CONCURRENCY,
+    VISION_ADAPTIVE_MIN_CONCURRENCY,
     VISION_DATA_DELAY_HOURS,
+    VISION_HEDGE_BUDGET,
+    VISION_HEDGE_MIN_SAMPLES,
+    VISION_HEDGE_PERCENTILE,
+    VISION_HEDGE_REQUESTS,
+    VISION_KEEP_ORIGINAL_TIMESTAMP,
+    VISION_USE_LISTING,
     FileType,
 )
 from ckvd.utils.dataframe_types import TimestampedDataFrame
 from ckvd.utils.dataframe_utils import ensure_open_time_as_column
+from ckvd.utils.for_core.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from ckvd.utils.for_core.request_hedging import RequestHedger
 from ckvd.utils.for_core.vision_constraints import (
     get_vision_url,
     is_date_too_fresh_for_vision,
@@ -63,6 +78,7 @@ from ckvd.utils.for_core.vision_file_utils import (
     fill_boundary_gaps_with_rest,
     find_day_boundary_gaps,
 )
+from ckvd.utils.for_core.vision_listing import VISION_LISTINGS
 from ckvd.utils.for_core.vision_timestamp import parse_interval, process_timestamp_columns
 from ckvd.utils.gap_detector import detect_gaps
 from ckvd.utils.loguru_setup import logger
@@ -79,9 +95,220 @@ from ckvd.utils.validation import DataFrameValidator
 # Pre-compiled regex pattern for SHA256 checksum extraction
 SHA256_HASH_PATTERN = re.compile(r"([a-fA-F0-9]{64})")
 
+# Responses that mean "too many requests" rather than "no such file"
+_OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 # Define the type variable for VisionDataClient
 T = TypeVar("T")
 
+# Day-file downloads in flight across all clients in this process
+_DAY_DOWNLOADS = SingleFlight()
+
+# Archive GETs in flight across all clients in this process. The right number
+# depends on the host's link and the time of day, so it adapts between the
+# floor and MAXIMUM_CONCURRENT_DOWNLOADS from observed latency and errors.
+VISION_DOWNLOAD_LIMITER = AdaptiveConcurrencyLimiter(
+    initial_limit=VISION_ADAPTIVE_INITIAL_CONCURRENCY,
+    max_limit=MAXIMUM_CONCURRENT_DOWNLOADS,
+    min_limit=VISION_ADAPTIVE_MIN_CONCURRENCY,
+    timeout_errors=(TimeoutError, httpx.TimeoutException),
+    name="Vision",
+)
+
+# Duplicates archive GETs that run past the p95 latency (CKVD_VISION_HEDGE=true),
+# so a few slow S3 responses do not decide the wall time of a multi-day fetch
+VISION_REQUEST_HEDGER = RequestHedger(
+    percentile=VISION_HEDGE_PERCENTILE,
+    budget=VISION_HEDGE_BUDGET,
+    min_samples=VISION_HEDGE_MIN_SAMPLES,
+    max_workers=MAXIMUM_CONCURRENT_DOWNLOADS,
+    name="Vision",
+)
+
+
+def get_vision_download_metrics() -> dict[str, Any]:
+    """Current adaptive Vision download limit, its measurements and hedging counters.
+
+    Returns:
+        Dictionary from ``AdaptiveConcurrencyLimiter.metrics()`` with the
+        ``RequestHedger.metrics()`` under ``"hedging"``
+    """
+    return {**VISION_DOWNLOAD_LIMITER.metrics(), "hedging": VISION_REQUEST_HEDGER.metrics()}
+
+
+def read_kline_zip(
+    source: str | Path | BinaryIO,
+    interval: str,
+    columns: Sequence[str] | None = None,
+    keep_original_timestamp: bool = VISION_KEEP_ORIGINAL_TIMESTAMP,
+) -> pd.DataFrame | None:
+    """Decode a Binance Vision daily kline zip into a DataFrame.
+
+    Shared by the thread-pool downloader (which reads the verified temp file)
+    and the asyncio client (which decodes the downloaded bytes in memory).
+
+    Args:
+        source: Path to the zip file, or a binary file object holding it
+        interval: Kline interval string (e.g., "1m") used for timestamp processing
+        columns: Optional column projection; only these CSV columns are parsed
+        keep_original_timestamp: Add the raw open_time epoch as an
+            ``original_timestamp`` string column (CKVD_VISION_ORIGINAL_TIMESTAMP)
+
+    Returns:
+        DataFrame with processed timestamps (empty if the CSV has no rows),
+        or None if the archive holds no CSV file
+
+    Raises:
+        zipfile.BadZipFile: If the archive is corrupt
+        pd.errors.ParserError: If the CSV cannot be parsed
+    """
+    with zipfile.ZipFile(source, "r") as zip_ref:
+        # Find the CSV file in the zip
+        csv_files = [f for f in zip_ref.namelist() if f.endswith(".csv")]
+        if not csv_files:
+            return None
+        csv_file = csv_files[0]  # Take the first CSV file
+
+        # Check if the first line contains headers (e.g., 'high' keyword)
+        with zip_ref.open(csv_file) as f:
+            has_header = "high" in f.readline().decode("utf-8", errors="replace").lower()
+        logger.debug("Headers detected: {}", has_header)
+
+        # Read CSV with or without header based on detection
+        with zip_ref.open(csv_file) as f:
+            if columns is not None:
+                # Projection: parse only the requested positions of the kline layout
+                usecols = [i for i, col in enumerate(KLINE_COLUMNS) if col in columns]
+                df = pd.read_csv(f, header=0 if has_header else None, names=KLINE_COLUMNS, usecols=usecols)
+            elif has_header:
+                logger.info("Headers detected in CSV, reading with header=0")
+                df = pd.read_csv(f, header=0)
+                # Map column names to standard names if needed
+                if "open_time" not in df.columns and len(df.columns) == len(KLINE_COLUMNS):
+                    df.columns = KLINE_COLUMNS
+            else:
+                # No headers detected, use the standard column names
+                logger.info("No headers detected in CSV, reading with header=None")
+                df = pd.read_csv(f, header=None, names=KLINE_COLUMNS)
+
+    logger.debug("Read {} rows from CSV", len(df))
+    if df.empty:
+        return df
+
+    # Normalise timestamps (and optionally keep the raw epoch) in one Polars pass
+    return process_timestamp_columns(df, interval, keep_original_timestamp=keep_original_timestamp)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_incrementing(start=1, increment=1, max=3),
+    retry=retry_if_exception_type(httpx.TransportError),
+    reraise=True,
+)
+async def _get_archive_file(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    """GET a Vision file, retrying transport errors like the thread-pool downloader."""
+    return await client.get(url)
+
+
+async def download_day_archive(
+    client: httpx.AsyncClient,
+    symbol: str,
+    interval: str,
+    market_type: str,
+    date: datetime,
+) -> tuple[bytes, str | None] | None:
+    """Download one Vision daily kline archive and its published SHA-256.
+
+    The asyncio counterpart of the download half of
+    ``VisionDataClient._download_day_file``; decode the result with
+    ``decode_day_archive`` off the event loop.
+
+    Args:
+        client: Async HTTP client
+        symbol: Trading pair symbol (e.g., "BTCUSDT")
+        interval: Kline interval string (e.g., "1m")
+        market_type: Market type name (e.g., "SPOT", "FUTURES_USDT")
+        date: Day to download (UTC midnight)
+
+    Returns:
+        Tuple of (archive bytes, expected SHA-256 or None when no checksum is
+        published), or None if the day is not available
+
+    Raises:
+        httpx.HTTPError: If the archive cannot be downloaded after retries
+    """
+    listed = VISION_LISTINGS.cached(symbol, interval, market_type, date.date()) if VISION_USE_LISTING else None
+    if listed is not None and date.date() not in listed:
+        logger.debug("{} {} {} is not listed on Vision, skipping", date.date(), symbol, interval)
+        return None
+    listed_file = listed.get(date.date()) if listed is not None else None
+
+    url = get_vision_url(symbol=symbol, interval=interval, date=date, file_type=FileType.DATA, market_type=market_type)
+    response = await _get_archive_file(client, url)
+    if response.status_code != HTTP_OK:
+        if is_date_too_fresh_for_vision(date):
+            logger.info("HTTP {} for {} {} {} - within freshness window", response.status_code, date.date(), symbol, interval)
+        else:
+            logger.warning(f"HTTP {response.status_code}: Data not available for {date.date()} {symbol} {interval}")
+        return None
+
+    expected_checksum = None
+    if listed_file is not None and listed_file.checksum_size is None:
+        logger.warning(f"Checksum file not available for {date.date()}")
+        return response.content, None
+    checksum_url = get_vision_url(symbol=symbol, interval=interval, date=date, file_type=FileType.CHECKSUM, market_type=market_type)
+    try:
+        checksum_response = await _get_archive_file(client, checksum_url)
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not download checksum for {date.date()}: {e}")
+    else:
+        if checksum_response.status_code == HTTP_OK and len(checksum_response.content) >= MIN_CHECKSUM_SIZE:
+            hash_match = SHA256_HASH_PATTERN.search(checksum_response.content.decode("utf-8", errors="replace"))
+            expected_checksum = hash_match.group(1) if hash_match else None
+        else:
+            logger.warning(f"Checksum file not available for {date.date()}")
+    return response.content, expected_checksum
+
+
+def decode_day_archive(
+    content: bytes,
+    expected_checksum: str | None,
+    interval: str,
+    date: datetime,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame | None:
+    """Verify and decode an archive returned by ``download_day_archive``.
+
+    A checksum mismatch is logged and the data is still used, as in the
+    thread-pool downloader.
+
+    Args:
+        content: Archive bytes
+        expected_checksum: Published SHA-256, or None to skip verification
+        interval: Kline interval string (e.g., "1m")
+        date: Day of the archive (for logging)
+        columns: Optional column projection; only these CSV columns are parsed
+
+    Returns:
+        Decoded DataFrame, or None if the archive is empty or unreadable
+    """
+    if expected_checksum is not None:
+        actual_checksum = hashlib.sha256(content).hexdigest()
+        if actual_checksum.lower() == expected_checksum.lower():
+            logger.debug("Checksum verification passed for {}", date.date())
+        else:
+            logger.critical(f"Checksum verification failed for {date.date()}. Expected: {expected_checksum}, Actual: {actual_checksum}")
+
+    try:
+        df = read_kline_zip(io.BytesIO(content), interval, columns)
+    except (zipfile.BadZipFile, OSError, pd.errors.ParserError) as e:
+        logger.error(f"Error processing zip archive for {date.date()}: {e!s}")
+        return None
+    if df is None or df.empty:
+        logger.warning(f"No kline rows in archive for {date.date()}")
+        return None
+    return df
+
 
 class VisionDataClient(DataClientInterface, Generic[T]):
     """Vision Data Client for direct access to Binance historical data.
@@ -230,7 +457,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             },
             follow_redirects=True,  # Automatically follow redirects
         )
-        logger.debug(f"Initialized Vision client for {self._symbol} {self._interval_str} ({self._market_type_str})")
+        logger.debug("Initialized Vision client for {} {} ({})", self._symbol, self._interval_str, self._market_type_str)
 
     def __enter__(self) -> "VisionDataClient":
         """Context manager entry."""
@@ -321,6 +548,52 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             return True
         return False
 
+    def _download_file(self, date: datetime, columns: Sequence[str] | None = None) -> tuple[pd.DataFrame | None, str | None]:
+        """Download a data file for a specific date, coalescing concurrent identical downloads.
+
+        Threads asking for the same market/symbol/interval/day/projection while
+        a download is in flight wait for it and receive a copy of its result
+        instead of downloading the file again.
+
+        Args:
+            date: Date to download data for
+            columns: Optional column projection; only these CSV columns are parsed
+
+        Returns:
+            Tuple of (DataFrame, warning message). DataFrame is None if download failed.
+        """
+        key = (
+            self.market_type_str,
+            self._symbol,
+            self._interval_str,
+            date.strftime("%Y-%m-%d"),
+            tuple(columns) if columns is not None else None,
+        )
+        (df, warning), shared = _DAY_DOWNLOADS.do(key, self._download_day_file, date, columns)
+        if shared:
+            logger.debug("Reused in-flight download for {} {} {}", date.date(), self._symbol, self._interval_str)
+            if df is not None:
+                df = df.copy()
+        return df, warning
+
+    def _get_archive(self, url: str) -> httpx.Response:
+        """GET one archive, admitted by the adaptive limiter, which learns from the outcome.
+
+        Hedging (CKVD_VISION_HEDGE=true) happens inside the limiter slot: the
+        hedger's latency window holds only the S3 GET, not the wait for a
+        slot, and the duplicate GET shares the primary's slot instead of
+        queueing behind a saturated limiter.
+        """
+        with VISION_DOWNLOAD_LIMITER.slot() as slot:
+            if VISION_HEDGE_REQUESTS:
+                response = VISION_REQUEST_HEDGER.call(lambda: self._client.get(url))
+            else:
+                response = self._client.get(url)
+            slot.record_bytes(len(response.content))
+            if response.status_code in _OVERLOAD_STATUSES:
+                slot.overloaded()
+        return response
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_incrementing(start=1, increment=1, max=3),
@@ -332,16 +605,17 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             f"waiting {retry_state.attempt_number} seconds"
         ),
     )
-    def _download_file(self, date: datetime) -> tuple[pd.DataFrame | None, str | None]:
-        """Download a data file for a specific date.
+    def _download_day_file(self, date: datetime, columns: Sequence[str] | None = None) -> tuple[pd.DataFrame | None, str | None]:
+        """Download a data file for a specific date (no coalescing, see ``_download_file``).
 
         Args:
             date: Date to download data for
+            columns: Optional column projection; only these CSV columns are parsed
 
         Returns:
             Tuple of (DataFrame, warning message). DataFrame is None if download failed.
         """
-        logger.debug(f"Downloading data for {date.date()} for {self._symbol} {self._interval_str}")
+        logger.debug("Downloading data for {} for {} {}", date.date(), self._symbol, self._interval_str)
 
         temp_file_path = None
         temp_checksum_path = None
@@ -401,8 +675,17 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                 market_type=self.market_type_str,
             )
 
-            # Create temporary files with meaningful names
-            filename = f"{self._symbol}-{base_interval}-{date.strftime('%Y-%m-%d')}"
+            # The month listing, when one is cached, says whether the day and its checksum exist
+            listed = VISION_LISTINGS.cached(self._symbol, base_interval, self.market_type_str, date.date()) if VISION_USE_LISTING else None
+            if listed is not None and date.date() not in listed:
+                if self._should_skip_retry_for_fresh_date(date):
+                    return None, f"404: Data not available for {date.date()} - within freshness window"
+                return None, f"404: Data not available for {date.date()}"
+            listed_file = listed.get(date.date()) if listed is not None else None
+
+            # Create temporary files with meaningful names; the unique suffix keeps
+            # workers in other processes downloading the same day from clobbering them
+            filename = f"{self._symbol}-{base_interval}-{date.strftime('%Y-%m-%d')}-{uuid.uuid4().hex[:12]}"
             temp_dir = tempfile.gettempdir()
 
             temp_file_path = Path(temp_dir) / f"{filename}.zip"
@@ -414,8 +697,8 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             if temp_checksum_path.exists():
                 temp_checksum_path.unlink()
 
-            # Download the data file
-            response = self._client.get(url)
+            # Download the data file (slow GETs are hedged when enabled)
+            response = self._get_archive(url)
             if response.status_code == HTTP_NOT_FOUND:
                 # For 404 errors, check if the date is too fresh
                 if self._should_skip_retry_for_fresh_date(date):
@@ -436,13 +719,19 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                     )
                 return None, f"HTTP error {response.status_code} for {date.date()}"
 
+            if listed_file is not None and len(response.content) != listed_file.size:
+                logger.warning(f"Archive for {date.date()} is {len(response.content)} bytes, the listing says {listed_file.size}")
+
             # Save to the temporary file
             with open(temp_file_path, "wb") as f:
                 f.write(response.content)
 
-            # Download the checksum file
-            checksum_response = self._client.get(checksum_url)
-            if checksum_response.status_code == HTTP_NOT_FOUND:
+            # Download the checksum file unless the listing shows none is published
+            if listed_file is not None and listed_file.checksum_size is None:
+                checksum_response = None
+            else:
+                checksum_response = self._client.get(checksum_url)
+            if checksum_response is None or checksum_response.status_code == HTTP_NOT_FOUND:
                 logger.warning(f"Checksum file not available for {date.date()}")
             elif checksum_response.status_code != HTTP_OK:
                 logger.warning(f"HTTP error {checksum_response.status_code} when getting checksum for {date.date()}")
@@ -490,7 +779,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                                     expected_checksum = hash_match.group(1)
 
                                     if expected_checksum.lower() == actual_checksum.lower():
-                                        logger.info(f"Checksum verification passed for {date.date()}")
+                                        logger.info("Checksum verification passed for {}", date.date())
                                     else:
                                         logger.critical(
                                             f"Checksum verification failed for {date.date()}. "
@@ -507,7 +796,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                                             )
                         except (OSError, ValueError) as extract_e:
                             # Extraction failed, but we can still self-verify
-                            logger.debug(f"Could not extract checksum from file: {extract_e}")
+                            logger.debug("Could not extract checksum from file: {}", extract_e)
 
                     except (OSError, ValueError, httpx.HTTPError) as e:
                         # Log checksum verification errors at warning level for visibility
@@ -515,67 +804,25 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
             # Process the zip file
             try:
-                with zipfile.ZipFile(temp_file_path, "r") as zip_ref:
-                    # Find the CSV file in the zip
-                    csv_files = [f for f in zip_ref.namelist() if f.endswith(".csv")]
-                    if not csv_files:
-                        # Check if date is too fresh when no CSV files found
-                        if self._should_skip_retry_for_fresh_date(date):
-                            return (
-                                None,
-                                f"No CSV file found in zip for {date.date()} - within freshness window",
-                            )
-                        return None, f"No CSV file found in zip for {date.date()}"
-
-                    csv_file = csv_files[0]  # Take the first CSV file
-
-                    # Extract and process the CSV file
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        zip_ref.extract(csv_file, temp_dir)
-                        csv_path = Path(temp_dir) / csv_file
-
-                        # Read the CSV file
-                        with open(csv_path) as f:
-                            first_lines = [next(f) for _ in range(3)]
-
-                            # Check if the first line contains headers (e.g., 'high' keyword)
-                            has_header = any("high" in line.lower() for line in first_lines[:1])
-                            logger.debug(f"Headers detected: {has_header}")
-
-                            # Reopen the file to read from the beginning
-                            f.seek(0)
-
-                        # Read CSV with or without header based on detection
-                        if has_header:
-                            logger.info("Headers detected in CSV, reading with header=0")
-                            df = pd.read_csv(csv_path, header=0)
-                            # Map column names to standard names if needed
-                            if "open_time" not in df.columns and len(df.columns) == len(KLINE_COLUMNS):
-                                df.columns = KLINE_COLUMNS
-                        else:
-                            # No headers detected, use the standard column names
-                            logger.info("No headers detected in CSV, reading with header=None")
-                            df = pd.read_csv(csv_path, header=None, names=KLINE_COLUMNS)
-
-                        logger.debug(f"Read {len(df)} rows from CSV")
-
-                        # Process the data
-                        if not df.empty:
-                            # Store original timestamp info for later analysis if not already present
-                            if "original_timestamp" not in df.columns:
-                                df["original_timestamp"] = df.iloc[:, 0].astype(str)
-
-                            # Process timestamp columns using the imported utility function
-                            df = process_timestamp_columns(df, self._interval_str)
+                df = read_kline_zip(temp_file_path, self._interval_str, columns)
+                if df is None:
+                    # Check if date is too fresh when no CSV files found
+                    if self._should_skip_retry_for_fresh_date(date):
+                        return (
+                            None,
+                            f"No CSV file found in zip for {date.date()} - within freshness window",
+                        )
+                    return None, f"No CSV file found in zip for {date.date()}"
 
-                            # Add warning to data if checksum failed (only if really failed)
-                            warning_msg = None
-                            if checksum_failed:
-                                warning_msg = f"Data used despite checksum verification failure for {date.date()}"
-                                logger.warning(warning_msg)
+                if not df.empty:
+                    # Add warning to data if checksum failed (only if really failed)
+                    warning_msg = None
+                    if checksum_failed:
+                        warning_msg = f"Data used despite checksum verification failure for {date.date()}"
+                        logger.warning(warning_msg)
 
-                            return df, warning_msg
-                        return None, f"Empty dataframe for {date.date()}"
+                    return df, warning_msg
+                return None, f"Empty dataframe for {date.date()}"
             except (zipfile.BadZipFile, OSError, pd.errors.ParserError) as e:
                 logger.error(
                     f"Error processing zip file {temp_file_path}: {e!s}",
@@ -597,16 +844,42 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
         return None, None
 
+    def _split_listed_dates(self, date_objects: list[datetime]) -> tuple[list[datetime], list[datetime]]:
+        """Split days into those listed on Vision and those that are not.
+
+        One listing request per month replaces a probing GET per missing day.
+        When listing is disabled or fails, every day is treated as listed.
+
+        Args:
+            date_objects: UTC midnights of the days to download
+
+        Returns:
+            Tuple of (days to download, days not published)
+        """
+        if not VISION_USE_LISTING or not date_objects:
+            return date_objects, []
+        listed = VISION_LISTINGS.available_days(
+            self._client, self._symbol, self._interval_str, self.market_type_str, date_objects[0].date(), date_objects[-1].date()
+        )
+        if listed is None:
+            return date_objects, []
+        unlisted = [date_obj for date_obj in date_objects if date_obj.date() not in listed]
+        if unlisted:
+            logger.info("Skipping {} dates not listed on Vision", len(unlisted))
+        return [date_obj for date_obj in date_objects if date_obj.date() in listed], unlisted
+
     def _download_data(
         self,
         start_time: datetime,
         end_time: datetime,
+        columns: Sequence[str] | None = None,
     ) -> TimestampedDataFrame:
         """Download data from Binance Vision API for a specific time range.
 
         Args:
             start_time: Start time
             end_time: End time
+            columns: Optional column projection passed to the CSV reader
 
         Returns:
             TimestampedDataFrame with downloaded data
@@ -616,7 +889,9 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             - open_time represents the BEGINNING of each candle period
             - close_time represents the END of each candle period
         """
-        logger.info(f"Downloading data for {self._symbol} {self._interval_str} from {start_time.isoformat()} to {end_time.isoformat()}")
+        logger.info(
+            "Downloading data for {} {} from {} to {}", self._symbol, self._interval_str, start_time.isoformat(), end_time.isoformat()
+        )
 
         # Convert start and end times to date objects for file-based lookups
         start_date = start_time.date()
@@ -628,19 +903,27 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             datetime.combine(start_date + timedelta(days=i), datetime.min.time(), tzinfo=timezone.utc) for i in range(days_count)
         ]
 
-        logger.info(f"Need to check {len(date_objects)} dates for data")
+        date_objects, unlisted_dates = self._split_listed_dates(date_objects)
 
-        # Use ThreadPoolExecutor to download files in parallel
+        logger.info("Need to check {} dates for data", len(date_objects))
+
+        # Use ThreadPoolExecutor to download files in parallel; the workers are an
+        # upper bound, VISION_DOWNLOAD_LIMITER decides how many GETs run at once
         max_workers = min(MAXIMUM_CONCURRENT_DOWNLOADS, len(date_objects))
         downloaded_dfs = []
         warning_messages = []  # Collect warning messages
         checksum_failures = []  # Track checksum failures
         fresh_date_failures = []  # Track date failures due to freshness
+        for date_obj in unlisted_dates:
+            if self._should_skip_retry_for_fresh_date(date_obj):
+                fresh_date_failures.append((date_obj, f"404: Data not available for {date_obj.date()} - within freshness window"))
+            else:
+                warning_messages.append(f"404: Data not available for {date_obj.date()}")
 
         # For very short intervals like 1s, avoid too many concurrent downloads
         if self._interval_str == "1s" and max_workers > CONCURRENT_DOWNLOADS_LIMIT_1S:
             max_workers = CONCURRENT_DOWNLOADS_LIMIT_1S
-            logger.info(f"Limited concurrent downloads to {max_workers} for 1s interval")
+            logger.info("Limited concurrent downloads to {} for 1s interval", max_workers)
 
         # Get data files
         if len(date_objects) == 0:
@@ -650,7 +933,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
         try:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 # Submit download tasks
-                future_to_date = {executor.submit(self._download_file, date_obj): date_obj for date_obj in date_objects}
+                future_to_date = {executor.submit(self._download_file, date_obj, columns): date_obj for date_obj in date_objects}
 
                 # Process results as they complete
                 for future in as_completed(future_to_date):
@@ -661,7 +944,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                             # Handle warnings about fresh data differently
                             if "freshness window" in warning:
                                 fresh_date_failures.append((date, warning))
-                                logger.info(f"Expected failure for {date}: {warning} (within VISION_DATA_DELAY_HOURS window)")
+                                logger.info("Expected failure for {}: {} (within VISION_DATA_DELAY_HOURS window)", date, warning)
                             # Only track actual checksum failures as warnings
                             elif "Checksum verification failed" in warning and "extraction" not in warning:
                                 checksum_failures.append((date, warning))
@@ -678,10 +961,13 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                         # Check if this date is too fresh
                         if self._should_skip_retry_for_fresh_date(date):
                             fresh_date_failures.append((date, f"Error: {exc}"))
-                            logger.info(f"Expected failure for {date}: {exc} - Date is within the freshness window, skipping retries")
+                            logger.info("Expected failure for {}: {} - Date is within the freshness window, skipping retries", date, exc)
                         else:
                             logger.error(f"Error downloading data for {date}: {exc} - This date will be treated as unavailable")
 
+            if logger.enabled("DEBUG"):
+                logger.debug("Vision download limiter: {}", get_vision_download_metrics())
+
             # After all downloads, check if there were any checksum failures
             if checksum_failures:
                 failed_dates = [d.strftime("%Y-%m-%d") for d, _ in checksum_failures]
@@ -737,7 +1023,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                 )
             return self.create_empty_dataframe()
 
-        logger.info(f"Downloaded {len(downloaded_dfs)} daily files")
+        logger.info("Downloaded {} daily files", len(downloaded_dfs))
 
         # Concatenate all dataframes efficiently
         # Use copy=False to avoid unnecessary memory copies (zero-copy where possible)
@@ -763,7 +1049,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
         # Log filtering results for debugging
         if not filtered_df.empty:
-            logger.debug(f"Filtered dataframe contains {len(filtered_df)} rows")
+            logger.debug("Filtered dataframe contains {} rows", len(filtered_df))
         else:
             logger.warning("Filtered dataframe is empty - no data within requested time range")
 
@@ -818,7 +1104,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                         enforce_min_span=min_span_required,
                     )
                     if gaps:
-                        logger.debug(f"Detected {len(gaps)} gaps in Vision data")
+                        logger.debug("Detected {} gaps in Vision data", len(gaps))
                 else:
                     logger.warning("No open_time column available for gap detection")
                     gaps = []
@@ -831,7 +1117,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
         # Try to fill day boundary gaps using REST API
         if boundary_gaps:
-            logger.debug(f"Detected {len(boundary_gaps)} day boundary gaps. Attempting to fill with REST API data.")
+            logger.debug("Detected {} day boundary gaps. Attempting to fill with REST API data.", len(boundary_gaps))
             filled_df = fill_boundary_gaps_with_rest(
                 filtered_df,
                 boundary_gaps,
@@ -841,12 +1127,12 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             )
             if filled_df is not None:
                 filtered_df = filled_df
-                logger.debug(f"Successfully filled boundary gaps with REST API. New row count: {len(filtered_df)}")
+                logger.debug("Successfully filled boundary gaps with REST API. New row count: {}", len(filtered_df))
             else:
                 logger.warning(f"Failed to fill {len(boundary_gaps)} boundary gaps with REST API.")
 
-        # Store original timestamp for reference
-        if "open_time" in filtered_df.columns and "original_timestamp" not in filtered_df.columns:
+        # Store original timestamp for reference (opt-in, see VISION_KEEP_ORIGINAL_TIMESTAMP)
+        if VISION_KEEP_ORIGINAL_TIMESTAMP and "open_time" in filtered_df.columns and "original_timestamp" not in filtered_df.columns:
             filtered_df["original_timestamp"] = filtered_df["open_time"]
 
         # Create TimestampedDataFrame based on available columns
@@ -900,7 +1186,8 @@ class VisionDataClient(DataClientInterface, Generic[T]):
             interval: Time interval string (e.g., "1m", "1h")
             start_time: Start time for data retrieval (timezone-aware datetime)
             end_time: End time for data retrieval (timezone-aware datetime)
-            **kwargs: Additional parameters (unused, for interface compatibility)
+            **kwargs: Additional parameters. ``columns`` restricts CSV parsing to a
+                column projection (``open_time`` is always read).
 
         Returns:
             pd.DataFrame: DataFrame with market data where:
@@ -971,11 +1258,11 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
             # Log if it's a large request
             if delta_days > LARGE_REQUEST_DAYS:
-                logger.info(f"Processing a large date range of {delta_days} days with parallel downloads.")
+                logger.info("Processing a large date range of {} days with parallel downloads.", delta_days)
 
             # Download data
             try:
-                timestamped_df = self._download_data(start_time, end_time)
+                timestamped_df = self._download_data(start_time, end_time, columns=kwargs.get("columns"))
 
                 # TimestampedDataFrame already is a pd.DataFrame subclass
                 # No copy needed - just ensure open_time is a column
@@ -989,7 +1276,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
                     # Return the data we have, or empty dataframe if none
                     if "timestamped_df" in locals() and timestamped_df is not None and not timestamped_df.empty:
-                        logger.info(f"Returning {len(timestamped_df)} rows despite checksum issues")
+                        logger.info("Returning {} rows despite checksum issues", len(timestamped_df))
                         return ensure_open_time_as_column(timestamped_df)
                     logger.critical("No data available due to checksum verification failure")
                     raise RuntimeError(f"VISION API DATA INTEGRITY ERROR: {e!s}") from e
@@ -1094,9 +1381,9 @@ class VisionDataClient(DataClientInterface, Generic[T]):
 
         # Log large requests but don't limit them
         if delta_days > LARGE_REQUEST_DAYS:
-            logger.info(f"Processing a large date range of {delta_days} days for {len(symbols)} symbols with parallel downloads.")
+            logger.info("Processing a large date range of {} days for {} symbols with parallel downloads.", delta_days, len(symbols))
 
-        logger.info(f"Fetching data for {len(symbols)} symbols using {max_workers} parallel workers")
+        logger.info("Fetching data for {} symbols using {} parallel workers", len(symbols), max_workers)
 
         results: dict[str, TimestampedDataFrame] = {}
 
@@ -1130,7 +1417,7 @@ class VisionDataClient(DataClientInterface, Generic[T]):
                 try:
                     symbol_result, df = future.result()
                     results[symbol_result] = df
-                    logger.info(f"Completed download for {symbol} ({i + 1}/{len(symbols)}): {len(df)} records")
+                    logger.info("Completed download for {} ({}/{}): {} records", symbol, i + 1, len(symbols), len(df))
                 except (httpx.HTTPError, OSError, TimeoutError, zipfile.BadZipFile, pd.errors.ParserError) as e:
                     logger.error(f"Error processing result for {symbol}: {e}")
                     # Create empty dataframe for failed symbols
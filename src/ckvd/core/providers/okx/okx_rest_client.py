@@ -31,6 +31,7 @@ from ckvd.utils.for_core.rest_exceptions import (
     RateLimitError,
     RestAPIError,
 )
+from ckvd.utils.for_core.rest_scheduler import get_rest_scheduler, request_weight
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import (
     ChartType,
@@ -205,15 +206,18 @@ class OKXRestClient(DataClientInterface):
             NetworkError: If network error after all retries
         """
         client = self._ensure_client()
+        scheduler = get_rest_scheduler(url)
 
         for attempt in range(self.retry_count):
             try:
+                scheduler.acquire(request_weight(url, params), wait_on_block=True)  # short blocks recorded below
                 response = client.get(url, params=params)
                 response.raise_for_status()
                 return response.json()
 
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 429:
+                    scheduler.record_rate_limit(RETRY_DELAY * (attempt + 1))
                     if attempt < self.retry_count - 1:
                         wait_time = RETRY_DELAY * (attempt + 1)
                         logger.warning(f"OKX rate limited, waiting {wait_time}s before retry")
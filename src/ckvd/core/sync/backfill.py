@@ -0,0 +1,562 @@
+#!/usr/bin/env python
+"""Parallel, resumable cache backfill.
+
+Warms a cache root for a symbol × interval × day grid using the library's
+own clients and cache writer, so the files land exactly where the FCP cache
+step reads them:
+
+1. ``BackfillEngine.plan()`` builds the grid and drops days the cache index
+   already holds in full, and days a previous run checkpointed.
+2. ``BackfillEngine.run()`` fetches days on a bounded pool (Vision download
+   and CSV decode, REST for days Vision has not published yet) and hands them
+   to a separate bounded writer pool (``save_to_cache``). At most
+   BACKFILL_MAX_PENDING_DAYS days are in flight, which bounds memory.
+3. Every finished day is appended to a JSONL checkpoint, so an interrupted
+   run resumes where it stopped. Days fetched over REST while still inside
+   the Vision delay window (or cut short by the rate limit) are checkpointed
+   as "partial" and fetched again on resume. A day that hits a REST host
+   block (``RateLimitError``) is recorded as failed and no further days are
+   started; the partial report is returned and the remaining days are
+   fetched on resume. Throughput is logged while running and returned as a
+   ``BackfillReport``.
+
+Example:
+    >>> from datetime import date
+    >>> from ckvd import Interval, MarketType
+    >>> from ckvd.core.sync.backfill import BackfillEngine
+    >>>
+    >>> with BackfillEngine(MarketType.SPOT, cache_dir="./cache") as engine:
+    ...     plan = engine.plan(["BTCUSDT", "ETHUSDT"], [Interval.MINUTE_1], date(2024, 1, 1), date(2024, 1, 31))
+    ...     report = engine.run(plan)
+    >>> print(report.summary())
+
+The command-line entry point is ``ckvd backfill`` (see ``ckvd.cli.backfill``).
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from types import TracebackType
+
+import httpx
+import pandas as pd
+
+from ckvd.core.providers.binance.rest_data_client import RestDataClient
+from ckvd.core.providers.binance.vision_data_client import VisionDataClient
+from ckvd.utils.app_paths import get_cache_dir
+from ckvd.utils.cache.index import CacheIndex
+from ckvd.utils.config import (
+    BACKFILL_CHECKPOINT_FILENAME,
+    BACKFILL_DOWNLOAD_WORKERS,
+    BACKFILL_MAX_PENDING_DAYS,
+    BACKFILL_PROGRESS_INTERVAL,
+    BACKFILL_WRITE_WORKERS,
+    SECONDS_IN_DAY,
+)
+from ckvd.utils.dataframe_utils import ensure_open_time_as_column
+from ckvd.utils.for_core.ckvd_cache_utils import get_vision_day_paths, save_to_cache
+from ckvd.utils.for_core.rest_exceptions import RateLimitError, RestAPIError
+from ckvd.utils.for_core.vision_constraints import is_date_too_fresh_for_vision
+from ckvd.utils.for_core.vision_exceptions import VisionAPIError
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market_constraints import Interval, MarketType
+
+__all__ = [
+    "BackfillCheckpoint",
+    "BackfillEngine",
+    "BackfillPlan",
+    "BackfillReport",
+    "BackfillTask",
+    "backfill",
+]
+
+# Errors a single day can fail with; the day is recorded as failed and retried on resume
+_DAY_ERRORS = (
+    httpx.HTTPError,
+    OSError,
+    TimeoutError,
+    ValueError,
+    RuntimeError,
+    pd.errors.ParserError,
+    RestAPIError,
+    VisionAPIError,
+)
+
+# Checkpoint statuses that mean "nothing left to do for this day"
+_FINISHED = frozenset({"done", "empty"})
+
+
+@dataclass(frozen=True, order=True)
+class BackfillTask:
+    """One symbol-interval-day of the backfill grid."""
+
+    symbol: str
+    interval: str
+    day: date
+
+    @property
+    def day_start(self) -> datetime:
+        """Start of the day (UTC)."""
+        return datetime(self.day.year, self.day.month, self.day.day, tzinfo=timezone.utc)
+
+    @property
+    def day_end(self) -> datetime:
+        """Last microsecond of the day (UTC)."""
+        return self.day_start + timedelta(days=1) - timedelta(microseconds=1)
+
+
+@dataclass
+class BackfillPlan:
+    """Days to fetch, plus the days planning skipped."""
+
+    market_type: MarketType
+    tasks: list[BackfillTask]
+    grid_size: int
+    cached: int = 0
+    checkpointed: int = 0
+
+
+@dataclass
+class BackfillReport:
+    """Outcome and throughput of a backfill run."""
+
+    planned: int = 0
+    completed: int = 0
+    empty: int = 0
+    failed: int = 0
+    vision_days: int = 0
+    rest_days: int = 0
+    rows: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    failures: list[tuple[BackfillTask, str]] = field(default_factory=list)
+    rate_limited: bool = False
+    retry_after: float | None = None
+
+    @property
+    def finished(self) -> int:
+        """Days processed so far (any outcome)."""
+        return self.completed + self.empty + self.failed
+
+    @property
+    def days_per_second(self) -> float:
+        """Processed days per second."""
+        return self.finished / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Cached rows per second."""
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Cache bytes written per second, in MB."""
+        return self.bytes_written / 1e6 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line human-readable summary."""
+        summary = (
+            f"{self.finished}/{self.planned} days in {self.elapsed:.1f}s "
+            f"({self.completed} cached: {self.vision_days} Vision, {self.rest_days} REST; "
+            f"{self.empty} without data; {self.failed} failed) - "
+            f"{self.days_per_second:.2f} days/s, {self.rows_per_second:,.0f} rows/s, {self.megabytes_per_second:.2f} MB/s"
+        )
+        if self.rate_limited:
+            retry = f" (retry after {self.retry_after}s)" if self.retry_after is not None else ""
+            summary += f" - stopped early by the REST rate limit{retry}; resume to fetch the rest"
+        return summary
+
+
+class BackfillCheckpoint:
+    """Append-only JSONL log of finished days, used to resume interrupted runs.
+
+    Each line records one day's outcome; when a day appears more than once the
+    last line wins, so retried failures are picked up on the next resume.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            path: JSONL file (created on the first record)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(market_type: MarketType, task: BackfillTask) -> str:
+        """Checkpoint key for a task."""
+        return f"{market_type.name}/{task.symbol}/{task.interval}/{task.day.isoformat()}"
+
+    def load(self) -> dict[str, str]:
+        """Return the latest status per task key (empty if there is no checkpoint)."""
+        statuses: dict[str, str] = {}
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        statuses[record["key"]] = record["status"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # torn line from an interrupted write
+        except FileNotFoundError:
+            pass
+        return statuses
+
+    def record(self, market_type: MarketType, task: BackfillTask, status: str, rows: int = 0, source: str | None = None) -> None:
+        """Append one day's outcome.
+
+        Args:
+            market_type: Market type of the run
+            task: Finished task
+            status: "done", "empty", "failed" or "partial" (cached, but refetched on resume)
+            rows: Rows cached for the day
+            source: Data source ("VISION" or "REST")
+        """
+        line = json.dumps({"key": self.key(market_type, task), "status": status, "rows": rows, "source": source})
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+
+
+class BackfillEngine:
+    """Plan and run a cache backfill for one market type and cache root."""
+
+    def __init__(
+        self,
+        market_type: MarketType = MarketType.SPOT,
+        cache_dir: str | Path | None = None,
+        *,
+        download_workers: int = BACKFILL_DOWNLOAD_WORKERS,
+        write_workers: int = BACKFILL_WRITE_WORKERS,
+        max_pending: int = BACKFILL_MAX_PENDING_DAYS,
+        checkpoint_path: str | Path | None = None,
+        rest_fallback: bool = True,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            market_type: Market to backfill (SPOT, FUTURES_USDT, FUTURES_COIN)
+            cache_dir: Cache root (default: same as CryptoKlineVisionData)
+            download_workers: Days fetched concurrently (download + decode)
+            write_workers: Cache files written concurrently
+            max_pending: Days in flight at once (fetching or awaiting a write)
+            checkpoint_path: Checkpoint file (default: ``<cache_dir>/backfill_checkpoint.jsonl``)
+            rest_fallback: Fetch days Vision has no file for from the REST API
+        """
+        if min(download_workers, write_workers, max_pending) < 1:
+            raise ValueError("download_workers, write_workers and max_pending must be at least 1")
+
+        self.market_type = market_type
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else get_cache_dir() / "data"
+        self.download_workers = download_workers
+        self.write_workers = write_workers
+        self.max_pending = max_pending
+        self.checkpoint = BackfillCheckpoint(checkpoint_path or self.cache_dir / BACKFILL_CHECKPOINT_FILENAME)
+        self.rest_fallback = rest_fallback
+
+        self._clients_lock = threading.Lock()
+        self._vision_clients: dict[tuple[str, str], VisionDataClient] = {}
+        self._rest_client: RestDataClient | None = None
+
+    def __enter__(self) -> BackfillEngine:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None) -> None:
+        """Close clients on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP clients created by runs."""
+        with self._clients_lock:
+            clients = [*self._vision_clients.values(), *([self._rest_client] if self._rest_client else [])]
+            self._vision_clients.clear()
+            self._rest_client = None
+        for client in clients:
+            client.close()
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def plan(
+        self,
+        symbols: Iterable[str],
+        intervals: Iterable[Interval | str],
+        start: date,
+        end: date,
+        *,
+        resume: bool = True,
+        force: bool = False,
+    ) -> BackfillPlan:
+        """Build the symbol × interval × day grid and drop days with nothing to do.
+
+        Args:
+            symbols: Symbols to backfill
+            intervals: Kline intervals (up to 1d; Vision publishes daily files)
+            start: First day (inclusive)
+            end: Last day (inclusive)
+            resume: Skip days a previous run checkpointed as finished
+            force: Refetch days the cache already holds in full
+
+        Returns:
+            BackfillPlan with the remaining tasks in symbol, interval, day order
+
+        Raises:
+            ValueError: If the day range is empty or an interval is longer than a day
+        """
+        if end < start:
+            raise ValueError(f"End day {end} is before start day {start}")
+        intervals = [Interval(i) if isinstance(i, str) else i for i in intervals]
+        too_long = [i.value for i in intervals if i.to_seconds() > SECONDS_IN_DAY]
+        if too_long:
+            raise ValueError(f"Intervals longer than one day cannot be backfilled from daily files: {too_long}")
+
+        symbols = [s.strip().upper() for s in symbols if s.strip()]
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        checkpointed = self.checkpoint.load() if resume else {}
+
+        plan = BackfillPlan(self.market_type, tasks=[], grid_size=len(symbols) * len(intervals) * len(days))
+        for symbol in symbols:
+            for interval in intervals:
+                complete = set() if force else self._complete_days(symbol, interval, start, end)
+                for day in days:
+                    task = BackfillTask(symbol, interval.value, day)
+                    if day.isoformat() in complete:
+                        plan.cached += 1
+                    elif checkpointed.get(BackfillCheckpoint.key(self.market_type, task)) in _FINISHED:
+                        plan.checkpointed += 1
+                    else:
+                        plan.tasks.append(task)
+
+        logger.info(
+            f"Backfill plan: {len(plan.tasks)} of {plan.grid_size} days to fetch "
+            f"({plan.cached} already cached, {plan.checkpointed} checkpointed)"
+        )
+        return plan
+
+    def _complete_days(self, symbol: str, interval: Interval, start: date, end: date) -> set[str]:
+        """Days the cache index holds with a full day of rows."""
+        index = CacheIndex.for_cache_dir(self.cache_dir)
+        try:
+            if not index.exists() and self.cache_dir.exists():
+                index.rebuild_from_disk()
+            entries = index.get_entries(self.market_type, symbol, interval, start, end)
+        except sqlite3.Error as e:
+            logger.warning(f"Cache index unavailable, planning without it: {e}")
+            return set()
+        rows_per_day = SECONDS_IN_DAY // interval.to_seconds()
+        return {entry.date for entry in entries if entry.num_records >= rows_per_day}
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def run(self, plan: BackfillPlan) -> BackfillReport:
+        """Fetch and cache every task in the plan.
+
+        Args:
+            plan: Plan from ``plan()``
+
+        Stops starting new days once a REST host block is hit; days already in
+        flight finish and the remaining ones are left for the next resume.
+
+        Returns:
+            BackfillReport with outcome counts and throughput
+        """
+        report = BackfillReport(planned=len(plan.tasks))
+        state_lock = threading.Lock()
+        stop = threading.Event()
+        slots = threading.BoundedSemaphore(self.max_pending)
+        started = time.monotonic()
+        last_progress = [started]
+
+        def finish(
+            task: BackfillTask,
+            status: str,
+            rows: int = 0,
+            size: int = 0,
+            source: str | None = None,
+            error: str = "",
+            final: bool = True,
+        ) -> None:
+            self.checkpoint.record(self.market_type, task, status if final else "partial", rows, source)
+            with state_lock:
+                if status == "done":
+                    report.completed += 1
+                    report.rows += rows
+                    report.bytes_written += size
+                    if source == "REST":
+                        report.rest_days += 1
+                    else:
+                        report.vision_days += 1
+                elif status == "empty":
+                    report.empty += 1
+                else:
+                    report.failed += 1
+                    report.failures.append((task, error))
+                now = time.monotonic()
+                report.elapsed = now - started
+                if now - last_progress[0] >= BACKFILL_PROGRESS_INTERVAL:
+                    last_progress[0] = now
+                    logger.info(f"Backfill progress: {report.summary()}")
+
+        def write(task: BackfillTask, df: pd.DataFrame, source: str, final: bool) -> None:
+            try:
+                rows, size = self._write_day(task, df, source)
+                finish(task, "done", rows, size, source, final=final)
+            except _DAY_ERRORS as e:
+                logger.error(f"Failed to cache {task.symbol} {task.interval} {task.day}: {e}")
+                finish(task, "failed", error=str(e))
+            finally:
+                slots.release()
+
+        def fetch(task: BackfillTask) -> None:
+            handed_off = False
+            try:
+                if stop.is_set():
+                    return  # not checkpointed, so the next resume fetches it
+                df, source = self._fetch_day(task)
+                final = self._is_final(task, df, source)
+                if df.empty:
+                    finish(task, "empty", source=source, final=final)
+                else:
+                    futures.append(writers.submit(write, task, df, source, final))
+                    handed_off = True
+            except RateLimitError as e:
+                logger.warning(f"Rate limited fetching {task.symbol} {task.interval} {task.day}; stopping the backfill: {e}")
+                with state_lock:
+                    report.rate_limited = True
+                    report.retry_after = e.retry_after
+                stop.set()
+                finish(task, "failed", error=str(e))
+            except _DAY_ERRORS as e:
+                logger.error(f"Failed to fetch {task.symbol} {task.interval} {task.day}: {e}")
+                finish(task, "failed", error=str(e))
+            finally:
+                if not handed_off:
+                    slots.release()
+
+        futures: list[Future] = []
+        with ThreadPoolExecutor(self.write_workers, thread_name_prefix="ckvd-backfill-write") as writers:
+            with ThreadPoolExecutor(self.download_workers, thread_name_prefix="ckvd-backfill-fetch") as fetchers:
+                for task in plan.tasks:
+                    slots.acquire()
+                    if stop.is_set():
+                        slots.release()
+                        break
+                    futures.append(fetchers.submit(fetch, task))
+
+        # Surface anything other than the per-day errors recorded above
+        for future in futures:
+            future.result()
+
+        report.elapsed = time.monotonic() - started
+        logger.info(f"Backfill finished: {report.summary()}")
+        return report
+
+    def _fetch_day(self, task: BackfillTask) -> tuple[pd.DataFrame, str]:
+        """Fetch one full day: Vision first, REST for days Vision has not published.
+
+        Returns:
+            Tuple of (DataFrame with an open_time column, source name)
+        """
+        if not is_date_too_fresh_for_vision(task.day_end):
+            df = self._vision_client(task).fetch(task.symbol, task.interval, task.day_start, task.day_end)
+            if not df.empty or not self.rest_fallback:
+                return ensure_open_time_as_column(df), "VISION"
+        elif not self.rest_fallback:
+            return pd.DataFrame(), "VISION"
+
+        day_end = min(task.day_end, datetime.now(timezone.utc))
+        df = self._rest().fetch(task.symbol, task.interval, task.day_start, day_end)
+        return ensure_open_time_as_column(df), "REST"
+
+    @staticmethod
+    def _is_final(task: BackfillTask, df: pd.DataFrame, source: str) -> bool:
+        """Whether a fetched day is complete, so a resumed run may skip it.
+
+        Vision files are final. A REST result is not while the day is still
+        inside the Vision delay window (the exchange is still adding rows, or
+        only the part up to now was fetched) or when the rate limit cut it short.
+        """
+        if source != "REST":
+            return True
+        return not df.attrs.get("_rate_limited") and not is_date_too_fresh_for_vision(task.day_end)
+
+    def _write_day(self, task: BackfillTask, df: pd.DataFrame, source: str) -> tuple[int, int]:
+        """Write one day to the cache.
+
+        Returns:
+            Tuple of (rows written, file size in bytes)
+
+        Raises:
+            OSError: If the cache file could not be written
+        """
+        df = df.copy()
+        df["_data_source"] = source
+        interval = Interval(task.interval)
+        if not save_to_cache(df, task.symbol, interval, self.market_type, self.cache_dir):
+            raise OSError(f"Cache write failed for {task.symbol} {task.interval} {task.day}")
+        path = get_vision_day_paths(task.symbol, task.day_start, task.day_start, interval, self.cache_dir, self.market_type)[0]
+        return len(df), path.stat().st_size
+
+    def _vision_client(self, task: BackfillTask) -> VisionDataClient:
+        """Vision client for the task's symbol and interval (one per pair, reused across days)."""
+        key = (task.symbol, task.interval)
+        with self._clients_lock:
+            client = self._vision_clients.get(key)
+            if client is None:
+                client = VisionDataClient(
+                    symbol=task.symbol, interval=task.interval, market_type=self.market_type, cache_dir=self.cache_dir
+                )
+                self._vision_clients[key] = client
+            return client
+
+    def _rest(self) -> RestDataClient:
+        """Shared REST client."""
+        with self._clients_lock:
+            if self._rest_client is None:
+                self._rest_client = RestDataClient(market_type=self.market_type)
+            return self._rest_client
+
+
+def backfill(
+    symbols: Sequence[str],
+    intervals: Sequence[Interval | str],
+    start: date,
+    end: date,
+    market_type: MarketType = MarketType.SPOT,
+    cache_dir: str | Path | None = None,
+    resume: bool = True,
+    force: bool = False,
+) -> BackfillReport:
+    """Plan and run a backfill with default pool sizes.
+
+    Args:
+        symbols: Symbols to backfill
+        intervals: Kline intervals
+        start: First day (inclusive)
+        end: Last day (inclusive)
+        market_type: Market type
+        cache_dir: Cache root (default: same as CryptoKlineVisionData)
+        resume: Skip days a previous run checkpointed as finished
+        force: Refetch days the cache already holds in full
+
+    Returns:
+        BackfillReport for the run
+    """
+    with BackfillEngine(market_type, cache_dir) as engine:
+        return engine.run(engine.plan(symbols, intervals, start, end, resume=resume, force=force))
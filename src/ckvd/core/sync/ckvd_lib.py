@@ -25,6 +25,7 @@ Example:
     ... )
 """
 
+from collections.abc import Sequence
 from datetime import datetime
 from time import perf_counter
 from typing import Literal, overload
@@ -58,6 +59,7 @@ def fetch_market_data(
     enforce_source: str = ...,
     max_retries: int = ...,
     return_polars: Literal[False] = ...,
+    columns: Sequence[str] | None = ...,
 ) -> tuple[pd.DataFrame | None, float, int]: ...
 
 
@@ -75,10 +77,11 @@ def fetch_market_data(
     enforce_source: str = ...,
     max_retries: int = ...,
     return_polars: Literal[True] = ...,
+    columns: Sequence[str] | None = ...,
 ) -> tuple[pl.DataFrame | None, float, int]: ...
 
 
-def fetch_market_data(
+def fetch_market_data(  # noqa: PLR0913, PLR0917
     provider: DataProvider,
     market_type: MarketType,
     chart_type: ChartType,
@@ -91,6 +94,7 @@ def fetch_market_data(
     enforce_source: str = "AUTO",
     max_retries: int = 3,
     return_polars: bool = False,
+    columns: Sequence[str] | None = None,
 ) -> tuple[pd.DataFrame | pl.DataFrame | None, float, int]:
     """Fetch market data using the Failover Control Protocol.
 
@@ -115,6 +119,8 @@ def fetch_market_data(
         return_polars: Whether to return a Polars DataFrame instead of Pandas.
                       When True, returns pl.DataFrame via zero-copy path.
                       When False (default), returns pd.DataFrame for backward compatibility.
+        columns: Optional subset of kline columns to return (``open_time`` is always included).
+                 See ``CryptoKlineVisionData.get_data`` for how the projection is pushed down.
 
     Returns:
         Tuple containing:
@@ -154,6 +160,7 @@ def fetch_market_data(
             chart_type=chart_type,
             enforce_source=enforce_source_enum,
             return_polars=return_polars,
+            columns=columns,
         )
 
     elapsed_time = perf_counter() - start_time_perf
@@ -12,13 +12,14 @@ from __future__ import annotations
 
 import os
 from collections.abc import Sequence
+from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
 from typing import TypeVar
 
 import attr
 
-from ckvd.utils.market_constraints import ChartType, DataProvider, MarketType
+from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
 
 # Default HTTP timeout in seconds
 DEFAULT_HTTP_TIMEOUT = 30.0
@@ -26,6 +27,7 @@ DEFAULT_HTTP_TIMEOUT = 30.0
 __all__ = [
     "CKVDConfig",
     "DataSource",
+    "FCPRequest",
 ]
 
 
@@ -83,6 +85,10 @@ class CKVDConfig:
             Default is True. Set to False to skip Vision API (e.g., for OKX which has no Vision).
         fcp_priority: FCP data source priority order.
             Default is [CACHE, VISION, REST]. Customize for different fallback behavior.
+        wait_on_rate_limit: Whether REST fetches pause for the rate limit and resume.
+            Default is False (a rate-limited fetch returns partial data).
+        rest_resume_dir: Directory for REST resume tokens.
+            Default is None (interrupted REST fetches start over).
 
     Example:
         >>> from ckvd import DataProvider, MarketType, ChartType
@@ -151,6 +157,14 @@ class CKVDConfig:
         factory=lambda: [DataSource.CACHE, DataSource.VISION, DataSource.REST],
     )
 
+    # REST rate-limit handling
+    wait_on_rate_limit: bool = attr.field(default=False, validator=attr.validators.instance_of(bool))
+    rest_resume_dir: Path | None = attr.field(
+        default=None,
+        validator=attr.validators.optional(attr.validators.instance_of(Path)),
+        converter=lambda p: Path(p) if p is not None and not isinstance(p, Path) else p,  # type: ignore[arg-type]
+    )
+
     @classmethod
     def create(cls: type[T], provider: DataProvider, market_type: MarketType, **kwargs) -> T:
         """Create a CKVDConfig with the given provider, market_type and optional overrides.
@@ -189,3 +203,53 @@ class CKVDConfig:
             ... )
         """
         return cls(market_type=market_type, provider=provider, **kwargs)
+
+
+@attr.define(slots=True, frozen=True)
+class FCPRequest:
+    """A validated ``get_data`` request as it moves through the FCP steps.
+
+    Built once after validation and time alignment so the cache step, the
+    source steps and the final standardization (shared by the sync and async
+    managers) see the same parameters.
+
+    Attributes:
+        symbol: Upper-cased, validated symbol
+        start_time: Start time as requested by the caller
+        end_time: End time as requested by the caller
+        aligned_start: Start time the FCP fetches from (interval-aligned when auto_reindex)
+        aligned_end: End time the FCP fetches to (interval-aligned when auto_reindex)
+        interval: Kline interval
+        chart_type: Chart type
+        include_source_info: Whether to keep the ``_data_source`` column
+        enforce_source: Source restriction
+        auto_reindex: Whether to reindex to a complete time series
+        return_polars: Whether to return a Polars DataFrame
+        columns: Resolved column projection, or None for all columns
+        dtype_backend: pandas dtype backend of the result
+        schema_profile: Column types of the result ("standard" or "compact")
+    """
+
+    symbol: str
+    start_time: datetime
+    end_time: datetime
+    aligned_start: datetime
+    aligned_end: datetime
+    interval: Interval
+    chart_type: ChartType
+    include_source_info: bool = True
+    enforce_source: DataSource = DataSource.AUTO
+    auto_reindex: bool = True
+    return_polars: bool = False
+    columns: Sequence[str] | None = None
+    dtype_backend: str = "numpy"
+    schema_profile: str = "standard"
+
+    @property
+    def pipeline_output(self) -> bool:
+        """Whether the result is built from the Polars pipeline instead of the merged pandas frame.
+
+        Polars, Arrow-backed and compact results are collected from the pipeline;
+        only the standard NumPy-backed result goes through ``standardize_columns``.
+        """
+        return self.return_polars or self.dtype_backend == "pyarrow" or self.schema_profile == "compact"
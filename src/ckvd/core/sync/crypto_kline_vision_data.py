@@ -34,26 +34,36 @@ Example:
     ... )
 """
 
+from __future__ import annotations
+
 import os
-from datetime import datetime
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Literal, overload
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
 
 import pandas as pd
-import polars as pl
 
 from ckvd.core.providers import ProviderClients, get_provider_clients, get_supported_providers
 from ckvd.core.providers.binance.binance_funding_rate_client import BinanceFundingRateClient
-from ckvd.core.sync.ckvd_types import CKVDConfig, DataSource
+from ckvd.core.sync.ckvd_types import CKVDConfig, DataSource, FCPRequest
 from ckvd.utils.app_paths import get_cache_dir
 from ckvd.utils.config import (
+    CANONICAL_INDEX_NAME,
+    DEFAULT_COLUMN_ORDER,
     FUNDING_RATE_DTYPES,
     OUTPUT_DTYPES,
     REST_CHUNK_SIZE,
     REST_MAX_CHUNKS,
     VISION_DATA_DELAY_HOURS,
+    VISION_LOCK_BATCH_DAYS,
     create_empty_dataframe,
 )
+from ckvd.utils.dataframe_utils import project_columns, resolve_columns
 from ckvd.utils.for_core.ckvd_api_utils import (
     fetch_from_rest,
     fetch_from_vision,
@@ -70,16 +80,25 @@ from ckvd.utils.for_core.ckvd_fcp_utils import (
     verify_final_data,
 )
 from ckvd.utils.for_core.ckvd_time_range_utils import (
+    merge_dataframes,
+    split_time_range,
     standardize_columns,
 )
 from ckvd.utils.for_core.rest_exceptions import RateLimitError, RestAPIError
 from ckvd.utils.for_core.vision_exceptions import VisionAPIError
-from ckvd.utils.internal.polars_pipeline import PolarsDataPipeline
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market.validation import _SYMBOL_SAFE_PATTERN
 from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
 from ckvd.utils.time_utils import align_time_boundaries
 
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
+
+    from ckvd.core.sync.panel import PanelMatrix
+    from ckvd.core.sync.plan import FCPPlan
+    from ckvd.utils.internal.polars_pipeline import DtypeBackend, PolarsDataPipeline, SchemaProfile
+
 # Re-export for backward compatibility
 __all__ = [
     "CKVDConfig",
@@ -92,6 +111,55 @@ __all__ = [
 # The factory pattern in core.providers registers supported providers
 SUPPORTED_PROVIDERS: frozenset[DataProvider] = get_supported_providers()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _prefetched(fetch: Callable[[T], R], items: Sequence[T], prefetch: int) -> Iterator[R]:
+    """Yield ``fetch(item)`` in order, keeping up to ``prefetch`` fetches ahead.
+
+    Fetches run one at a time on a single background thread (the manager's
+    clients are not shared between concurrent calls); only the window of
+    pending results is held in memory. Closing the iterator early cancels the
+    fetches not yet started and waits for the one in progress.
+    """
+    if prefetch < 0:
+        raise ValueError(f"prefetch must be >= 0, got {prefetch}")
+    if prefetch == 0:
+        for item in items:
+            yield fetch(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ckvd-prefetch")
+    remaining = iter(items)
+    pending: deque[Future[R]] = deque(executor.submit(fetch, item) for item in islice(remaining, prefetch))
+    try:
+        while pending:
+            result = pending.popleft().result()
+            # Top the window up before handing the current result to the consumer
+            for item in islice(remaining, 1):
+                pending.append(executor.submit(fetch, item))
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _day_batches(start_time: datetime, end_time: datetime, interval: Interval, days: int) -> Iterator[tuple[datetime, datetime]]:
+    """Split a range into consecutive sub-ranges covering at most ``days`` UTC days each.
+
+    Each batch except the last ends one bar (at most a day) before the next
+    starts, so the Vision day expansion of one batch never reaches into the next.
+    """
+    step = timedelta(seconds=min(interval.to_seconds(), 86400))
+    batch_start = start_time
+    while True:
+        boundary = batch_start.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=days)
+        if boundary > end_time:
+            yield batch_start, end_time
+            return
+        yield batch_start, boundary - step
+        batch_start = boundary
+
 
 class CryptoKlineVisionData:
     """Mediator between data sources with smart selection and caching.
@@ -245,6 +313,8 @@ class CryptoKlineVisionData:
                 - log_level: Logging level for CKVD operations (default: 'WARNING')
                 - suppress_http_debug: Whether to suppress HTTP debug logging (default: True)
                 - quiet_mode: Whether to suppress all non-error logging (default: False)
+                - wait_on_rate_limit: Pause for the REST rate limit and resume (default: False)
+                - rest_resume_dir: Directory for REST resume tokens (default: None)
 
         Returns:
             CryptoKlineVisionData: Initialized CryptoKlineVisionData instance
@@ -304,7 +374,7 @@ class CryptoKlineVisionData:
         # Use the configured default market type if none provided
         if market_type is None:
             market_type = cls.DEFAULT_MARKET_TYPE
-            logger.debug(f"Using default market type: {market_type.name}")
+            logger.debug("Using default market type: {}", market_type.name)
 
         config = CKVDConfig.create(provider, market_type, **kwargs)
         return cls(
@@ -317,6 +387,8 @@ class CryptoKlineVisionData:
             log_level=config.log_level,
             suppress_http_debug=config.suppress_http_debug,
             quiet_mode=config.quiet_mode,
+            wait_on_rate_limit=config.wait_on_rate_limit,
+            rest_resume_dir=config.rest_resume_dir,
         )
 
     def __init__(
@@ -330,6 +402,8 @@ class CryptoKlineVisionData:
         log_level: str = "WARNING",
         suppress_http_debug: bool = True,
         quiet_mode: bool = False,
+        wait_on_rate_limit: bool = False,
+        rest_resume_dir: Path | None = None,
     ) -> None:
         """Initialize CryptoKlineVisionData.
 
@@ -343,6 +417,11 @@ class CryptoKlineVisionData:
             log_level: Logging level for CKVD operations ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
             suppress_http_debug: Whether to suppress HTTP debug logging (default: True)
             quiet_mode: Whether to suppress all non-error logging (default: False)
+            wait_on_rate_limit: When the REST API rate-limits a fetch, pause as long as it
+                asks and resume from the next unfetched chunk instead of returning partial
+                data flagged ``_rate_limited`` (default: False)
+            rest_resume_dir: Directory for REST resume tokens. Completed REST chunks are
+                persisted there so a restarted job continues where it stopped (default: None)
         """
         self.provider = provider
         self.market_type = market_type
@@ -353,6 +432,8 @@ class CryptoKlineVisionData:
             self.use_cache = False
             logger.info("[CKVD] Cache disabled via CKVD_ENABLE_CACHE environment variable")
         self.retry_count = retry_count
+        self.wait_on_rate_limit = wait_on_rate_limit
+        self.rest_resume_dir = Path(rest_resume_dir) if rest_resume_dir is not None else None
 
         # Store logging configuration
         self.log_level = log_level.upper()
@@ -380,19 +461,41 @@ class CryptoKlineVisionData:
                 cache_dir=self.cache_dir,
                 retry_count=self.retry_count,
             )
-            logger.info(f"Initialized provider clients for {self.provider.name}")
+            logger.info("Initialized provider clients for {}", self.provider.name)
         except ValueError as e:
             # Re-raise with context - this should not happen if create() validated
             raise ValueError(f"Failed to initialize provider clients: {e}") from e
 
-        # Extract clients for backward compatibility with existing code paths
-        self.cache_manager = self._provider_clients.cache  # Cache manager
-        self.rest_client = self._provider_clients.rest  # REST API client
-        self.vision_client = self._provider_clients.vision  # Vision API client (None for OKX)
+        # Clients are built by the factory on first access (see the properties below)
+        if self.use_cache:
+            logger.debug("Cache manager available via factory pattern")
+
+    @property
+    def cache_manager(self) -> Any:
+        """Cache manager from the provider factory."""
+        return self._provider_clients.cache
+
+    @cache_manager.setter
+    def cache_manager(self, client: Any) -> None:
+        self._provider_clients.cache = client
 
-        # Log cache status
-        if self.use_cache and self.cache_manager is not None:
-            logger.debug("Cache manager initialized via factory pattern")
+    @property
+    def rest_client(self) -> Any:
+        """REST API client, created on first use."""
+        return self._provider_clients.rest
+
+    @rest_client.setter
+    def rest_client(self, client: Any) -> None:
+        self._provider_clients.rest = client
+
+    @property
+    def vision_client(self) -> Any:
+        """Vision API client, created on first use (None for providers without Vision, e.g. OKX)."""
+        return self._provider_clients.vision
+
+    @vision_client.setter
+    def vision_client(self, client: Any) -> None:
+        self._provider_clients.vision = client
 
     def _configure_logging(self) -> None:
         """Configure logging levels based on user preferences.
@@ -416,7 +519,7 @@ class CryptoKlineVisionData:
 
         # Log the configuration for debugging
         if not self.quiet_mode:
-            logger.debug(f"CKVD logging configured: level={effective_level}, suppress_http_debug={self.suppress_http_debug}")
+            logger.debug("CKVD logging configured: level={}, suppress_http_debug={}", effective_level, self.suppress_http_debug)
 
     def reconfigure_logging(
         self, log_level: str | None = None, suppress_http_debug: bool | None = None, quiet_mode: bool | None = None
@@ -492,7 +595,7 @@ class CryptoKlineVisionData:
             # Return empty DataFrame and the entire date range as missing
             return create_empty_dataframe(), [(start_time, end_time)]
 
-        logger.info(f"Checking cache for {symbol} from {start_time} to {end_time}")
+        logger.info("Checking cache for {} from {} to {}", symbol, start_time, end_time)
 
         # Use cache utils for Arrow file operations
         return get_from_cache(
@@ -540,12 +643,12 @@ class CryptoKlineVisionData:
             logger.warning(f"Empty DataFrame for {symbol} - skipping cache save")
             return
 
-        logger.info(f"Saving {len(df)} records for {symbol} to cache")
+        logger.info("Saving {} records for {} to cache", len(df), symbol)
 
         # Track the source of the data for future source-specific optimizations
         # Currently not used in the underlying implementation but preserved for telemetry
         if source:
-            logger.debug(f"Data source for cache: {source}")
+            logger.debug("Data source for cache: {}", source)
 
         # Use cache utils for Arrow file operations
         save_to_cache(
@@ -558,7 +661,14 @@ class CryptoKlineVisionData:
             provider=self.provider,
         )
 
-    def _fetch_from_vision(self, symbol: str, start_time: datetime, end_time: datetime, interval: Interval) -> pd.DataFrame:
+    def _fetch_from_vision(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
         """Fetch data from the Binance Vision API.
 
         This method is part of the FCP's second phase - retrieving data from
@@ -568,11 +678,18 @@ class CryptoKlineVisionData:
         The Vision API provides highly efficient access to historical data through
         pre-generated files hosted on AWS S3, avoiding REST API rate limits.
 
+        With caching enabled, concurrent fetches of the same days (from other
+        threads or from other processes sharing ``cache_dir``) are coalesced:
+        one worker downloads and caches the days while the others wait on
+        advisory locks and then read the cached files. Long ranges are locked
+        and fetched in batches of VISION_LOCK_BATCH_DAYS days.
+
         Args:
             symbol: Symbol to retrieve data for (e.g., "BTCUSDT")
             start_time: Start time for data retrieval (UTC)
             end_time: End time for data retrieval (UTC)
             interval: Time interval between data points (e.g., MINUTE_1)
+            columns: Optional column projection (see ``get_data``)
 
         Returns:
             pd.DataFrame: DataFrame with data from Vision API (may be empty if no data available)
@@ -585,11 +702,11 @@ class CryptoKlineVisionData:
         # Vision client is initialized via factory pattern in __init__
         # For providers without Vision API (e.g., OKX), vision_client will be None
         if self.vision_client is None:
-            logger.debug(f"Provider {self.provider.name} does not have Vision API, returning empty DataFrame")
+            logger.debug("Provider {} does not have Vision API, returning empty DataFrame", self.provider.name)
             return create_empty_dataframe()
 
-        # Call the extracted utility function
-        return fetch_from_vision(
+        fetch = partial(
+            fetch_from_vision,
             symbol=symbol,
             start_time=start_time,
             end_time=end_time,
@@ -598,9 +715,45 @@ class CryptoKlineVisionData:
             chart_type=self.chart_type,
             use_cache=self.use_cache,
             save_to_cache_func=self._save_to_cache if self.use_cache else None,
+            columns=columns,
         )
+        if not self.use_cache or self.cache_dir is None:
+            return fetch()
+
+        from ckvd.utils.cache.single_flight import cache_file_locks
+        from ckvd.utils.for_core.ckvd_cache_utils import get_vision_day_paths
+
+        # Lock and fetch at most VISION_LOCK_BATCH_DAYS days at a time, so a
+        # multi-year request holds a bounded number of lock files and workers
+        # with overlapping ranges only wait for the days they share
+        parts = []
+        for batch_start, batch_end in _day_batches(start_time, end_time, interval, VISION_LOCK_BATCH_DAYS):
+            day_paths = get_vision_day_paths(symbol, batch_start, batch_end, interval, self.cache_dir, self.market_type, self.chart_type)
+            with cache_file_locks(self.cache_dir, day_paths):
+                part = None
+                if all(path.exists() for path in day_paths):
+                    # Another worker may have cached these days while we waited
+                    cached_df, missing_ranges = self._get_from_cache(symbol, batch_start, batch_end, interval)
+                    if not cached_df.empty and not missing_ranges:
+                        logger.info("[FCP] {} was cached by a concurrent fetch; skipping Vision download", symbol)
+                        part = project_columns(cached_df, columns)
+                if part is None:
+                    part = fetch(start_time=batch_start, end_time=batch_end)
+            if not part.empty:
+                parts.append(part)
+
+        if not parts:
+            return create_empty_dataframe()
+        return parts[0] if len(parts) == 1 else merge_dataframes(parts, columns=columns)
 
-    def _fetch_from_rest(self, symbol: str, start_time: datetime, end_time: datetime, interval: Interval) -> pd.DataFrame:
+    def _fetch_from_rest(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
         """Fetch data from the Binance REST API.
 
         This method is part of the FCP's third phase - retrieving data directly
@@ -615,6 +768,8 @@ class CryptoKlineVisionData:
             start_time: Start time for data retrieval (UTC)
             end_time: End time for data retrieval (UTC)
             interval: Time interval between data points (e.g., MINUTE_1)
+            columns: Optional column projection. Ignored while caching is enabled
+                because REST results are written to the cache with every column.
 
         Returns:
             pd.DataFrame: DataFrame with data from REST API
@@ -633,6 +788,56 @@ class CryptoKlineVisionData:
             interval=interval,
             rest_client=self.rest_client,
             chart_type=self.chart_type,
+            columns=None if self.use_cache else columns,
+            wait_on_rate_limit=self.wait_on_rate_limit,
+            resume_token=self._rest_resume_token(symbol, start_time, end_time, interval),
+        )
+
+    def _rest_resume_token(self, symbol: str, start_time: datetime, end_time: datetime, interval: Interval) -> Path | None:
+        """Resume token file of one REST range (shared by the sync and async managers).
+
+        Args:
+            symbol: Symbol of the fetch
+            start_time: Start of the range as requested from the REST step
+            end_time: End of the range as requested from the REST step
+            interval: Kline interval
+
+        Returns:
+            Path of the token, or None when ``rest_resume_dir`` is not set
+        """
+        if self.rest_resume_dir is None:
+            return None
+        range_key = f"{int(start_time.timestamp() * 1000)}_{int(end_time.timestamp() * 1000)}"
+        return self.rest_resume_dir / f"{self.market_type.name.lower()}_{symbol}_{interval.value}_{range_key}.jsonl"
+
+    def _create_funding_client(self, symbol: str, interval: Interval = Interval.HOUR_8) -> BinanceFundingRateClient:
+        """Create a funding rate client sharing this manager's cache settings.
+
+        Args:
+            symbol: Trading symbol the client defaults to
+            interval: Funding rate interval (default: HOUR_8, standard for Binance)
+
+        Returns:
+            BinanceFundingRateClient (the caller closes it)
+
+        Raises:
+            ValueError: If market type doesn't support funding rates
+        """
+        # Validate market type - funding rates only available for futures
+        if self.market_type not in (MarketType.FUTURES_USDT, MarketType.FUTURES_COIN):
+            raise ValueError(
+                f"Funding rate data is only available for futures markets. "
+                f"Current market type: {self.market_type.name}. "
+                f"Use FUTURES_USDT or FUTURES_COIN instead."
+            )
+
+        return BinanceFundingRateClient(
+            symbol=symbol,
+            interval=interval,
+            market_type=self.market_type,
+            use_cache=self.use_cache,
+            cache_dir=self.cache_dir,
+            retry_count=self.retry_count,
         )
 
     def _fetch_funding_rate(
@@ -665,25 +870,10 @@ class CryptoKlineVisionData:
         Raises:
             ValueError: If market type doesn't support funding rates
         """
-        # Validate market type - funding rates only available for futures
-        if self.market_type not in (MarketType.FUTURES_USDT, MarketType.FUTURES_COIN):
-            raise ValueError(
-                f"Funding rate data is only available for futures markets. "
-                f"Current market type: {self.market_type.name}. "
-                f"Use FUTURES_USDT or FUTURES_COIN instead."
-            )
-
-        logger.info(f"[FCP] Fetching funding rate for {symbol} from {start_time} to {end_time}")
+        logger.info("[FCP] Fetching funding rate for {} from {} to {}", symbol, start_time, end_time)
 
         # Create funding rate client
-        funding_client = BinanceFundingRateClient(
-            symbol=symbol,
-            interval=interval,
-            market_type=self.market_type,
-            use_cache=self.use_cache,
-            cache_dir=self.cache_dir,
-            retry_count=self.retry_count,
-        )
+        funding_client = self._create_funding_client(symbol, interval)
 
         try:
             # Fetch funding rate data
@@ -694,12 +884,14 @@ class CryptoKlineVisionData:
                 end_time=end_time,
             )
 
-            logger.info(f"[FCP] Retrieved {len(result_df)} funding rate records for {symbol}")
+            logger.info("[FCP] Retrieved {} funding rate records for {}", len(result_df), symbol)
 
             # Convert to Polars if requested
             if return_polars and not result_df.empty:
+                import polars as pl
+
                 result_pl = pl.from_pandas(result_df)
-                logger.debug(f"[FCP] Converted funding rate to Polars DataFrame with {len(result_pl)} rows")
+                logger.debug("[FCP] Converted funding rate to Polars DataFrame with {} rows", len(result_pl))
                 return result_pl
 
             return result_df
@@ -720,6 +912,9 @@ class CryptoKlineVisionData:
         enforce_source: DataSource = ...,
         auto_reindex: bool = ...,
         return_polars: Literal[False] = ...,
+        columns: Sequence[str] | None = ...,
+        dtype_backend: DtypeBackend = ...,
+        schema_profile: SchemaProfile = ...,
     ) -> pd.DataFrame: ...
 
     @overload
@@ -734,6 +929,9 @@ class CryptoKlineVisionData:
         enforce_source: DataSource = ...,
         auto_reindex: bool = ...,
         return_polars: Literal[True] = ...,
+        columns: Sequence[str] | None = ...,
+        dtype_backend: DtypeBackend = ...,
+        schema_profile: SchemaProfile = ...,
     ) -> pl.DataFrame: ...
 
     def get_data(
@@ -747,6 +945,9 @@ class CryptoKlineVisionData:
         enforce_source: DataSource = DataSource.AUTO,
         auto_reindex: bool = True,
         return_polars: bool = False,
+        columns: Sequence[str] | None = None,
+        dtype_backend: DtypeBackend = "numpy",
+        schema_profile: SchemaProfile = "standard",
     ) -> pd.DataFrame | pl.DataFrame:
         """Retrieve market data for a symbol within a specified time range.
 
@@ -778,6 +979,24 @@ class CryptoKlineVisionData:
             return_polars: Whether to return a Polars DataFrame instead of Pandas.
                          When True, returns pl.DataFrame for better performance.
                          When False (default), returns pd.DataFrame for backward compatibility.
+            columns: Optional subset of kline columns to return (e.g. ``["close", "volume"]``).
+                         ``open_time`` is always included. The projection is pushed into the
+                         cache scan, the Vision CSV reader (when not caching) and the merge
+                         steps, so memory and conversion cost scale with the columns requested.
+                         Cache files are always written with every column.
+            dtype_backend: Backing for the pandas result. "numpy" (default) returns the
+                         classic NumPy dtypes. "pyarrow" returns ``pd.ArrowDtype`` columns
+                         wrapping the merged Polars/Arrow buffers, skipping the NumPy
+                         conversion, dtype casts and index rebuilds (see
+                         ``docs/design/2025-01-30-failover-control-protocol/spec.md``
+                         for the dtype contract). Ignored when return_polars=True.
+            schema_profile: Column types of the result. "standard" (default) returns
+                         float64 prices/volumes, int64 counts, microsecond (pyarrow/Polars)
+                         or nanosecond (NumPy) timestamps and string ``_data_source``.
+                         "compact" returns float32 prices/volumes, int32 counts,
+                         millisecond timestamps and a categorical/Enum ``_data_source``,
+                         roughly halving the result; the casts are applied in the cache
+                         scan plan. Float32 keeps about 7 significant digits.
 
         Returns:
             pd.DataFrame or pl.DataFrame (based on return_polars parameter) containing
@@ -790,9 +1009,11 @@ class CryptoKlineVisionData:
             - taker_buy_volume: Taker buy volume
             - taker_buy_quote_volume: Taker buy quote volume
             - _data_source: Source of each record (if include_source_info=True)
+            When ``columns`` is given, only ``open_time``, the requested columns and
+            ``_data_source`` are returned.
 
         Raises:
-            ValueError: If start_time >= end_time or invalid parameters
+            ValueError: If start_time >= end_time, unknown columns or invalid parameters
             RuntimeError: If all data sources fail and no data can be retrieved
 
         Examples:
@@ -822,6 +1043,25 @@ class CryptoKlineVisionData:
             ...     return_polars=True
             ... )
             >>> print(type(df_polars))  # <class 'polars.dataframe.frame.DataFrame'>
+            >>>
+            >>> # Arrow-backed pandas output without a NumPy copy
+            >>> df = manager.get_data(
+            ...     "BTCUSDT", start_time, end_time, Interval.MINUTE_1,
+            ...     dtype_backend="pyarrow"
+            ... )
+            >>> df["close"].dtype  # double[pyarrow]
+            >>>
+            >>> # Only decode and return the columns you need
+            >>> df = manager.get_data(
+            ...     "BTCUSDT", start_time, end_time, Interval.MINUTE_1,
+            ...     columns=["close", "volume"]
+            ... )
+            >>>
+            >>> # Float32/Int32 columns and a categorical source for large ranges
+            >>> df = manager.get_data(
+            ...     "BTCUSDT", start_time, end_time, Interval.MINUTE_1,
+            ...     return_polars=True, schema_profile="compact"
+            ... )
 
         Note:
             When the current time is close to end_time, Vision API data may not be
@@ -839,6 +1079,8 @@ class CryptoKlineVisionData:
         # Route to funding rate handler if chart_type is FUNDING_RATE
         # This uses a separate data path since funding rates have different structure
         if chart_type == ChartType.FUNDING_RATE:
+            if columns is not None:
+                raise ValueError("columns is only supported for kline chart types, not FUNDING_RATE")
             return self._fetch_funding_rate(
                 symbol=symbol,
                 start_time=start_time,
@@ -847,6 +1089,12 @@ class CryptoKlineVisionData:
                 return_polars=return_polars,
             )
 
+        # Validate the projection up front (open_time is always included)
+        columns = resolve_columns(columns)
+
+        # Initialize result DataFrame to hold progressively merged data
+        result_df = pd.DataFrame()
+
         try:
             # Validate interval against market type
             validate_interval(self.market_type, interval)
@@ -866,276 +1114,74 @@ class CryptoKlineVisionData:
                 f"[FCP] get_data called with use_cache={self.use_cache}, auto_reindex={auto_reindex} for "
                 f"symbol={symbol}, interval={interval.value}, chart_type={chart_type.name}"
             )
-            logger.debug(f"[FCP] Time range: {start_time.isoformat()} to {end_time.isoformat()}")
-
-            # Validate time range
-            if start_time >= end_time:
-                raise ValueError(f"start_time ({start_time}) must be before end_time ({end_time})")
-
-            # Normalize symbol to upper case
-            symbol = symbol.upper()
-
-            # Security: defense-in-depth path traversal prevention (CWE-22, GitHub #21)
-            if not _SYMBOL_SAFE_PATTERN.match(symbol):
-                raise ValueError(f"Symbol contains invalid characters: '{symbol}'")
-
-            # FAIL-LOUD: Validate symbol availability before any API calls (GitHub Issue #10)
-            from ckvd.utils.for_core.vision_exceptions import DataNotAvailableError
-            from ckvd.utils.validation.availability_data import (
-                check_futures_counterpart_availability,
-                is_symbol_available_at,
+            logger.debug("[FCP] Time range: {} to {}", start_time.isoformat(), end_time.isoformat())
+
+            request = self._prepare_request(
+                symbol,
+                start_time,
+                end_time,
+                interval,
+                chart_type,
+                include_source_info=include_source_info,
+                enforce_source=enforce_source,
+                auto_reindex=auto_reindex,
+                return_polars=return_polars,
+                columns=columns,
+                dtype_backend=dtype_backend,
+                schema_profile=schema_profile,
             )
+            symbol = request.symbol
 
-            is_available, earliest_date = is_symbol_available_at(self.market_type, symbol, start_time)
-            if not is_available and earliest_date is not None:
-                raise DataNotAvailableError(
-                    symbol=symbol,
-                    market_type=self.market_type.name,
-                    requested_start=start_time,
-                    earliest_available=earliest_date,
-                )
-
-            # CROSS-MARKET WARNING: Check futures counterpart availability (for SPOT requests)
-            futures_warning = check_futures_counterpart_availability(self.market_type, symbol, start_time)
-            if futures_warning:
-                # Console warning (loud) - stderr for visibility
-                import sys
-
-                print(
-                    f"\n\u26a0\ufe0f  FUTURES COUNTERPART WARNING: {futures_warning.message}\n",
-                    file=sys.stderr,
-                )
-                # Log for telemetry
-                logger.warning(
-                    f"[FCP] Futures counterpart unavailable: {futures_warning.message}",
-                    extra={
-                        "event_type": "futures_counterpart_unavailable",
-                        "futures_market": futures_warning.futures_market,
-                        "futures_earliest": futures_warning.earliest_date.isoformat(),
-                        "requested_start": start_time.isoformat(),
-                    },
-                )
-
-            # Log key parameters
-            logger.info(f"Retrieving {interval.value} data for {symbol} from {start_time} to {end_time}")
-
-            # CRITICAL FIX: Use different alignment strategies based on auto_reindex
-            if auto_reindex:
-                # When auto_reindex=True, align boundaries to ensure complete time series
-                aligned_start, aligned_end = align_time_boundaries(start_time, end_time, interval)
-                logger.debug(f"[FCP] Aligned boundaries for complete time series: {aligned_start} to {aligned_end}")
-            else:
-                # When auto_reindex=False, use exact user boundaries to prevent artificial gaps
-                aligned_start, aligned_end = start_time, end_time
-                logger.debug(f"[FCP] Using exact user boundaries (auto_reindex=False): {aligned_start} to {aligned_end}")
-
-            # Initialize result DataFrame to hold progressively merged data
-            result_df = pd.DataFrame()
-            missing_ranges = []
+            # The plan decides which steps run (see plan()/explain())
+            plan = self._build_plan(request)
 
             # Polars pipeline is always active for internal processing
+            # (imported here: Polars is only loaded once data is requested)
+            from ckvd.utils.internal.polars_pipeline import PolarsDataPipeline
+
+            polars_pipeline = PolarsDataPipeline(schema_profile=request.schema_profile)
 
             # ----------------------------------------------------------------
             # STEP 1: Local Cache Retrieval
             # ----------------------------------------------------------------
-            if enforce_source == DataSource.CACHE and not self.use_cache:
-                raise ValueError(
-                    "Cannot use enforce_source=DataSource.CACHE when use_cache=False. "
-                    "Either enable caching or use a different data source."
-                )
-
-            skip_cache = not self.use_cache or enforce_source in (
-                DataSource.REST,
-                DataSource.VISION,
-            )
-
-            # Initialize Polars pipeline for internal processing
-            polars_pipeline = PolarsDataPipeline()
-
-            if not skip_cache:
-                # Use Polars LazyFrame-based cache retrieval
-                from ckvd.utils.for_core.ckvd_cache_utils import get_cache_lazyframes
-
-                logger.info(f"[FCP] STEP 1: Checking local cache for {symbol}")
-                cache_lazyframes = get_cache_lazyframes(
-                    symbol=symbol,
-                    start_time=aligned_start,
-                    end_time=aligned_end,
-                    interval=interval,
-                    cache_dir=self.cache_dir,
-                    market_type=self.market_type,
-                    chart_type=chart_type,
-                )
-
-                if cache_lazyframes:
-                    for lf in cache_lazyframes:
-                        polars_pipeline.add_source(lf, "CACHE")
-                    logger.info(f"[FCP] Cache contributed {len(cache_lazyframes)} LazyFrame(s) to pipeline")
-
-                    # Still need to identify missing ranges for Vision/REST steps
-                    # Collect cache data to check coverage
-                    cache_df = polars_pipeline.collect_pandas(use_streaming=True)
-                    if not cache_df.empty:
-                        from ckvd.utils.for_core.ckvd_time_range_utils import identify_missing_segments
-
-                        missing_ranges = identify_missing_segments(cache_df, aligned_start, aligned_end, interval)
-                        result_df = cache_df
-                    else:
-                        missing_ranges = [(aligned_start, aligned_end)]
-                else:
-                    missing_ranges = [(aligned_start, aligned_end)]
-                    logger.debug(f"[FCP] No cache data available, entire range marked as missing: {aligned_start} to {aligned_end}")
-            else:
-                if enforce_source == DataSource.REST:
-                    logger.info("[FCP] Cache check skipped due to enforce_source=REST")
-                elif enforce_source == DataSource.VISION:
-                    logger.info("[FCP] Cache check skipped due to enforce_source=VISION")
-                else:
-                    logger.info("[FCP] Cache disabled, skipping cache check")
-
-                # If cache is disabled, treat entire range as missing
-                missing_ranges = [(aligned_start, aligned_end)]
-
-            # CRITICAL FIX: When auto_reindex=False and we have some data, don't fetch missing ranges
-            if not auto_reindex and not result_df.empty:
-                logger.info(f"[FCP] auto_reindex=False: Found {len(result_df)} cached records, skipping API calls to prevent NaN creation")
-                missing_ranges = []  # Clear missing ranges to prevent API calls
+            result_df, missing_ranges = self._read_cache(plan, polars_pipeline)
 
             # ----------------------------------------------------------------
             # STEP 2: Vision API Retrieval with Iterative Merge
             # ----------------------------------------------------------------
-            if enforce_source != DataSource.REST and missing_ranges:
+            if plan.use_vision and missing_ranges:
                 result_df, missing_ranges = process_vision_step(
-                    fetch_from_vision_func=self._fetch_from_vision,
+                    fetch_from_vision_func=partial(self._fetch_from_vision, columns=columns),
                     symbol=symbol,
                     missing_ranges=missing_ranges,
                     interval=interval,
                     include_source_info=include_source_info,
                     result_df=result_df,
+                    columns=columns,
                 )
 
                 # Add Vision data to Polars pipeline for final merge
-                if not result_df.empty and "_data_source" in result_df.columns:
-                    vision_df = result_df[result_df["_data_source"] == "VISION"]
-                    if not vision_df.empty:
-                        polars_pipeline.add_pandas(vision_df, "VISION")
+                self._track_source(polars_pipeline, result_df, "VISION")
 
             # ----------------------------------------------------------------
             # STEP 3: REST API Fallback with Final Merge
             # ----------------------------------------------------------------
-            if missing_ranges and enforce_source != DataSource.VISION:
+            if missing_ranges and plan.use_rest:
                 result_df = process_rest_step(
-                    fetch_from_rest_func=self._fetch_from_rest,
+                    fetch_from_rest_func=partial(self._fetch_from_rest, columns=columns),
                     symbol=symbol,
                     missing_ranges=missing_ranges,
                     interval=interval,
                     include_source_info=include_source_info,
                     result_df=result_df,
                     save_to_cache_func=self._save_to_cache if self.use_cache else None,
+                    columns=columns,
                 )
 
                 # Add REST data to Polars pipeline for final merge
-                if not result_df.empty and "_data_source" in result_df.columns:
-                    rest_only_df = result_df[result_df["_data_source"] == "REST"]
-                    if not rest_only_df.empty:
-                        polars_pipeline.add_pandas(rest_only_df, "REST")
-
-            # ----------------------------------------------------------------
-            # Final check and standardization
-            # ----------------------------------------------------------------
-            verify_final_data(result_df, aligned_start, aligned_end)
-
-            # First standardize columns to ensure consistent data types and format
-            result_df = standardize_columns(result_df)
-
-            # CRITICAL FIX: Filter to user's exact time range when auto_reindex=False
-            if not auto_reindex and not result_df.empty:
-                # Filter the result to the user's exact requested time range
-                from ckvd.utils.time_utils import filter_dataframe_by_time
-
-                original_length = len(result_df)
-                result_df = filter_dataframe_by_time(result_df, start_time, end_time, "open_time")
-                logger.info(f"[FCP] auto_reindex=False: Filtered to user's exact range: {original_length} -> {len(result_df)} records")
-
-            # ----------------------------------------------------------------
-            # Intelligent Reindexing Logic
-            # ----------------------------------------------------------------
-            # Only reindex if explicitly requested AND if we have some data to work with
-            if auto_reindex and not result_df.empty:
-                # Import additional utilities for enhanced functionality
-                from ckvd.utils.for_core.ckvd_utilities import safely_reindex_dataframe
-
-                # Check if we have significant missing ranges that couldn't be filled
-                if missing_ranges:
-                    # Calculate the percentage of missing data
-                    total_expected_seconds = (aligned_end - aligned_start).total_seconds()
-                    missing_seconds = sum((end - start).total_seconds() for start, end in missing_ranges)
-                    missing_percentage = (missing_seconds / total_expected_seconds) * 100 if total_expected_seconds > 0 else 0
-
-                    # If more than 50% of data is missing and we couldn't fetch it from APIs,
-                    # warn the user about potential NaN padding
-                    if missing_percentage > 50:
-                        logger.warning(
-                            f"[FCP] Reindexing will create {missing_percentage:.1f}% NaN values. "
-                            f"Consider setting auto_reindex=False to get only available data, "
-                            f"or ensure API access to fetch missing data."
-                        )
-
-                # Safely reindex to ensure a complete time series with no gaps
-                # This gives users a complete DataFrame with the expected number of rows
-                # even if some data could not be retrieved
-                result_df = safely_reindex_dataframe(df=result_df, start_time=aligned_start, end_time=aligned_end, interval=interval)
-
-            elif not auto_reindex:
-                logger.info(
-                    f"[FCP] auto_reindex=False: Returning {len(result_df)} available records without NaN padding for missing timestamps"
-                )
-
-            # Skip source info column if not requested
-            if not include_source_info and "_data_source" in result_df.columns:
-                result_df = result_df.drop(columns=["_data_source"])
-
-            # CRITICAL FIX: Different completeness checks based on auto_reindex
-            if auto_reindex:
-                # Original completeness check for reindexed data
-                from ckvd.utils.dataframe_utils import verify_data_completeness
+                self._track_source(polars_pipeline, result_df, "REST")
 
-                is_complete, gaps = verify_data_completeness(result_df, aligned_start, aligned_end, interval.value)
-
-                if not is_complete:
-                    logger.warning(
-                        f"Data retrieval for {symbol} has {len(gaps)} gaps in the time series. "
-                        f"The DataFrame contains NaN values for missing timestamps."
-                    )
-            # For auto_reindex=False, just report actual data coverage
-            elif not result_df.empty and "open_time" in result_df.columns:
-                actual_start = result_df["open_time"].min()
-                actual_end = result_df["open_time"].max()
-                logger.info(f"[FCP] auto_reindex=False: Data covers {actual_start} to {actual_end} ({len(result_df)} records)")
-
-                # Check if we have NaN values (which shouldn't happen with auto_reindex=False)
-                nan_count = result_df.isna().sum().sum()
-                if nan_count > 0:
-                    logger.error(f"[FCP] BUG: auto_reindex=False should not create {nan_count} NaN values!")
-
-            logger.info(f"[FCP] Successfully retrieved {len(result_df)} records for {symbol}")
-
-            # Convert to Polars if requested
-            if return_polars:
-                # Use Polars pipeline directly — avoids wasteful pandas → Polars round-trip
-                if not polars_pipeline.is_empty():
-                    logger.debug("[FCP] Using Polars pipeline for return_polars=True output")
-                    result_pl = polars_pipeline.collect_polars(use_streaming=True)
-                    logger.debug(f"[FCP] Polars DataFrame with {len(result_pl)} rows")
-                    return result_pl
-                # Fallback: pipeline is empty but result_df has data
-                if result_df.index.name == "open_time":
-                    result_df = result_df.reset_index()
-                result_pl = pl.from_pandas(result_df)
-                logger.debug(f"[FCP] Converted to Polars DataFrame with {len(result_pl)} rows (fallback)")
-                return result_pl
-
-            return result_df
+            return self._finalize_result(request, result_df, polars_pipeline, missing_ranges)
 
         except (
             VisionAPIError,
@@ -1149,12 +1195,668 @@ class CryptoKlineVisionData:
             # Preserve partial data on rate limit instead of destroying it
             if isinstance(e, RateLimitError) and not result_df.empty:
                 logger.warning(f"[FCP] Rate limited but returning {len(result_df)} partial records")
+                if request.pipeline_output:
+                    # The cache step only kept open_time in result_df; the cached rows are in the pipeline
+                    result_df = polars_pipeline.collect_pandas(use_streaming=True, columns=columns)
                 result_df.attrs["_rate_limited"] = True
-                return standardize_columns(result_df)
+                return project_columns(standardize_columns(result_df, columns=columns), columns)
 
             handle_error(e)
             return None  # unreachable, handle_error always raises
 
+    def plan(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        chart_type: ChartType | None = None,
+        enforce_source: DataSource = DataSource.AUTO,
+        auto_reindex: bool = True,
+        columns: Sequence[str] | None = None,
+    ) -> FCPPlan:
+        """Plan a ``get_data`` request without fetching anything.
+
+        Runs the same validation and FCP decisions as ``get_data`` (symbol
+        availability, cache coverage from the cache index, the Vision
+        freshness window, REST chunking) and returns the resulting plan with
+        cost estimates. ``get_data`` executes exactly such a plan.
+
+        Args:
+            symbol: Trading symbol (e.g., "BTCUSDT")
+            start_time: Start time (timezone-aware datetime)
+            end_time: End time (timezone-aware datetime)
+            interval: Time interval for data points (default: 1 minute)
+            chart_type: Kline chart type (default: uses instance setting)
+            enforce_source: Source restriction, as for ``get_data``
+            auto_reindex: Boundary alignment, as for ``get_data``
+            columns: Optional column projection, as for ``get_data``
+
+        Returns:
+            FCPPlan listing cache files, Vision days (and those expected to
+            404), REST ranges, chunks and weight, and an estimated duration
+
+        Raises:
+            ValueError: If the request is invalid or chart_type is FUNDING_RATE
+            DataNotAvailableError: If the symbol was not listed at start_time
+
+        Example:
+            >>> print(manager.explain("BTCUSDT", start, end, Interval.MINUTE_1))
+            >>> plan = manager.plan("BTCUSDT", start, end, Interval.MINUTE_1)
+            >>> plan.rest_weight, plan.estimated_seconds
+        """
+        chart_type = chart_type or self.chart_type
+        if chart_type == ChartType.FUNDING_RATE:
+            raise ValueError("plan() is only supported for kline chart types, not FUNDING_RATE")
+        validate_interval(self.market_type, interval)
+        request = self._prepare_request(
+            symbol,
+            start_time,
+            end_time,
+            interval,
+            chart_type,
+            enforce_source=enforce_source,
+            auto_reindex=auto_reindex,
+            columns=resolve_columns(columns),
+        )
+        return self._build_plan(request)
+
+    def explain(self, *args: Any, **kwargs: Any) -> str:
+        """Describe what ``get_data`` would do for a request, one line per FCP step.
+
+        Takes the same arguments as ``plan``.
+
+        Returns:
+            Readable plan with cost estimates
+        """
+        return self.plan(*args, **kwargs).explain()
+
+    def iter_data(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        batch: str | timedelta = "1D",
+        prefetch: int = 1,
+        **kwargs: Any,
+    ) -> Iterator[pl.DataFrame]:
+        """Stream market data for a long range as one Polars frame per time slice.
+
+        The range is split into ``batch``-sized slices (aligned to UTC
+        boundaries, so "1D" slices are calendar days) and each slice goes
+        through the full FCP independently via ``get_data``. While the caller
+        consumes one slice, the next ``prefetch`` slices are fetched on a
+        background thread, so peak memory is bounded by ``prefetch + 1``
+        slices rather than by the whole range.
+
+        Args:
+            symbol: Trading symbol (e.g., "BTCUSDT")
+            start_time: Start time for data retrieval (timezone-aware datetime)
+            end_time: Exclusive end time for data retrieval (timezone-aware datetime)
+            interval: Time interval for data points (default: 1 minute)
+            batch: Slice length as a ``timedelta`` or pandas offset string
+                (e.g. "1D", "6h"); must be a multiple of ``interval``
+            prefetch: Slices fetched ahead of the consumer (0 disables prefetch)
+            **kwargs: Other ``get_data`` arguments (``return_polars`` is forced on)
+
+        Yields:
+            pl.DataFrame per non-empty slice, in time order
+
+        Raises:
+            ValueError: If batch is not a multiple of interval or prefetch is negative
+
+        Example:
+            >>> for frame in manager.iter_data("BTCUSDT", start, end, Interval.SECOND_1, batch="1D"):
+            ...     process(frame)
+        """
+        slices = split_time_range(start_time, end_time, batch, interval)
+
+        def fetch(slice_range: tuple[datetime, datetime]) -> pl.DataFrame:
+            return self.get_data(symbol, *slice_range, interval, **{**kwargs, "return_polars": True})
+
+        for frame in _prefetched(fetch, slices, prefetch):
+            if not frame.is_empty():
+                yield frame
+
+    def iter_data_many(
+        self,
+        symbols: Sequence[str],
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        batch: str | timedelta = "1D",
+        prefetch: int = 1,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, pl.DataFrame]]:
+        """Stream several symbols slice by slice, like ``iter_data``.
+
+        Every symbol is fetched for a slice before the next slice starts, so
+        memory is bounded by ``prefetch + 1`` slices across all symbols.
+
+        Args:
+            symbols: Trading symbols (e.g., ["BTCUSDT", "ETHUSDT"])
+            start_time: Start time for data retrieval (timezone-aware datetime)
+            end_time: Exclusive end time for data retrieval (timezone-aware datetime)
+            interval: Time interval for data points (default: 1 minute)
+            batch: Slice length as a ``timedelta`` or pandas offset string
+            prefetch: Slices fetched ahead of the consumer (0 disables prefetch)
+            **kwargs: Other ``get_data`` arguments (``return_polars`` is forced on)
+
+        Yields:
+            Dictionary mapping each symbol to its frame for one slice, in time
+            order (symbols with no rows in the slice are omitted; slices with no
+            rows at all are skipped)
+
+        Raises:
+            ValueError: If batch is not a multiple of interval or prefetch is negative
+        """
+        slices = split_time_range(start_time, end_time, batch, interval)
+
+        def fetch(slice_range: tuple[datetime, datetime]) -> dict[str, pl.DataFrame]:
+            frames = {symbol: self.get_data(symbol, *slice_range, interval, **{**kwargs, "return_polars": True}) for symbol in symbols}
+            return {symbol: frame for symbol, frame in frames.items() if not frame.is_empty()}
+
+        for frames in _prefetched(fetch, slices, prefetch):
+            if frames:
+                yield frames
+
+    def get_data_with_funding(
+        self,
+        symbols: str | Sequence[str],
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        columns: Sequence[str] | None = None,
+        **kwargs: Any,
+    ) -> pl.DataFrame:
+        """Fetch klines with the funding rate in effect at each bar, as one Polars frame.
+
+        Klines run through the FCP per symbol (``get_data``, cache first) and
+        funding rates are fetched with one funding client for all symbols
+        (cached by ``BinanceFundingRateClient``), starting
+        ``FUNDING_ASOF_LOOKBACK`` before ``start_time`` so the first bars have
+        a rate. Each bar then gets the latest funding rate at or before its
+        ``open_time`` (``join_asof`` on ``open_time``/``funding_time``).
+
+        Args:
+            symbols: Trading symbol or symbols (e.g., ["BTCUSDT", "ETHUSDT"])
+            start_time: Start time for data retrieval (timezone-aware datetime)
+            end_time: Exclusive end time for data retrieval (timezone-aware datetime)
+            interval: Kline interval (default: 1 minute)
+            columns: Optional kline column projection, as for ``get_data``
+            **kwargs: Other ``get_data`` arguments (``return_polars`` is forced on)
+
+        Returns:
+            pl.DataFrame of every symbol's bars sorted by ``symbol`` and
+            ``open_time``, with ``funding_time`` and ``funding_rate`` columns
+            (null before the first known funding rate)
+
+        Raises:
+            ValueError: If the market type has no funding rates or the request is invalid
+
+        Example:
+            >>> df = manager.get_data_with_funding(["BTCUSDT", "ETHUSDT"], start, end, Interval.HOUR_1)
+            >>> df.select("symbol", "open_time", "close", "funding_rate")
+        """
+        import polars as pl
+
+        from ckvd.utils.config import FUNDING_ASOF_LOOKBACK
+        from ckvd.utils.for_core.ckvd_funding_utils import join_funding_asof
+
+        symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+        funding_client = self._create_funding_client(symbols[0])
+        try:
+            bars = []
+            rates = []
+            for symbol in symbols:
+                frame = self.get_data(symbol, start_time, end_time, interval, **{**kwargs, "columns": columns, "return_polars": True})
+                bars.append(frame.with_columns(pl.lit(symbol.upper()).alias("symbol")))
+                funding = funding_client.fetch(
+                    symbol=symbol.upper(),
+                    interval=Interval.HOUR_8.value,
+                    start_time=start_time - FUNDING_ASOF_LOOKBACK,
+                    end_time=end_time,
+                )
+                if not funding.empty:
+                    rates.append(pl.from_pandas(funding[["symbol", "funding_time", "funding_rate"]]))
+        finally:
+            funding_client.close()
+
+        klines = pl.concat(bars, how="diagonal_relaxed")
+        if rates:
+            funding = pl.concat(rates)
+        else:
+            funding = pl.DataFrame(schema={"symbol": pl.String, "funding_time": klines.schema["open_time"], "funding_rate": pl.Float64})
+        logger.info("[FCP] Joining {} funding rates onto {} bars for {} symbols", len(funding), len(klines), len(symbols))
+        return join_funding_asof(klines, funding)
+
+    def get_panel(
+        self,
+        symbols: Sequence[str],
+        field: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        as_numpy: bool = False,
+        dtype: np.dtype | type | None = None,
+    ) -> pl.DataFrame | PanelMatrix:
+        """Build a wide time × symbol panel of one field from the cache.
+
+        Scans every symbol's cache files lazily, collects only (time, symbol,
+        value) on the Polars streaming engine and scatters them into a dense
+        matrix on the shared ``interval`` grid, without per-symbol pandas
+        frames. Only cached bars are used; missing ones are NaN.
+
+        Args:
+            symbols: Trading symbols, in column order
+            field: Numeric kline column (e.g. "close", "volume")
+            start_time: Start time (timezone-aware datetime)
+            end_time: Exclusive end time (timezone-aware datetime)
+            interval: Kline interval and grid step (default: 1 minute)
+            as_numpy: Return a ``PanelMatrix`` (contiguous values plus time and
+                symbol index arrays) instead of a Polars frame
+            dtype: Float dtype of the values (default: float64)
+
+        Returns:
+            pl.DataFrame with ``open_time`` and one column per symbol, or a
+            ``PanelMatrix`` when ``as_numpy`` is set
+
+        Raises:
+            ValueError: If caching is disabled or the request is invalid
+
+        Example:
+            >>> panel = manager.get_panel(symbols, "close", start, end, Interval.MINUTE_1, as_numpy=True, dtype=np.float32)
+            >>> panel.matrix.shape  # (len(panel.times), len(panel.symbols))
+        """
+        if not self.use_cache or self.cache_dir is None:
+            raise ValueError("get_panel() reads the cache; create the manager with use_cache=True")
+        if self.chart_type == ChartType.FUNDING_RATE:
+            raise ValueError("get_panel() is only supported for kline chart types, not FUNDING_RATE")
+        validate_interval(self.market_type, interval)
+
+        from ckvd.core.sync.panel import build_panel
+
+        return build_panel(
+            symbols,
+            field,
+            start_time,
+            end_time,
+            interval,
+            self.cache_dir,
+            self.market_type,
+            self.chart_type,
+            as_numpy=as_numpy,
+            dtype=dtype or "float64",
+        )
+
+    def _prepare_request(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval,
+        chart_type: ChartType,
+        **options: Any,
+    ) -> FCPRequest:
+        """Validate a kline request and align its time boundaries.
+
+        Args:
+            symbol: Symbol to retrieve data for (e.g., "BTCUSDT")
+            start_time: Start time for data retrieval (UTC)
+            end_time: End time for data retrieval (UTC)
+            interval: Time interval between data points
+            chart_type: Chart type
+            **options: Remaining ``get_data`` options, stored on the request
+
+        Returns:
+            FCPRequest carrying the normalized symbol and aligned boundaries
+
+        Raises:
+            ValueError: If the time range or symbol is invalid
+            DataNotAvailableError: If the symbol was not listed at start_time
+        """
+        # Validate time range
+        if start_time >= end_time:
+            raise ValueError(f"start_time ({start_time}) must be before end_time ({end_time})")
+
+        # Normalize symbol to upper case
+        symbol = symbol.upper()
+
+        # Security: defense-in-depth path traversal prevention (CWE-22, GitHub #21)
+        if not _SYMBOL_SAFE_PATTERN.match(symbol):
+            raise ValueError(f"Symbol contains invalid characters: '{symbol}'")
+
+        # FAIL-LOUD: Validate symbol availability before any API calls (GitHub Issue #10)
+        from ckvd.utils.for_core.vision_exceptions import DataNotAvailableError
+        from ckvd.utils.validation.availability_data import (
+            check_futures_counterpart_availability,
+            is_symbol_available_at,
+        )
+
+        is_available, earliest_date = is_symbol_available_at(self.market_type, symbol, start_time)
+        if not is_available and earliest_date is not None:
+            raise DataNotAvailableError(
+                symbol=symbol,
+                market_type=self.market_type.name,
+                requested_start=start_time,
+                earliest_available=earliest_date,
+            )
+
+        # CROSS-MARKET WARNING: Check futures counterpart availability (for SPOT requests)
+        futures_warning = check_futures_counterpart_availability(self.market_type, symbol, start_time)
+        if futures_warning:
+            # Console warning (loud) - stderr for visibility
+            import sys
+
+            print(
+                f"\n\u26a0\ufe0f  FUTURES COUNTERPART WARNING: {futures_warning.message}\n",
+                file=sys.stderr,
+            )
+            # Log for telemetry
+            logger.warning(
+                f"[FCP] Futures counterpart unavailable: {futures_warning.message}",
+                extra={
+                    "event_type": "futures_counterpart_unavailable",
+                    "futures_market": futures_warning.futures_market,
+                    "futures_earliest": futures_warning.earliest_date.isoformat(),
+                    "requested_start": start_time.isoformat(),
+                },
+            )
+
+        # Log key parameters
+        logger.info("Retrieving {} data for {} from {} to {}", interval.value, symbol, start_time, end_time)
+
+        # CRITICAL FIX: Use different alignment strategies based on auto_reindex
+        auto_reindex = options.get("auto_reindex", True)
+        if auto_reindex:
+            # When auto_reindex=True, align boundaries to ensure complete time series
+            aligned_start, aligned_end = align_time_boundaries(start_time, end_time, interval)
+            logger.debug("[FCP] Aligned boundaries for complete time series: {} to {}", aligned_start, aligned_end)
+        else:
+            # When auto_reindex=False, use exact user boundaries to prevent artificial gaps
+            aligned_start, aligned_end = start_time, end_time
+            logger.debug("[FCP] Using exact user boundaries (auto_reindex=False): {} to {}", aligned_start, aligned_end)
+
+        return FCPRequest(
+            symbol=symbol,
+            start_time=start_time,
+            end_time=end_time,
+            aligned_start=aligned_start,
+            aligned_end=aligned_end,
+            interval=interval,
+            chart_type=chart_type,
+            **options,
+        )
+
+    def _build_plan(self, request: FCPRequest) -> FCPPlan:
+        """Plan the FCP steps for a validated request (no network I/O).
+
+        Args:
+            request: Validated request
+
+        Returns:
+            FCPPlan that ``get_data`` executes
+
+        Raises:
+            ValueError: If enforce_source=CACHE is requested with caching disabled
+        """
+        # Imported here: planning needs the REST helpers, which load httpx
+        from ckvd.core.sync.plan import build_fcp_plan
+
+        return build_fcp_plan(
+            request,
+            provider=self.provider,
+            market_type=self.market_type,
+            use_cache=self.use_cache,
+            cache_dir=self.cache_dir,
+            has_vision=self._provider_clients.has("vision"),
+        )
+
+    def _read_cache(self, plan: FCPPlan, polars_pipeline: PolarsDataPipeline) -> tuple[pd.DataFrame, list[tuple[datetime, datetime]]]:
+        """Run the FCP cache step (Step 1).
+
+        Scans the cache files listed in the plan; cached LazyFrames are added
+        to ``polars_pipeline``. When the result is built from the pipeline
+        (``FCPRequest.pipeline_output``), only the cached ``open_time`` values
+        are collected to find the missing ranges; the full frame is
+        materialized once, in ``_finalize_result``.
+
+        Args:
+            plan: Plan of the request
+            polars_pipeline: Pipeline collecting the sources of the final result
+
+        Returns:
+            Tuple of (cached data, time ranges still to fetch)
+        """
+        request = plan.request
+        symbol, interval, chart_type, columns = request.symbol, request.interval, request.chart_type, request.columns
+        aligned_start, aligned_end = request.aligned_start, request.aligned_end
+        enforce_source = request.enforce_source
+        result_df = pd.DataFrame()
+        missing_ranges = []
+
+        if plan.read_cache:
+            # Use Polars LazyFrame-based cache retrieval
+            from ckvd.utils.for_core.ckvd_cache_utils import get_cache_lazyframes
+
+            logger.info("[FCP] STEP 1: Checking local cache for {}", symbol)
+            cache_lazyframes = get_cache_lazyframes(
+                symbol=symbol,
+                start_time=aligned_start,
+                end_time=aligned_end,
+                interval=interval,
+                cache_dir=self.cache_dir,
+                market_type=self.market_type,
+                chart_type=chart_type,
+                columns=columns,
+                cache_files=plan.cache_files,
+            )
+
+            if cache_lazyframes:
+                for lf in cache_lazyframes:
+                    polars_pipeline.add_source(lf, "CACHE")
+                logger.info("[FCP] Cache contributed {} LazyFrame(s) to pipeline", len(cache_lazyframes))
+
+                # Still need to identify missing ranges for Vision/REST steps
+                # Collect cache data to check coverage
+                if request.pipeline_output:
+                    import polars as pl
+
+                    coverage = polars_pipeline.collect_polars(use_streaming=True, columns=["open_time"])
+                    cache_df = coverage.with_columns(pl.col("_data_source").cast(pl.String)).to_pandas().set_index("open_time")
+                else:
+                    cache_df = polars_pipeline.collect_pandas(use_streaming=True)
+                if not cache_df.empty:
+                    from ckvd.utils.for_core.ckvd_time_range_utils import identify_missing_segments
+
+                    missing_ranges = identify_missing_segments(cache_df, aligned_start, aligned_end, interval)
+                    result_df = cache_df
+                else:
+                    missing_ranges = [(aligned_start, aligned_end)]
+            else:
+                missing_ranges = [(aligned_start, aligned_end)]
+                logger.debug("[FCP] No cache data available, entire range marked as missing: {} to {}", aligned_start, aligned_end)
+        else:
+            if enforce_source == DataSource.REST:
+                logger.info("[FCP] Cache check skipped due to enforce_source=REST")
+            elif enforce_source == DataSource.VISION:
+                logger.info("[FCP] Cache check skipped due to enforce_source=VISION")
+            else:
+                logger.info("[FCP] Cache disabled, skipping cache check")
+
+            # If cache is disabled, treat entire range as missing
+            missing_ranges = [(aligned_start, aligned_end)]
+
+        # CRITICAL FIX: When auto_reindex=False and we have some data, don't fetch missing ranges
+        if not request.auto_reindex and not result_df.empty:
+            logger.info("[FCP] auto_reindex=False: Found {} cached records, skipping API calls to prevent NaN creation", len(result_df))
+            missing_ranges = []  # Clear missing ranges to prevent API calls
+
+        return result_df, missing_ranges
+
+    @staticmethod
+    def _track_source(polars_pipeline: PolarsDataPipeline, result_df: pd.DataFrame, source: str) -> None:
+        """Add the rows a source step contributed to the Polars pipeline.
+
+        Args:
+            polars_pipeline: Pipeline collecting the sources of the final result
+            result_df: Merged result after the step
+            source: Source tag of the step ("VISION" or "REST")
+        """
+        if not result_df.empty and "_data_source" in result_df.columns:
+            source_df = result_df[result_df["_data_source"] == source]
+            if not source_df.empty:
+                polars_pipeline.add_pandas(source_df, source)
+
+    def _finalize_result(
+        self,
+        request: FCPRequest,
+        result_df: pd.DataFrame,
+        polars_pipeline: PolarsDataPipeline,
+        missing_ranges: list[tuple[datetime, datetime]],
+    ) -> pd.DataFrame | pl.DataFrame:
+        """Verify, standardize, reindex and project the merged FCP result.
+
+        Args:
+            request: Validated request
+            result_df: Data merged from cache, Vision and REST
+            polars_pipeline: Pipeline holding the same data per source
+            missing_ranges: Ranges no source could fill
+
+        Returns:
+            The ``get_data`` result in the requested output format
+
+        Raises:
+            RuntimeError: If no source returned any data
+        """
+        symbol, interval, columns = request.symbol, request.interval, request.columns
+        start_time, end_time = request.start_time, request.end_time
+        aligned_start, aligned_end = request.aligned_start, request.aligned_end
+        auto_reindex, include_source_info, return_polars = request.auto_reindex, request.include_source_info, request.return_polars
+
+        import polars as pl
+
+        from ckvd.utils.internal.polars_pipeline import reindex_polars, to_arrow_pandas
+
+        verify_final_data(result_df, aligned_start, aligned_end)
+
+        # Pipeline outputs (Polars, Arrow-backed or compact pandas): build the result
+        # from the pipeline instead of standardizing, casting and re-indexing a
+        # Float64 NumPy copy that would only be converted or discarded afterwards
+        if request.pipeline_output:
+            if polars_pipeline.is_empty():
+                # No source step tagged its rows; route them through the pipeline
+                # so the result keeps the pipeline's output dtypes
+                polars_pipeline.add_pandas(result_df, "UNKNOWN")
+            if return_polars:
+                result_pl = polars_pipeline.collect_polars(use_streaming=True, columns=columns)
+                logger.info("[FCP] Successfully retrieved {} records for {} (Polars)", len(result_pl), symbol)
+                return result_pl
+            standard_columns = columns or [CANONICAL_INDEX_NAME, *DEFAULT_COLUMN_ORDER]
+            result_pl = polars_pipeline.collect_polars(use_streaming=True, columns=standard_columns)
+            if auto_reindex:
+                result_pl = reindex_polars(result_pl, aligned_start, aligned_end, interval)
+            else:
+                result_pl = result_pl.filter(pl.col("open_time").is_between(start_time, end_time))
+            if not include_source_info and "_data_source" in result_pl.columns:
+                result_pl = result_pl.drop("_data_source")
+            if request.dtype_backend == "pyarrow":
+                logger.info("[FCP] Successfully retrieved {} records for {} (Arrow-backed)", len(result_pl), symbol)
+                arrow_df = to_arrow_pandas(result_pl)
+                arrow_df.attrs.update(result_df.attrs)  # _rate_limited / _fcp_partial flags
+                return arrow_df
+            # Compact NumPy-backed output: a single conversion of the already compact
+            # columns (counts left null by reindexing become float32 NaN, as in compact_dataframe)
+            if "count" in result_pl.columns and result_pl["count"].null_count():
+                result_pl = result_pl.with_columns(pl.col("count").cast(pl.Float32))
+            compact_df = result_pl.to_pandas()
+            if "open_time" in compact_df.columns:
+                compact_df = compact_df.set_index("open_time")
+            compact_df.attrs.update(result_df.attrs)
+            logger.info("[FCP] Successfully retrieved {} records for {} (compact)", len(compact_df), symbol)
+            return compact_df
+
+        # First standardize columns to ensure consistent data types and format
+        result_df = standardize_columns(result_df, columns=columns)
+
+        # CRITICAL FIX: Filter to user's exact time range when auto_reindex=False
+        if not auto_reindex and not result_df.empty:
+            # Filter the result to the user's exact requested time range
+            from ckvd.utils.time_utils import filter_dataframe_by_time
+
+            original_length = len(result_df)
+            result_df = filter_dataframe_by_time(result_df, start_time, end_time, "open_time")
+            logger.info("[FCP] auto_reindex=False: Filtered to user's exact range: {} -> {} records", original_length, len(result_df))
+
+        # ----------------------------------------------------------------
+        # Intelligent Reindexing Logic
+        # ----------------------------------------------------------------
+        # Only reindex if explicitly requested AND if we have some data to work with
+        if auto_reindex and not result_df.empty:
+            # Import additional utilities for enhanced functionality
+            from ckvd.utils.for_core.ckvd_utilities import safely_reindex_dataframe
+
+            # Check if we have significant missing ranges that couldn't be filled
+            if missing_ranges:
+                # Calculate the percentage of missing data
+                total_expected_seconds = (aligned_end - aligned_start).total_seconds()
+                missing_seconds = sum((end - start).total_seconds() for start, end in missing_ranges)
+                missing_percentage = (missing_seconds / total_expected_seconds) * 100 if total_expected_seconds > 0 else 0
+
+                # If more than 50% of data is missing and we couldn't fetch it from APIs,
+                # warn the user about potential NaN padding
+                if missing_percentage > 50:
+                    logger.warning(
+                        f"[FCP] Reindexing will create {missing_percentage:.1f}% NaN values. "
+                        f"Consider setting auto_reindex=False to get only available data, "
+                        f"or ensure API access to fetch missing data."
+                    )
+
+            # Safely reindex to ensure a complete time series with no gaps
+            # This gives users a complete DataFrame with the expected number of rows
+            # even if some data could not be retrieved
+            result_df = safely_reindex_dataframe(df=result_df, start_time=aligned_start, end_time=aligned_end, interval=interval)
+
+        elif not auto_reindex:
+            logger.info(
+                "[FCP] auto_reindex=False: Returning {} available records without NaN padding for missing timestamps", len(result_df)
+            )
+
+        # Skip source info column if not requested
+        if not include_source_info and "_data_source" in result_df.columns:
+            result_df = result_df.drop(columns=["_data_source"])
+
+        # Apply the column projection in the requested order
+        result_df = project_columns(result_df, columns)
+
+        # CRITICAL FIX: Different completeness checks based on auto_reindex
+        if auto_reindex:
+            # Original completeness check for reindexed data
+            from ckvd.utils.dataframe_utils import verify_data_completeness
+
+            is_complete, gaps = verify_data_completeness(result_df, aligned_start, aligned_end, interval.value)
+
+            if not is_complete:
+                logger.warning(
+                    f"Data retrieval for {symbol} has {len(gaps)} gaps in the time series. "
+                    f"The DataFrame contains NaN values for missing timestamps."
+                )
+        # For auto_reindex=False, just report actual data coverage
+        elif not result_df.empty and "open_time" in result_df.columns:
+            actual_start = result_df["open_time"].min()
+            actual_end = result_df["open_time"].max()
+            logger.info("[FCP] auto_reindex=False: Data covers {} to {} ({} records)", actual_start, actual_end, len(result_df))
+
+            # Check if we have NaN values (which shouldn't happen with auto_reindex=False)
+            nan_count = result_df.isna().sum().sum()
+            if nan_count > 0:
+                logger.error(f"[FCP] BUG: auto_reindex=False should not create {nan_count} NaN values!")
+
+        logger.info("[FCP] Successfully retrieved {} records for {}", len(result_df), symbol)
+
+        return result_df
+
     def __enter__(self) -> "CryptoKlineVisionData":
         """Context manager entry point.
 
@@ -1200,21 +1902,21 @@ class CryptoKlineVisionData:
             >>> df = manager.get_data("BTCUSDT", start_time, end_time, Interval.MINUTE_1)
             >>> manager.close()  # Clean up resources
         """
-        # Close Vision client if it exists
-        if self.vision_client is not None:
+        # Close Vision client if it was created (clients never used are just dropped)
+        if self._provider_clients.is_created("vision"):
             try:
                 self.vision_client.close()
             except (OSError, AttributeError) as e:
                 logger.warning(f"Error closing Vision client: {e}")
-            self.vision_client = None
+        self.vision_client = None
 
-        # Close REST client if it exists
-        if self.rest_client is not None:
+        # Close REST client if it was created
+        if self._provider_clients.is_created("rest"):
             try:
                 if hasattr(self.rest_client, "close"):
                     self.rest_client.close()
             except (OSError, AttributeError) as e:
                 logger.warning(f"Error closing REST client: {e}")
-            self.rest_client = None
+        self.rest_client = None
 
         logger.debug("Closed all data clients")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+"""Incremental export of cached klines to a hive-partitioned Parquet dataset.
+
+Writes ``<output>/market=<MARKET>/symbol=<SYMBOL>/interval=<INTERVAL>/date=<YYYY-MM-DD>/part-0.parquet``
+straight from the cache files, for Spark/DuckDB/Arrow dataset readers. Market
+types share symbol names (SPOT and FUTURES_USDT both list BTCUSDT), so the
+market is the top partition level and several market types can share a root:
+
+1. The cache files for each symbol × interval × day are selected with the same
+   logic as the FCP cache step (``find_cache_files``: cache index when present,
+   per-day probe otherwise).
+2. Each day file is scanned lazily and written with ``sink_parquet`` on the
+   streaming engine, so nothing is materialised in Python and memory stays
+   flat regardless of dataset size. Files are written to a temporary name and
+   renamed, so readers never see a partial partition.
+3. Every exported partition is appended to a manifest in the output root
+   together with its source file's size and mtime; later runs skip partitions
+   whose source is unchanged.
+
+Example:
+    >>> from datetime import date
+    >>> from ckvd import Interval, MarketType
+    >>> from ckvd.core.sync.export import export_parquet_dataset
+    >>>
+    >>> report = export_parquet_dataset(
+    ...     "./dataset", ["BTCUSDT", "ETHUSDT"], [Interval.MINUTE_1], date(2024, 1, 1), date(2024, 1, 31), MarketType.SPOT
+    ... )
+    >>> print(report.summary())
+
+The command-line entry point is ``ckvd export`` (see ``ckvd.cli.export``).
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import polars as pl
+
+from ckvd.utils.app_paths import get_cache_dir
+from ckvd.utils.config import EXPORT_MANIFEST_FILENAME, EXPORT_PARQUET_COMPRESSION
+from ckvd.utils.for_core.ckvd_cache_utils import find_cache_files, scan_cache_file
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market_constraints import ChartType, Interval, MarketType
+
+__all__ = [
+    "ExportManifest",
+    "ExportReport",
+    "export_parquet_dataset",
+    "partition_path",
+]
+
+# Errors a single partition can fail with; it is reported and retried on the next run
+_PARTITION_ERRORS = (OSError, pl.exceptions.PolarsError, ValueError)
+
+
+@dataclass
+class ExportReport:
+    """Outcome of an export run."""
+
+    exported: int = 0
+    skipped: int = 0
+    failed: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    failures: list[tuple[str, str]] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """One-line human-readable summary."""
+        megabytes_per_second = self.bytes_written / 1e6 / self.elapsed if self.elapsed > 0 else 0.0
+        return (
+            f"{self.exported} partitions exported, {self.skipped} unchanged, {self.failed} failed "
+            f"in {self.elapsed:.1f}s ({self.bytes_written / 1e6:.1f} MB, {megabytes_per_second:.2f} MB/s)"
+        )
+
+
+class ExportManifest:
+    """Append-only JSONL log of exported partitions and their source files.
+
+    Each line records one partition with the size and mtime of the cache file
+    it was written from; when a partition appears more than once the last line
+    wins.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the manifest.
+
+        Args:
+            path: JSONL file (created on the first record)
+        """
+        self.path = Path(path)
+
+    def load(self) -> dict[str, dict]:
+        """Return the latest record per partition (empty if there is no manifest)."""
+        records: dict[str, dict] = {}
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        records[record["partition"]] = record
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # torn line from an interrupted write
+        except FileNotFoundError:
+            pass
+        return records
+
+    def record(self, partition: str, source: Path, source_stat: os.stat_result, market_type: MarketType) -> None:
+        """Append one exported partition.
+
+        Args:
+            partition: Partition path relative to the dataset root
+            source: Cache file the partition was written from
+            source_stat: ``stat`` of the source taken before the export
+            market_type: Market type of the source
+        """
+        line = json.dumps(
+            {
+                "partition": partition,
+                "market_type": market_type.name,
+                "source": str(source),
+                "source_size": source_stat.st_size,
+                "source_mtime_ns": source_stat.st_mtime_ns,
+            }
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(line + "\n")
+
+
+def partition_path(market_type: MarketType, symbol: str, interval: Interval, day: str) -> str:
+    """Relative path of one day's partition file.
+
+    Args:
+        market_type: Market type of the source cache
+        symbol: Trading symbol
+        interval: Kline interval
+        day: Day as YYYY-MM-DD
+
+    Returns:
+        ``market=<MARKET>/symbol=<SYMBOL>/interval=<INTERVAL>/date=<DAY>/part-0.parquet``
+    """
+    return f"market={market_type.name}/symbol={symbol}/interval={interval.value}/date={day}/part-0.parquet"
+
+
+def _is_unchanged(record: dict | None, source_stat: os.stat_result, target: Path) -> bool:
+    """Whether a manifest record still describes the source and its output exists."""
+    return (
+        record is not None
+        and record.get("source_size") == source_stat.st_size
+        and record.get("source_mtime_ns") == source_stat.st_mtime_ns
+        and target.exists()
+    )
+
+
+def export_parquet_dataset(
+    output_dir: str | Path,
+    symbols: Sequence[str],
+    intervals: Sequence[Interval | str],
+    start: date,
+    end: date,
+    market_type: MarketType = MarketType.SPOT,
+    cache_dir: str | Path | None = None,
+    *,
+    force: bool = False,
+    compression: str = EXPORT_PARQUET_COMPRESSION,
+) -> ExportReport:
+    """Export cached klines as a hive-partitioned Parquet dataset.
+
+    Only days present in the cache are exported; run a backfill first to fill
+    gaps. Each partition is written on the Polars streaming engine.
+
+    Args:
+        output_dir: Dataset root (may be shared between market types)
+        symbols: Symbols to export
+        intervals: Kline intervals
+        start: First day (inclusive)
+        end: Last day (inclusive)
+        market_type: Market type of the cache files
+        cache_dir: Cache root (default: same as CryptoKlineVisionData)
+        force: Rewrite partitions whose source is unchanged
+        compression: Parquet compression codec
+
+    Returns:
+        ExportReport for the run
+    """
+    output_root = Path(output_dir)
+    cache_root = Path(cache_dir) if cache_dir is not None else get_cache_dir() / "data"
+    manifest = ExportManifest(output_root / EXPORT_MANIFEST_FILENAME)
+    exported = {} if force else manifest.load()
+    range_start = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+    range_end = datetime(end.year, end.month, end.day, tzinfo=timezone.utc)
+
+    report = ExportReport()
+    started = time.monotonic()
+    for symbol in (s.upper() for s in symbols):
+        for interval in (Interval(i) if isinstance(i, str) else i for i in intervals):
+            cache_files = find_cache_files(symbol, range_start, range_end, interval, cache_root, market_type, ChartType.KLINES)
+            logger.debug("Exporting {} cache files for {} {}", len(cache_files), symbol, interval.value)
+            for day, source in cache_files:
+                partition = partition_path(market_type, symbol, interval, day)
+                target = output_root / partition
+                try:
+                    source_stat = source.stat()
+                    if _is_unchanged(exported.get(partition), source_stat, target):
+                        report.skipped += 1
+                        continue
+
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    temp_target = target.with_name(f".{target.name}.tmp")
+                    scan_cache_file(source).sink_parquet(temp_target, compression=compression, engine="streaming")
+                    temp_target.replace(target)
+                except _PARTITION_ERRORS as e:
+                    logger.warning(f"Export of {partition} from {source} failed: {e}")
+                    report.failed += 1
+                    report.failures.append((partition, str(e)))
+                    continue
+
+                manifest.record(partition, source, source_stat, market_type)
+                report.exported += 1
+                report.bytes_written += target.stat().st_size
+
+    report.elapsed = time.monotonic() - started
+    logger.info(f"[Export] {report.summary()}")
+    return report
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+"""Wide time × symbol panels of one kline field, built from the cache.
+
+``build_panel`` aligns many symbols on a shared time grid without going
+through ``get_data`` and pandas per symbol:
+
+1. Each symbol's cache files are selected like the FCP cache step
+   (``get_cache_lazyframes``: cache index when present, per-day probe
+   otherwise) and scanned lazily, projecting ``open_time`` and the field.
+2. One symbol at a time, the scans are reduced to (grid row, value) pairs in
+   the panel's dtype and collected on the Polars streaming engine, so only
+   two narrow columns of a single symbol are ever materialised.
+3. The pairs are scattered straight into that symbol's column of a
+   preallocated NaN matrix, which is the pivot: cells with no cached bar
+   stay NaN.
+
+The result is either a Polars frame (``open_time`` plus one column per
+symbol) or a ``PanelMatrix`` holding the contiguous NumPy matrix and its
+index arrays. Only the cache is read; fetch missing days first (e.g. with
+``iter_data_many``) to fill it.
+
+Example:
+    >>> from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+    >>>
+    >>> with CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT) as manager:
+    ...     panel = manager.get_panel(["BTCUSDT", "ETHUSDT"], "close", start, end, Interval.MINUTE_1, as_numpy=True)
+    >>> panel.matrix.shape  # (len(panel.times), len(panel.symbols))
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from ckvd.utils.for_core.ckvd_cache_utils import get_cache_lazyframes
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market_constraints import ChartType, Interval, MarketType
+
+__all__ = [
+    "PanelMatrix",
+    "build_panel",
+]
+
+
+@dataclass(frozen=True)
+class PanelMatrix:
+    """A time × symbol matrix of one field with its index arrays.
+
+    Attributes:
+        matrix: C-contiguous array of shape (len(times), len(symbols)); NaN where no bar is cached
+        times: Bar open times as ``datetime64[ms]`` (UTC)
+        symbols: Column labels
+    """
+
+    matrix: np.ndarray
+    times: np.ndarray
+    symbols: tuple[str, ...]
+
+    def to_polars(self) -> pl.DataFrame:
+        """The panel as a frame with ``open_time`` and one column per symbol."""
+        frame = pl.from_numpy(self.matrix, schema=list(self.symbols), orient="row")
+        open_time = pl.Series("open_time", self.times).dt.replace_time_zone("UTC")
+        return frame.insert_column(0, open_time)
+
+
+def _epoch_ms(value: datetime) -> int:
+    """Epoch milliseconds of a datetime (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def build_panel(
+    symbols: Sequence[str],
+    field: str,
+    start_time: datetime,
+    end_time: datetime,
+    interval: Interval,
+    cache_dir: Path,
+    market_type: MarketType,
+    chart_type: ChartType = ChartType.KLINES,
+    as_numpy: bool = False,
+    dtype: np.dtype | type = np.float64,
+) -> pl.DataFrame | PanelMatrix:
+    """Align one field of many symbols' cached klines on a shared time grid.
+
+    Args:
+        symbols: Trading symbols, in column order
+        field: Numeric kline column (e.g. "close", "volume")
+        start_time: Start of the grid (rounded up to the interval)
+        end_time: Exclusive end of the grid
+        interval: Kline interval and grid step
+        cache_dir: Cache root
+        market_type: Market type
+        chart_type: Chart type of the cached klines
+        as_numpy: Return a ``PanelMatrix`` instead of a Polars frame
+        dtype: Float dtype of the values (np.float32 halves the memory)
+
+    Returns:
+        Polars frame with ``open_time`` and one column per symbol, or a
+        ``PanelMatrix`` when ``as_numpy`` is set
+
+    Raises:
+        ValueError: If the range is empty, dtype is not a float type or symbols repeat
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError(f"dtype must be a float type (NaN marks missing bars), got {dtype}")
+    symbols = tuple(symbol.upper() for symbol in symbols)
+    if len(set(symbols)) != len(symbols):
+        raise ValueError("symbols must be unique")
+    if start_time >= end_time:
+        raise ValueError(f"Start time {start_time} must be before end time {end_time}")
+
+    step_ms = interval.to_seconds() * 1000
+    first_ms = math.ceil(_epoch_ms(start_time) / step_ms) * step_ms
+    rows = max(0, math.ceil((_epoch_ms(end_time) - first_ms) / step_ms))
+
+    # Polars has no float16; narrower dtypes are cast once more by the scatter
+    value_dtype = pl.Float32 if dtype.itemsize <= 4 else pl.Float64
+    values = np.full((rows, len(symbols)), np.nan, dtype=dtype)
+    scattered = 0
+    for column, symbol in enumerate(symbols):
+        scans = get_cache_lazyframes(
+            symbol, start_time, end_time, interval, cache_dir, market_type, chart_type, columns=["open_time", field]
+        )
+        cells: list[pl.LazyFrame] = []
+        for lf in scans:
+            if field not in lf.collect_schema().names():
+                logger.warning(f"Cache file for {symbol} has no {field!r} column, leaving it empty")
+                continue
+            cells.append(
+                lf.select(
+                    ((pl.col("open_time").dt.epoch("ms") - first_ms) // step_ms).alias("row"),
+                    pl.col(field).cast(value_dtype).alias("value"),
+                )
+            )
+        if not cells:
+            continue
+        pairs = pl.concat(cells).filter((pl.col("row") >= 0) & (pl.col("row") < rows)).collect(engine="streaming")
+        values[pairs["row"].to_numpy(), column] = pairs["value"].to_numpy()
+        scattered += pairs.height
+    logger.debug("Scattered {} cached bars into a {}x{} panel", scattered, rows, len(symbols))
+
+    times = (first_ms + np.arange(rows, dtype=np.int64) * step_ms).astype("datetime64[ms]")
+    panel = PanelMatrix(matrix=values, times=times, symbols=symbols)
+    return panel if as_numpy else panel.to_polars()
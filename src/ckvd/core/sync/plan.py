@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""Query planning for the Failover Control Protocol (FCP).
+
+``build_fcp_plan`` runs the FCP's decisions for a validated request without
+touching the network or reading cache files:
+
+1. Cache: which daily files would be scanned and what they cover (from the
+   cache index, or from file existence when the root has no index)
+2. Vision: which UTC days would be downloaded and which of them fall inside
+   the freshness window (``is_date_too_fresh_for_vision``) and will 404
+3. REST: which ranges are left for REST, chunked like ``RestDataClient``
+   (``calculate_chunks``), and the request weight they cost
+
+The resulting ``FCPPlan`` carries rough cost estimates and is what
+``CryptoKlineVisionData.get_data`` executes, so the steps a plan lists are
+the steps a fetch runs. Coverage is estimated: intraday gaps in cache files
+and Vision days missing for other reasons are only found during execution.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import urlparse
+
+import attr
+
+from ckvd.core.sync.ckvd_types import DataSource, FCPRequest
+from ckvd.utils.config import (
+    PLAN_CACHE_SECONDS_PER_FILE,
+    PLAN_REST_SECONDS_PER_CHUNK,
+    PLAN_VISION_SECONDS_PER_DAY,
+    REST_CHUNK_SIZE,
+    REST_DEFAULT_WEIGHT_LIMIT,
+    REST_MAX_CHUNKS,
+    REST_WEIGHT_LIMITS,
+    REST_WEIGHT_PAUSE_THRESHOLD,
+    VISION_ADAPTIVE_INITIAL_CONCURRENCY,
+    VISION_DATA_DELAY_HOURS,
+)
+from ckvd.utils.for_core.ckvd_time_range_utils import merge_adjacent_ranges
+from ckvd.utils.for_core.rest_client_utils import calculate_chunks
+from ckvd.utils.for_core.rest_scheduler import request_weight
+from ckvd.utils.for_core.vision_constraints import is_date_too_fresh_for_vision
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market.endpoints import get_endpoint_url
+from ckvd.utils.market_constraints import DataProvider, MarketType
+
+__all__ = [
+    "FCPPlan",
+    "build_fcp_plan",
+]
+
+TimeRange = tuple[datetime, datetime]
+
+
+@attr.define(slots=True, frozen=True)
+class FCPPlan:
+    """What a ``get_data`` request will do, step by step, with cost estimates.
+
+    Attributes:
+        request: The validated request the plan was built for
+        read_cache: Whether the cache step runs
+        use_vision: Whether the Vision step runs for ranges the cache misses
+        use_rest: Whether the REST step runs for ranges still missing
+        cache_files: (day, path) of the cache files the cache step scans
+        missing_ranges: Ranges expected to be missing after the cache step
+        vision_days: UTC days the Vision step downloads
+        vision_fresh_days: Vision days inside the freshness window (expected 404)
+        rest_ranges: Ranges expected to be left for REST
+        rest_chunks: REST requests for ``rest_ranges``
+        rest_weight: Request weight of those requests
+        rest_wait_seconds: Expected rate-limit pauses when the weight exceeds one window
+        estimated_seconds: Rough wall time of the whole request
+    """
+
+    request: FCPRequest
+    read_cache: bool
+    use_vision: bool
+    use_rest: bool
+    cache_files: tuple[tuple[str, Path], ...] = ()
+    missing_ranges: tuple[TimeRange, ...] = ()
+    vision_days: tuple[date, ...] = ()
+    vision_fresh_days: tuple[date, ...] = ()
+    rest_ranges: tuple[TimeRange, ...] = ()
+    rest_chunks: int = 0
+    rest_weight: int = 0
+    rest_wait_seconds: float = 0.0
+    estimated_seconds: float = 0.0
+
+    def explain(self) -> str:
+        """Describe the plan as readable text, one line per FCP step."""
+        request = self.request
+        lines = [
+            f"FCP plan for {request.symbol} {request.interval.value} {request.chart_type.name} "
+            f"{request.aligned_start.isoformat()} -> {request.aligned_end.isoformat()}"
+        ]
+
+        if self.read_cache:
+            lines.append(f"  1. Cache:  scan {len(self.cache_files)} file(s); {_describe_ranges(self.missing_ranges)} not covered")
+        else:
+            lines.append("  1. Cache:  skipped")
+
+        if not self.use_vision:
+            lines.append("  2. Vision: skipped")
+        elif self.vision_days:
+            lines.append(
+                f"  2. Vision: download {len(self.vision_days)} day(s) "
+                f"({self.vision_days[0].isoformat()} .. {self.vision_days[-1].isoformat()}), "
+                f"{len(self.vision_fresh_days)} within the {VISION_DATA_DELAY_HOURS}h freshness window (expected 404)"
+            )
+        else:
+            lines.append("  2. Vision: nothing to download")
+
+        if not self.use_rest:
+            lines.append("  3. REST:   skipped")
+        elif self.rest_chunks:
+            wait = f", ~{self.rest_wait_seconds:.0f}s rate-limit pauses" if self.rest_wait_seconds else ""
+            lines.append(
+                f"  3. REST:   {_describe_ranges(self.rest_ranges)} in {self.rest_chunks} request(s), weight {self.rest_weight}{wait}"
+            )
+        else:
+            lines.append("  3. REST:   nothing expected")
+
+        lines.append(f"  Estimated time: ~{self.estimated_seconds:.1f}s")
+        return "\n".join(lines)
+
+
+def _describe_ranges(ranges: Sequence[TimeRange]) -> str:
+    """Summarize ranges as "N range(s) totalling <duration>"."""
+    total = sum((end - start for start, end in ranges), timedelta())
+    return f"{len(ranges)} range(s) totalling {total}"
+
+
+def _subtract_ranges(start: datetime, end: datetime, covered: Sequence[TimeRange]) -> list[TimeRange]:
+    """Parts of ``[start, end)`` not covered by any of ``covered``."""
+    missing = []
+    cursor = start
+    for covered_start, covered_end in sorted(covered):
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+def _vision_days(ranges: Sequence[TimeRange]) -> list[date]:
+    """UTC days a Vision fetch of ``ranges`` downloads (each range's start to end day inclusive)."""
+    days: set[date] = set()
+    for start, end in ranges:
+        day = start.astimezone(timezone.utc).date()
+        last = end.astimezone(timezone.utc).date()
+        while day <= last:
+            days.add(day)
+            day += timedelta(days=1)
+    return sorted(days)
+
+
+def _clip_ranges(ranges: Sequence[TimeRange], start: datetime) -> list[TimeRange]:
+    """Parts of ``ranges`` at or after ``start``."""
+    return [(max(range_start, start), range_end) for range_start, range_end in ranges if range_end > start]
+
+
+def _rest_cost(ranges: Sequence[TimeRange], request: FCPRequest, provider: DataProvider, market_type: MarketType) -> tuple[int, int, float]:
+    """REST requests, their weight, and the rate-limit pauses they imply."""
+    interval_ms = request.interval.to_seconds() * 1000
+    chunks = sum(
+        len(calculate_chunks(int(start.timestamp() * 1000), int(end.timestamp() * 1000), interval_ms, REST_CHUNK_SIZE, REST_MAX_CHUNKS))
+        for start, end in ranges
+    )
+
+    try:
+        endpoint = get_endpoint_url(market_type, request.chart_type, data_provider=provider)
+    except (ValueError, KeyError) as e:
+        logger.debug(f"[FCP] No REST endpoint for planning ({e}); counting weight 1 per request")
+        endpoint = ""
+    weight_per_chunk = request_weight(endpoint, {"limit": REST_CHUNK_SIZE}) if provider == DataProvider.BINANCE else 1
+    weight = chunks * weight_per_chunk
+
+    weight_limit, window_seconds = REST_WEIGHT_LIMITS.get(urlparse(endpoint).netloc, REST_DEFAULT_WEIGHT_LIMIT)
+    windows = math.ceil(weight / (weight_limit * REST_WEIGHT_PAUSE_THRESHOLD)) if weight else 0
+    return chunks, weight, max(0, windows - 1) * window_seconds
+
+
+def build_fcp_plan(
+    request: FCPRequest,
+    *,
+    provider: DataProvider,
+    market_type: MarketType,
+    use_cache: bool,
+    cache_dir: Path | None,
+    has_vision: bool,
+    now: datetime | None = None,
+) -> FCPPlan:
+    """Plan the FCP steps for a validated kline request without network I/O.
+
+    Args:
+        request: Request from ``CryptoKlineVisionData._prepare_request``
+        provider: Data provider
+        market_type: Market type
+        use_cache: Whether the manager reads and writes the cache
+        cache_dir: Cache root
+        has_vision: Whether the provider has a Vision client
+        now: Current time for the freshness window (default: now, UTC)
+
+    Returns:
+        FCPPlan for the request
+
+    Raises:
+        ValueError: If enforce_source=CACHE is requested with caching disabled
+    """
+    enforce_source = request.enforce_source
+    if enforce_source == DataSource.CACHE and not use_cache:
+        raise ValueError(
+            "Cannot use enforce_source=DataSource.CACHE when use_cache=False. Either enable caching or use a different data source."
+        )
+
+    aligned_start, aligned_end = request.aligned_start, request.aligned_end
+    read_cache = use_cache and cache_dir is not None and enforce_source not in (DataSource.REST, DataSource.VISION)
+    use_vision = has_vision and enforce_source != DataSource.REST
+    use_rest = enforce_source != DataSource.VISION
+
+    # Step 1: cache files and the spans they cover, from the index or file existence
+    cache_files: list[tuple[str, Path]] = []
+    missing = [(aligned_start, aligned_end)]
+    if read_cache:
+        from ckvd.utils.for_core.ckvd_cache_utils import find_cache_coverage
+
+        coverage = find_cache_coverage(
+            request.symbol, aligned_start, aligned_end, request.interval, cache_dir, market_type, request.chart_type
+        )
+        cache_files = [(day, path) for day, path, _, _ in coverage]
+        missing = _subtract_ranges(aligned_start, aligned_end, [(start, end) for _, _, start, end in coverage])
+        if cache_files and not request.auto_reindex:
+            # Partial cache with auto_reindex=False is returned as is, without API calls
+            missing = []
+
+    # Step 2: Vision days, and those too fresh to be published yet
+    vision_days: list[date] = []
+    fresh_days: list[date] = []
+    rest_ranges = missing
+    if use_vision and missing:
+        vision_days = _vision_days(missing)
+        fresh_days = [day for day in vision_days if is_date_too_fresh_for_vision(_midnight(day), now)]
+        rest_ranges = _clip_ranges(missing, _midnight(fresh_days[0])) if fresh_days else []
+
+    # Step 3: REST chunks and weight for what Vision cannot provide
+    rest_chunks, rest_weight, rest_wait = 0, 0, 0.0
+    if use_rest and rest_ranges:
+        rest_ranges = merge_adjacent_ranges(rest_ranges, request.interval)
+        rest_chunks, rest_weight, rest_wait = _rest_cost(rest_ranges, request, provider, market_type)
+    else:
+        rest_ranges = []
+
+    estimated = (
+        len(cache_files) * PLAN_CACHE_SECONDS_PER_FILE
+        + math.ceil(len(vision_days) / VISION_ADAPTIVE_INITIAL_CONCURRENCY) * PLAN_VISION_SECONDS_PER_DAY
+        + rest_chunks * PLAN_REST_SECONDS_PER_CHUNK
+        + rest_wait
+    )
+
+    return FCPPlan(
+        request=request,
+        read_cache=read_cache,
+        use_vision=use_vision,
+        use_rest=use_rest,
+        cache_files=tuple(cache_files),
+        missing_ranges=tuple(missing),
+        vision_days=tuple(vision_days),
+        vision_fresh_days=tuple(fresh_days),
+        rest_ranges=tuple(rest_ranges),
+        rest_chunks=rest_chunks,
+        rest_weight=rest_weight,
+        rest_wait_seconds=rest_wait,
+        estimated_seconds=estimated,
+    )
+
+
+def _midnight(day: date) -> datetime:
+    """UTC midnight starting ``day``."""
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
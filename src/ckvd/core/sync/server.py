@@ -0,0 +1,550 @@
+#!/usr/bin/env python
+"""Local data server sharing one cache and FCP pipeline across processes.
+
+``KlineServer`` (run by ``ckvd serve``) owns one ``CryptoKlineVisionData``
+per provider × market type and answers ``get_data`` requests on a Unix
+domain socket. Every notebook or worker on the machine then shares:
+
+- one warm cache and cache index (no per-process re-scans),
+- one REST weight budget and request scheduler,
+- coalesced Vision downloads (concurrent requests for the same day wait on
+  the day's lock and read the cached file).
+
+``KlineClient`` mirrors the ``get_data`` signature. Results travel as Arrow
+IPC streams, the in-memory Arrow layout itself, so neither side serializes
+values. With ``shared_memory=True`` the server writes the result as an Arrow
+IPC file under ``/dev/shm`` and the client memory-maps it: the returned
+columns point at the shared pages without a copy. The client unlinks the file
+once mapped; the server unlinks it when the response cannot be delivered and
+sweeps files left by dead servers on start and its own on shutdown.
+
+Wire format, per request on a connection:
+
+1. request header: 4-byte big-endian length + JSON object
+2. response header: 4-byte big-endian length + JSON object
+3. for stream responses, an Arrow IPC stream with the result table
+
+Example:
+    $ ckvd serve --cache-dir ./cache &
+
+    >>> from ckvd import Interval, MarketType
+    >>> from ckvd.core.sync.server import KlineClient
+    >>>
+    >>> client = KlineClient(market_type=MarketType.SPOT)
+    >>> df = client.get_data("BTCUSDT", start, end, Interval.MINUTE_1, return_polars=True)
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import socket
+import socketserver
+import struct
+import tempfile
+import threading
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import pyarrow as pa
+
+from ckvd.core.sync.ckvd_types import DataSource
+from ckvd.utils.app_paths import get_cache_dir
+from ckvd.utils.config import (
+    SERVER_CLIENT_TIMEOUT,
+    SERVER_MAX_HEADER_BYTES,
+    SERVER_SHM_DIR,
+    SERVER_SHM_PREFIX,
+    SERVER_SOCKET_FILENAME,
+    SERVER_SOCKET_PATH,
+)
+from ckvd.utils.for_core.rest_exceptions import RestAPIError
+from ckvd.utils.for_core.vision_exceptions import VisionAPIError
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
+    from ckvd.core.sync.crypto_kline_vision_data import CryptoKlineVisionData
+
+__all__ = [
+    "KlineClient",
+    "KlineServer",
+    "KlineServerError",
+    "default_socket_path",
+]
+
+_LENGTH = struct.Struct("!I")
+
+# Errors a get_data call may raise; reported to the client instead of dropping the connection
+_REQUEST_ERRORS = (VisionAPIError, RestAPIError, ValueError, TypeError, KeyError, OSError, RuntimeError)
+
+
+class KlineServerError(RuntimeError):
+    """A request failed on the server (the message carries the server-side error type)."""
+
+
+def default_socket_path() -> Path:
+    """Socket path used when none is given (``CKVD_SERVER_SOCKET`` or ``<cache dir>/ckvd.sock``)."""
+    return Path(SERVER_SOCKET_PATH) if SERVER_SOCKET_PATH else get_cache_dir() / SERVER_SOCKET_FILENAME
+
+
+def _send_header(wfile: BinaryIO, header: dict[str, Any]) -> None:
+    """Write one length-prefixed JSON header."""
+    payload = json.dumps(header).encode()
+    wfile.write(_LENGTH.pack(len(payload)) + payload)
+
+
+def _recv_header(rfile: BinaryIO) -> dict[str, Any] | None:
+    """Read one length-prefixed JSON header (None at end of stream).
+
+    Raises:
+        ValueError: If the header is truncated, too large or not a JSON object
+    """
+    prefix = rfile.read(_LENGTH.size)
+    if not prefix:
+        return None
+    if len(prefix) < _LENGTH.size:
+        raise ValueError("Truncated header length")
+    (length,) = _LENGTH.unpack(prefix)
+    if length > SERVER_MAX_HEADER_BYTES:
+        raise ValueError(f"Header of {length} bytes exceeds {SERVER_MAX_HEADER_BYTES}")
+    payload = rfile.read(length)
+    if len(payload) < length:
+        raise ValueError("Truncated header")
+    header = json.loads(payload)
+    if not isinstance(header, dict):
+        raise ValueError("Header must be a JSON object")
+    return header
+
+
+def _shm_owner_pid(path: Path) -> int | None:
+    """Server pid encoded in a shared-memory result name (None if it has none)."""
+    pid = path.name[len(SERVER_SHM_PREFIX) :].split("-", 1)[0]
+    return int(pid) if pid.isdigit() else None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this pid exists (owned by any user)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _to_arrow(result: pd.DataFrame | pl.DataFrame) -> tuple[pa.Table, str]:
+    """Arrow table of a ``get_data`` result and the frame type to rebuild on the client."""
+    import pandas as pd
+
+    if isinstance(result, pd.DataFrame):
+        # The pandas schema metadata restores the index and dtypes on the client
+        return pa.Table.from_pandas(result, preserve_index=True), "pandas"
+    return result.to_arrow(), "polars"
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers the requests of one client connection."""
+
+    server: _UnixServer
+
+    def handle(self) -> None:
+        while True:
+            try:
+                header = _recv_header(self.rfile)
+            except ValueError as e:
+                logger.warning(f"Dropping client connection: {e}")
+                return
+            if header is None:
+                return
+            self.server.kline_server.respond(header, self.wfile)
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server (one thread per connection)."""
+
+    daemon_threads = True
+    kline_server: KlineServer
+
+
+class KlineServer:
+    """Serves ``get_data`` from shared managers over a local Unix socket."""
+
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        use_cache: bool = True,
+        shm_dir: str | Path | None = None,
+    ) -> None:
+        """Initialize the server (the socket is bound by ``serve_forever``/``start``).
+
+        Args:
+            socket_path: Unix socket to listen on (default: ``default_socket_path()``)
+            cache_dir: Cache root of the managers (default: the library's cache directory)
+            use_cache: Whether the managers read and write the cache
+            shm_dir: Directory for shared-memory results (default: /dev/shm, else the temp dir)
+        """
+        self.socket_path = Path(socket_path) if socket_path is not None else default_socket_path()
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.use_cache = use_cache
+        if shm_dir is not None:
+            self.shm_dir = Path(shm_dir)
+        else:
+            self.shm_dir = SERVER_SHM_DIR if SERVER_SHM_DIR.is_dir() else Path(tempfile.gettempdir())
+
+        self._managers: dict[tuple[DataProvider, MarketType], CryptoKlineVisionData] = {}
+        self._managers_lock = threading.Lock()
+        self._shm_prefix = f"{SERVER_SHM_PREFIX}{os.getpid()}-{secrets.token_hex(4)}-"
+        self._requests = 0
+        self._server: _UnixServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> KlineServer:
+        """Start serving in a background thread."""
+        self.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Stop serving and close the managers."""
+        self.shutdown()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def bind(self) -> _UnixServer:
+        """Bind the socket, replacing a stale socket file left by a dead server.
+
+        Shared-memory results left by dead servers are removed as well.
+
+        Raises:
+            RuntimeError: If another server is listening on the socket
+        """
+        if self.socket_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"A server is already listening on {self.socket_path}")
+            finally:
+                probe.close()
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server = _UnixServer(str(self.socket_path), _RequestHandler)
+        server.kline_server = self
+        # Same-user access only, like the cache directory itself
+        os.chmod(self.socket_path, 0o600)
+        self._server = server
+        self._sweep_shared_memory(own=False)
+        logger.info(f"ckvd server listening on {self.socket_path}")
+        return server
+
+    def serve_forever(self) -> None:
+        """Serve requests until ``shutdown`` is called (blocks)."""
+        server = self._server or self.bind()
+        try:
+            server.serve_forever()
+        finally:
+            self._close()
+
+    def start(self) -> None:
+        """Serve requests in a daemon thread (returns once the socket accepts connections)."""
+        server = self.bind()
+        self._thread = threading.Thread(target=server.serve_forever, name="ckvd-server", daemon=True)
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop serving, remove the socket and close the managers."""
+        if self._server is not None:
+            self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._close()
+
+    def _close(self) -> None:
+        """Release the socket, undelivered shared-memory results and the managers."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+            self._sweep_shared_memory(own=True)
+        with self._managers_lock:
+            managers = list(self._managers.values())
+            self._managers.clear()
+        for manager in managers:
+            manager.close()
+
+    def _sweep_shared_memory(self, own: bool) -> None:
+        """Remove shared-memory results nobody will read.
+
+        Args:
+            own: Remove this server's files (on shutdown) instead of the files
+                of servers whose process is gone (on start)
+        """
+        for path in self.shm_dir.glob(f"{SERVER_SHM_PREFIX}*.arrow"):
+            if own:
+                stale = path.name.startswith(self._shm_prefix)
+            else:
+                pid = _shm_owner_pid(path)
+                stale = pid is None or not _pid_alive(pid)
+            if stale:
+                logger.debug("Removing undelivered shared-memory result {}", path)
+                path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def _manager(self, provider: DataProvider, market_type: MarketType) -> CryptoKlineVisionData:
+        """The shared manager of a provider and market type, created on first use."""
+        from ckvd.core.sync.crypto_kline_vision_data import CryptoKlineVisionData
+
+        with self._managers_lock:
+            manager = self._managers.get((provider, market_type))
+            if manager is None:
+                manager = CryptoKlineVisionData.create(provider, market_type, cache_dir=self.cache_dir, use_cache=self.use_cache)
+                self._managers[(provider, market_type)] = manager
+            return manager
+
+    def status(self) -> dict[str, Any]:
+        """Process id, request count and the managers created so far."""
+        with self._managers_lock:
+            managers = [f"{provider.name}/{market_type.name}" for provider, market_type in self._managers]
+        return {"pid": os.getpid(), "requests": self._requests, "managers": managers}
+
+    def get_data(self, request: dict[str, Any]) -> pd.DataFrame | pl.DataFrame:
+        """Run one decoded ``get_data`` request on the shared manager.
+
+        Args:
+            request: Request header (see ``KlineClient._request``)
+
+        Returns:
+            The manager's ``get_data`` result
+        """
+        manager = self._manager(DataProvider[request["provider"]], MarketType[request["market_type"]])
+        options = request["options"]
+        chart_type = options.get("chart_type")
+        return manager.get_data(
+            request["symbol"],
+            datetime.fromisoformat(request["start_time"]),
+            datetime.fromisoformat(request["end_time"]),
+            Interval(request["interval"]),
+            chart_type=ChartType[chart_type] if chart_type else None,
+            include_source_info=options["include_source_info"],
+            enforce_source=DataSource[options["enforce_source"]],
+            auto_reindex=options["auto_reindex"],
+            return_polars=options["return_polars"],
+            columns=options.get("columns"),
+            dtype_backend=options["dtype_backend"],
+            schema_profile=options["schema_profile"],
+        )
+
+    def respond(self, request: dict[str, Any], wfile: BinaryIO) -> None:
+        """Answer one request header on a connection.
+
+        Args:
+            request: Decoded request header
+            wfile: Connection to write the response to
+        """
+        with self._managers_lock:
+            self._requests += 1
+        op = request.get("op")
+        if op == "status":
+            _send_header(wfile, {"ok": True, **self.status()})
+            return
+        if op != "get_data":
+            _send_header(wfile, {"ok": False, "error": "ValueError", "message": f"Unknown op {op!r}", "value_error": True})
+            return
+
+        try:
+            table, frame = _to_arrow(self.get_data(request))
+        except _REQUEST_ERRORS as e:
+            logger.warning(f"get_data request for {request.get('symbol')} failed: {type(e).__name__}: {e}")
+            _send_header(wfile, {"ok": False, "error": type(e).__name__, "message": str(e), "value_error": isinstance(e, ValueError)})
+            return
+
+        if request.get("shared_memory"):
+            fd, path = tempfile.mkstemp(prefix=self._shm_prefix, suffix=".arrow", dir=self.shm_dir)
+            os.close(fd)
+            try:
+                with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+                _send_header(wfile, {"ok": True, "frame": frame, "rows": table.num_rows, "path": path})
+                wfile.flush()
+            except OSError:
+                # Client gone (timed out or disconnected) or /dev/shm full: nobody will unlink it
+                Path(path).unlink(missing_ok=True)
+                raise
+            return
+
+        _send_header(wfile, {"ok": True, "frame": frame, "rows": table.num_rows})
+        with pa.ipc.new_stream(wfile, table.schema) as writer:
+            writer.write_table(table)
+
+
+class KlineClient:
+    """Thin client of a ``KlineServer`` mirroring ``CryptoKlineVisionData.get_data``.
+
+    Each call opens its own connection, so one client can be shared by threads.
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider = DataProvider.BINANCE,
+        market_type: MarketType = MarketType.SPOT,
+        socket_path: str | Path | None = None,
+        shared_memory: bool = False,
+        timeout: float = SERVER_CLIENT_TIMEOUT,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            provider: Data provider of the requests
+            market_type: Market type of the requests
+            socket_path: Server socket (default: ``default_socket_path()``)
+            shared_memory: Receive results as memory-mapped Arrow files instead of over the socket
+            timeout: Seconds to wait for a response
+        """
+        self.provider = provider
+        self.market_type = market_type
+        self.socket_path = Path(socket_path) if socket_path is not None else default_socket_path()
+        self.shared_memory = shared_memory
+        self.timeout = timeout
+
+    def _connect(self) -> socket.socket:
+        """Open a connection to the server."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _request(self, header: dict[str, Any]) -> tuple[dict[str, Any], pa.Table | None]:
+        """Send one request and read the response header and table.
+
+        Raises:
+            ValueError: If the server rejected the request arguments
+            KlineServerError: If the request failed on the server
+        """
+        with self._connect() as sock, sock.makefile("rwb") as stream:
+            _send_header(stream, header)
+            stream.flush()
+            response = _recv_header(stream)
+            if response is None:
+                raise KlineServerError("Server closed the connection without a response")
+            if not response["ok"]:
+                if response.get("value_error"):
+                    raise ValueError(response["message"])
+                raise KlineServerError(f"{response['error']}: {response['message']}")
+            if "frame" not in response:
+                return response, None
+            if "path" in response:
+                return response, self._read_shared(response["path"])
+            return response, pa.ipc.open_stream(stream).read_all()
+
+    @staticmethod
+    def _read_shared(path: str) -> pa.Table:
+        """Memory-map a shared-memory result and remove its name.
+
+        The mapping stays valid while the returned table is referenced.
+        """
+        try:
+            with pa.memory_map(path) as source:
+                return pa.ipc.open_file(source).read_all()
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    def status(self) -> dict[str, Any]:
+        """Server process id, request count and managers."""
+        response, _ = self._request({"op": "status"})
+        return {key: value for key, value in response.items() if key != "ok"}
+
+    def get_data(
+        self,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: Interval = Interval.MINUTE_1,
+        chart_type: ChartType | None = None,
+        include_source_info: bool = True,
+        enforce_source: DataSource = DataSource.AUTO,
+        auto_reindex: bool = True,
+        return_polars: bool = False,
+        columns: Sequence[str] | None = None,
+        dtype_backend: str = "numpy",
+        schema_profile: str = "standard",
+    ) -> pd.DataFrame | pl.DataFrame:
+        """Retrieve market data through the server (see ``CryptoKlineVisionData.get_data``).
+
+        Args:
+            symbol: Trading symbol (e.g., "BTCUSDT")
+            start_time: Start time (timezone-aware datetime)
+            end_time: End time (timezone-aware datetime)
+            interval: Kline interval
+            chart_type: Chart type (default: the server manager's)
+            include_source_info: Whether to include ``_data_source``
+            enforce_source: Force a specific data source
+            auto_reindex: Whether to reindex to a complete time series
+            return_polars: Return a Polars DataFrame instead of pandas
+            columns: Optional subset of kline columns
+            dtype_backend: pandas dtype backend ("numpy" or "pyarrow")
+            schema_profile: Column types ("standard" or "compact")
+
+        Returns:
+            The same frame ``get_data`` returns in the server process
+
+        Raises:
+            ValueError: If the server rejected the arguments
+            KlineServerError: If the request failed on the server
+            OSError: If the server is not reachable
+        """
+        header = {
+            "op": "get_data",
+            "provider": self.provider.name,
+            "market_type": self.market_type.name,
+            "symbol": symbol,
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "interval": interval.value,
+            "shared_memory": self.shared_memory,
+            "options": {
+                "chart_type": chart_type.name if chart_type is not None else None,
+                "include_source_info": include_source_info,
+                "enforce_source": enforce_source.name,
+                "auto_reindex": auto_reindex,
+                "return_polars": return_polars,
+                "columns": list(columns) if columns is not None else None,
+                "dtype_backend": dtype_backend,
+                "schema_profile": schema_profile,
+            },
+        }
+        response, table = self._request(header)
+        logger.debug("Received {} rows for {} from {}", response["rows"], symbol, self.socket_path)
+
+        if response["frame"] == "polars":
+            import polars as pl
+
+            return pl.from_arrow(table)
+
+        import pandas as pd
+
+        if dtype_backend == "pyarrow":
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return table.to_pandas()
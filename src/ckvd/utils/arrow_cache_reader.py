@@ -9,6 +9,10 @@ This module provides a class for interacting with the Arrow Cache SQLite databas
 and reading data from the Arrow cache files. It's designed to be used by external
 modules that need to efficiently determine what data is available in the cache.
 
+The database is the cache index (see ``ckvd.utils.cache.index.CacheIndex``),
+kept current by every cache writer. Pass ``cache_dir`` to read the index of a
+runtime cache root instead of the cache builder's ``./logs/cache_index.db``.
+
 Internally uses Polars for zero-copy Arrow file reads. Converts to pandas only
 at the API boundary for backward compatibility.
 
@@ -41,8 +45,11 @@ from typing import Any
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 from rich import print
 
+from ckvd.utils.cache.compression import read_ipc_polars
+from ckvd.utils.cache.index import CacheIndex
 from ckvd.utils.config import MAX_PREVIEW_ITEMS, MIN_FILES_FOR_README
 from ckvd.utils.dataframe_utils import ensure_open_time_as_index
 from ckvd.utils.loguru_setup import logger
@@ -57,6 +64,7 @@ class ArrowCacheReader:
         cache_db_path: str | Path = "./logs/cache_index.db",
         data_provider: DataProvider = DataProvider.BINANCE,
         chart_type: ChartType = ChartType.KLINES,
+        cache_dir: str | Path | None = None,
     ) -> None:
         """Initialize the Arrow Cache Reader.
 
@@ -64,11 +72,18 @@ class ArrowCacheReader:
             cache_db_path: Path to the SQLite database
             data_provider: Data provider (default: DataProvider.BINANCE)
             chart_type: Chart type (default: ChartType.KLINES)
+            cache_dir: Cache root whose index to read; overrides cache_db_path
         """
-        self.cache_db_path = Path(cache_db_path)
+        self._index = CacheIndex.for_cache_dir(cache_dir) if cache_dir is not None else CacheIndex(cache_db_path)
+        self.cache_db_path = self._index.db_path
         self.data_provider = data_provider
         self.chart_type = chart_type
 
+    def _require_index(self) -> None:
+        """Raise FileNotFoundError if the cache database doesn't exist."""
+        if not self.cache_db_path.exists():
+            raise FileNotFoundError(f"Cache database not found at {self.cache_db_path}")
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a connection to the SQLite database.
 
@@ -78,38 +93,10 @@ class ArrowCacheReader:
         Raises:
             FileNotFoundError: If the cache database doesn't exist
         """
-        if not self.cache_db_path.exists():
-            raise FileNotFoundError(f"Cache database not found at {self.cache_db_path}")
+        self._require_index()
 
-        return sqlite3.connect(self.cache_db_path)
-
-    def _get_cache_path_components(
-        self,
-        symbol: str,
-        interval: str | Interval,
-        market_type: MarketType | None = MarketType.SPOT,
-    ) -> tuple[str, str]:
-        """Get the cache path components for a symbol and interval.
-
-        Args:
-            symbol: Trading pair symbol
-            interval: Time interval (Interval enum or string)
-            market_type: Market type (default: MarketType.SPOT)
-
-        Returns:
-            Tuple of (provider_str, path_pattern) for finding files in the database
-        """
-        # Convert interval to string if it's an Interval enum
-        interval_str = interval.value if isinstance(interval, Interval) else str(interval)
-
-        # Format: BINANCE/KLINES/{market_type}/{symbol}/{interval}/
-        provider_str = self.data_provider.name
-        chart_type_str = self.chart_type.vision_api_path
-        market_type_str = market_type.vision_api_path.replace("/", "_")
-
-        path_pattern = f"cache/{provider_str}/{chart_type_str}/{market_type_str}/{symbol}/{interval_str}/%"
-
-        return provider_str, path_pattern
+        # WAL mode; legacy path-only indexes are migrated on first connect
+        return self._index.connect()
 
     def check_availability(
         self,
@@ -134,7 +121,10 @@ class ArrowCacheReader:
                 - missing_dates: List of dates without data
                 - coverage_percentage: Percentage of requested dates available
                 - total_records: Total number of records available
+                - total_size_bytes: Total size of the available files
                 - paths: Dict mapping dates to file paths
+                - checksums: Dict mapping dates to SHA-256 file checksums
+                  (None for files indexed before checksums were recorded)
         """
         # Convert interval to string if it's an Interval enum
         interval_str = interval.value if isinstance(interval, Interval) else str(interval)
@@ -151,36 +141,19 @@ class ArrowCacheReader:
         days_count = (end_dt - start_dt).days + 1
         all_dates = [(start_dt + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days_count)]
 
-        # Query the database for available dates
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        if all_dates:
-            placeholders = ", ".join(["?"] * len(all_dates))
-
-            # Get the path pattern for this type of data
-            _, path_pattern = self._get_cache_path_components(symbol, interval_str, market_type)
-
-            cursor.execute(
-                f"""
-                SELECT date, num_records, path
-                FROM cache_entries
-                WHERE symbol = ? AND interval = ? AND date IN ({placeholders})
-                AND path LIKE ?
-                """,
-                [symbol, interval_str, *all_dates, path_pattern],
-            )
-
-            results = cursor.fetchall()
-        else:
-            results = []
-
-        conn.close()
+        # Query the index for available dates
+        self._require_index()
+        entries = (
+            self._index.get_entries(market_type, symbol, interval_str, start_date, end_date, self.chart_type, self.data_provider)
+            if all_dates
+            else []
+        )
 
         # Process results
-        available_dates = [row[0] for row in results]
-        missing_dates = [date for date in all_dates if date not in available_dates]
-        total_records = sum(row[1] for row in results)
+        available_dates = [entry.date for entry in entries]
+        available = set(available_dates)
+        missing_dates = [date for date in all_dates if date not in available]
+        total_records = sum(entry.num_records or 0 for entry in entries)
 
         coverage = 0 if not all_dates else (len(available_dates) / len(all_dates)) * 100
 
@@ -189,7 +162,9 @@ class ArrowCacheReader:
             "missing_dates": missing_dates,
             "coverage_percentage": coverage,
             "total_records": total_records,
-            "paths": {row[0]: row[2] for row in results},
+            "total_size_bytes": sum(entry.file_size or 0 for entry in entries),
+            "paths": {entry.date: entry.path for entry in entries},
+            "checksums": {entry.date: entry.checksum for entry in entries},
         }
 
     def get_file_path(
@@ -216,27 +191,15 @@ class ArrowCacheReader:
         if isinstance(date, datetime):
             date = date.strftime("%Y-%m-%d")
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Get the path pattern for this type of data
-        _, path_pattern = self._get_cache_path_components(symbol, interval_str, market_type)
-
-        cursor.execute(
-            """
-            SELECT path FROM cache_entries
-            WHERE symbol = ? AND interval = ? AND date = ? AND path LIKE ?
-            """,
-            (symbol, interval_str, date, path_pattern),
-        )
-
-        result = cursor.fetchone()
-        conn.close()
+        self._require_index()
+        entries = self._index.get_entries(market_type, symbol, interval_str, date, date, self.chart_type, self.data_provider)
 
-        return result[0] if result else None
+        return entries[0].path if entries else None
 
     def _read_arrow_file_polars(self, file_path: str | Path) -> pl.DataFrame:
-        """Read an Arrow IPC file using Polars (zero-copy).
+        """Read an Arrow IPC file using Polars (zero-copy when uncompressed).
+
+        Handles LZ4/ZSTD-compressed and uncompressed cache files alike.
 
         Args:
             file_path: Path to the Arrow file
@@ -252,9 +215,9 @@ class ArrowCacheReader:
             raise FileNotFoundError(f"Arrow file not found: {file_path}")
 
         try:
-            # Polars reads Arrow IPC format with zero-copy
-            return pl.read_ipc(path, memory_map=True)
-        except (OSError, pl.exceptions.ComputeError) as e:
+            # Memory-mapped Arrow read; compressed batches are decompressed on read
+            return read_ipc_polars(path)
+        except (OSError, pa.ArrowInvalid, pl.exceptions.ComputeError) as e:
             logger.error(f"Error reading arrow file {file_path}: {e}")
             raise
 
@@ -351,65 +314,8 @@ class ArrowCacheReader:
         Returns:
             dict: Statistics about the cache
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Last update time
-        cursor.execute("SELECT value FROM cache_metadata WHERE key = 'last_update'")
-        result = cursor.fetchone()
-        last_update = result[0] if result else "Unknown"
-
-        # Total number of entries
-        cursor.execute("SELECT COUNT(*) FROM cache_entries")
-        total_entries = cursor.fetchone()[0]
-
-        # Total number of symbols
-        cursor.execute("SELECT COUNT(DISTINCT symbol) FROM cache_entries")
-        total_symbols = cursor.fetchone()[0]
-
-        # Total number of intervals
-        cursor.execute("SELECT COUNT(DISTINCT interval) FROM cache_entries")
-        total_intervals = cursor.fetchone()[0]
-
-        # Count by market type (inferred from path)
-        cursor.execute(
-            """
-            SELECT
-                CASE
-                    WHEN path LIKE '%/spot/%' THEN 'SPOT'
-                    WHEN path LIKE '%/futures_um/%' THEN 'FUTURES_USDT'
-                    WHEN path LIKE '%/futures_cm/%' THEN 'FUTURES_COIN'
-                    ELSE 'OTHER'
-                END as market_type,
-                COUNT(*) as count
-            FROM cache_entries
-            GROUP BY market_type
-        """
-        )
-        market_counts = dict(cursor.fetchall())
-
-        # Total storage size
-        cursor.execute("SELECT SUM(file_size) FROM cache_entries")
-        result = cursor.fetchone()
-        total_size = result[0] or 0
-
-        # Total records
-        cursor.execute("SELECT SUM(num_records) FROM cache_entries")
-        result = cursor.fetchone()
-        total_records = result[0] or 0
-
-        conn.close()
-
-        return {
-            "last_update": last_update,
-            "total_entries": total_entries,
-            "total_symbols": total_symbols,
-            "total_intervals": total_intervals,
-            "market_type_counts": market_counts,
-            "total_size_bytes": total_size,
-            "total_size_mb": total_size / (1024 * 1024),
-            "total_records": total_records,
-        }
+        self._require_index()
+        return self._index.get_statistics()
 
     def list_available_symbols(self, market_type: MarketType | None = None) -> list[str]:
         """Get a list of all symbols available in the cache.
@@ -424,11 +330,9 @@ class ArrowCacheReader:
         cursor = conn.cursor()
 
         if market_type:
-            # Get pattern based on market type
-            market_type_pattern = f"%/{market_type.vision_api_path.replace('/', '_')}/%"
             cursor.execute(
-                "SELECT DISTINCT symbol FROM cache_entries WHERE path LIKE ?",
-                (market_type_pattern,),
+                "SELECT DISTINCT symbol FROM cache_entries WHERE market_type = ?",
+                (self._index.market_key(market_type),),
             )
         else:
             cursor.execute("SELECT DISTINCT symbol FROM cache_entries")
@@ -458,10 +362,8 @@ class ArrowCacheReader:
             params.append(symbol)
 
         if market_type:
-            # Get pattern based on market type
-            market_type_pattern = f"%/{market_type.vision_api_path.replace('/', '_')}/%"
-            query_parts.append("path LIKE ?")
-            params.append(market_type_pattern)
+            query_parts.append("market_type = ?")
+            params.append(self._index.market_key(market_type))
 
         if query_parts:
             query = f"SELECT DISTINCT interval FROM cache_entries WHERE {' AND '.join(query_parts)}"
@@ -492,24 +394,9 @@ class ArrowCacheReader:
         # Convert interval to string if it's an Interval enum
         interval_str = interval.value if isinstance(interval, Interval) else str(interval)
 
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Get the path pattern for this type of data
-        _, path_pattern = self._get_cache_path_components(symbol, interval_str, market_type)
-
-        cursor.execute(
-            """
-            SELECT date FROM cache_entries
-            WHERE symbol = ? AND interval = ? AND path LIKE ?
-            ORDER BY date
-            """,
-            (symbol, interval_str, path_pattern),
-        )
-
-        dates = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        return dates
+        self._require_index()
+        entries = self._index.get_entries(market_type, symbol, interval_str, chart_type=self.chart_type, provider=self.data_provider)
+        return [entry.date for entry in entries]
 
     def list_available_market_types(self) -> list[str]:
         """Get a list of all market types available in the cache.
@@ -520,18 +407,7 @@ class ArrowCacheReader:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT DISTINCT
-                CASE
-                    WHEN path LIKE '%/spot/%' THEN 'SPOT'
-                    WHEN path LIKE '%/futures_um/%' THEN 'FUTURES_USDT'
-                    WHEN path LIKE '%/futures_cm/%' THEN 'FUTURES_COIN'
-                    ELSE path
-                END as market_type
-            FROM cache_entries
-        """
-        )
+        cursor.execute("SELECT DISTINCT market_type FROM cache_entries ORDER BY market_type")
 
         market_types = [row[0] for row in cursor.fetchall()]
         conn.close()
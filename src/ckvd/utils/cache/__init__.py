@@ -3,6 +3,11 @@
 
 This subpackage provides centralized cache validation utilities including:
 - Error types and constants
+- Arrow IPC compression settings per cache root
+- Hourly record batches with a time index for sub-day reads
+- SQLite index of cache files shared by all writers and readers
+- Incremental metadata store for UnifiedCacheManager
+- Single-flight coalescing and advisory locks for concurrent fetches
 - Safe memory map handling for Arrow files
 - Validation options and configuration
 - Cache key and path generation
@@ -14,6 +19,13 @@ This subpackage provides centralized cache validation utilities including:
 # Refactoring: Split from cache_validator.py (808 lines) for modularity
 """
 
+from ckvd.utils.cache.compression import (
+    get_cache_compression,
+    read_ipc_compression,
+    read_ipc_polars,
+    set_cache_compression,
+    write_ipc_table,
+)
 from ckvd.utils.cache.errors import (
     ERROR_TYPES,
     TEST_SYMBOL,
@@ -26,13 +38,17 @@ from ckvd.utils.cache.functions import (
     validate_cache_metadata,
     validate_cache_records,
 )
+from ckvd.utils.cache.index import CacheIndex, CacheIndexEntry
 from ckvd.utils.cache.key_manager import CacheKeyManager
 from ckvd.utils.cache.memory_map import SafeMemoryMap
+from ckvd.utils.cache.metadata_store import CacheMetadataStore
 from ckvd.utils.cache.options import (
     AlignmentOptions,
     CachePathOptions,
     ValidationOptions,
 )
+from ckvd.utils.cache.single_flight import SingleFlight, cache_file_lock, cache_file_locks
+from ckvd.utils.cache.time_batches import read_ipc_time_range
 from ckvd.utils.cache.validator import CacheValidator
 from ckvd.utils.cache.vision_manager import VisionCacheManager
 
@@ -41,18 +57,30 @@ __all__ = [
     "TEST_SYMBOL",
     # Classes
     "AlignmentOptions",
+    "CacheIndex",
+    "CacheIndexEntry",
     "CacheKeyManager",
+    "CacheMetadataStore",
     "CachePathOptions",
     # Errors
     "CacheValidationError",
     "CacheValidator",
     "SafeMemoryMap",
+    "SingleFlight",
     "ValidationOptions",
     "VisionCacheManager",
     # Functions
+    "cache_file_lock",
+    "cache_file_locks",
+    "get_cache_compression",
+    "read_ipc_compression",
+    "read_ipc_polars",
+    "read_ipc_time_range",
     "safely_read_arrow_file_async",
+    "set_cache_compression",
     "validate_cache_checksum",
     "validate_cache_integrity",
     "validate_cache_metadata",
     "validate_cache_records",
+    "write_ipc_table",
 ]
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""Arrow IPC compression settings for cache roots.
+
+Each cache root can opt into LZ4_FRAME or ZSTD compression for the Arrow IPC
+files written beneath it. The choice lives in ``cache_settings.json`` at the
+root so every writer (library, UnifiedCacheManager, cache builder scripts)
+agrees. Readers do not need the setting: Arrow IPC records the codec per
+record batch, so compressed and uncompressed files can be mixed freely.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+
+from ckvd.utils.cache.time_batches import split_time_batches
+from ckvd.utils.config import CACHE_COMPRESSION_CODECS, CACHE_RECORD_BATCH_SECONDS, CACHE_SETTINGS_FILENAME
+from ckvd.utils.loguru_setup import logger
+
+if TYPE_CHECKING:
+    import polars as pl
+
+__all__ = [
+    "COMPRESSION_METADATA_KEY",
+    "get_cache_compression",
+    "read_ipc_compression",
+    "read_ipc_polars",
+    "set_cache_compression",
+    "write_ipc_table",
+]
+
+# Schema metadata key recording the codec a cache file was written with
+COMPRESSION_METADATA_KEY = b"ckvd:ipc_compression"
+
+
+def _normalize_codec(codec: str | None) -> str | None:
+    """Normalize a codec name, mapping "none"/"uncompressed" to None.
+
+    Raises:
+        ValueError: If the codec is not supported or not built into pyarrow.
+    """
+    if codec is None:
+        return None
+    codec = codec.lower().replace("_frame", "")
+    if codec in ("", "none", "uncompressed"):
+        return None
+    if codec not in CACHE_COMPRESSION_CODECS:
+        raise ValueError(f"Unsupported cache compression '{codec}'. Use one of {(*CACHE_COMPRESSION_CODECS, 'none')}")
+    if not pa.Codec.is_available(codec):
+        raise ValueError(f"Compression codec '{codec}' is not available in this pyarrow build")
+    return codec
+
+
+def get_cache_compression(cache_root: str | Path) -> str | None:
+    """Return the IPC compression codec configured for a cache root.
+
+    Args:
+        cache_root: Cache root directory
+
+    Returns:
+        "lz4", "zstd" or None (uncompressed, also when no setting exists)
+    """
+    settings_path = Path(cache_root) / CACHE_SETTINGS_FILENAME
+    if not settings_path.exists():
+        return None
+    try:
+        with open(settings_path) as f:
+            return _normalize_codec(json.load(f).get("ipc_compression"))
+    except (OSError, json.JSONDecodeError, AttributeError, ValueError) as e:
+        logger.warning(f"Ignoring invalid cache settings {settings_path}: {e}")
+        return None
+
+
+def set_cache_compression(cache_root: str | Path, codec: str | None) -> None:
+    """Set the IPC compression codec for files written under a cache root.
+
+    Existing files are left as they are; readers handle both layouts.
+
+    Args:
+        cache_root: Cache root directory
+        codec: "lz4", "zstd", or None/"none" for uncompressed files
+
+    Raises:
+        ValueError: If the codec is not supported
+        OSError: If the settings file cannot be written
+    """
+    codec = _normalize_codec(codec)
+    root = Path(cache_root)
+    root.mkdir(parents=True, exist_ok=True)
+    settings_path = root / CACHE_SETTINGS_FILENAME
+
+    settings = {}
+    if settings_path.exists():
+        try:
+            with open(settings_path) as f:
+                settings = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Overwriting unreadable cache settings {settings_path}: {e}")
+
+    settings["ipc_compression"] = codec or "none"
+    temp_path = settings_path.with_suffix(".tmp")
+    with open(temp_path, "w") as f:
+        json.dump(settings, f, indent=2)
+    temp_path.replace(settings_path)
+    logger.info(f"Cache IPC compression for {root} set to {settings['ipc_compression']}")
+
+
+def write_ipc_table(
+    table: pa.Table,
+    path: str | Path,
+    compression: str | None = None,
+    batch_seconds: int = CACHE_RECORD_BATCH_SECONDS,
+) -> None:
+    """Write a table as an Arrow IPC file, optionally compressed.
+
+    The codec is also stored in the schema metadata so tools can report it
+    without decoding record batches. Tables with an ``open_time`` timestamp
+    column are written as one record batch per ``batch_seconds`` with a batch
+    index in the schema metadata, so ``read_ipc_time_range`` can read just the
+    batches a query needs. The file is written under a temporary name and
+    renamed into place, so concurrent readers and writers of the same path
+    never see a partial file.
+
+    Args:
+        table: Table to write
+        path: Destination file path
+        compression: "lz4", "zstd" or None (uncompressed)
+        batch_seconds: open_time span of each record batch (0 = one batch)
+    """
+    compression = _normalize_codec(compression)
+    if compression is not None:
+        metadata = {**(table.schema.metadata or {}), COMPRESSION_METADATA_KEY: compression.encode()}
+        table = table.replace_schema_metadata(metadata)
+    split = split_time_batches(table, batch_seconds)
+    batches = None
+    if split is not None:
+        table, batches = split
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            if batches is None:
+                writer.write_table(table)
+            else:
+                for batch in batches:
+                    writer.write_batch(batch)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_ipc_compression(path: str | Path) -> str | None:
+    """Return the codec recorded in a cache file's schema metadata.
+
+    Only reads the file footer. Files written before compression support (or
+    by other tools) report None.
+
+    Args:
+        path: Arrow IPC file path
+
+    Returns:
+        "lz4", "zstd" or None
+    """
+    with pa.memory_map(str(path), "r") as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    codec = metadata.get(COMPRESSION_METADATA_KEY)
+    return codec.decode() if codec else None
+
+
+def read_ipc_polars(path: str | Path) -> pl.DataFrame:
+    """Read a cache file into Polars, compressed or not.
+
+    Uncompressed files stay memory-mapped (zero-copy); compressed record
+    batches are decompressed by Arrow as they are read. Unlike
+    ``pl.read_ipc(memory_map=True)`` this needs no per-file codec check.
+
+    Args:
+        path: Arrow IPC file path
+
+    Returns:
+        Polars DataFrame with the file contents
+    """
+    import polars as pl
+
+    with pa.memory_map(str(path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return pl.from_arrow(table)
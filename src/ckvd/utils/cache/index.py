@@ -0,0 +1,445 @@
+#!/usr/bin/env python
+"""Unified SQLite index of cache files.
+
+Every cache root keeps one WAL-mode database (``cache_index.db``) with a row
+per daily cache file: coverage key, row count, byte size, time bounds,
+SHA-256 checksum and IPC codec. All cache writers (``save_to_cache``,
+UnifiedCacheManager, the cache builder script) upsert rows transactionally
+right after writing a file, so ArrowCacheReader and the FCP cache step can
+answer coverage questions with one query instead of probing the filesystem
+day by day; days the index does not list are still probed. ``rebuild_from_disk()``
+(``ckvd reindex``) backfills roots written before the index existed; it is
+never run implicitly because it walks the whole root.
+
+Indexes created by older cache builder versions (no ``market_type`` column,
+market inferred from the file path) are migrated in place on first open.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import astuple, dataclass, fields
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ckvd.utils.cache.compression import read_ipc_compression
+from ckvd.utils.cache.validator import CacheValidator
+from ckvd.utils.config import CACHE_INDEX_BUSY_TIMEOUT, CACHE_INDEX_FILENAME
+from ckvd.utils.loguru_setup import logger
+from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
+
+__all__ = [
+    "CacheIndex",
+    "CacheIndexEntry",
+]
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_metadata (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        provider TEXT NOT NULL,
+        chart_type TEXT NOT NULL,
+        market_type TEXT NOT NULL,
+        symbol TEXT NOT NULL,
+        interval TEXT NOT NULL,
+        date TEXT NOT NULL,
+        path TEXT NOT NULL,
+        file_size INTEGER,
+        num_records INTEGER,
+        start_time_ms INTEGER,
+        end_time_ms INTEGER,
+        checksum TEXT,
+        compression TEXT,
+        last_updated TEXT,
+        UNIQUE(provider, chart_type, market_type, symbol, interval, date)
+    )
+    """,
+)
+
+# Market type of rows migrated from the path-only schema
+_LEGACY_MARKET_TYPE_SQL = """
+    CASE
+        WHEN path LIKE '%/futures_um/%' OR path LIKE '%/futures/um/%' THEN 'FUTURES_USDT'
+        WHEN path LIKE '%/futures_cm/%' OR path LIKE '%/futures/cm/%' THEN 'FUTURES_COIN'
+        ELSE 'SPOT'
+    END
+"""
+
+# Vision-style cache layout shared by save_to_cache ("data/...") and
+# UnifiedCacheManager ("{provider}/{chart}/..."):
+# {market}/daily/{chart}/{SYMBOL}/{interval}/{SYMBOL}-{interval}-{date}.arrow
+_VISION_LAYOUT = re.compile(
+    r"^(?:(\w+)/\w+/)?(?:data/)?(spot|futures/um|futures/cm)/daily/([^/]+)/([^/]+)/([^/]+)/[^/]+-(\d{4}-\d{2}-\d{2})\.arrow$"
+)
+_MARKET_BY_VISION_PATH = {"spot": "SPOT", "futures/um": "FUTURES_USDT", "futures/cm": "FUTURES_COIN"}
+_MARKET_ALIASES = {"FUTURES": "FUTURES_USDT", "UM": "FUTURES_USDT", "CM": "FUTURES_COIN"}
+_CHART_BY_VISION_PATH = {"klines": "KLINES", "fundingRate": "FUNDING_RATE"}
+
+
+def _market_name(market_type: MarketType | str) -> str:
+    """Index key for a market type (FUTURES and "um" are stored as FUTURES_USDT, "cm" as FUTURES_COIN)."""
+    if isinstance(market_type, MarketType):
+        return _MARKET_BY_VISION_PATH.get(market_type.vision_api_path, market_type.name)
+    market_type = market_type.upper()
+    return _MARKET_ALIASES.get(market_type, market_type)
+
+
+def _index_symbol(symbol: str, market_type: str) -> str:
+    """Index key for a symbol, matching the on-disk name (coin-margined symbols carry _PERP)."""
+    symbol = symbol.upper()
+    if market_type == "FUTURES_COIN" and not symbol.endswith("_PERP"):
+        return f"{symbol}_PERP"
+    return symbol
+
+
+def _enum_name(value: DataProvider | ChartType | str) -> str:
+    """Index key for a provider or chart type."""
+    return value.upper() if isinstance(value, str) else value.name
+
+
+def _interval_str(interval: Interval | str) -> str:
+    """Index key for an interval."""
+    return interval.value if isinstance(interval, Interval) else str(interval)
+
+
+def _date_str(day: date | str) -> str:
+    """Index key for a day (YYYY-MM-DD)."""
+    return day if isinstance(day, str) else day.strftime("%Y-%m-%d")
+
+
+def _time_bounds_ms(table: pa.Table) -> tuple[int | None, int | None]:
+    """Return the first/last timestamp of a cache table in milliseconds."""
+    for name in ("open_time", "funding_time"):
+        if name not in table.column_names or table.num_rows == 0:
+            continue
+        column = table.column(name)
+        if pa.types.is_timestamp(column.type):
+            column = column.cast(pa.timestamp("ms", tz=column.type.tz)).cast(pa.int64())
+        elif not pa.types.is_integer(column.type):
+            continue
+        bounds = pc.min_max(column)
+        return bounds["min"].as_py(), bounds["max"].as_py()
+    return None, None
+
+
+@dataclass(frozen=True)
+class CacheIndexEntry:
+    """One cache file as recorded in the index."""
+
+    provider: str
+    chart_type: str
+    market_type: str
+    symbol: str
+    interval: str
+    date: str
+    path: str
+    file_size: int
+    num_records: int
+    start_time_ms: int | None = None
+    end_time_ms: int | None = None
+    checksum: str | None = None
+    compression: str | None = None
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        *,
+        market_type: MarketType | str,
+        symbol: str,
+        interval: Interval | str,
+        day: date | str,
+        chart_type: ChartType | str = ChartType.KLINES,
+        provider: DataProvider | str = DataProvider.BINANCE,
+        table: pa.Table | None = None,
+        checksum: bool = True,
+    ) -> CacheIndexEntry:
+        """Describe a cache file that has just been written.
+
+        Args:
+            path: Cache file path
+            market_type: Market type
+            symbol: Trading symbol
+            interval: Time interval
+            day: Day the file covers
+            chart_type: Chart type
+            provider: Data provider
+            table: The table that was written; read back from ``path`` if omitted
+            checksum: Compute the file's SHA-256 (reads the whole file)
+
+        Returns:
+            Entry with size, row count, time bounds, checksum (if requested) and codec filled in
+        """
+        path = Path(path)
+        if table is None:
+            with pa.memory_map(str(path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+        start_ms, end_ms = _time_bounds_ms(table)
+        market = _market_name(market_type)
+        return cls(
+            provider=_enum_name(provider),
+            chart_type=_enum_name(chart_type),
+            market_type=market,
+            symbol=_index_symbol(symbol, market),
+            interval=_interval_str(interval),
+            date=_date_str(day),
+            path=str(path.resolve()),
+            file_size=path.stat().st_size,
+            num_records=table.num_rows,
+            start_time_ms=start_ms,
+            end_time_ms=end_ms,
+            checksum=CacheValidator.calculate_checksum(path) if checksum else None,
+            compression=read_ipc_compression(path),
+        )
+
+
+_ENTRY_COLUMNS = ", ".join(field.name for field in fields(CacheIndexEntry))
+
+
+class CacheIndex:
+    """SQLite index of the cache files under one cache root.
+
+    Connections are opened per operation, so one instance can be shared
+    between threads and several processes can write the same index (WAL mode
+    lets readers proceed while a writer commits).
+    """
+
+    def __init__(self, db_path: str | Path) -> None:
+        """Initialize the index.
+
+        Args:
+            db_path: Path to the SQLite database (created on first write)
+        """
+        self.db_path = Path(db_path)
+        self._schema_ready = False
+
+    @classmethod
+    def for_cache_dir(cls, cache_dir: str | Path) -> CacheIndex:
+        """Return the index stored at the root of a cache directory."""
+        return cls(Path(cache_dir) / CACHE_INDEX_FILENAME)
+
+    @staticmethod
+    def market_key(market_type: MarketType | str) -> str:
+        """Return the ``market_type`` column value stored for a market type."""
+        return _market_name(market_type)
+
+    def exists(self) -> bool:
+        """Return True if the index database has been created."""
+        return self.db_path.exists()
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a connection in WAL mode, creating or migrating the schema if needed.
+
+        Returns:
+            SQLite connection (caller closes it)
+        """
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=CACHE_INDEX_BUSY_TIMEOUT)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            with conn:
+                self._ensure_schema(conn)
+            self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        """Create tables, migrating a path-only legacy ``cache_entries`` table."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache_entries)")}
+        legacy = bool(columns) and "market_type" not in columns
+        if legacy:
+            conn.execute("ALTER TABLE cache_entries RENAME TO cache_entries_legacy")
+
+        for statement in _SCHEMA:
+            conn.execute(statement)
+
+        if legacy:
+            conn.execute(
+                f"""
+                INSERT OR REPLACE INTO cache_entries
+                (provider, chart_type, market_type, symbol, interval, date, path, file_size, num_records, last_updated)
+                SELECT 'BINANCE', 'KLINES', {_LEGACY_MARKET_TYPE_SQL}, symbol, interval, date, path, file_size, num_records, last_updated
+                FROM cache_entries_legacy
+                """
+            )
+            conn.execute("DROP TABLE cache_entries_legacy")
+            logger.info("Migrated legacy cache index schema (market_type column added)")
+
+    def record_files(self, entries: Iterable[CacheIndexEntry]) -> int:
+        """Upsert cache files in a single transaction.
+
+        Args:
+            entries: Files to record; existing rows for the same day are replaced
+
+        Returns:
+            Number of rows written
+        """
+        entries = list(entries)
+        if not entries:
+            return 0
+        with closing(self.connect()) as conn, conn:
+            return self._upsert(conn, entries)
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, entries: list[CacheIndexEntry]) -> int:
+        """Write entries and bump last_update inside the caller's transaction."""
+        now = datetime.now(timezone.utc).isoformat()
+        placeholders = ", ".join(["?"] * (len(fields(CacheIndexEntry)) + 1))
+        conn.executemany(
+            f"INSERT OR REPLACE INTO cache_entries ({_ENTRY_COLUMNS}, last_updated) VALUES ({placeholders})",
+            [(*astuple(entry), now) for entry in entries],
+        )
+        conn.execute("INSERT OR REPLACE INTO cache_metadata (key, value) VALUES ('last_update', ?)", (now,))
+        return len(entries)
+
+    def get_entries(
+        self,
+        market_type: MarketType | str,
+        symbol: str,
+        interval: Interval | str,
+        start_date: date | str | None = None,
+        end_date: date | str | None = None,
+        chart_type: ChartType | str = ChartType.KLINES,
+        provider: DataProvider | str = DataProvider.BINANCE,
+    ) -> list[CacheIndexEntry]:
+        """Return the indexed files for one symbol/interval, ordered by date.
+
+        Args:
+            market_type: Market type
+            symbol: Trading symbol
+            interval: Time interval
+            start_date: First day to include (inclusive), or None for no lower bound
+            end_date: Last day to include (inclusive), or None for no upper bound
+            chart_type: Chart type
+            provider: Data provider
+
+        Returns:
+            Entries ordered by date (empty if the index does not exist)
+        """
+        if not self.exists():
+            return []
+
+        market = _market_name(market_type)
+        query = f"""
+            SELECT {_ENTRY_COLUMNS} FROM cache_entries
+            WHERE provider = ? AND chart_type = ? AND market_type = ? AND symbol = ? AND interval = ?
+            AND date >= ? AND date <= ?
+            ORDER BY date
+        """
+        params = (
+            _enum_name(provider),
+            _enum_name(chart_type),
+            market,
+            _index_symbol(symbol, market),
+            _interval_str(interval),
+            _date_str(start_date) if start_date is not None else "",
+            _date_str(end_date) if end_date is not None else "9999-12-31",
+        )
+        with closing(self.connect()) as conn:
+            return [CacheIndexEntry(*row) for row in conn.execute(query, params)]
+
+    def remove_paths(self, paths: Iterable[str | Path]) -> int:
+        """Drop index rows for files that were deleted.
+
+        Args:
+            paths: Cache file paths
+
+        Returns:
+            Number of rows removed
+        """
+        resolved = [(str(Path(path).resolve()),) for path in paths]
+        if not resolved or not self.exists():
+            return 0
+        with closing(self.connect()) as conn, conn:
+            return conn.executemany("DELETE FROM cache_entries WHERE path = ?", resolved).rowcount
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Return totals across the whole index.
+
+        Returns:
+            dict with last_update, total_entries, total_symbols, total_intervals,
+            market_type_counts, total_size_bytes, total_size_mb and total_records
+        """
+        with closing(self.connect()) as conn:
+            row = conn.execute("SELECT value FROM cache_metadata WHERE key = 'last_update'").fetchone()
+            totals = conn.execute(
+                """
+                SELECT COUNT(*), COUNT(DISTINCT symbol), COUNT(DISTINCT interval),
+                       COALESCE(SUM(file_size), 0), COALESCE(SUM(num_records), 0)
+                FROM cache_entries
+                """
+            ).fetchone()
+            market_counts = dict(conn.execute("SELECT market_type, COUNT(*) FROM cache_entries GROUP BY market_type"))
+
+        total_entries, total_symbols, total_intervals, total_size, total_records = totals
+        return {
+            "last_update": row[0] if row else "Unknown",
+            "total_entries": total_entries,
+            "total_symbols": total_symbols,
+            "total_intervals": total_intervals,
+            "market_type_counts": market_counts,
+            "total_size_bytes": total_size,
+            "total_size_mb": total_size / (1024 * 1024),
+            "total_records": total_records,
+        }
+
+    def rebuild_from_disk(self, cache_dir: str | Path | None = None) -> int:
+        """Re-index every Vision-layout cache file under a cache root.
+
+        Covers the layouts written by ``save_to_cache`` and UnifiedCacheManager.
+        Replaces all rows, so files deleted outside the library disappear from
+        the index. Unreadable files are skipped with a warning. Checksums are
+        not computed (each file is only memory-mapped for its row count and
+        time bounds), but the whole root is still walked; run it from
+        ``ckvd reindex`` or a maintenance job, not on a request path.
+
+        Args:
+            cache_dir: Cache root to scan (default: the directory holding the index)
+
+        Returns:
+            Number of files indexed
+        """
+        root = Path(cache_dir) if cache_dir is not None else self.db_path.parent
+        entries: list[CacheIndexEntry] = []
+        for path in sorted(root.rglob("*.arrow")):
+            match = _VISION_LAYOUT.match(path.relative_to(root).as_posix())
+            if not match:
+                continue
+            provider, market_dir, chart_dir, symbol, interval, day = match.groups()
+            try:
+                entries.append(
+                    CacheIndexEntry.from_file(
+                        path,
+                        market_type=_MARKET_BY_VISION_PATH[market_dir],
+                        symbol=symbol,
+                        interval=interval,
+                        day=day,
+                        chart_type=_CHART_BY_VISION_PATH.get(chart_dir, chart_dir),
+                        provider=provider or DataProvider.BINANCE,
+                        checksum=False,
+                    )
+                )
+            except (OSError, pa.ArrowInvalid) as e:
+                logger.warning(f"Skipping unreadable cache file {path}: {e}")
+
+        with closing(self.connect()) as conn, conn:
+            conn.execute("DELETE FROM cache_entries")
+            self._upsert(conn, entries)
+        logger.info(f"Rebuilt cache index {self.db_path}: {len(entries)} files")
+        return len(entries)
@@ -10,19 +10,26 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import polars as pl
 import pyarrow as pa
 
 from ckvd.utils.loguru_setup import logger
 
+if TYPE_CHECKING:
+    import polars as pl
+
 __all__ = [
     "SafeMemoryMap",
 ]
 
 
 class SafeMemoryMap:
-    """Context manager for safe memory map handling."""
+    """Context manager for safe memory map handling.
+
+    Works for uncompressed and LZ4/ZSTD-compressed Arrow IPC files: Arrow
+    decompresses compressed record batches when they are read from the map.
+    """
 
     def __init__(self, path: Path) -> None:
         """Initialize memory map.
@@ -81,6 +88,8 @@ class SafeMemoryMap:
         Returns:
             DataFrame with data from Arrow file
         """
+        import polars as pl
+
         with SafeMemoryMap(path) as source, pa.ipc.open_file(source) as reader:
             if columns:
                 all_cols = reader.schema.names
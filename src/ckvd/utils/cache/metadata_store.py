@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+"""Incremental metadata store for UnifiedCacheManager.
+
+One SQLite database (WAL mode) per cache root holds a row per cache key, so
+a write touches one row instead of re-serialising every entry, and startup
+does not load anything into memory. ``last_accessed`` updates from cache hits
+are buffered and written in batches (by count, by age, on ``flush()`` and when
+the store is garbage collected), keeping read-heavy workloads read-only on
+disk most of the time.
+
+A ``cache_metadata.json`` left by earlier versions is imported on first open
+and renamed to ``cache_metadata.json.migrated``.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import weakref
+from collections.abc import Iterator, Mapping
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ckvd.utils.config import (
+    CACHE_INDEX_BUSY_TIMEOUT,
+    CACHE_METADATA_ACCESS_BATCH,
+    CACHE_METADATA_FLUSH_INTERVAL,
+)
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "CacheMetadataStore",
+]
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache_metadata (
+        cache_key TEXT PRIMARY KEY,
+        entry TEXT NOT NULL,
+        last_accessed TEXT
+    )
+"""
+
+
+def _flush_access_times(conn: sqlite3.Connection | None, pending: dict[str, str], lock: threading.Lock) -> None:
+    """Write buffered last_accessed values (shared by flush() and the finalizer)."""
+    with lock:
+        if conn is None or not pending:
+            return
+        rows = [(accessed, key) for key, accessed in pending.items()]
+        try:
+            with conn:
+                conn.executemany("UPDATE cache_metadata SET last_accessed = ? WHERE cache_key = ?", rows)
+            pending.clear()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to flush {len(rows)} cache access times: {e}")
+
+
+class CacheMetadataStore(Mapping[str, dict[str, Any]]):
+    """Per-cache-key metadata backed by SQLite.
+
+    Reads return plain dicts (including ``last_accessed``); mutate entries
+    through ``put()``/``update()``/``touch()`` rather than in place.
+    Thread-safe: a single connection is shared behind a lock.
+    """
+
+    def __init__(self, db_path: str | Path, legacy_json_path: str | Path | None = None) -> None:
+        """Initialize the store. The database is opened on first use.
+
+        Args:
+            db_path: SQLite database path (created on first write)
+            legacy_json_path: Whole-file JSON metadata to import on first open
+        """
+        self.db_path = Path(db_path)
+        self.legacy_json_path = Path(legacy_json_path) if legacy_json_path is not None else None
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pending: dict[str, str] = {}
+        self._oldest_pending: float | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _connection(self, create: bool) -> sqlite3.Connection | None:
+        """Return the shared connection, opening it if needed (caller holds the lock).
+
+        Args:
+            create: Create the database if it does not exist yet
+
+        Returns:
+            Connection, or None if the database does not exist and create is False
+        """
+        if self._conn is not None:
+            return self._conn
+        has_legacy = self.legacy_json_path is not None and self.legacy_json_path.exists()
+        if not create and not has_legacy and not self.db_path.exists():
+            return None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=CACHE_INDEX_BUSY_TIMEOUT, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.execute(_SCHEMA)
+        if has_legacy:
+            self._import_legacy_json(conn)
+
+        self._conn = conn
+        self._finalizer = weakref.finalize(self, self._finalize, conn, self._pending, self._lock)
+        return conn
+
+    @staticmethod
+    def _finalize(conn: sqlite3.Connection, pending: dict[str, str], lock: threading.Lock) -> None:
+        """Flush buffered access times and close the connection."""
+        _flush_access_times(conn, pending, lock)
+        conn.close()
+
+    def _import_legacy_json(self, conn: sqlite3.Connection) -> None:
+        """Import entries from a whole-file JSON metadata file, then rename it."""
+        try:
+            with open(self.legacy_json_path) as f:
+                legacy = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping unreadable legacy cache metadata {self.legacy_json_path}: {e}")
+            return
+        if not isinstance(legacy, dict):
+            logger.warning(f"Skipping legacy cache metadata {self.legacy_json_path}: not a JSON object")
+            return
+
+        rows = [
+            (key, json.dumps({k: v for k, v in entry.items() if k != "last_accessed"}), entry.get("last_accessed"))
+            for key, entry in legacy.items()
+            if isinstance(entry, dict)
+        ]
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO cache_metadata (cache_key, entry, last_accessed) VALUES (?, ?, ?)", rows)
+        self.legacy_json_path.replace(self.legacy_json_path.with_name(f"{self.legacy_json_path.name}.migrated"))
+        logger.info(f"Imported {len(rows)} cache metadata entries from {self.legacy_json_path}")
+
+    def close(self) -> None:
+        """Flush buffered access times and close the database."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._conn = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, cache_key: str, default: Any = None) -> dict[str, Any] | Any:
+        """Return the entry for a cache key, or default if there is none."""
+        with self._lock:
+            conn = self._connection(create=False)
+            query = "SELECT entry, last_accessed FROM cache_metadata WHERE cache_key = ?"
+            row = conn.execute(query, (cache_key,)).fetchone() if conn else None
+            pending_access = self._pending.get(cache_key)
+        if row is None:
+            return default
+        entry = json.loads(row[0])
+        last_accessed = pending_access or row[1]
+        if last_accessed is not None:
+            entry["last_accessed"] = last_accessed
+        return entry
+
+    def __getitem__(self, cache_key: str) -> dict[str, Any]:
+        """Return the entry for a cache key."""
+        entry = self.get(cache_key)
+        if entry is None:
+            raise KeyError(cache_key)
+        return entry
+
+    def __contains__(self, cache_key: object) -> bool:
+        """Return True if the cache key has an entry."""
+        with self._lock:
+            conn = self._connection(create=False)
+            return bool(conn and conn.execute("SELECT 1 FROM cache_metadata WHERE cache_key = ?", (cache_key,)).fetchone())
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over cache keys."""
+        with self._lock:
+            conn = self._connection(create=False)
+            keys = [row[0] for row in conn.execute("SELECT cache_key FROM cache_metadata ORDER BY cache_key")] if conn else []
+        return iter(keys)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        with self._lock:
+            conn = self._connection(create=False)
+            return conn.execute("SELECT COUNT(*) FROM cache_metadata").fetchone()[0] if conn else 0
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, cache_key: str, entry: dict[str, Any]) -> None:
+        """Insert or replace the entry for a cache key (one-row write).
+
+        Args:
+            cache_key: Cache key
+            entry: JSON-serialisable metadata; ``last_accessed`` is stored separately
+        """
+        entry = dict(entry)
+        last_accessed = entry.pop("last_accessed", None)
+        payload = json.dumps(entry)
+        with self._lock:
+            conn = self._connection(create=True)
+            last_accessed = self._pending.pop(cache_key, last_accessed)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_metadata (cache_key, entry, last_accessed) VALUES (?, ?, ?)",
+                    (cache_key, payload, last_accessed),
+                )
+
+    def update(self, cache_key: str, **fields: Any) -> bool:
+        """Merge fields into an existing entry (one-row read-modify-write).
+
+        Args:
+            cache_key: Cache key
+            **fields: Fields to set
+
+        Returns:
+            True if the entry existed and was updated
+        """
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return False
+            with conn:
+                row = conn.execute("SELECT entry FROM cache_metadata WHERE cache_key = ?", (cache_key,)).fetchone()
+                if row is None:
+                    return False
+                entry = {**json.loads(row[0]), **fields}
+                entry.pop("last_accessed", None)
+                conn.execute("UPDATE cache_metadata SET entry = ? WHERE cache_key = ?", (json.dumps(entry), cache_key))
+        return True
+
+    def touch(self, cache_key: str) -> None:
+        """Record a cache hit; the write is buffered and batched.
+
+        Buffered updates are flushed once CACHE_METADATA_ACCESS_BATCH keys are
+        pending or the oldest is CACHE_METADATA_FLUSH_INTERVAL seconds old.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._pending[cache_key] = datetime.now(timezone.utc).isoformat()
+            if self._oldest_pending is None:
+                self._oldest_pending = now
+            due = len(self._pending) >= CACHE_METADATA_ACCESS_BATCH or now - self._oldest_pending >= CACHE_METADATA_FLUSH_INTERVAL
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered access times to the database."""
+        with self._lock:
+            conn = self._connection(create=False)
+            self._oldest_pending = None
+        _flush_access_times(conn, self._pending, self._lock)
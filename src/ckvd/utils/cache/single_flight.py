@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+"""Request coalescing for concurrent identical fetches.
+
+Two layers keep concurrent callers from downloading and writing the same
+daily files:
+
+- ``SingleFlight``: in-process. The first caller for a key runs the work;
+  callers arriving while it is in flight wait for it and share its result.
+- ``cache_file_locks``: cross-process. Advisory ``flock`` locks, one per
+  daily cache file, under ``<cache_dir>/.locks``. A worker holding the locks
+  for the days it fetches makes other workers (processes or threads) sharing
+  the cache root wait, after which they find the days already cached.
+
+Locks are an optimisation, not a correctness requirement (cache files are
+written atomically), so a lock that cannot be taken within
+CACHE_LOCK_TIMEOUT is skipped with a warning instead of failing the fetch.
+On platforms without ``fcntl`` only threads of the same process coalesce.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from concurrent.futures import Future
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+from ckvd.utils.config import CACHE_LOCK_DIRNAME, CACHE_LOCK_POLL_INTERVAL, CACHE_LOCK_TIMEOUT
+from ckvd.utils.loguru_setup import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+__all__ = [
+    "SingleFlight",
+    "cache_file_lock",
+    "cache_file_locks",
+]
+
+T = TypeVar("T")
+
+# Fallback for platforms without flock: coalesces threads of this process only
+_THREAD_LOCKS: dict[Path, threading.Lock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share the result.
+
+    Exceptions raised by the leading call are re-raised in every waiting
+    caller. Results are not cached: once a call finishes, the next caller
+    for the key starts a new one.
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> value, shared = flights.do(("BTCUSDT", "2024-01-15"), download_day)
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, bool]:
+        """Run fn(*args, **kwargs) for key, or wait for the call already running.
+
+        Args:
+            key: Identity of the work (callers with equal keys are coalesced)
+            fn: Work to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Tuple of (result, shared). shared is True when the result came
+            from another caller's call; treat it as read-only or copy it.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Return the number of keys with a call running."""
+        with self._lock:
+            return len(self._calls)
+
+
+def _lock_file_path(cache_dir: Path, cache_path: Path) -> Path:
+    """Lock file for a cache file: readable name plus a digest of its full path."""
+    digest = hashlib.sha1(str(cache_path.resolve()).encode(), usedforsecurity=False).hexdigest()[:12]
+    return cache_dir / CACHE_LOCK_DIRNAME / f"{cache_path.stem}.{digest}.lock"
+
+
+def _try_flock(handle: IO[bytes]) -> bool:
+    """Take an exclusive lock without blocking."""
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+@contextmanager
+def cache_file_lock(cache_dir: str | Path, cache_path: str | Path, timeout: float | None = None) -> Iterator[bool]:
+    """Hold the advisory lock for one cache file.
+
+    Args:
+        cache_dir: Cache root (lock files live under ``<cache_dir>/.locks``)
+        cache_path: Cache file the caller is about to fetch or write
+        timeout: Seconds to wait for a held lock (default CACHE_LOCK_TIMEOUT)
+
+    Yields:
+        True if the lock is held, False if it timed out or could not be created
+    """
+    lock_path = _lock_file_path(Path(cache_dir), Path(cache_path))
+    deadline = time.monotonic() + (CACHE_LOCK_TIMEOUT if timeout is None else timeout)
+
+    if fcntl is None:
+        with _THREAD_LOCKS_GUARD:
+            thread_lock = _THREAD_LOCKS.setdefault(lock_path, threading.Lock())
+        acquired = thread_lock.acquire(timeout=max(0.0, deadline - time.monotonic()))
+        if not acquired:
+            logger.warning(f"Timed out waiting for cache lock {lock_path}; continuing without it")
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                thread_lock.release()
+        return
+
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(lock_path, "ab")
+    except OSError as e:
+        logger.warning(f"Cannot create cache lock {lock_path}: {e}; continuing without it")
+        yield False
+        return
+
+    try:
+        acquired = _try_flock(handle)
+        if not acquired:
+            logger.debug(f"Waiting for cache lock {lock_path} held by another worker")
+        while not acquired and time.monotonic() < deadline:
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+            acquired = _try_flock(handle)
+        if not acquired:
+            logger.warning(f"Timed out waiting for cache lock {lock_path}; continuing without it")
+        yield acquired
+    finally:
+        handle.close()  # closing the descriptor releases the flock
+
+
+@contextmanager
+def cache_file_locks(cache_dir: str | Path, cache_paths: Iterable[str | Path], timeout: float | None = None) -> Iterator[bool]:
+    """Hold the advisory locks for several cache files.
+
+    Locks are taken in sorted order so workers fetching overlapping day
+    ranges cannot deadlock. The timeout bounds the wait for the whole set,
+    not for each lock.
+
+    Args:
+        cache_dir: Cache root
+        cache_paths: Cache files the caller is about to fetch or write
+        timeout: Seconds to wait for all held locks (default CACHE_LOCK_TIMEOUT)
+
+    Yields:
+        True if every lock is held
+    """
+    deadline = time.monotonic() + (CACHE_LOCK_TIMEOUT if timeout is None else timeout)
+    with ExitStack() as stack:
+        held = [
+            stack.enter_context(cache_file_lock(cache_dir, path, max(0.0, deadline - time.monotonic())))
+            for path in sorted({Path(p) for p in cache_paths})
+        ]
+        yield all(held)
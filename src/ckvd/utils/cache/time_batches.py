@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""Time-bucketed record batches and their index inside Arrow IPC cache files.
+
+A daily cache file of 1s klines holds 86,400 rows. Written as one record
+batch, a 15-minute read still has to map and filter the whole day. Writers
+therefore split each file into record batches of a fixed ``open_time`` span
+(hourly by default) and store every batch's min/max ``open_time`` in the
+schema's custom metadata, which lives in the IPC footer:
+
+    ckvd:time_batches = {"column": "open_time", "seconds": 3600,
+                         "ranges": [[min_ms, max_ms], ...]}
+
+``read_ipc_time_range`` reads the footer, binary-searches the ranges and
+memory-maps only the batches overlapping the query. Files without the index
+(older caches, other tools) are read by the regular scanners.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "TIME_BATCHES_METADATA_KEY",
+    "read_ipc_time_range",
+    "read_time_batch_ranges",
+    "split_time_batches",
+]
+
+# Schema metadata key holding the per-batch open_time ranges of a cache file
+TIME_BATCHES_METADATA_KEY = b"ckvd:time_batches"
+
+# Divisor turning a timestamp of each unit into epoch milliseconds
+_UNIT_PER_MS = {"s": 1e-3, "ms": 1, "us": 1_000, "ns": 1_000_000}
+
+
+def _epoch_ms(column: pa.ChunkedArray) -> np.ndarray:
+    """Epoch milliseconds of a timestamp column."""
+    values = pc.cast(column, pa.int64()).to_numpy()
+    factor = _UNIT_PER_MS[column.type.unit]
+    return (values * 1000).astype(np.int64) if factor < 1 else values // factor
+
+
+def split_time_batches(table: pa.Table, batch_seconds: int, column: str = "open_time") -> tuple[pa.Table, list[pa.RecordBatch]] | None:
+    """Split a table into record batches of ``batch_seconds`` of ``column``.
+
+    Rows are sorted by ``column`` first if they are not already. The returned
+    table carries the batch index in its schema metadata; write its schema and
+    then the batches. There is exactly one batch per indexed range, even when
+    the table is made of several chunks.
+
+    Args:
+        table: Table to split
+        batch_seconds: Time span of each batch
+        column: Timestamp column the batches are bucketed by
+
+    Returns:
+        (table with index metadata, batches), or None if the table cannot be
+        indexed (no such timestamp column, nulls, or nothing to split)
+    """
+    if batch_seconds <= 0 or table.num_rows == 0 or column not in table.column_names:
+        return None
+    time_column = table.column(column)
+    if not pa.types.is_timestamp(time_column.type) or time_column.null_count:
+        return None
+
+    times_ms = _epoch_ms(time_column)
+    if np.any(np.diff(times_ms) < 0):
+        order = np.argsort(times_ms, kind="stable")
+        table = table.take(pa.array(order))
+        times_ms = times_ms[order]
+
+    buckets = times_ms // (batch_seconds * 1000)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.append(starts[1:], len(times_ms))
+    ranges = [[int(times_ms[start]), int(times_ms[end - 1])] for start, end in zip(starts, ends, strict=True)]
+
+    index = {"column": column, "seconds": batch_seconds, "ranges": ranges}
+    metadata = {**(table.schema.metadata or {}), TIME_BATCHES_METADATA_KEY: json.dumps(index).encode()}
+    table = table.replace_schema_metadata(metadata)
+    # Exactly one batch per range: readers match batches to ranges by position, and a
+    # chunked table (concat, multi-batch reads) would otherwise split a range in two.
+    # combine_chunks() leaves single-chunk columns as they are, so it only copies chunked slices.
+    batches = [table.slice(start, end - start).combine_chunks().to_batches()[0] for start, end in zip(starts, ends, strict=True)]
+    return table, batches
+
+
+def read_time_batch_ranges(schema: pa.Schema) -> list[tuple[int, int]] | None:
+    """Per-batch ``(min_ms, max_ms)`` recorded in a cache file's schema, or None."""
+    raw = (schema.metadata or {}).get(TIME_BATCHES_METADATA_KEY)
+    if raw is None:
+        return None
+    try:
+        return [(int(low), int(high)) for low, high in json.loads(raw)["ranges"]]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Ignoring invalid time batch index: {e}")
+        return None
+
+
+def _to_ms(value: datetime) -> int:
+    """Epoch milliseconds of a datetime (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def read_ipc_time_range(
+    path: str | Path, start_time: datetime, end_time: datetime, columns: Sequence[str] | None = None
+) -> pa.Table | None:
+    """Read only the record batches of a cache file overlapping a time range.
+
+    The batches are selected by binary search over the file's batch index and
+    read from a memory map (zero-copy for uncompressed files). Rows outside
+    the range in the selected batches are kept; callers filter them.
+
+    Args:
+        path: Arrow IPC file path
+        start_time: Start of the range
+        end_time: End of the range (batches starting at it are included)
+        columns: Optional column projection
+
+    Returns:
+        Table of the overlapping batches (possibly empty), or None if the file
+        has no batch index
+    """
+    start_ms, end_ms = _to_ms(start_time), _to_ms(end_time)
+    with pa.memory_map(str(path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        ranges = read_time_batch_ranges(reader.schema)
+        if ranges is None or len(ranges) != reader.num_record_batches:
+            return None
+
+        # Batches are ordered by time, so both bounds are monotonic
+        first = bisect.bisect_left([high for _, high in ranges], start_ms)
+        last = bisect.bisect_right([low for low, _ in ranges], end_ms)
+        batches = [reader.get_batch(i) for i in range(first, last)]
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    if columns is not None:
+        table = table.select([name for name in columns if name in table.column_names])
+    logger.debug("Read {}/{} record batches of {}", len(batches), len(ranges), path)
+    return table
@@ -46,6 +46,37 @@ INCOMPLETE_BAR_THRESHOLD: Final = timedelta(minutes=5)  # Time after which bars
 MAX_CACHE_AGE: Final = timedelta(days=30)
 CACHE_UPDATE_INTERVAL: Final = timedelta(minutes=5)
 MIN_VALID_FILE_SIZE: Final = 1024  # 1KB minimum
+CACHE_SETTINGS_FILENAME: Final = "cache_settings.json"  # Per-cache-root settings (IPC compression)
+CACHE_COMPRESSION_CODECS: Final = ("lz4", "zstd")  # Arrow IPC codecs ("lz4" = LZ4_FRAME)
+CACHE_RECORD_BATCH_SECONDS: Final = 3600  # open_time span of each record batch in cache files (0 = one batch per file)
+CACHE_INDEX_FILENAME: Final = "cache_index.db"  # Per-cache-root SQLite index of cache files
+CACHE_INDEX_BUSY_TIMEOUT: Final = 30.0  # Seconds to wait on a locked index before failing
+CACHE_METADATA_FILENAME: Final = "cache_metadata.db"  # UnifiedCacheManager metadata store (SQLite, WAL)
+CACHE_METADATA_ACCESS_BATCH: Final = 256  # Buffered last_accessed updates before a flush
+CACHE_METADATA_FLUSH_INTERVAL: Final = 30.0  # Seconds before buffered last_accessed updates are flushed
+CACHE_LOCK_DIRNAME: Final = ".locks"  # Advisory lock files (one per daily cache file) under the cache root
+CACHE_LOCK_TIMEOUT: Final = 600.0  # Seconds to wait for another worker's fetch before proceeding unlocked
+CACHE_LOCK_POLL_INTERVAL: Final = 0.05  # Seconds between attempts to take a held lock
+VISION_LOCK_BATCH_DAYS: Final = 7  # Days one Vision fetch locks, downloads and caches at a time
+
+# Cache backfill (ckvd backfill)
+BACKFILL_DOWNLOAD_WORKERS: Final = 8  # Concurrent day downloads (download + CSV decode)
+BACKFILL_WRITE_WORKERS: Final = 2  # Concurrent cache file writers
+BACKFILL_MAX_PENDING_DAYS: Final = 64  # Days in flight (fetching or awaiting a write); bounds memory
+BACKFILL_CHECKPOINT_FILENAME: Final = "backfill_checkpoint.jsonl"  # Per-cache-root progress log for resume
+BACKFILL_PROGRESS_INTERVAL: Final = 10.0  # Seconds between progress/throughput log lines
+
+# Parquet dataset export (ckvd export)
+EXPORT_MANIFEST_FILENAME: Final = "_ckvd_export_manifest.jsonl"  # "_" prefix: ignored by Spark/DuckDB/Arrow readers
+EXPORT_PARQUET_COMPRESSION: Final = "zstd"
+
+# Local data server (ckvd serve)
+SERVER_SOCKET_PATH: Final = os.getenv("CKVD_SERVER_SOCKET", "")  # Unix socket; empty: <cache dir>/ckvd.sock
+SERVER_SOCKET_FILENAME: Final = "ckvd.sock"  # Default socket name under the platform cache directory
+SERVER_SHM_DIR: Final = Path("/dev/shm")  # Shared-memory results (falls back to the temp dir where missing)
+SERVER_SHM_PREFIX: Final = "ckvd-"  # Shared-memory result files: <prefix><server pid>-<server tag>-<random>.arrow
+SERVER_MAX_HEADER_BYTES: Final = 1 << 20  # Upper bound on one JSON request/response header
+SERVER_CLIENT_TIMEOUT: Final = 600.0  # Seconds a client waits for a response (downloads can be long)
 
 # API constraints
 MAX_TIMEOUT: Final = 9.0  # Maximum timeout for any individual operation in seconds
@@ -63,6 +94,12 @@ ENABLE_FORCED_GC: Final = True  # Whether to force garbage collection after clea
 TASK_CANCEL_WAIT_TIMEOUT: Final = 1.0  # Seconds - default timeout for cancel_and_wait operations
 LINGERING_TASK_CLEANUP_TIMEOUT: Final = 0.5  # Seconds - timeout for lingering task cleanup
 AGGRESSIVE_TASK_CLEANUP_TIMEOUT: Final = 0.2  # Seconds - timeout for aggressive cleanup after initial failure
+
+# Asyncio API (AsyncCryptoKlineVisionData)
+ASYNC_HTTP_MAX_CONNECTIONS: Final = 100  # Connection pool shared by all fetches of one async manager
+ASYNC_VISION_CONCURRENCY: Final = 50  # Vision day downloads in flight per async manager
+ASYNC_REST_CONCURRENCY: Final = 8  # REST chunk requests in flight per async manager
+ASYNC_EXECUTOR_WORKERS: Final = 8  # Threads for cache I/O, archive decoding and DataFrame assembly
 DEMO_SIMULATED_DELAY: Final = 3  # Seconds - delay for the task cancellation demonstration
 
 # Canonical column names
@@ -107,6 +144,23 @@ OUTPUT_DTYPES: Final[dict[str, str]] = {
     "taker_buy_quote_volume": "float64",
 }
 
+# Column dtypes of get_data(schema_profile="compact") with NumPy-backed pandas output
+# (open_time/close_time are converted to datetime64[ms, UTC] separately)
+COMPACT_OUTPUT_DTYPES: Final[dict[str, str]] = {
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
+    "volume": "float32",
+    "quote_asset_volume": "float32",
+    "count": "int32",
+    "taker_buy_volume": "float32",
+    "taker_buy_quote_volume": "float32",
+}
+
+# _data_source values in FCP priority order (categories of the compact profile)
+DATA_SOURCE_CATEGORIES: Final[tuple[str, ...]] = ("UNKNOWN", "VISION", "CACHE", "REST")
+
 # Standard column dtypes for funding rate DataFrames
 FUNDING_RATE_DTYPES: Final[dict[str, str]] = {
     "contracts": "string",
@@ -173,7 +227,33 @@ HTTP_SERVER_ERROR: Final = 500  # HTTP Server Error status code
 # Chunk size constraints
 REST_CHUNK_SIZE: Final = 1000
 REST_MAX_CHUNKS: Final = 1000  # Increased from 5 to 1000 to effectively remove limit
-MAXIMUM_CONCURRENT_DOWNLOADS: Final = 50  # Increased from 13 to 50 based on benchmarks
+# Request weight allowed per window (weight, window seconds) by host. Exchanges
+# count weight per API host and IP, so the budget is shared by every process on the host.
+REST_WEIGHT_LIMITS: Final[dict[str, tuple[int, float]]] = {
+    "api.binance.com": (6000, 60.0),
+    "fapi.binance.com": (2400, 60.0),
+    "dapi.binance.com": (2400, 60.0),
+    "www.okx.com": (20, 2.0),  # Candle endpoints: 20 requests per 2 seconds
+}
+REST_DEFAULT_WEIGHT_LIMIT: Final[tuple[int, float]] = (1200, 60.0)  # Hosts not listed above
+REST_WEIGHT_BUDGET_DIRNAME: Final = ".rate_limits"  # Shared per-host weight budgets under the cache root
+REST_WEIGHT_BUDGET_DIR_ENV: Final = "CKVD_RATE_LIMIT_DIR"  # Overrides the directory holding the weight budgets
+REST_WEIGHT_PAUSE_THRESHOLD: Final = 0.9  # Wait for the next minute once this share of the weight is used
+REST_MAX_RATE_LIMIT_WAITS: Final = 10  # Rate-limit pauses per chunk before falling back to partial data
+REST_MAX_RATE_LIMIT_WAIT_SECONDS: Final = 300.0  # Longest rate-limit wait per request before RateLimitError
+MAXIMUM_CONCURRENT_DOWNLOADS: Final = 50  # Upper bound for the adaptive Vision download limit
+VISION_ADAPTIVE_INITIAL_CONCURRENCY: Final = 8  # Starting Vision download limit (adapted from latency/errors)
+VISION_ADAPTIVE_MIN_CONCURRENCY: Final = 2  # Floor for the adaptive Vision download limit
+VISION_HEDGE_PERCENTILE: Final = 95.0  # Hedge a Vision GET once it runs longer than this latency percentile
+VISION_HEDGE_BUDGET: Final = 0.05  # At most this many duplicate Vision GETs per request
+VISION_HEDGE_MIN_SAMPLES: Final = 20  # Latencies observed before Vision hedging starts
+VISION_LISTING_URL: Final = "https://s3-ap-northeast-1.amazonaws.com/data.binance.vision"  # S3 bucket behind data.binance.vision
+VISION_LISTING_TTL_SECONDS: Final = 900.0  # How long a month's Vision file listing is reused
+# Rough per-unit costs used by CryptoKlineVisionData.plan() to estimate a request's duration
+PLAN_CACHE_SECONDS_PER_FILE: Final = 0.01  # Scanning one daily cache file
+PLAN_VISION_SECONDS_PER_DAY: Final = 1.5  # Downloading and decoding one Vision day (divided by the download concurrency)
+PLAN_REST_SECONDS_PER_CHUNK: Final = 0.35  # One REST klines request
+FUNDING_ASOF_LOOKBACK: Final = timedelta(hours=8)  # Funding fetched before the first bar so it has an as-of rate
 
 
 # File management enums and constants
@@ -211,6 +291,15 @@ ERROR_TYPES: Final[dict[str, str]] = {
 # Environment configuration
 ENV: Final = os.getenv("APP_ENV", "development")
 DEBUG: Final = os.getenv("DEBUG", "false").lower() == "true"
+# Keep each Vision row's raw epoch value as an ``original_timestamp`` string column.
+# Off by default: it adds a per-row object column to every Vision frame.
+VISION_KEEP_ORIGINAL_TIMESTAMP: Final = os.getenv("CKVD_VISION_ORIGINAL_TIMESTAMP", "false").lower() in ("true", "1", "yes")
+# Hedge slow Vision archive GETs with a duplicate request (see VISION_HEDGE_* above).
+# Off by default: it trades a few percent extra requests for lower tail latency.
+VISION_HEDGE_REQUESTS: Final = os.getenv("CKVD_VISION_HEDGE", "false").lower() in ("true", "1", "yes")
+# List each month's Vision files with one S3 request and download only listed days.
+# Disable to probe every day with a GET as before (e.g. behind a proxy without the S3 endpoint).
+VISION_USE_LISTING: Final = os.getenv("CKVD_VISION_LISTING", "true").lower() in ("true", "1", "yes")
 
 # Base directories
 DEFAULT_CACHE_DIR = Path.home() / ".binance_data_cache"
@@ -16,12 +16,15 @@ across the codebase, particularly for:
 
 import contextlib
 import traceback
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
 from ckvd.utils.config import (
     CANONICAL_INDEX_NAME,
+    COMPACT_OUTPUT_DTYPES,
+    DATA_SOURCE_CATEGORIES,
     DEFAULT_COLUMN_ORDER,
     FUNDING_RATE_DTYPES,
     OUTPUT_DTYPES,
@@ -62,9 +65,9 @@ def ensure_open_time_as_column(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Log initial state
-    logger.debug(f"DataFrame columns: {list(df.columns)}")
-    logger.debug(f"DataFrame index name: {df.index.name}")
-    logger.debug(f"DataFrame index type: {type(df.index)}")
+    logger.debug("DataFrame columns: {}", list(df.columns))
+    logger.debug("DataFrame index name: {}", df.index.name)
+    logger.debug("DataFrame index type: {}", type(df.index))
 
     # Case 1: open_time exists as both index and column
     if hasattr(df, "index") and hasattr(df.index, "name") and df.index.name == CANONICAL_INDEX_NAME and CANONICAL_INDEX_NAME in df.columns:
@@ -88,7 +91,7 @@ def ensure_open_time_as_column(df: pd.DataFrame) -> pd.DataFrame:
         # Try to find any time-related columns that could serve as open_time
         for col in df.columns:
             if "time" in col.lower() and pd.api.types.is_datetime64_any_dtype(df[col]):
-                logger.debug(f"Using {col} as open_time")
+                logger.debug("Using {} as open_time", col)
                 df[CANONICAL_INDEX_NAME] = df[col]
                 break
         else:
@@ -107,7 +110,7 @@ def ensure_open_time_as_column(df: pd.DataFrame) -> pd.DataFrame:
         # Handle non-datetime columns
         if not pd.api.types.is_datetime64_any_dtype(df[CANONICAL_INDEX_NAME]):
             try:
-                logger.debug(f"Converting {CANONICAL_INDEX_NAME} to datetime")
+                logger.debug("Converting {} to datetime", CANONICAL_INDEX_NAME)
                 df[CANONICAL_INDEX_NAME] = pd.to_datetime(df[CANONICAL_INDEX_NAME], utc=True)
             except (ValueError, TypeError) as e:
                 logger.error(f"Error converting {CANONICAL_INDEX_NAME} to datetime: {e}")
@@ -115,13 +118,13 @@ def ensure_open_time_as_column(df: pd.DataFrame) -> pd.DataFrame:
         # Ensure timezone is UTC
         if hasattr(df[CANONICAL_INDEX_NAME], "dt") and hasattr(df[CANONICAL_INDEX_NAME].dt, "tz"):
             if df[CANONICAL_INDEX_NAME].dt.tz is None:
-                logger.debug(f"Localizing {CANONICAL_INDEX_NAME} to UTC")
+                logger.debug("Localizing {} to UTC", CANONICAL_INDEX_NAME)
                 df[CANONICAL_INDEX_NAME] = df[CANONICAL_INDEX_NAME].dt.tz_localize(timezone.utc)
             elif df[CANONICAL_INDEX_NAME].dt.tz != timezone.utc:
-                logger.debug(f"Converting {CANONICAL_INDEX_NAME} timezone to UTC")
+                logger.debug("Converting {} timezone to UTC", CANONICAL_INDEX_NAME)
                 df[CANONICAL_INDEX_NAME] = df[CANONICAL_INDEX_NAME].dt.tz_convert(timezone.utc)
 
-    logger.debug(f"Final DataFrame columns: {list(df.columns)}")
+    logger.debug("Final DataFrame columns: {}", list(df.columns))
     return df
 
 
@@ -146,9 +149,9 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Log initial state
-    logger.debug(f"DataFrame columns: {list(df.columns)}")
-    logger.debug(f"DataFrame index name: {df.index.name}")
-    logger.debug(f"DataFrame index type: {type(df.index)}")
+    logger.debug("DataFrame columns: {}", list(df.columns))
+    logger.debug("DataFrame index name: {}", df.index.name)
+    logger.debug("DataFrame index type: {}", type(df.index))
 
     try:
         # Case 1: open_time is already properly set as index
@@ -161,7 +164,7 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
                 df.index = df.index.tz_localize(timezone.utc)
             # Case 1b: index has non-UTC timezone - convert to UTC
             elif df.index.tz != timezone.utc:
-                logger.debug(f"Converting DatetimeIndex timezone from {df.index.tz} to UTC")
+                logger.debug("Converting DatetimeIndex timezone from {} to UTC", df.index.tz)
                 df.index = df.index.tz_convert(timezone.utc)
 
             return df
@@ -180,7 +183,7 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
                     logger.debug("Localizing open_time column to UTC before setting as index")
                     df[CANONICAL_INDEX_NAME] = df[CANONICAL_INDEX_NAME].dt.tz_localize(timezone.utc)
                 elif df[CANONICAL_INDEX_NAME].dt.tz != timezone.utc:
-                    logger.debug(f"Converting open_time column timezone from {df[CANONICAL_INDEX_NAME].dt.tz} to UTC")
+                    logger.debug("Converting open_time column timezone from {} to UTC", df[CANONICAL_INDEX_NAME].dt.tz)
                     df[CANONICAL_INDEX_NAME] = df[CANONICAL_INDEX_NAME].dt.tz_convert(timezone.utc)
 
             try:
@@ -206,7 +209,7 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
                     break
 
             if time_col:
-                logger.debug(f"Using {time_col} as open_time index")
+                logger.debug("Using {} as open_time index", time_col)
                 try:
                     df = df.set_index(time_col)
                     df.index.name = CANONICAL_INDEX_NAME
@@ -275,8 +278,8 @@ def ensure_open_time_as_index(df: pd.DataFrame) -> pd.DataFrame:
             # Last resort, create a new empty index
             df.index = pd.DatetimeIndex([datetime.now(timezone.utc)] * len(df), name=CANONICAL_INDEX_NAME)
 
-    logger.debug(f"Final DataFrame index name: {df.index.name}")
-    logger.debug(f"Final DataFrame index type: {type(df.index)}")
+    logger.debug("Final DataFrame index name: {}", df.index.name)
+    logger.debug("Final DataFrame index type: {}", type(df.index))
     return df
 
 
@@ -375,12 +378,71 @@ def verify_data_completeness(
 
     for i, (gap_start, gap_end) in enumerate(gaps):
         gap_duration = (gap_end - gap_start).total_seconds()
-        logger.debug(f"Gap {i + 1}: {gap_start} to {gap_end} ({gap_duration}s)")
+        logger.debug("Gap {}: {} to {} ({}s)", i + 1, gap_start, gap_end, gap_duration)
 
     return False, gaps
 
 
-def standardize_dataframe(df: pd.DataFrame, keep_as_column: bool = True) -> pd.DataFrame:
+def resolve_columns(columns: Sequence[str] | None) -> list[str] | None:
+    """Validate a kline column projection and normalize it to a list.
+
+    ``open_time`` is the row key of every kline DataFrame, so it is always part
+    of the projection even when not requested.
+
+    Args:
+        columns: Requested output columns, or None for all columns
+
+    Returns:
+        List of columns with ``open_time`` first, or None when no projection was requested
+
+    Raises:
+        ValueError: If ``columns`` is empty or contains unknown column names
+    """
+    if columns is None:
+        return None
+    if isinstance(columns, str):
+        columns = [columns]
+
+    allowed = [CANONICAL_INDEX_NAME, *DEFAULT_COLUMN_ORDER]
+    unknown = [col for col in columns if col not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown columns requested: {unknown}. Available columns: {allowed}")
+    if not columns:
+        raise ValueError(f"columns must not be empty. Available columns: {allowed}")
+
+    resolved = [CANONICAL_INDEX_NAME]
+    resolved.extend(col for col in dict.fromkeys(columns) if col != CANONICAL_INDEX_NAME)
+    return resolved
+
+
+def project_columns(df: pd.DataFrame, columns: Sequence[str] | None) -> pd.DataFrame:
+    """Restrict a DataFrame to a column projection.
+
+    Columns are returned in projection order. ``_data_source`` is kept when
+    present so FCP source tracking survives projection; columns missing from
+    ``df`` are skipped rather than created.
+
+    Args:
+        df: DataFrame to project
+        columns: Projection from ``resolve_columns``, or None to return ``df`` unchanged
+
+    Returns:
+        Projected DataFrame (``df`` itself when nothing needs to be dropped)
+    """
+    if columns is None:
+        return df
+
+    keep = [col for col in [*columns, "_data_source"] if col in df.columns]
+    if keep == list(df.columns):
+        return df
+    return df[keep]
+
+
+def standardize_dataframe(
+    df: pd.DataFrame,
+    keep_as_column: bool = True,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
     """Standardize a DataFrame for consistent use throughout the system.
 
     This is a comprehensive function that ensures:
@@ -394,6 +456,7 @@ def standardize_dataframe(df: pd.DataFrame, keep_as_column: bool = True) -> pd.D
         keep_as_column: Whether to keep open_time as a column (in addition to index)
                        Set to True for REST API and Vision API compatibility
                        Set to False for compact storage (cache files)
+        columns: Optional column projection; only these standard columns are kept
 
     Returns:
         Standardized DataFrame
@@ -426,6 +489,8 @@ def standardize_dataframe(df: pd.DataFrame, keep_as_column: bool = True) -> pd.D
 
     # Use centralized DEFAULT_COLUMN_ORDER from config.py instead of duplicating
     standard_columns = DEFAULT_COLUMN_ORDER.copy()
+    if columns is not None:
+        standard_columns = [col for col in standard_columns if col in columns]
 
     # Add open_time to front of column list if we're keeping it as a column
     if keep_as_column:
@@ -447,6 +512,38 @@ def standardize_dataframe(df: pd.DataFrame, keep_as_column: bool = True) -> pd.D
     return df[result_columns]
 
 
+def compact_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast a standardized kline DataFrame to the compact schema profile.
+
+    Prices and volumes become float32, ``count`` int32 (float32 when reindexing
+    left gaps), timestamps ``datetime64[ms, UTC]`` and ``_data_source`` an
+    ordered categorical over ``DATA_SOURCE_CATEGORIES`` (like the Polars Enum).
+
+    Args:
+        df: DataFrame in the standard NumPy-backed output format
+
+    Returns:
+        DataFrame with compact dtypes (a new frame; the input is not modified)
+    """
+    df = df.copy(deep=False)
+    for col, dtype in COMPACT_OUTPUT_DTYPES.items():
+        if col in df.columns:
+            # NaN rows from reindexing cannot be stored as int32
+            if dtype == "int32" and df[col].isna().any():
+                dtype = "float32"
+            df[col] = df[col].astype(dtype)
+
+    for col in ("open_time", "close_time"):
+        if col in df.columns and isinstance(df[col].dtype, pd.DatetimeTZDtype):
+            df[col] = df[col].dt.as_unit("ms")
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+        df.index = df.index.as_unit("ms")
+
+    if "_data_source" in df.columns:
+        df["_data_source"] = df["_data_source"].astype(pd.CategoricalDtype(DATA_SOURCE_CATEGORIES, ordered=True))
+    return df
+
+
 def convert_to_standardized_formats(df: pd.DataFrame, output_format: str = "default", chart_type: str = "klines") -> pd.DataFrame:
     """Convert a DataFrame to a standardized format based on the specified output format.
 
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+"""Adaptive concurrency limit for parallel downloads.
+
+A static worker count is either too timid on a fast link or too aggressive on a
+congested one. ``AdaptiveConcurrencyLimiter`` admits requests up to a limit it
+adjusts from what it observes (AIMD with a latency-gradient guard):
+
+- Additive increase: each successful request while the limit is actually in
+  use adds ``1 / limit``, i.e. about +1 per round of requests.
+- Latency backoff: when the short-term latency average rises above
+  ``latency_tolerance`` times the long-term average (queues building up on the
+  link or the server), the limit shrinks by ``latency_backoff``.
+- Error backoff: errors and timeouts cut the limit by ``error_backoff``.
+
+Decreases are applied at most once per cooldown (one short-term latency), so a
+burst of failures from requests that were already in flight counts once.
+The limit always stays within ``[min_limit, max_limit]``.
+
+Example:
+    >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=50)
+    >>> with limiter.slot() as slot:
+    ...     response = client.get(url)
+    ...     slot.record_bytes(len(response.content))
+    >>> limiter.metrics()["limit"]
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "LimiterSlot",
+]
+
+# Smoothing factors for the short- and long-term latency averages
+_SHORT_ALPHA = 0.3
+_LONG_ALPHA = 0.02
+
+# Throughput is measured over this trailing window (seconds)
+_THROUGHPUT_WINDOW = 10.0
+
+
+class LimiterSlot:
+    """One admitted request; report its outcome before the slot is released."""
+
+    __slots__ = ("_overloaded", "bytes")
+
+    def __init__(self) -> None:
+        """Initialize an empty slot."""
+        self.bytes = 0
+        self._overloaded = False
+
+    def record_bytes(self, size: int) -> None:
+        """Add transferred bytes (for throughput metrics)."""
+        self.bytes += size
+
+    def overloaded(self) -> None:
+        """Mark the request as rejected for load (e.g. HTTP 429/503) without raising."""
+        self._overloaded = True
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread-safe concurrency limit adjusted from latency, errors and timeouts."""
+
+    def __init__(
+        self,
+        initial_limit: int,
+        max_limit: int,
+        min_limit: int = 1,
+        *,
+        latency_tolerance: float = 2.0,
+        latency_backoff: float = 0.9,
+        error_backoff: float = 0.5,
+        timeout_errors: tuple[type[BaseException], ...] = (TimeoutError,),
+        name: str = "downloads",
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting limit
+            max_limit: Upper bound for the limit
+            min_limit: Lower bound for the limit
+            latency_tolerance: Short/long latency ratio treated as congestion
+            latency_backoff: Factor applied to the limit on congestion
+            error_backoff: Factor applied to the limit on errors and timeouts
+            timeout_errors: Exception types counted as timeouts
+            name: Name used in log lines
+
+        Raises:
+            ValueError: If the bounds are inconsistent
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(f"Need 1 <= min_limit <= initial_limit <= max_limit, got {min_limit}, {initial_limit}, {max_limit}")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.latency_backoff = latency_backoff
+        self.error_backoff = error_backoff
+        self.timeout_errors = timeout_errors
+        self.name = name
+
+        self._condition = threading.Condition()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._short_latency: float | None = None
+        self._long_latency: float | None = None
+        self._last_decrease = 0.0
+        self._transfers: deque[tuple[float, int]] = deque()
+        self._successes = 0
+        self._errors = 0
+        self._timeouts = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests admitted at once."""
+        return int(self._limit)
+
+    @contextmanager
+    def slot(self) -> Iterator[LimiterSlot]:
+        """Wait for a free slot and hold it for the duration of the block.
+
+        An exception leaving the block is recorded as an error (or a timeout
+        for ``timeout_errors``) and re-raised.
+
+        Yields:
+            LimiterSlot to record transferred bytes or overload on
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            in_flight_at_start = self._in_flight
+
+        slot = LimiterSlot()
+        started = time.monotonic()
+        try:
+            yield slot
+        except self.timeout_errors:
+            self._on_failure(timeout=True)
+            raise
+        except BaseException:
+            self._on_failure(timeout=False)
+            raise
+        else:
+            if slot._overloaded:
+                self._on_failure(timeout=False)
+            else:
+                self._on_success(time.monotonic() - started, slot.bytes, in_flight_at_start)
+
+    def _on_success(self, latency: float, size: int, in_flight_at_start: int) -> None:
+        """Update averages and grow or shrink the limit after a success."""
+        now = time.monotonic()
+        with self._condition:
+            self._release()
+            self._successes += 1
+            self._transfers.append((now, size))
+            while self._transfers and now - self._transfers[0][0] > _THROUGHPUT_WINDOW:
+                self._transfers.popleft()
+
+            if self._short_latency is None or self._long_latency is None:
+                self._short_latency = self._long_latency = latency
+                return
+            self._short_latency += _SHORT_ALPHA * (latency - self._short_latency)
+            self._long_latency += _LONG_ALPHA * (latency - self._long_latency)
+
+            if self._short_latency > self.latency_tolerance * self._long_latency:
+                self._decrease(self.latency_backoff, now, "latency")
+            elif in_flight_at_start * 2 >= self._limit:
+                # Only grow while the limit is the bottleneck (not when callers submit less)
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+                self._condition.notify()
+
+    def _on_failure(self, timeout: bool) -> None:
+        """Record an error or timeout and shrink the limit."""
+        with self._condition:
+            self._release()
+            if timeout:
+                self._timeouts += 1
+            else:
+                self._errors += 1
+            self._decrease(self.error_backoff, time.monotonic(), "timeout" if timeout else "error")
+
+    def _release(self) -> None:
+        """Free a slot (caller holds the condition)."""
+        self._in_flight -= 1
+        self._condition.notify()
+
+    def _decrease(self, factor: float, now: float, reason: str) -> None:
+        """Multiply the limit by ``factor``, at most once per cooldown (caller holds the condition)."""
+        if now - self._last_decrease < (self._short_latency or 0.0):
+            return
+        previous = self.limit
+        self._limit = max(float(self.min_limit), self._limit * factor)
+        self._last_decrease = now
+        self._decreases += 1
+        if self.limit != previous:
+            logger.debug("[{}] Concurrency limit {} -> {} ({})", self.name, previous, self.limit, reason)
+
+    def metrics(self) -> dict[str, Any]:
+        """Current limit and measurements.
+
+        Returns:
+            Dictionary with the limit, its bounds, requests in flight, latency
+            averages (ms), trailing throughput (bytes/s) and outcome counters
+        """
+        with self._condition:
+            now = time.monotonic()
+            recent = [(t, size) for t, size in self._transfers if now - t <= _THROUGHPUT_WINDOW]
+            span = now - recent[0][0] if recent else 0.0
+            throughput = sum(size for _, size in recent) / span if span > 0 else 0.0
+            return {
+                "limit": self.limit,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "in_flight": self._in_flight,
+                "short_latency_ms": (self._short_latency or 0.0) * 1000,
+                "long_latency_ms": (self._long_latency or 0.0) * 1000,
+                "throughput_bytes_per_second": throughput,
+                "successes": self._successes,
+                "errors": self._errors,
+                "timeouts": self._timeouts,
+                "decreases": self._decreases,
+            }
@@ -5,12 +5,14 @@
 """Utility functions for CryptoKlineVisionData API operations."""
 
 import traceback
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
 from ckvd.utils.config import VISION_DATA_DELAY_HOURS, create_empty_dataframe
+from ckvd.utils.dataframe_utils import project_columns
 from ckvd.utils.for_core.rest_exceptions import RateLimitError
 from ckvd.utils.for_core.vision_constraints import is_date_too_fresh_for_vision
 from ckvd.utils.loguru_setup import logger
@@ -60,6 +62,7 @@ def fetch_from_vision(
     chart_type: ChartType,
     use_cache: bool,
     save_to_cache_func=None,
+    columns: Sequence[str] | None = None,
 ) -> pd.DataFrame:
     """Fetch data from the Vision API.
 
@@ -72,6 +75,9 @@ def fetch_from_vision(
         chart_type: Type of chart data
         use_cache: Whether to use caching
         save_to_cache_func: Function to save data to cache
+        columns: Optional column projection. When the data is not cached it is
+            pushed into the CSV reader; otherwise full days are decoded for the
+            cache and projected afterwards.
 
     Returns:
         DataFrame with data from Vision API filtered to the requested time range
@@ -86,7 +92,7 @@ def fetch_from_vision(
         This ensures that even if a request specifies a start time at the beginning, middle, or end
         of the day, the entire day's data is cached for future use.
     """
-    logger.info(f"Fetching data from Vision API for {symbol} from {start_time} to {end_time}")
+    logger.info("Fetching data from Vision API for {} from {} to {}", symbol, start_time, end_time)
 
     try:
         # Get aligned boundaries to ensure complete data
@@ -101,7 +107,10 @@ def fetch_from_vision(
         # End at the end of the day for end_time
         vision_end = aligned_end.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        logger.debug(f"[FCP] Expanding Vision API request to full days: {vision_start} to {vision_end}")
+        logger.debug("[FCP] Expanding Vision API request to full days: {} to {}", vision_start, vision_end)
+
+        # Cache files must hold every column, so only project at decode time when not caching
+        caching = use_cache and save_to_cache_func is not None
 
         # Vision API has date-based files, fetch with chunking
         df = vision_client.fetch(
@@ -110,31 +119,32 @@ def fetch_from_vision(
             start_time=vision_start,
             end_time=vision_end,
             chart_type=chart_type,
+            columns=None if caching else columns,
         )
 
         if df is not None and not df.empty:
             # Add debugging information about dataframe
-            logger.debug(f"Vision API returned DataFrame with shape: {df.shape}")
+            logger.debug("Vision API returned DataFrame with shape: {}", df.shape)
             if hasattr(df, "index") and df.index is not None:
-                logger.debug(f"DataFrame index name: {df.index.name}, type: {type(df.index).__name__}")
+                logger.debug("DataFrame index name: {}, type: {}", df.index.name, type(df.index).__name__)
 
             # Add source information
             df["_data_source"] = "VISION"
 
             # Save the entire day's data to cache before filtering to the requested range
-            if use_cache and save_to_cache_func is not None:
+            if caching:
                 logger.debug("[FCP] Caching full day's data from Vision API")
                 save_to_cache_func(df, symbol, interval, source="VISION")
 
             # Filter the dataframe to the originally requested time range
-            logger.debug(f"[FCP] Filtering Vision API data to originally requested range: {aligned_start} to {aligned_end}")
-            filtered_df = filter_dataframe_by_time(df, aligned_start, aligned_end, "open_time")
+            logger.debug("[FCP] Filtering Vision API data to originally requested range: {} to {}", aligned_start, aligned_end)
+            filtered_df = project_columns(filter_dataframe_by_time(df, aligned_start, aligned_end, "open_time"), columns)
 
             # Help with debugging
-            logger.info(f"Retrieved {len(filtered_df)} records from Vision API (after filtering to requested range)")
+            logger.info("Retrieved {} records from Vision API (after filtering to requested range)", len(filtered_df))
 
             return filtered_df
-        logger.info(f"Vision API returned no data for {symbol}")
+        logger.info("Vision API returned no data for {}", symbol)
         # Check if end_time is within the Vision API delay window using our centralized function
         if is_date_too_fresh_for_vision(end_time):
             logger.info(
@@ -192,6 +202,9 @@ def fetch_from_rest(
     interval: Interval,
     rest_client,
     chart_type: ChartType,
+    columns: Sequence[str] | None = None,
+    wait_on_rate_limit: bool = False,
+    resume_token: Path | None = None,
 ) -> pd.DataFrame:
     """Fetch data from REST API with chunking.
 
@@ -202,6 +215,9 @@ def fetch_from_rest(
         interval: Time interval between data points
         rest_client: RestDataClient instance
         chart_type: Type of chart data
+        columns: Optional column projection applied before the pandas conversion
+        wait_on_rate_limit: Pause for rate limits and resume instead of returning partial data
+        resume_token: File persisting completed chunks so a restarted fetch resumes
 
     Returns:
         DataFrame with data from REST API
@@ -211,12 +227,12 @@ def fetch_from_rest(
                       data source in the FCP chain, failures here represent
                       complete failure of all data sources.
     """
-    logger.info(f"Fetching data from REST API for {symbol} from {start_time} to {end_time}")
+    logger.info("Fetching data from REST API for {} from {} to {}", symbol, start_time, end_time)
 
     try:
         # Get aligned boundaries to ensure complete data
         aligned_start, aligned_end = align_time_boundaries(start_time, end_time, interval)
-        logger.debug(f"Complete data range after alignment: {aligned_start} to {aligned_end}")
+        logger.debug("Complete data range after alignment: {} to {}", aligned_start, aligned_end)
 
         # REST API has limits, so get data with chunking
         df = rest_client.fetch(
@@ -225,6 +241,9 @@ def fetch_from_rest(
             start_time=aligned_start,
             end_time=aligned_end,
             chart_type=chart_type,
+            columns=columns,
+            wait_on_rate_limit=wait_on_rate_limit,
+            resume_token=resume_token,
         )
 
         if df.empty:
@@ -235,7 +254,7 @@ def fetch_from_rest(
         df["_data_source"] = "REST"
 
         # Help with debugging
-        logger.info(f"Retrieved {len(df)} records from REST API")
+        logger.info("Retrieved {} records from REST API", len(df))
 
         return df
     except RateLimitError:
@@ -284,7 +303,7 @@ def create_client_if_needed(
     """
     # Check if this is a RestDataClient
     if client_class.__name__ == "RestDataClient":
-        logger.debug(f"Setting up {client_class.__name__} with market_type={market_type}, retry_count={retry_count}")
+        logger.debug("Setting up {} with market_type={}, retry_count={}", client_class.__name__, market_type, retry_count)
 
         # Only create a new client if needed
         if client is None or not isinstance(client, client_class):
@@ -300,7 +319,7 @@ def create_client_if_needed(
             return client_class(market_type=market_type, **kwargs)
         # Already have a client, check if it needs reconfiguration
         if market_type is not None and client.market_type != market_type:
-            logger.debug(f"Reconfiguring RestDataClient with market_type={market_type}")
+            logger.debug("Reconfiguring RestDataClient with market_type={}", market_type)
             # Need a new client for different market type
             kwargs = {}
             if retry_count is not None:
@@ -333,7 +352,7 @@ def create_client_if_needed(
         # Already have a client, check if it needs reconfiguration
         if client.symbol != symbol or client.interval != interval or client.market_type_str != str(market_type).lower():
             logger.debug(
-                f"Reconfiguring VisionDataClient with new parameters: symbol={symbol}, interval={interval}, market_type={market_type}"
+                "Reconfiguring VisionDataClient with new parameters: symbol={}, interval={}, market_type={}", symbol, interval, market_type
             )
             # Need a new client for different parameters
             kwargs = {}
@@ -8,6 +8,8 @@ Provides provider-agnostic cache path generation and cache I/O operations.
 Uses Polars LazyFrame for memory-efficient file reading with predicate pushdown.
 """
 
+import sqlite3
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime
 from pathlib import Path
 
@@ -19,11 +21,14 @@ import pyarrow as pa
 from ckvd.core.providers.binance.vision_path_mapper import (
     FSSpecVisionHandler,
 )
+from ckvd.utils.cache.compression import get_cache_compression, write_ipc_table
+from ckvd.utils.cache.index import CacheIndex, CacheIndexEntry
+from ckvd.utils.cache.time_batches import read_ipc_time_range
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import ChartType, DataProvider, Interval, MarketType
 
 
-def _scan_cache_file(cache_path: str | Path) -> pl.LazyFrame:
+def scan_cache_file(cache_path: str | Path) -> pl.LazyFrame:
     """Detect cache file format via magic bytes and return a LazyFrame scanner.
 
     Arrow IPC files start with "ARROW1" (6 bytes), Parquet files start with "PAR1".
@@ -45,7 +50,7 @@ def _scan_cache_file(cache_path: str | Path) -> pl.LazyFrame:
     if magic == b"ARROW1":
         return pl.scan_ipc(cache_path)
     if magic[:4] == b"PAR1":
-        logger.debug(f"Cache file {cache_path} is Parquet format (legacy)")
+        logger.debug("Cache file {} is Parquet format (legacy)", cache_path)
         return pl.scan_parquet(cache_path)
 
     # Unknown format, try IPC first then Parquet
@@ -57,6 +62,35 @@ def _scan_cache_file(cache_path: str | Path) -> pl.LazyFrame:
         return pl.scan_parquet(cache_path)
 
 
+# Backward-compatible private name
+_scan_cache_file = scan_cache_file
+
+
+def _scan_cache_file_range(cache_path: str | Path, start_time: datetime, end_time: datetime) -> pl.LazyFrame:
+    """Scan only the part of a cache file that can hold rows in a time range.
+
+    Files written with a record-batch time index (see ``write_ipc_table``)
+    have just the overlapping batches memory-mapped, so a sub-day read of a
+    1s/1m file touches a few hourly batches instead of the whole day. Other
+    files are scanned whole. Callers still filter rows by ``open_time``.
+
+    Args:
+        cache_path: Path to the cache file.
+        start_time: Start of the range.
+        end_time: End of the range.
+
+    Returns:
+        Polars LazyFrame over the candidate rows.
+    """
+    with open(cache_path, "rb") as f:
+        magic = f.read(6)
+    if magic == b"ARROW1":
+        table = read_ipc_time_range(cache_path, start_time, end_time)
+        if table is not None:
+            return pl.from_arrow(table).lazy()
+    return scan_cache_file(cache_path)
+
+
 # =============================================================================
 # Provider-Agnostic Cache Path Generation
 # =============================================================================
@@ -143,6 +177,52 @@ def get_cache_dir_for_symbol(
     return cache_root / provider_dir / market_dir / chart_dir / "daily" / symbol.upper() / interval_str
 
 
+def get_vision_day_paths(
+    symbol: str,
+    start_time: datetime,
+    end_time: datetime,
+    interval: Interval,
+    cache_dir: Path,
+    market_type: MarketType,
+    chart_type: ChartType = ChartType.KLINES,
+) -> list[Path]:
+    """List the daily cache files covering a time range.
+
+    These are the files a Vision fetch for the range writes (Vision requests
+    are expanded to whole UTC days), so they double as the keys for
+    coalescing concurrent fetches of the same days.
+
+    Args:
+        symbol: Trading symbol
+        start_time: Start time
+        end_time: End time
+        interval: Time interval
+        cache_dir: Cache directory
+        market_type: Market type
+        chart_type: Chart type
+
+    Returns:
+        One path per UTC day from start_time to end_time inclusive
+    """
+    fs_handler = FSSpecVisionHandler(base_cache_dir=cache_dir)
+    current_date = pendulum.instance(start_time).in_tz("UTC").start_of("day")
+    end_date = pendulum.instance(end_time).in_tz("UTC").start_of("day")
+
+    paths = []
+    while current_date <= end_date:
+        paths.append(
+            fs_handler.get_local_path_for_data(
+                symbol=symbol,
+                interval=interval,
+                date=current_date,
+                market_type=market_type,
+                chart_type=chart_type,
+            )
+        )
+        current_date = current_date.add(days=1)
+    return paths
+
+
 # =============================================================================
 # Cache I/O Operations
 # =============================================================================
@@ -157,6 +237,8 @@ def get_cache_lazyframes(
     market_type: MarketType,
     chart_type: ChartType = ChartType.KLINES,
     provider: DataProvider = DataProvider.BINANCE,
+    columns: Sequence[str] | None = None,
+    cache_files: Sequence[tuple[str, Path]] | None = None,
 ) -> list[pl.LazyFrame]:
     """Get LazyFrames from cache for use with PolarsDataPipeline.
 
@@ -165,6 +247,10 @@ def get_cache_lazyframes(
 
     This enables predicate pushdown and lazy evaluation through the entire pipeline.
 
+    When the cache root has an index (``cache_index.db``), the files to scan are
+    taken from one index query and no per-day existence checks are made.
+    Roots without an index fall back to probing each day's path.
+
     Args:
         symbol: Trading symbol
         start_time: Start time
@@ -174,26 +260,172 @@ def get_cache_lazyframes(
         market_type: Market type (spot, um, cm)
         chart_type: Chart type (klines, funding_rate)
         provider: Data provider - currently supports Binance only
+        columns: Optional column projection, pushed down into the IPC scan so
+            unrequested columns are never read from disk
+        cache_files: (day, path) pairs to scan, as listed by ``find_cache_files``
+            when the request was planned; looked up here when omitted
 
     Returns:
         List of LazyFrames with time-filtered data and _data_source="CACHE" column
     """
-    # Initialize FSSpecVisionHandler for path mapping
-    fs_handler = FSSpecVisionHandler(base_cache_dir=cache_dir)
-
     if provider != DataProvider.BINANCE:
         logger.warning(f"Provider {provider.name} cache retrieval not yet implemented, falling back to Binance format")
 
-    # Calculate the days we need to query
-    current_date = pendulum.instance(start_time).start_of("day")
-    end_date = pendulum.instance(end_time).start_of("day")
+    if cache_files is None:
+        cache_files = find_cache_files(symbol, start_time, end_time, interval, cache_dir, market_type, chart_type)
 
     lazy_frames: list[pl.LazyFrame] = []
 
-    # Iterate through days
-    while current_date <= end_date:
+    for day_str, cache_path in cache_files:
+        try:
+            # Use < end_time (exclusive) for consistency with OHLCV semantics:
+            # open_time represents the START of a candle period, so a candle with
+            # open_time == end_time would represent data AFTER the requested range.
+            lf = _scan_cache_file_range(cache_path, start_time, end_time)
+            if columns is not None:
+                file_columns = lf.collect_schema().names()
+                lf = lf.select([col for col in columns if col in file_columns])
+
+            lf = lf.filter((pl.col("open_time") >= start_time) & (pl.col("open_time") < end_time)).with_columns(
+                pl.lit("CACHE").alias("_data_source")
+            )
+
+            lazy_frames.append(lf)
+            logger.debug("Added LazyFrame for {}", day_str)
+        except (OSError, pl.exceptions.ComputeError, ValueError, KeyError) as e:
+            logger.error(f"Error scanning cache file {cache_path}: {e}")
+
+    logger.debug("Returning {} cache LazyFrames", len(lazy_frames))
+    return lazy_frames
+
+
+def find_cache_files(
+    symbol: str,
+    start_time: datetime,
+    end_time: datetime,
+    interval: Interval,
+    cache_dir: Path,
+    market_type: MarketType,
+    chart_type: ChartType = ChartType.KLINES,
+) -> list[tuple[str, Path]]:
+    """List the daily cache files covering a time range.
+
+    Uses the cache root's index when it has one and checks the path of each day
+    the index does not list.
+
+    Args:
+        symbol: Trading symbol
+        start_time: Start time (its whole day is included)
+        end_time: End time (its whole day is included)
+        interval: Time interval
+        cache_dir: Cache directory
+        market_type: Market type (spot, um, cm)
+        chart_type: Chart type (klines, funding_rate)
+
+    Returns:
+        (YYYY-MM-DD, path) pairs ordered by day
+    """
+    return [
+        (day, path) for day, path, _, _ in find_cache_coverage(symbol, start_time, end_time, interval, cache_dir, market_type, chart_type)
+    ]
+
+
+def find_cache_coverage(
+    symbol: str,
+    start_time: datetime,
+    end_time: datetime,
+    interval: Interval,
+    cache_dir: Path,
+    market_type: MarketType,
+    chart_type: ChartType = ChartType.KLINES,
+) -> list[tuple[str, Path, datetime, datetime]]:
+    """List the daily cache files covering a time range and the span each holds.
+
+    Reads only the cache root's index and checks the path of each day the
+    index does not list (files written by paths that skip the index, or before
+    it existed), never the files. Indexed files cover
+    ``[first open_time, last open_time + interval)``; files found by probing
+    are assumed to cover their whole UTC day. Intraday gaps are only found
+    when the files are read.
+
+    Args:
+        symbol: Trading symbol
+        start_time: Start time (its whole day is included)
+        end_time: End time (its whole day is included)
+        interval: Time interval
+        cache_dir: Cache directory
+        market_type: Market type (spot, um, cm)
+        chart_type: Chart type (klines, funding_rate)
+
+    Returns:
+        (YYYY-MM-DD, path, covered_start, covered_end) tuples ordered by day
+    """
+    start_date = pendulum.instance(start_time).start_of("day")
+    end_date = pendulum.instance(end_time).start_of("day")
+
+    coverage: dict[str, tuple[str, Path, datetime, datetime]] = {}
+    for entry in _find_indexed_cache_files(symbol, start_date, end_date, interval, cache_dir, market_type, chart_type) or []:
+        day_start = pendulum.parse(entry.date, tz="UTC")
+        if entry.start_time_ms is None or entry.end_time_ms is None:
+            covered_start, covered_end = day_start, day_start.add(days=1)
+        else:
+            covered_start = pendulum.from_timestamp(entry.start_time_ms / 1000, tz="UTC")
+            covered_end = pendulum.from_timestamp(entry.end_time_ms / 1000, tz="UTC").add(seconds=interval.to_seconds())
+        coverage[entry.date] = (entry.date, Path(entry.path), covered_start, covered_end)
+
+    days = [start_date.add(days=i) for i in range((end_date - start_date).days + 1)]
+    unindexed = [day for day in days if day.format("YYYY-MM-DD") not in coverage]
+    if unindexed:
+        fs_handler = FSSpecVisionHandler(base_cache_dir=cache_dir)
+        for day, path in _probe_cache_files(fs_handler, symbol, unindexed, interval, market_type, chart_type):
+            day_start = pendulum.parse(day, tz="UTC")
+            coverage[day] = (day, path, day_start, day_start.add(days=1))
+    return [coverage[day] for day in sorted(coverage)]
+
+
+def _find_indexed_cache_files(
+    symbol: str,
+    start_date: pendulum.DateTime,
+    end_date: pendulum.DateTime,
+    interval: Interval,
+    cache_dir: Path,
+    market_type: MarketType,
+    chart_type: ChartType,
+) -> list[CacheIndexEntry] | None:
+    """Look up the cache files for a date range in the cache root's index.
+
+    Returns:
+        Index entries ordered by day, or None if the root has no usable index
+    """
+    index = CacheIndex.for_cache_dir(cache_dir)
+    if not index.exists():
+        return None
+    try:
+        entries = index.get_entries(market_type, symbol, interval, start_date.date(), end_date.date(), chart_type)
+    except sqlite3.Error as e:
+        logger.warning(f"Cache index {index.db_path} unusable, probing cache files instead: {e}")
+        return None
+    logger.debug("Cache index lists {} files for {} {} {}..{}", len(entries), symbol, interval.value, start_date.date(), end_date.date())
+    return entries
+
+
+def _probe_cache_files(
+    fs_handler: FSSpecVisionHandler,
+    symbol: str,
+    days: Iterable[pendulum.DateTime],
+    interval: Interval,
+    market_type: MarketType,
+    chart_type: ChartType,
+) -> list[tuple[str, Path]]:
+    """Find the cache files for some days by checking each day's path.
+
+    Returns:
+        (day, path) pairs in the order of ``days``
+    """
+    cache_files: list[tuple[str, Path]] = []
+    for current_date in days:
+        day_str = current_date.format("YYYY-MM-DD")
         try:
-            # Get cache path for this day
             cache_path = fs_handler.get_local_path_for_data(
                 symbol=symbol,
                 interval=interval,
@@ -201,35 +433,14 @@ def get_cache_lazyframes(
                 market_type=market_type,
                 chart_type=chart_type,
             )
-
-            # Check if cache file exists
             if fs_handler.exists(cache_path):
-                logger.debug(f"Found cache file: {cache_path}")
-
-                try:
-                    # Use < end_time (exclusive) for consistency with OHLCV semantics:
-                    # open_time represents the START of a candle period, so a candle with
-                    # open_time == end_time would represent data AFTER the requested range.
-                    lf = _scan_cache_file(cache_path)
-
-                    lf = lf.filter((pl.col("open_time") >= start_time) & (pl.col("open_time") < end_time)).with_columns(
-                        pl.lit("CACHE").alias("_data_source")
-                    )
-
-                    lazy_frames.append(lf)
-                    logger.debug(f"Added LazyFrame for {current_date.format('YYYY-MM-DD')}")
-                except (OSError, pl.exceptions.ComputeError, ValueError, KeyError) as e:
-                    logger.error(f"Error scanning cache file {cache_path}: {e}")
+                logger.debug("Found cache file: {}", cache_path)
+                cache_files.append((day_str, cache_path))
             else:
-                logger.debug(f"No cache file found for {current_date.format('YYYY-MM-DD')}")
+                logger.debug("No cache file found for {}", day_str)
         except (OSError, ValueError, TypeError) as e:
-            logger.error(f"Error processing cache for {current_date.format('YYYY-MM-DD')}: {e}")
-
-        # Move to next day
-        current_date = current_date.add(days=1)
-
-    logger.debug(f"Returning {len(lazy_frames)} cache LazyFrames")
-    return lazy_frames
+            logger.error(f"Error processing cache for {day_str}: {e}")
+    return cache_files
 
 
 def get_from_cache(
@@ -293,14 +504,14 @@ def get_from_cache(
 
             # Check if cache file exists
             if fs_handler.exists(cache_path):
-                logger.info(f"Loading from cache: {cache_path}")
+                logger.info("Loading from cache: {}", cache_path)
 
                 # MEMORY OPTIMIZATION: Use Polars LazyFrame with predicate pushdown
                 # This filters at read time instead of loading entire file then filtering.
                 # Detect format and use appropriate scanner.
                 # Source: https://docs.pola.rs/api/python/stable/reference/api/polars.scan_ipc.html
                 try:
-                    lf = _scan_cache_file(cache_path)
+                    lf = _scan_cache_file_range(cache_path, start_time, end_time)
 
                     # Apply time range filter with predicate pushdown
                     # Note: Polars datetime comparison requires proper type handling
@@ -311,7 +522,7 @@ def get_from_cache(
                     daily_pl = filtered_lf.collect(engine="streaming")
 
                     if len(daily_pl) > 0:
-                        logger.info(f"Loaded {len(daily_pl)} records from cache for {current_date.format('YYYY-MM-DD')}")
+                        logger.info("Loaded {} records from cache for {}", len(daily_pl), current_date.format("YYYY-MM-DD"))
                         loaded_days.append(current_date.date())
 
                         # Convert to pandas and add source information
@@ -325,7 +536,7 @@ def get_from_cache(
                 except (OSError, pl.exceptions.ComputeError, ValueError, KeyError) as e:
                     logger.error(f"Error loading cache file {cache_path}: {e}")
             else:
-                logger.info(f"No cache file found for {current_date.format('YYYY-MM-DD')}")
+                logger.info("No cache file found for {}", current_date.format("YYYY-MM-DD"))
         except (OSError, ValueError, TypeError) as e:
             logger.error(f"Error processing cache for {current_date.format('YYYY-MM-DD')}: {e}")
 
@@ -348,13 +559,13 @@ def get_from_cache(
         # This will detect both missing days and intraday gaps
         from ckvd.utils.for_core.ckvd_time_range_utils import identify_missing_segments
 
-        logger.debug(f"[CACHE] Using gap detection to find missing ranges between {start_time} and {end_time}")
+        logger.debug("[CACHE] Using gap detection to find missing ranges between {} and {}", start_time, end_time)
         missing_ranges = identify_missing_segments(result_df, start_time, end_time, interval)
 
         if missing_ranges:
-            logger.debug(f"[CACHE] Gap detection found {len(missing_ranges)} missing segments:")
+            logger.debug("[CACHE] Gap detection found {} missing segments:", len(missing_ranges))
             for i, (miss_start, miss_end) in enumerate(missing_ranges):
-                logger.debug(f"[CACHE]   Missing segment {i + 1}: {miss_start} to {miss_end}")
+                logger.debug("[CACHE]   Missing segment {}: {} to {}", i + 1, miss_start, miss_end)
         else:
             logger.debug("[CACHE] Gap detection found no missing segments - cache provides complete coverage")
 
@@ -362,10 +573,10 @@ def get_from_cache(
     if result_df.empty:
         logger.info("No data found in cache for the requested time range")
     else:
-        logger.info(f"Loaded {len(result_df)} total records from cache")
+        logger.info("Loaded {} total records from cache", len(result_df))
 
     if missing_ranges:
-        logger.info(f"Missing {len(missing_ranges)} time ranges in cache")
+        logger.info("Missing {} time ranges in cache", len(missing_ranges))
 
     return result_df, missing_ranges
 
@@ -381,6 +592,11 @@ def save_to_cache(
 ) -> bool:
     """Save DataFrame to cache.
 
+    Files are compressed with the codec configured for ``cache_dir``
+    (see ``set_cache_compression``), uncompressed by default. Every file
+    written is recorded in the cache root's index in one transaction (the
+    first write to a root without an index indexes the whole root).
+
     Args:
         df: DataFrame to save
         symbol: Trading symbol
@@ -402,6 +618,9 @@ def save_to_cache(
         # Initialize FSSpecVisionHandler for path mapping
         fs_handler = FSSpecVisionHandler(base_cache_dir=cache_dir)
 
+        # IPC codec configured for this cache root (None = uncompressed)
+        compression = get_cache_compression(cache_dir)
+
         # TODO: When adding support for multiple providers, update the cache
         # path structure to include the provider information.
         # Currently, only Binance is supported.
@@ -413,6 +632,7 @@ def save_to_cache(
         grouped = df.groupby(df["date"])
 
         saved_files = 0
+        index_entries: list[CacheIndexEntry] = []
 
         for date, day_df in grouped:
             try:
@@ -438,18 +658,37 @@ def save_to_cache(
 
                 # Save to Arrow IPC format (not Parquet) for consistency with
                 # cache_manager.py and vision_manager.py, and to enable memory
-                # mapping and predicate pushdown via scan_ipc()
+                # mapping and predicate pushdown via scan_ipc() (compressed
+                # files are decompressed transparently by scan_ipc)
                 table = pa.Table.from_pandas(save_df)
-                with pa.OSFile(str(cache_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
-                    writer.write_table(table)
-                logger.info(f"Saved {len(save_df)} records to cache: {cache_path}")
+                write_ipc_table(table, cache_path, compression)
+                logger.info("Saved {} records to cache: {}", len(save_df), cache_path)
                 saved_files += 1
 
+                index_entries.append(
+                    CacheIndexEntry.from_file(
+                        cache_path,
+                        market_type=market_type,
+                        symbol=symbol,
+                        interval=interval,
+                        day=date,
+                        chart_type=chart_type,
+                        provider=provider,
+                        table=table,
+                    )
+                )
             except (OSError, PermissionError, pd.errors.ParserError) as e:
                 logger.error(f"Error saving cache file for {date}: {e}")
 
+        try:
+            # Files written before the index existed are found by probing until
+            # ``ckvd reindex`` adds them
+            CacheIndex.for_cache_dir(cache_dir).record_files(index_entries)
+        except sqlite3.Error as e:
+            logger.warning(f"Cache files saved but cache index not updated: {e}")
+
         if saved_files > 0:
-            logger.info(f"Saved data to {saved_files} cache files")
+            logger.info("Saved data to {} cache files", saved_files)
             return True
         logger.warning("No cache files were saved")
         return False
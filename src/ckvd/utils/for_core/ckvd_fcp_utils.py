@@ -4,6 +4,7 @@
 # Refactoring: Fix silent failure patterns (BLE001)
 """Utility functions for Failover Control Protocol (FCP) implementation."""
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
 
 import pandas as pd
@@ -59,6 +60,7 @@ def process_vision_step(
     interval: Interval,
     include_source_info: bool,
     result_df: pd.DataFrame,
+    columns: Sequence[str] | None = None,
 ) -> tuple[pd.DataFrame, list[tuple[datetime, datetime]]]:
     """Process the Vision API step (Step 2) of the FCP mechanism.
 
@@ -69,6 +71,7 @@ def process_vision_step(
         interval: Interval for data points
         include_source_info: Whether to include source info in the DataFrame
         result_df: Existing results DataFrame to merge with
+        columns: Optional column projection applied when merging
 
     Returns:
         Tuple of (updated_result_df, remaining_missing_ranges)
@@ -79,7 +82,7 @@ def process_vision_step(
     remaining_ranges = []
 
     for range_idx, (miss_start, miss_end) in enumerate(missing_ranges):
-        logger.debug(f"[FCP] Fetching from Vision API range {range_idx + 1}/{len(missing_ranges)}: {miss_start} to {miss_end}")
+        logger.debug("[FCP] Fetching from Vision API range {}/{}: {} to {}", range_idx + 1, len(missing_ranges), miss_start, miss_end)
 
         range_df = fetch_from_vision_func(symbol, miss_start, miss_end, interval)
 
@@ -90,8 +93,8 @@ def process_vision_step(
 
             # If we already have data, merge with the new data
             if not result_df.empty:
-                logger.debug(f"[FCP] Merging {len(range_df)} Vision records with existing {len(result_df)} records")
-                result_df = merge_dataframes([result_df, range_df])
+                logger.debug("[FCP] Merging {} Vision records with existing {} records", len(range_df), len(result_df))
+                result_df = merge_dataframes([result_df, range_df], columns=columns)
             else:
                 # Otherwise just use the Vision data
                 result_df = range_df
@@ -102,7 +105,7 @@ def process_vision_step(
                 missing_segments = identify_missing_segments(result_df, miss_start, miss_end, interval)
 
                 if missing_segments:
-                    logger.debug(f"[FCP] Vision API left {len(missing_segments)} missing segments")
+                    logger.debug("[FCP] Vision API left {} missing segments", len(missing_segments))
                     remaining_ranges.extend(missing_segments)
                 else:
                     logger.debug("[FCP] Vision API provided complete coverage for this range")
@@ -115,7 +118,7 @@ def process_vision_step(
     if remaining_ranges:
         # Merge adjacent or overlapping ranges
         updated_missing_ranges = merge_adjacent_ranges(remaining_ranges, interval)
-        logger.debug(f"[FCP] After Vision API, still have {len(updated_missing_ranges)} missing ranges")
+        logger.debug("[FCP] After Vision API, still have {} missing ranges", len(updated_missing_ranges))
     else:
         updated_missing_ranges = []
         logger.debug("[FCP] No missing ranges after Vision API")
@@ -131,6 +134,7 @@ def process_rest_step(
     include_source_info: bool,
     result_df: pd.DataFrame,
     save_to_cache_func=None,
+    columns: Sequence[str] | None = None,
 ) -> pd.DataFrame:
     """Process the REST API step (Step 3) of the FCP mechanism.
 
@@ -142,18 +146,20 @@ def process_rest_step(
         include_source_info: Whether to include source info in the DataFrame
         result_df: Existing results DataFrame to merge with
         save_to_cache_func: Function to save data to cache (optional)
+        columns: Optional column projection applied when merging. REST data is
+            cached before projection so cache files always hold every column.
 
     Returns:
         Updated result DataFrame
     """
-    logger.info(f"[FCP] STEP 3: Using REST API for {len(missing_ranges)} remaining missing ranges")
+    logger.info("[FCP] STEP 3: Using REST API for {} remaining missing ranges", len(missing_ranges))
 
     # Merge adjacent ranges to minimize API calls
     merged_rest_ranges = merge_adjacent_ranges(missing_ranges, interval)
 
     rate_limit_hit = False
     for range_idx, (miss_start, miss_end) in enumerate(merged_rest_ranges):
-        logger.debug(f"[FCP] Fetching from REST API range {range_idx + 1}/{len(merged_rest_ranges)}: {miss_start} to {miss_end}")
+        logger.debug("[FCP] Fetching from REST API range {}/{}: {} to {}", range_idx + 1, len(merged_rest_ranges), miss_start, miss_end)
 
         try:
             rest_df = fetch_from_rest_func(symbol, miss_start, miss_end, interval)
@@ -172,8 +178,8 @@ def process_rest_step(
 
             # If we already have data, merge with the new data
             if not result_df.empty:
-                logger.debug(f"[FCP] Merging {len(rest_df)} REST records with existing {len(result_df)} records")
-                result_df = merge_dataframes([result_df, rest_df])
+                logger.debug("[FCP] Merging {} REST records with existing {} records", len(rest_df), len(result_df))
+                result_df = merge_dataframes([result_df, rest_df], columns=columns)
             else:
                 # Otherwise just use the REST data
                 result_df = rest_df
@@ -231,8 +237,8 @@ def verify_final_data(
     data_age_hours = (now - max_time).total_seconds() / 3600
     is_historical_data = data_age_hours > 24
 
-    logger.debug(f"[FCP] Final result spans from {min_time} to {max_time} with {len(result_df)} records")
-    logger.debug(f"[FCP] Data age: {data_age_hours:.1f} hours, is_historical: {is_historical_data}")
+    logger.debug("[FCP] Final result spans from {} to {} with {} records", min_time, max_time, len(result_df))
+    logger.debug("[FCP] Data age: {:.1f} hours, is_historical: {}", data_age_hours, is_historical_data)
 
     # CORRECTED VALIDATION LOGIC:
     # For historical data, if we have data, it should be considered successful.
@@ -276,7 +282,11 @@ def verify_final_data(
     else:
         # Recent data with good coverage
         logger.info(
-            f"[FCP] Recent data coverage: {100 - missing_percentage:.1f}% complete ({len(result_df)} records from {min_time} to {max_time})"
+            "[FCP] Recent data coverage: {:.1f}% complete ({} records from {} to {})",
+            100 - missing_percentage,
+            len(result_df),
+            min_time,
+            max_time,
         )
 
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""As-of joins of funding rates onto kline bars for CryptoKlineVisionData.
+
+Funding rates are published every few hours, klines every interval. Each bar
+gets the latest funding rate at or before its ``open_time`` (a backward
+``join_asof`` on ``open_time``/``funding_time`` per symbol).
+"""
+
+from collections.abc import Sequence
+
+import polars as pl
+
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "join_funding_asof",
+]
+
+
+def join_funding_asof(klines: pl.DataFrame, funding: pl.DataFrame, by: Sequence[str] = ("symbol",)) -> pl.DataFrame:
+    """Attach the latest funding rate at or before each bar's ``open_time``.
+
+    Args:
+        klines: Kline bars with ``open_time`` and the ``by`` columns
+        funding: Funding rates with ``funding_time``, ``funding_rate`` and the ``by`` columns
+        by: Columns both frames are matched on before the as-of join
+
+    Returns:
+        ``klines`` sorted by ``by`` and ``open_time``, with ``funding_time`` and
+        ``funding_rate`` of the latest funding at or before each bar (null when
+        there is none)
+    """
+    by = list(by)
+    time_dtype = klines.schema["open_time"]
+    funding = funding.select(
+        *(pl.col(name).cast(klines.schema[name]) for name in by),
+        pl.col("funding_time").cast(time_dtype),
+        pl.col("funding_rate").cast(pl.Float64),
+    )
+
+    # join_asof needs both sides sorted by the as-of key within each group; sorted
+    # globally here, which polars cannot verify per group, so the check is skipped
+    joined = klines.sort("open_time").join_asof(
+        funding.sort("funding_time"),
+        left_on="open_time",
+        right_on="funding_time",
+        by=by,
+        strategy="backward",
+        check_sortedness=False,
+    )
+    joined = joined.sort([*by, "open_time"])
+    logger.debug("Joined {} funding rates onto {} bars", len(funding), len(joined))
+    return joined
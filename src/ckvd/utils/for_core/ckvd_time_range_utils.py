@@ -4,7 +4,8 @@
 # and FCP merge logic. Full Polars migration would require broader changes.
 """Utility functions for CryptoKlineVisionData time range and data segment operations."""
 
-from datetime import datetime, timedelta
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
@@ -53,7 +54,48 @@ def merge_adjacent_ranges(ranges: list[tuple[datetime, datetime]], interval: Int
     return merged
 
 
-def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
+def split_time_range(
+    start_time: datetime,
+    end_time: datetime,
+    batch: str | timedelta,
+    interval: Interval,
+) -> list[tuple[datetime, datetime]]:
+    """Split ``[start_time, end_time)`` into consecutive batch-sized slices.
+
+    Slice boundaries are aligned to multiples of ``batch`` since the Unix epoch,
+    so daily batches coincide with UTC days (and with the Vision/cache day files).
+    The first and last slices are clipped to the requested range.
+
+    Args:
+        start_time: Start of the range (timezone-aware)
+        end_time: Exclusive end of the range (timezone-aware)
+        batch: Slice length as a ``timedelta`` or a pandas offset string
+            (e.g. "1D", "6h")
+        interval: Kline interval; the batch must be a whole number of intervals
+
+    Returns:
+        List of (start, end) tuples covering the range in order
+
+    Raises:
+        ValueError: If the batch is not a positive multiple of the interval
+    """
+    batch_delta = pd.Timedelta(batch).to_pytimedelta() if isinstance(batch, str) else batch
+    interval_delta = timedelta(seconds=interval.to_seconds())
+    if batch_delta <= timedelta(0) or batch_delta % interval_delta:
+        raise ValueError(f"batch {batch!r} must be a positive multiple of the {interval.value} interval")
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    slices = []
+    slice_start = start_time
+    while slice_start < end_time:
+        boundary = epoch + ((slice_start - epoch) // batch_delta + 1) * batch_delta
+        slice_end = min(boundary, end_time)
+        slices.append((slice_start, slice_end))
+        slice_start = slice_end
+    return slices
+
+
+def standardize_columns(df: pd.DataFrame, columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Standardize column names and data types to ensure consistency.
 
     This method ensures:
@@ -65,6 +107,7 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     Args:
         df: DataFrame to standardize
+        columns: Optional column projection (see ``resolve_columns``)
 
     Returns:
         Standardized DataFrame following REST API format
@@ -96,7 +139,7 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     # First apply the centralized standardize_dataframe function
     # This function ensures proper column structure and data types
-    df = standardize_dataframe(df)
+    df = standardize_dataframe(df, columns=columns)
 
     # Ensure open_time is a proper datetime column with UTC timezone
     if "open_time" in df.columns:
@@ -110,7 +153,7 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
                 logger.debug("Localizing naive datetime open_time to UTC")
                 df["open_time"] = df["open_time"].dt.tz_localize("UTC")
             elif df["open_time"].dt.tz.zone != "UTC":
-                logger.debug(f"Converting open_time timezone from {df['open_time'].dt.tz.zone} to UTC")
+                logger.debug("Converting open_time timezone from {} to UTC", df["open_time"].dt.tz.zone)
                 df["open_time"] = df["open_time"].dt.tz_convert("UTC")
 
     # Apply the same timezone standardization to close_time
@@ -123,7 +166,7 @@ def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
                 logger.debug("Localizing naive datetime close_time to UTC")
                 df["close_time"] = df["close_time"].dt.tz_localize("UTC")
             elif df["close_time"].dt.tz.zone != "UTC":
-                logger.debug(f"Converting close_time timezone from {df['close_time'].dt.tz.zone} to UTC")
+                logger.debug("Converting close_time timezone from {} to UTC", df["close_time"].dt.tz.zone)
                 df["close_time"] = df["close_time"].dt.tz_convert("UTC")
 
     # Set the index to open_time for standard representation
@@ -166,7 +209,7 @@ def identify_missing_segments(
     Returns:
         List of (start, end) tuples representing missing segments
     """
-    logger.debug(f"Identifying missing segments between {start_time} and {end_time}")
+    logger.debug("Identifying missing segments between {} and {}", start_time, end_time)
     if df.empty:
         logger.debug("DataFrame is empty, entire range is missing")
         return [(start_time, end_time)]
@@ -178,7 +221,7 @@ def identify_missing_segments(
     df = df.sort_values("open_time")
 
     min_time, max_time = df["open_time"].min(), df["open_time"].max()
-    logger.debug(f"Data spans from {min_time} to {max_time}")
+    logger.debug("Data spans from {} to {}", min_time, max_time)
 
     from ckvd.utils.gap_detector import detect_gaps
 
@@ -190,7 +233,7 @@ def identify_missing_segments(
         day_boundary_threshold=1.0,
         enforce_min_span=False,
     )
-    logger.debug(f"Gap detector found {stats['total_gaps']} gaps")
+    logger.debug("Gap detector found {} gaps", stats["total_gaps"])
 
     # Pre-calculate interval offset once (avoids N timedelta allocations)
     interval_offset = timedelta(seconds=interval.to_seconds())
@@ -207,11 +250,11 @@ def identify_missing_segments(
 
     if missing_segments:
         missing_segments = merge_adjacent_ranges(missing_segments, interval)
-    logger.debug(f"Final missing segments count: {len(missing_segments)}")
+    logger.debug("Final missing segments count: {}", len(missing_segments))
     return missing_segments
 
 
-def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
+def merge_dataframes(dfs: list[pd.DataFrame], columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Merge multiple DataFrames into one, handling overlaps.
 
     This function is a critical part of the FCP mechanism that ensures:
@@ -224,6 +267,7 @@ def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
 
     Args:
         dfs: List of DataFrames to merge
+        columns: Optional column projection applied during standardization
 
     Returns:
         Merged DataFrame with consistent schema
@@ -239,10 +283,10 @@ def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
         # MEMORY OPTIMIZATION: No defensive copy needed - standardize_columns
         # operates on the DataFrame and callers don't expect original preservation.
         # See: /tmp/memory_audit_findings.md - Priority 1 fix
-        return standardize_columns(dfs[0])
+        return standardize_columns(dfs[0], columns=columns)
 
     # Log information about DataFrames to be merged
-    logger.debug(f"Merging {len(dfs)} DataFrames")
+    logger.debug("Merging {} DataFrames", len(dfs))
 
     # Ensure all DataFrames have open_time as a column, not just an index
     for i, df in enumerate(dfs):
@@ -251,7 +295,7 @@ def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
             continue
 
         if "open_time" not in df.columns:
-            logger.debug(f"Converting index to open_time column in DataFrame {i}")
+            logger.debug("Converting index to open_time column in DataFrame {}", i)
             if df.index.name == "open_time":
                 df_reset = df.reset_index()
                 dfs[i] = df_reset  # Update the DataFrame in the list
@@ -261,23 +305,23 @@ def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
 
         # Ensure open_time is a datetime column
         if not pd.api.types.is_datetime64_any_dtype(dfs[i]["open_time"]):
-            logger.debug(f"Converting open_time to datetime in DataFrame {i}")
+            logger.debug("Converting open_time to datetime in DataFrame {}", i)
             dfs[i]["open_time"] = pd.to_datetime(dfs[i]["open_time"], utc=True)
 
         # Add data source information if missing
         if "_data_source" not in dfs[i].columns:
-            logger.debug(f"Adding unknown source tag to DataFrame {i}")
+            logger.debug("Adding unknown source tag to DataFrame {}", i)
             dfs[i]["_data_source"] = "UNKNOWN"
 
-    # Log source counts before merging
-    for i, df in enumerate(dfs):
-        if not df.empty and "_data_source" in df.columns:
-            source_counts = df["_data_source"].value_counts()
-            for source, count in source_counts.items():
-                logger.debug(f"DataFrame {i} contains {count} records from source={source}")
+    # Log source counts before merging (value_counts per frame is skipped unless DEBUG is on)
+    if logger.enabled("DEBUG"):
+        for i, df in enumerate(dfs):
+            if not df.empty and "_data_source" in df.columns:
+                for source, count in df["_data_source"].value_counts().items():
+                    logger.debug("DataFrame {} contains {} records from source={}", i, count, source)
 
     # Concatenate all DataFrames efficiently (copy=False avoids unnecessary copies)
-    logger.debug(f"Concatenating {len(dfs)} DataFrames")
+    logger.debug("Concatenating {} DataFrames", len(dfs))
     merged = pd.concat(dfs, ignore_index=True, copy=False, sort=False)
 
     # Set source priority for resolving duplicates (higher number = higher priority)
@@ -323,7 +367,7 @@ def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
         after_count = len(merged)
 
         if before_count > after_count:
-            logger.debug(f"Removed {before_count - after_count} duplicate timestamps, keeping highest priority source")
+            logger.debug("Removed {} duplicate timestamps, keeping highest priority source", before_count - after_count)
 
     # Remove the temporary source priority column (inplace)
     if "_source_priority" in merged.columns:
@@ -334,14 +378,13 @@ def merge_dataframes(dfs: list[pd.DataFrame]) -> pd.DataFrame:
     merged = merged.reset_index(drop=True)
 
     # Final standardization to ensure consistency across all columns
-    merged = standardize_columns(merged)
+    merged = standardize_columns(merged, columns=columns)
 
     # Log statistics about the merged result
-    if "_data_source" in merged.columns and not merged.empty:
-        source_counts = merged["_data_source"].value_counts()
-        for source, count in source_counts.items():
+    if logger.enabled("DEBUG") and "_data_source" in merged.columns and not merged.empty:
+        for source, count in merged["_data_source"].value_counts().items():
             percentage = (count / len(merged)) * 100
-            logger.debug(f"Final merged DataFrame contains {count} records ({percentage:.1f}%) from {source}")
+            logger.debug("Final merged DataFrame contains {} records ({:.1f}%) from {}", count, percentage, source)
 
-    logger.debug(f"Successfully merged {len(dfs)} DataFrames into one with {len(merged)} rows")
+    logger.debug("Successfully merged {} DataFrames into one with {} rows", len(dfs), len(merged))
     return merged
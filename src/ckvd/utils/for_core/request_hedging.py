@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+"""Hedged requests to cut tail latency on parallel downloads.
+
+When many files are downloaded in parallel, the slowest few decide the wall
+time. ``RequestHedger`` tracks a rolling window of request latencies; once a
+request has been running longer than the configured percentile of that window,
+it issues one duplicate and returns whichever finishes first. The loser is not
+cancelled (a blocking HTTP request cannot be), its result is just dropped.
+
+Duplicates are capped by a budget: at most ``budget`` hedges per request made
+(e.g. 0.05 = 5% extra requests). No hedging happens until ``min_samples``
+latencies have been observed.
+
+Example:
+    >>> hedger = RequestHedger(percentile=95.0, budget=0.05)
+    >>> response = hedger.call(lambda: client.get(url))
+    >>> hedger.metrics()["hedge_rate"]
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "RequestHedger",
+]
+
+R = TypeVar("R")
+
+
+class RequestHedger:
+    """Issue a duplicate of slow requests and take the first to finish."""
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay: float = 0.05,
+        max_workers: int = 32,
+        name: str = "requests",
+    ) -> None:
+        """Initialize the hedger.
+
+        Args:
+            percentile: Latency percentile (0-100) after which a request is hedged
+            budget: Maximum hedges per request made (0 disables hedging)
+            min_samples: Latencies to observe before hedging starts
+            window: Number of recent latencies the percentile is computed over
+            min_delay: Lower bound for the hedge delay in seconds
+            max_workers: Threads running hedged requests
+            name: Name used in log lines
+
+        Raises:
+            ValueError: If percentile or budget are out of range
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(f"percentile must be between 0 and 100, got {percentile}")
+        if not 0 <= budget <= 1:
+            raise ValueError(f"budget must be between 0 and 1, got {budget}")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_workers = max_workers
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._executor: ThreadPoolExecutor | None = None
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def hedge_delay(self) -> float | None:
+        """Seconds after which a request is hedged, or None while too few latencies are known."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = round(self.percentile / 100 * (len(ordered) - 1))
+        return max(self.min_delay, ordered[index])
+
+    def call(self, request: Callable[[], R]) -> R:
+        """Run ``request``, hedging it if it is slower than the latency percentile.
+
+        ``request`` may run twice concurrently, so it must be idempotent and
+        thread-safe (e.g. an HTTP GET on a shared client). An exception is only
+        raised when every attempt failed.
+
+        Args:
+            request: Callable performing one attempt
+
+        Returns:
+            Result of the first attempt to succeed
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            self._requests += 1
+        if delay is None or self.budget == 0:
+            return self._timed(request)
+
+        primary = self._submit(request)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_hedge():
+            return primary.result()
+
+        logger.debug("[{}] Hedging request running longer than {:.0f}ms", self.name, delay * 1000)
+        hedge = self._submit(request)
+        pending: set[Future[R]] = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return future.result()
+        return primary.result()  # both attempts failed: raise the primary's error
+
+    def _timed(self, request: Callable[[], R]) -> R:
+        """Run one attempt and record its latency if it succeeds."""
+        started = time.monotonic()
+        result = request()
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _submit(self, request: Callable[[], R]) -> Future[R]:
+        """Run one attempt on the hedging threads."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"ckvd-hedge-{self.name}")
+            executor = self._executor
+        return executor.submit(self._timed, request)
+
+    def _take_hedge(self) -> bool:
+        """Reserve one hedge if the budget allows it."""
+        with self._lock:
+            if self._hedged + 1 > self.budget * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+    def metrics(self) -> dict[str, Any]:
+        """Hedging counters and the current hedge delay.
+
+        Returns:
+            Dictionary with requests, hedges issued and won, hedge rate (hedges
+            per request), win rate (hedges that finished first) and delay (ms)
+        """
+        delay = self.hedge_delay()
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+                "hedge_rate": self._hedged / self._requests if self._requests else 0.0,
+                "win_rate": self._hedge_wins / self._hedged if self._hedged else 0.0,
+                "hedge_delay_ms": delay * 1000 if delay is not None else None,
+                "budget": self.budget,
+            }
@@ -10,10 +10,12 @@ This module provides common utilities for REST API client operations including:
 # Refactoring: Fix silent failure patterns (BLE001)
 """
 
+import asyncio
 import json
 from datetime import datetime
 from typing import Any
 
+import httpx
 import requests
 
 from ckvd.utils.config import DEFAULT_HTTP_TIMEOUT_SECONDS, HTTP_OK
@@ -28,6 +30,7 @@ from ckvd.utils.for_core.rest_exceptions import (
 )
 from ckvd.utils.for_core.rest_metrics import metrics_tracker, track_api_call
 from ckvd.utils.for_core.rest_retry import create_retry_decorator
+from ckvd.utils.for_core.rest_scheduler import get_rest_scheduler, request_weight
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import Interval
 
@@ -86,6 +89,10 @@ def fetch_chunk(
     # Use wrapper to track metrics
     @track_api_call(endpoint=endpoint, params=params)
     def _fetch(client, endpoint, params, timeout):
+        # Reserve the request's weight in the budget shared by every process on this host
+        scheduler = get_rest_scheduler(endpoint)
+        scheduler.acquire(request_weight(endpoint, params))
+
         try:
             # Send the request with proper headers and explicit timeout
             response = client.get(
@@ -94,10 +101,12 @@ def fetch_chunk(
                 timeout=timeout,
             )
 
-            # Handle rate limiting
+            # Track used weight and handle rate limiting
+            scheduler.observe(response.headers)
             if response.status_code in (418, 429):
                 retry_after = int(response.headers.get("retry-after", 60))
                 logger.warning(f"Rate limited by API (HTTP {response.status_code}). Waiting {retry_after}s before continuing")
+                scheduler.record_rate_limit(retry_after)
                 raise RateLimitError(retry_after=retry_after)
 
             # Check for HTTP error codes
@@ -139,6 +148,86 @@ def fetch_chunk(
     return _fetch(client, endpoint, params, timeout)
 
 
+def _check_chunk_response(status_code: int, headers: Any, text: str, payload: Any, endpoint: str) -> list[list[Any]]:
+    """Apply the REST error contract of ``fetch_chunk`` to an async response."""
+    scheduler = get_rest_scheduler(endpoint)
+    scheduler.observe(headers)
+    if status_code in (418, 429):
+        retry_after = int(headers.get("retry-after", 60))
+        logger.warning(f"Rate limited by API (HTTP {status_code}). Waiting {retry_after}s before continuing")
+        scheduler.record_rate_limit(retry_after)
+        raise RateLimitError(retry_after=retry_after)
+    if status_code != HTTP_OK:
+        error_msg = f"HTTP error {status_code}: {text}"
+        logger.warning(f"Error response from {endpoint}: {error_msg}")
+        raise HTTPError(status_code, error_msg)
+    if isinstance(payload, dict) and "code" in payload and payload.get("code", 0) != 0:
+        error_code = payload.get("code")
+        error_msg = payload.get("msg", "Unknown error")
+        logger.warning(f"API error from {endpoint}: {error_code} - {error_msg}")
+        raise APIError(error_code, f"API error {error_code}: {error_msg}")
+    return payload
+
+
+@create_retry_decorator()
+async def fetch_chunk_async(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    params: dict[str, Any],
+    timeout: float = DEFAULT_HTTP_TIMEOUT_SECONDS,
+    wait_on_block: bool = False,
+) -> list[list[Any]]:
+    """Fetch a chunk of data without blocking the event loop.
+
+    Same retry policy and exceptions as ``fetch_chunk`` (RateLimitError is
+    never retried), over an ``httpx.AsyncClient``.
+
+    Args:
+        client: Async HTTP client
+        endpoint: API endpoint URL
+        params: Request parameters
+        timeout: Request timeout in seconds
+        wait_on_block: Wait out a ``Retry-After`` block of the host instead of
+            raising RateLimitError before the request is sent
+
+    Returns:
+        List of data points from the API
+
+    Raises:
+        RateLimitError: If rate limited by the API
+        HTTPError: If an HTTP error occurs
+        APIError: If the API returns an error code
+        NetworkError: If a network error occurs
+        RestTimeoutError: If the request times out
+        JSONDecodeError: If unable to decode the JSON response
+    """
+    scheduler = get_rest_scheduler(endpoint)
+    weight = request_weight(endpoint, params)
+    waited = 0.0
+    while (delay := scheduler.try_acquire(weight, wait_on_block, waited)) > 0:
+        logger.warning(f"[{scheduler.name}] Rate limit reached, pausing {delay:.1f}s before the next request")
+        await asyncio.sleep(delay)
+        waited += delay
+
+    try:
+        response = await client.get(endpoint, params=params, timeout=timeout)
+    except httpx.TimeoutException as e:
+        logger.error(f"Request timeout: {e}")
+        raise RestTimeoutError(f"Request timed out: {e!s}") from e
+    except httpx.TransportError as e:
+        logger.error(f"Network connection error: {e}")
+        raise NetworkError(f"Connection error: {e!s}") from e
+
+    payload = None
+    if response.status_code == HTTP_OK:
+        try:
+            payload = response.json()
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode JSON response: {e}")
+            raise JSONDecodeError(f"Failed to decode JSON response: {e!s}") from e
+    return _check_chunk_response(response.status_code, response.headers, response.text, payload, endpoint)
+
+
 def log_rest_metrics():
     """Log REST API metrics to the logger."""
     metrics_tracker.log_metrics()
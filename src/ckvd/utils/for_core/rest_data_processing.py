@@ -12,6 +12,8 @@ This module provides common utilities for processing data from REST API response
 Internally uses Polars for efficient processing, converts to pandas at API boundary.
 """
 
+from collections.abc import Sequence
+
 import pandas as pd
 import polars as pl
 
@@ -128,17 +130,21 @@ def _process_kline_data_polars(raw_data: list[list]) -> pl.DataFrame:
     )
 
 
-def process_kline_data(raw_data: list[list]) -> pd.DataFrame:
+def process_kline_data(raw_data: list[list], columns: Sequence[str] | None = None) -> pd.DataFrame:
     """Process raw kline data into a structured DataFrame.
 
     Args:
         raw_data: Raw kline data from the API
+        columns: Optional column projection; other columns are dropped before
+            the pandas conversion
 
     Returns:
         Processed DataFrame with standardized columns
     """
     # Use Polars internally for efficient processing
     df_pl = _process_kline_data_polars(raw_data)
+    if columns is not None:
+        df_pl = df_pl.select([col for col in columns if col in df_pl.columns])
 
     # Convert to pandas at API boundary
     df = df_pl.to_pandas()
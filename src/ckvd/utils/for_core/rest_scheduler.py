@@ -0,0 +1,328 @@
+#!/usr/bin/env python
+"""Rate-limit-aware scheduling and resume tokens for chunked REST fetches.
+
+Every REST request to an exchange host goes through that host's
+``RestRateLimitScheduler`` (``get_rest_scheduler``):
+
+- Before sending, ``acquire`` reserves the request's weight in the host-wide
+  ``SharedWeightBudget`` that all processes on the machine share, sleeping
+  until the exchange's window resets when the budget is spent. Aggregate
+  traffic from many workers behind one IP so stays at the limit instead of
+  tripping bans. While the host is blocked by a ``Retry-After`` (429/418),
+  ``acquire`` raises ``RateLimitError`` unless the caller opted into waiting,
+  and it never waits longer than ``max_wait`` in total.
+- After the response, ``observe`` syncs the budget from the used-weight header
+  (``X-MBX-USED-WEIGHT-1M``) and ``record_rate_limit`` shares ``Retry-After``.
+
+By default a ``RateLimitError`` stops ``RestDataClient.fetch`` and the caller
+gets partial data. With ``wait_on_rate_limit=True`` the fetch instead pauses
+exactly as long as the exchange asks and resumes from the chunk that was
+rejected. ``RestResumeToken`` is an append-only JSONL file holding the chunks
+a fetch has completed. A restarted job given the same token skips them and
+only fetches what is left; the token is removed once the fetch completes.
+
+The shared state lives under ``<cache_dir>/.rate_limits`` unless
+``CKVD_RATE_LIMIT_DIR`` points elsewhere.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from ckvd.utils.app_paths import get_cache_dir
+from ckvd.utils.config import (
+    REST_DEFAULT_WEIGHT_LIMIT,
+    REST_MAX_RATE_LIMIT_WAIT_SECONDS,
+    REST_WEIGHT_BUDGET_DIR_ENV,
+    REST_WEIGHT_BUDGET_DIRNAME,
+    REST_WEIGHT_LIMITS,
+    REST_WEIGHT_PAUSE_THRESHOLD,
+)
+from ckvd.utils.for_core.rest_exceptions import RateLimitError
+from ckvd.utils.for_core.shared_weight_budget import SharedWeightBudget
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "RestRateLimitScheduler",
+    "RestResumeToken",
+    "get_rest_scheduler",
+    "request_weight",
+    "rest_state_dir",
+]
+
+# Header carrying the request weight used in the current one-minute window
+USED_WEIGHT_HEADER = "x-mbx-used-weight-1m"
+
+# Pause after a 429/418 that carries no Retry-After
+DEFAULT_RETRY_AFTER = 60.0
+
+
+def request_weight(endpoint: str, params: Mapping[str, Any] | None = None) -> int:
+    """Weight the exchange charges for one request.
+
+    Binance spot klines cost 2; futures klines cost 1/2/5/10 depending on
+    ``limit``. Other requests are counted as 1.
+
+    Args:
+        endpoint: Request URL
+        params: Query parameters
+
+    Returns:
+        Request weight
+    """
+    path = urlparse(endpoint).path
+    if not path.endswith("/klines"):
+        return 1
+    if path.startswith("/api/"):
+        return 2
+    limit = int((params or {}).get("limit", 500))
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    return 5 if limit <= 1000 else 10
+
+
+def rest_state_dir() -> Path:
+    """Directory holding the shared per-host weight budgets.
+
+    ``CKVD_RATE_LIMIT_DIR`` overrides the default ``<cache_dir>/.rate_limits``;
+    it is read on every call so tests and sandboxed jobs can isolate their state.
+
+    Returns:
+        Path of the state directory
+    """
+    override = os.environ.get(REST_WEIGHT_BUDGET_DIR_ENV)
+    if override:
+        return Path(override)
+    return get_cache_dir() / REST_WEIGHT_BUDGET_DIRNAME
+
+
+class RestRateLimitScheduler:
+    """Paces REST requests to one API host so every process together stays within its limits."""
+
+    def __init__(
+        self,
+        weight_limit: int,
+        window_seconds: float = 60.0,
+        pause_threshold: float = REST_WEIGHT_PAUSE_THRESHOLD,
+        max_wait: float = REST_MAX_RATE_LIMIT_WAIT_SECONDS,
+        name: str = "REST",
+        state_path: str | Path | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            weight_limit: Request weight allowed per window
+            window_seconds: Length of the exchange's rate-limit window
+            pause_threshold: Fraction of the limit at which requests wait for the next window
+            max_wait: Longest time in seconds a request may wait before RateLimitError is raised
+            name: Name used in log lines and for the shared state file
+            state_path: Shared state file (default ``rest_state_dir() / "<name>.weight"``)
+        """
+        self.weight_limit = weight_limit
+        self.max_wait = max_wait
+        self.name = name
+        if state_path is None:
+            state_path = rest_state_dir() / f"{name}.weight"
+        self.budget = SharedWeightBudget(state_path, weight_limit, window_seconds, pause_threshold)
+
+        self._lock = threading.Lock()
+        self._rate_limits = 0
+        self._pauses = 0
+        self._paused_seconds = 0.0
+
+    def observe(self, headers: Mapping[str, Any]) -> None:
+        """Sync the shared budget from the used weight reported in a response's headers."""
+        try:
+            used_weight = int(headers.get(USED_WEIGHT_HEADER))
+        except (TypeError, ValueError):
+            return
+        self.budget.sync(used_weight, time.time())
+
+    def record_rate_limit(self, retry_after: float | None) -> None:
+        """Block requests from every process until ``retry_after`` seconds from now (429/418)."""
+        with self._lock:
+            self._rate_limits += 1
+        now = time.time()
+        self.budget.block_until(now + float(retry_after or DEFAULT_RETRY_AFTER), now)
+
+    def delay(self) -> float:
+        """Seconds the next request should wait (0 when it can go now)."""
+        return max(0.0, min(self.budget.delay(time.time()), self.max_wait))
+
+    def try_acquire(self, weight: int = 1, wait_on_block: bool = False, waited: float = 0.0) -> float:
+        """Reserve ``weight`` without waiting.
+
+        Args:
+            weight: Weight of the request about to be sent
+            wait_on_block: Wait out a ``Retry-After`` block instead of raising
+            waited: Seconds the caller already waited for this request
+
+        Returns:
+            0 if reserved, otherwise seconds to wait before trying again
+
+        Raises:
+            RateLimitError: If the host is blocked and ``wait_on_block`` is False,
+                or the request would wait longer than ``max_wait`` in total
+        """
+        now = time.time()
+        delay = self.budget.try_reserve(weight, now)
+        if delay <= 0:
+            return 0.0
+        blocked = self.budget.blocked_for(now)
+        if blocked > 0 and not wait_on_block:
+            raise RateLimitError(retry_after=blocked, message=f"[{self.name}] Host is rate limited")
+        if waited + delay > self.max_wait:
+            raise RateLimitError(retry_after=delay, message=f"[{self.name}] Rate limit wait exceeds {self.max_wait:.0f}s")
+        return delay
+
+    def acquire(self, weight: int = 1, wait_on_block: bool = False) -> float:
+        """Wait until ``weight`` fits in the shared budget and reserve it.
+
+        Args:
+            weight: Weight of the request about to be sent
+            wait_on_block: Wait out a ``Retry-After`` block instead of raising
+
+        Returns:
+            Seconds slept
+
+        Raises:
+            RateLimitError: If the host is blocked and ``wait_on_block`` is False,
+                or reserving would take longer than ``max_wait`` in total
+        """
+        slept = 0.0
+        while (delay := self.try_acquire(weight, wait_on_block, slept)) > 0:
+            self._sleep(delay)
+            slept += delay
+        return slept
+
+    def wait(self) -> float:
+        """Sleep until the next request is allowed (without reserving weight).
+
+        Returns:
+            Seconds slept
+
+        Raises:
+            RateLimitError: If the host stays blocked for longer than ``max_wait``
+        """
+        delay = self.budget.delay(time.time())
+        if delay > self.max_wait:
+            raise RateLimitError(retry_after=delay, message=f"[{self.name}] Rate limit wait exceeds {self.max_wait:.0f}s")
+        if delay > 0:
+            self._sleep(delay)
+        return max(0.0, delay)
+
+    def _sleep(self, delay: float) -> None:
+        """Pause and count it."""
+        logger.warning(f"[{self.name}] Rate limit reached, pausing {delay:.1f}s before the next request")
+        time.sleep(delay)
+        with self._lock:
+            self._pauses += 1
+            self._paused_seconds += delay
+
+    def metrics(self) -> dict[str, Any]:
+        """Used weight, rate limits hit and time spent paused."""
+        used_weight = self.budget.used(time.time())
+        with self._lock:
+            return {
+                "weight_limit": self.weight_limit,
+                "used_weight": used_weight,
+                "rate_limits": self._rate_limits,
+                "pauses": self._pauses,
+                "paused_seconds": self._paused_seconds,
+            }
+
+
+_SCHEDULERS: dict[str, RestRateLimitScheduler] = {}
+_SCHEDULERS_LOCK = threading.Lock()
+
+
+def get_rest_scheduler(endpoint: str) -> RestRateLimitScheduler:
+    """Process-wide scheduler for the API host of ``endpoint``.
+
+    Exchanges count request weight per host (e.g. spot and futures have
+    separate limits), so every client talking to the same host shares one,
+    and its budget is shared with the other processes on the machine.
+
+    Args:
+        endpoint: Request URL or host
+
+    Returns:
+        RestRateLimitScheduler for the host
+    """
+    host = urlparse(endpoint).netloc or endpoint
+    with _SCHEDULERS_LOCK:
+        scheduler = _SCHEDULERS.get(host)
+        if scheduler is None:
+            weight_limit, window_seconds = REST_WEIGHT_LIMITS.get(host, REST_DEFAULT_WEIGHT_LIMIT)
+            scheduler = _SCHEDULERS[host] = RestRateLimitScheduler(weight_limit, window_seconds, name=host)
+        return scheduler
+
+
+class RestResumeToken:
+    """Append-only JSONL file of the chunks a REST fetch has completed.
+
+    The first line describes the request; every following line holds one
+    chunk's raw rows. A token written for a different request is discarded.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the token.
+
+        Args:
+            path: JSONL file (created on first use)
+        """
+        self.path = Path(path)
+
+    def resume(self, request: dict[str, Any]) -> dict[tuple[int, int], list]:
+        """Load the chunks completed for ``request`` and start recording new ones.
+
+        Args:
+            request: JSON-serialisable description of the fetch
+
+        Returns:
+            Raw rows per completed ``(chunk_start_ms, chunk_end_ms)``
+        """
+        completed: dict[tuple[int, int], list] = {}
+        matches = False
+        try:
+            with open(self.path) as f:
+                for number, line in enumerate(f):
+                    try:
+                        record = json.loads(line)
+                        if number == 0:
+                            matches = record.get("request") == request
+                            if not matches:
+                                break
+                        else:
+                            completed[(record["start"], record["end"])] = record["rows"]
+                    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                        continue  # torn line from an interrupted write
+        except FileNotFoundError:
+            pass
+
+        if not matches:
+            completed = {}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                f.write(json.dumps({"request": request}) + "\n")
+        elif completed:
+            logger.info("Resuming REST fetch from {}: {} chunks already fetched", self.path, len(completed))
+        return completed
+
+    def record(self, start_ms: int, end_ms: int, rows: list) -> None:
+        """Append one completed chunk."""
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"start": start_ms, "end": end_ms, "rows": rows}) + "\n")
+
+    def clear(self) -> None:
+        """Remove the token once the fetch is complete."""
+        self.path.unlink(missing_ok=True)
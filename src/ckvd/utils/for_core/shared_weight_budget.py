@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+"""Host-wide REST weight budget shared by every process through an mmap file.
+
+Exchanges enforce request weight limits per IP, not per process, so workers
+that each track their own usage overrun the limit together and get 429/418
+bans. ``SharedWeightBudget`` keeps one small state record per API host in a
+memory-mapped file under ``<cache_dir>/.rate_limits``:
+
+- the current rate-limit window and the weight used in it (a token bucket that
+  refills completely when the exchange's window rolls over),
+- the time until which the host is blocked after a ``Retry-After``.
+
+Every read-modify-write runs under an exclusive ``flock`` on the file (and a
+thread lock), so all processes on the host see one budget. Weight is reserved
+before a request is sent and corrected from the used-weight the exchange
+reports, which also accounts for requests from processes that do not use this
+budget. On platforms without ``fcntl`` the budget is shared by the threads of
+one process only.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+__all__ = [
+    "SharedWeightBudget",
+]
+
+# Window index, weight used in that window, blocked-until (epoch seconds)
+_STATE = struct.Struct("<qdd")
+
+
+class SharedWeightBudget:
+    """Weight used per rate-limit window and Retry-After deadline for one API host.
+
+    All methods take the current wall-clock time (``time.time()``) so windows
+    line up with the exchange's and callers control the clock.
+    """
+
+    def __init__(self, path: str | Path, weight_limit: int, window_seconds: float = 60.0, threshold: float = 1.0) -> None:
+        """Initialize the budget (the state file is opened on first use).
+
+        Args:
+            path: State file shared by all processes using this host
+            weight_limit: Weight allowed per window
+            window_seconds: Length of the exchange's rate-limit window
+            threshold: Fraction of ``weight_limit`` that may be reserved
+        """
+        self.path = Path(path)
+        self.weight_limit = weight_limit
+        self.window_seconds = window_seconds
+        self.threshold = threshold
+
+        self._thread_lock = threading.Lock()
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+
+    def _open(self) -> mmap.mmap:
+        """Map the state file, creating it zeroed if needed (caller holds the thread lock)."""
+        if self._map is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            if os.fstat(fd).st_size < _STATE.size:
+                os.ftruncate(fd, _STATE.size)
+            self._fd = fd
+            self._map = mmap.mmap(fd, _STATE.size)
+        return self._map
+
+    @contextmanager
+    def _state(self, now: float) -> Iterator[list[float]]:
+        """Lock the state and yield ``[window, used, blocked_until]``; changes are written back.
+
+        The used weight is reset when ``now`` is in a later window than the stored one.
+        """
+        with self._thread_lock:
+            state_map = self._open()
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                state = list(_STATE.unpack_from(state_map))
+                window = int(now // self.window_seconds)
+                if state[0] != window:
+                    state[0], state[1] = window, 0.0
+                yield state
+                _STATE.pack_into(state_map, 0, int(state[0]), state[1], state[2])
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _wait(self, state: list[float], now: float, weight: float) -> float:
+        """Seconds until ``weight`` more fits in the budget (0 if it fits now)."""
+        if state[2] > now:
+            return state[2] - now
+        if state[1] + weight > self.threshold * self.weight_limit:
+            return (state[0] + 1) * self.window_seconds - now
+        return 0.0
+
+    def try_reserve(self, weight: float, now: float) -> float:
+        """Reserve ``weight`` if the budget allows it.
+
+        Args:
+            weight: Weight of the request about to be sent
+            now: Current epoch seconds
+
+        Returns:
+            0 if reserved, otherwise seconds to wait before trying again
+        """
+        with self._state(now) as state:
+            wait = self._wait(state, now, weight)
+            if wait <= 0:
+                state[1] += weight
+            return wait
+
+    def delay(self, now: float) -> float:
+        """Seconds until the budget has room again (0 when it has room now)."""
+        with self._state(now) as state:
+            return self._wait(state, now, 0.0)
+
+    def blocked_for(self, now: float) -> float:
+        """Seconds left on the host's ``Retry-After`` block (0 when not blocked)."""
+        with self._state(now) as state:
+            return max(0.0, state[2] - now)
+
+    def sync(self, used_weight: float, now: float) -> None:
+        """Correct the used weight from the exchange's used-weight header.
+
+        The reported value includes requests from every process on the IP; the
+        larger of it and the local reservations is kept, since responses for
+        weight already reserved may still be in flight.
+        """
+        with self._state(now) as state:
+            state[1] = max(state[1], used_weight)
+
+    def block_until(self, deadline: float, now: float) -> None:
+        """Block the host for every process until ``deadline`` (epoch seconds)."""
+        with self._state(now) as state:
+            state[2] = max(state[2], deadline)
+
+    def used(self, now: float) -> float:
+        """Weight used in the current window."""
+        with self._state(now) as state:
+            return state[1]
+
+    def close(self) -> None:
+        """Unmap and close the state file."""
+        with self._thread_lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
@@ -18,7 +18,6 @@ from typing import (
     TypeVar,
 )
 
-import httpx
 import pandas as pd
 import pyarrow as pa
 
@@ -122,6 +121,8 @@ def classify_error(error: Exception) -> str:
     Returns:
         Standardized error type string
     """
+    import httpx
+
     if isinstance(error, httpx.HTTPError):
         return ERROR_TYPES["NETWORK"]
     if isinstance(error, OSError):
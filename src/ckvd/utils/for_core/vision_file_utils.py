@@ -8,16 +8,62 @@ This module provides functions for downloading, processing, and handling files f
 the Binance Vision API, including boundary gap filling and related operations.
 """
 
+import math
 from datetime import datetime, timedelta
 
 import pandas as pd
 
 from ckvd.core.providers.binance.rest_data_client import RestDataClient
+from ckvd.utils.config import REST_CHUNK_SIZE
+from ckvd.utils.for_core.rest_exceptions import RestAPIError
 from ckvd.utils.gap_detector import Gap
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import Interval, MarketType
 
 
+def coalesce_gap_windows(
+    gaps: list[Gap],
+    interval_obj: Interval,
+    chunk_size: int = REST_CHUNK_SIZE,
+) -> list[tuple[datetime, datetime]]:
+    """Coalesce gaps into the minimal set of REST request windows.
+
+    Each gap is padded by half an interval on both sides. Neighbouring windows
+    are merged whenever the merged window needs no more REST requests (chunks of
+    ``chunk_size`` candles) than fetching them separately.
+
+    Args:
+        gaps: Gaps to cover
+        interval_obj: Interval enum object
+        chunk_size: Maximum records per REST request
+
+    Returns:
+        List of (start_time, end_time) windows sorted by start time
+    """
+    if not gaps:
+        return []
+
+    buffer = timedelta(seconds=interval_obj.to_seconds() * 0.5)
+    chunk_span = timedelta(seconds=interval_obj.to_seconds() * chunk_size)
+
+    def _chunks(start: datetime, end: datetime) -> int:
+        return max(1, math.ceil((end - start) / chunk_span))
+
+    windows: list[tuple[datetime, datetime]] = []
+    for gap in sorted(gaps, key=lambda g: g.start_time_ms):
+        start = gap.start_time - buffer
+        end = gap.end_time + buffer
+        if windows:
+            prev_start, prev_end = windows[-1]
+            merged_end = max(prev_end, end)
+            if _chunks(prev_start, merged_end) <= _chunks(prev_start, prev_end) + _chunks(start, end):
+                windows[-1] = (prev_start, merged_end)
+                continue
+        windows.append((start, end))
+
+    return windows
+
+
 def fill_boundary_gaps_with_rest(
     df: pd.DataFrame,
     boundary_gaps: list[Gap],
@@ -25,10 +71,12 @@ def fill_boundary_gaps_with_rest(
     interval_obj: Interval,
     market_type: MarketType,
 ) -> pd.DataFrame | None:
-    """Fill day boundary gaps using REST API data.
+    """Fill day boundary gaps with REST API data.
 
-    This method is used to fill specific gaps that occur at day boundaries
-    by fetching the missing data directly from the REST API.
+    The gaps are coalesced into the minimal set of REST windows (see
+    ``coalesce_gap_windows``) and fetched in one concurrent pass via
+    ``RestDataClient.fetch_klines_parallel``. Rows already in ``df`` win over
+    overlapping REST rows.
 
     Args:
         df: DataFrame with Vision API data that has gaps
@@ -44,68 +92,36 @@ def fill_boundary_gaps_with_rest(
         return df
 
     try:
-        # Create a REST client with the same parameters
-        rest_client = RestDataClient(
-            market_type=market_type,
-            symbol=symbol,
-            interval=interval_obj,
-        )
-
-        # Create a list to hold the gap data we'll fetch
-        gap_dfs = []
-        gap_dfs.append(df)
-
-        # For each gap, fetch the specific missing data
-        for gap in boundary_gaps:
-            # Add a small buffer around the gap to ensure we get the needed data
-            # Use 50% of the interval duration as buffer
-            interval_seconds = interval_obj.to_seconds()
-            buffer_seconds = interval_seconds * 0.5
-
-            # Fetch a bit before and after the actual gap to ensure we get the needed data
-            gap_start = gap.start_time - timedelta(seconds=buffer_seconds)
-            gap_end = gap.end_time + timedelta(seconds=buffer_seconds)
-
-            logger.debug(f"Fetching gap data from REST API: {gap_start} to {gap_end} (to fill missing data)")
-
-            # Fetch the gap data using REST API
-            gap_data = rest_client.fetch(
-                symbol,
-                interval_obj.value,
-                start_time=gap_start,
-                end_time=gap_end,
-            )
+        # Vision data comes first so drop_duplicates(keep="first") prefers it over REST
+        gap_dfs = [df]
 
-            if not gap_data.empty:
-                # Check if we got data around midnight
-                expected_midnight = gap.start_time + (gap.end_time - gap.start_time) / 2
-                midnight_time = datetime(
-                    expected_midnight.year,
-                    expected_midnight.month,
-                    expected_midnight.day,
-                    0,
-                    0,
-                    0,
-                    tzinfo=expected_midnight.tzinfo,
-                )
-
-                # Look for records near midnight
-                midnight_records = gap_data[(gap_data["open_time"] - midnight_time).abs() < timedelta(seconds=interval_seconds)]
-
-                if not midnight_records.empty:
-                    logger.debug(f"Found {len(midnight_records)} records near midnight in REST API data")
-                else:
-                    logger.debug("No midnight records found in REST API data")
-
-                gap_dfs.append(gap_data)
-            else:
-                logger.warning("No data retrieved from REST API for gap")
+        windows = coalesce_gap_windows(boundary_gaps, interval_obj)
+        if windows:
+            logger.debug(f"Fetching {len(boundary_gaps)} boundary gaps from REST API in {len(windows)} windows")
+
+            rest_client = RestDataClient(
+                market_type=market_type,
+                symbol=symbol,
+                interval=interval_obj,
+            )
+            try:
+                rest_dfs = rest_client.fetch_klines_parallel(symbol, interval_obj, windows)
+            except RestAPIError as e:
+                # Rate limited or failed: return the Vision data with its gaps
+                logger.warning(f"REST boundary gap repair aborted: {e}")
+                rest_dfs = []
+            finally:
+                rest_client.close()
+
+            fetched = [gap_df for gap_df in rest_dfs if not gap_df.empty]
+            if len(fetched) < len(windows):
+                logger.warning(f"No data retrieved from REST API for {len(windows) - len(fetched)} of {len(windows)} gap windows")
+            gap_dfs.extend(fetched)
 
         # If we have gap data, merge it with the original data
         if len(gap_dfs) > 1:  # More than just the original df
             # Concatenate all dataframes efficiently (copy=False, sort=False)
             merged_df = pd.concat(gap_dfs, ignore_index=True, copy=False, sort=False)
-            # Use inplace operations to avoid additional allocations
             merged_df = merged_df.drop_duplicates(subset=["open_time"], keep="first")
             merged_df = merged_df.sort_values("open_time")
             return merged_df.reset_index(drop=True)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+"""Bulk discovery of the daily files published on Binance Vision.
+
+data.binance.vision is served from an S3 bucket that answers
+``ListObjectsV2`` requests. Instead of probing every day with a GET and
+treating a 404 as "not available", ``VisionListingCache`` lists each
+symbol/interval month once:
+
+    GET <VISION_LISTING_URL>?list-type=2&prefix=data/spot/daily/klines/BTCUSDT/1m/BTCUSDT-1m-2024-01-
+
+The listing names every archive of the month and its ``.CHECKSUM`` file
+with their sizes, so downloaders only request days that exist and know up
+front whether a checksum is published. Listings are kept for
+VISION_LISTING_TTL_SECONDS. A listing that fails returns None and callers
+fall back to probing each day.
+
+# ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timezone
+from urllib.parse import urlparse
+
+import attr
+import httpx
+
+from ckvd.utils.config import HTTP_OK, VISION_LISTING_TTL_SECONDS, VISION_LISTING_URL, FileType
+from ckvd.utils.for_core.vision_constraints import get_vision_url
+from ckvd.utils.loguru_setup import logger
+
+__all__ = [
+    "VISION_LISTINGS",
+    "VisionFile",
+    "VisionListingCache",
+]
+
+# Archive and checksum keys of one day: <SYMBOL>-<interval>-YYYY-MM-DD.zip[.CHECKSUM]
+_KEY_PATTERN = re.compile(r"-(\d{4}-\d{2}-\d{2})\.zip(\.CHECKSUM)?$")
+
+MonthKey = tuple[str, str, str, int, int]
+MonthFiles = dict[date, "VisionFile"]
+
+
+@attr.define(slots=True, frozen=True)
+class VisionFile:
+    """One day's archive as listed on Vision.
+
+    Attributes:
+        day: UTC day the archive covers
+        size: Archive size in bytes
+        checksum_size: Size of the ``.CHECKSUM`` file, or None if none is published
+    """
+
+    day: date
+    size: int
+    checksum_size: int | None = None
+
+
+def _months(start: date, end: date) -> list[tuple[int, int]]:
+    """(year, month) of every month from ``start`` to ``end`` inclusive."""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _month_prefix(symbol: str, interval: str, market_type: str, year: int, month: int) -> str:
+    """S3 key prefix of a month's daily archives, derived from the download URL."""
+    url = get_vision_url(symbol, interval, datetime(year, month, 1, tzinfo=timezone.utc), FileType.DATA, market_type)
+    key = urlparse(url).path.lstrip("/")
+    return key[: -len("01.zip")]
+
+
+def _parse_page(content: bytes) -> tuple[dict[str, int], str | None]:
+    """Keys and sizes of one ``ListBucketResult`` page, and the continuation token.
+
+    Raises:
+        ValueError: If the page is not a listing
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid listing: {e}") from e
+    if not root.tag.endswith("ListBucketResult"):
+        raise ValueError(f"Unexpected listing root element {root.tag}")
+
+    def child(element: ET.Element, name: str) -> str | None:
+        for node in element:
+            if node.tag.rsplit("}", 1)[-1] == name:
+                return node.text
+        return None
+
+    sizes = {}
+    for node in root:
+        if node.tag.rsplit("}", 1)[-1] == "Contents":
+            key, size = child(node, "Key"), child(node, "Size")
+            if key and size is not None:
+                sizes[key] = int(size)
+    truncated = (child(root, "IsTruncated") or "false").lower() == "true"
+    return sizes, child(root, "NextContinuationToken") if truncated else None
+
+
+def _files_by_day(sizes: dict[str, int]) -> MonthFiles:
+    """Group listed archive and checksum sizes by day."""
+    archives: dict[date, int] = {}
+    checksums: dict[date, int] = {}
+    for key, size in sizes.items():
+        match = _KEY_PATTERN.search(key)
+        if match is None:
+            continue
+        day = date.fromisoformat(match.group(1))
+        (checksums if match.group(2) else archives)[day] = size
+    return {day: VisionFile(day, size, checksums.get(day)) for day, size in archives.items()}
+
+
+class VisionListingCache:
+    """Per-month Vision file listings, fetched once and reused for a TTL."""
+
+    def __init__(self, base_url: str = VISION_LISTING_URL, ttl: float = VISION_LISTING_TTL_SECONDS) -> None:
+        """Initialize the cache.
+
+        Args:
+            base_url: S3 bucket endpoint answering ``ListObjectsV2``
+            ttl: Seconds a month's listing is reused
+        """
+        self.base_url = base_url
+        self.ttl = ttl
+        self._months: dict[MonthKey, tuple[float, MonthFiles]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(symbol: str, interval: str, market_type: str, year: int, month: int) -> MonthKey:
+        return (market_type.lower(), symbol.upper(), interval, year, month)
+
+    def _get(self, key: MonthKey) -> MonthFiles | None:
+        with self._lock:
+            cached = self._months.get(key)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        return cached[1]
+
+    def _store(self, key: MonthKey, prefix: str, sizes: dict[str, int]) -> MonthFiles:
+        files = _files_by_day(sizes)
+        with self._lock:
+            self._months[key] = (time.monotonic() + self.ttl, files)
+        logger.debug("Listed {} Vision days under {}", len(files), prefix)
+        return files
+
+    def _params(self, prefix: str, token: str | None) -> dict[str, str]:
+        params = {"list-type": "2", "prefix": prefix}
+        if token:
+            params["continuation-token"] = token
+        return params
+
+    def cached(self, symbol: str, interval: str, market_type: str, day: date) -> MonthFiles | None:
+        """Files of ``day``'s month from an unexpired listing, without any request.
+
+        Returns:
+            Listed files of the month by day, or None if the month is not listed yet
+        """
+        return self._get(self._key(symbol, interval, market_type, day.year, day.month))
+
+    def _list_month(self, client: httpx.Client, prefix: str) -> dict[str, int]:
+        """Keys and sizes under ``prefix``, following continuation tokens."""
+        sizes: dict[str, int] = {}
+        token = None
+        while True:
+            response = client.get(self.base_url, params=self._params(prefix, token))
+            if response.status_code != HTTP_OK:
+                raise ValueError(f"HTTP {response.status_code}")
+            page, token = _parse_page(response.content)
+            sizes.update(page)
+            if not token:
+                return sizes
+
+    async def _list_month_async(self, client: httpx.AsyncClient, prefix: str) -> dict[str, int]:
+        """Asyncio counterpart of ``_list_month``."""
+        sizes: dict[str, int] = {}
+        token = None
+        while True:
+            response = await client.get(self.base_url, params=self._params(prefix, token))
+            if response.status_code != HTTP_OK:
+                raise ValueError(f"HTTP {response.status_code}")
+            page, token = _parse_page(response.content)
+            sizes.update(page)
+            if not token:
+                return sizes
+
+    def available_days(
+        self, client: httpx.Client, symbol: str, interval: str, market_type: str, start: date, end: date
+    ) -> MonthFiles | None:
+        """Files published from ``start`` to ``end``, listing uncached months.
+
+        Args:
+            client: HTTP client for the listing requests
+            symbol: Trading pair symbol
+            interval: Kline interval string (e.g., "1m")
+            market_type: Market type (spot, futures_usdt, futures_coin)
+            start: First day
+            end: Last day (inclusive)
+
+        Returns:
+            Listed files by day, or None if a month could not be listed
+        """
+        files: MonthFiles = {}
+        for year, month in _months(start, end):
+            key = self._key(symbol, interval, market_type, year, month)
+            month_files = self._get(key)
+            if month_files is None:
+                prefix = _month_prefix(symbol, interval, market_type, year, month)
+                try:
+                    month_files = self._store(key, prefix, self._list_month(client, prefix))
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning(f"Could not list Vision files under {prefix}: {e}; probing each day instead")
+                    return None
+            files.update(month_files)
+        return {day: file for day, file in files.items() if start <= day <= end}
+
+    async def available_days_async(
+        self, client: httpx.AsyncClient, symbol: str, interval: str, market_type: str, start: date, end: date
+    ) -> MonthFiles | None:
+        """Asyncio counterpart of ``available_days``."""
+        files: MonthFiles = {}
+        for year, month in _months(start, end):
+            key = self._key(symbol, interval, market_type, year, month)
+            month_files = self._get(key)
+            if month_files is None:
+                prefix = _month_prefix(symbol, interval, market_type, year, month)
+                try:
+                    month_files = self._store(key, prefix, await self._list_month_async(client, prefix))
+                except (httpx.HTTPError, ValueError) as e:
+                    logger.warning(f"Could not list Vision files under {prefix}: {e}; probing each day instead")
+                    return None
+            files.update(month_files)
+        return {day: file for day, file in files.items() if start <= day <= end}
+
+    def clear(self) -> None:
+        """Forget every listing."""
+        with self._lock:
+            self._months.clear()
+
+
+# Process-wide listings shared by the sync and asyncio Vision downloaders
+VISION_LISTINGS = VisionListingCache()
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-# polars-exception: Timestamp utilities convert Vision API data to pandas timestamps
+# polars-exception: Timestamp utilities convert Vision API data to pandas timestamps (conversion itself runs in Polars)
 # ADR: docs/adr/2026-01-30-claude-code-infrastructure.md
 # Refactoring: Fix silent failure patterns (BLE001)
 """Utility module for timestamp handling in Vision API data.
@@ -11,25 +11,63 @@ ensuring proper conversion and preservation of semantic meaning.
 import re
 
 import pandas as pd
+import polars as pl
 
+from ckvd.utils.config import CANONICAL_CLOSE_TIME, CANONICAL_INDEX_NAME, TIMESTAMP_PRECISION
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import Interval
-from ckvd.utils.time_utils import detect_timestamp_unit
+from ckvd.utils.time_utils import TimestampUnit, detect_timestamp_unit
 
 # Pre-compiled regex pattern for parsing interval strings
 INTERVAL_PATTERN = re.compile(r"(\d+)([smhdwM])")
 
 
-def process_timestamp_columns(df: pd.DataFrame, interval_str: str) -> pd.DataFrame:
+# Raw epoch ticks per second for each unit Vision publishes
+_TICKS_PER_SECOND = {"ms": 1_000, "us": 1_000_000}
+
+
+def _trace_close(df: pd.DataFrame, row: int) -> object:
+    """Return the close price of a row for trace logging (None if the column is projected away)."""
+    return df["close"].iloc[row] if "close" in df.columns else None
+
+
+def vision_epoch_expr(column: str, unit: TimestampUnit) -> pl.Expr:
+    """Build the expression turning a raw Vision epoch column into UTC datetimes.
+
+    Values are truncated to the canonical ``TIMESTAMP_PRECISION`` (so 2025+
+    microsecond files line up with REST data without a later re-conversion)
+    and returned as ``Datetime("ns", "UTC")``, the dtype of the other sources.
+
+    Args:
+        column: Name of the integer epoch column
+        unit: Unit of the raw values ("ms" or "us")
+
+    Returns:
+        Expression aliased to ``column``
+    """
+    raw = pl.col(column).cast(pl.Int64)
+    source_ticks, target_ticks = _TICKS_PER_SECOND[unit], _TICKS_PER_SECOND[TIMESTAMP_PRECISION]
+    if source_ticks > target_ticks:
+        raw = raw // (source_ticks // target_ticks)
+    elif source_ticks < target_ticks:
+        raw = raw * (target_ticks // source_ticks)
+    return pl.from_epoch(raw, time_unit=TIMESTAMP_PRECISION).dt.replace_time_zone("UTC").dt.cast_time_unit("ns").alias(column)
+
+
+def process_timestamp_columns(df: pd.DataFrame, interval_str: str, keep_original_timestamp: bool = False) -> pd.DataFrame:
     """Process timestamp columns in the dataframe, handling various formats.
 
-    This method preserves the exact timestamps from the raw data without any shifting:
+    The unit (ms before 2025, us after) is detected once per file from the first
+    row; both columns are then converted in a single Polars pass. This preserves
+    the semantic meaning of the raw data without any shifting:
     - open_time represents the BEGINNING of a candle period
     - close_time represents the END of the candle period
 
     Args:
         df: DataFrame with timestamp columns to process
         interval_str: Interval string (e.g., "1s", "1m", "1h")
+        keep_original_timestamp: Also add the raw open_time epoch as an
+            ``original_timestamp`` string column
 
     Returns:
         DataFrame with processed timestamp columns
@@ -37,100 +75,65 @@ def process_timestamp_columns(df: pd.DataFrame, interval_str: str) -> pd.DataFra
     if df.empty:
         return df
 
-    try:
-        # Check timestamp format if dataframe has rows
-        if len(df) > 0:
-            # Debug: Log first few raw rows to track data through the pipeline
-            logger.debug(f"[TIMESTAMP TRACE] Input data to process_timestamp_columns has {len(df)} rows")
-            for i in range(min(3, len(df))):
-                logger.debug(f"[TIMESTAMP TRACE] Raw row {i}: open_time={df.iloc[i, 0]}, close={df.iloc[i, 4]}")
+    time_columns = [col for col in (CANONICAL_INDEX_NAME, CANONICAL_CLOSE_TIME) if col in df.columns]
+    if not time_columns:
+        return df
 
-            first_ts = df.iloc[0, 0]  # First timestamp in first column
-            last_ts = df.iloc[-1, 0] if len(df) > 1 else first_ts
+    # Row dumps and timestamp diagnostics only feed debug lines; skip them when DEBUG is off
+    trace = logger.enabled("DEBUG")
+    first_ts = df[time_columns[0]].iloc[0]
 
-            logger.debug(f"First raw timestamp detected: {first_ts}")
-            logger.debug(f"Last raw timestamp detected: {last_ts}")
+    if trace:
+        # Log first few raw rows to track data through the pipeline
+        logger.debug("[TIMESTAMP TRACE] Input data to process_timestamp_columns has {} rows", len(df))
+        for i in range(min(3, len(df))):
+            logger.debug("[TIMESTAMP TRACE] Raw row {}: open_time={}, close={}", i, df.iloc[i, 0], _trace_close(df, i))
 
-            try:
-                # Detect timestamp unit using the standardized function from utils.time_utils
-                timestamp_unit = detect_timestamp_unit(first_ts)
-
-                # Log timestamp details for debugging
-                logger.debug(f"First timestamp: {first_ts} ({timestamp_unit})")
-                if len(df) > 1:
-                    last_ts = df.iloc[-1, 0]
-                    logger.debug(f"Last timestamp: {last_ts} ({timestamp_unit})")
-
-                # Convert timestamps to datetime, preserving their semantic meaning:
-                # - open_time (1st column) is the BEGINNING of the candle period
-                # - close_time (7th column) is the END of the candle period
-                if "open_time" in df.columns:
-                    df["open_time"] = pd.to_datetime(df["open_time"], unit=timestamp_unit, utc=True)
-                    logger.debug(f"Converted open_time: first value = {df['open_time'].iloc[0]} (BEGINNING of candle)")
-                    # Debug: Log first few converted timestamps to track processing
-                    for i in range(min(3, len(df))):
-                        logger.debug(f"[TIMESTAMP TRACE] Converted row {i}: open_time={df['open_time'].iloc[i]}, close={df.iloc[i, 4]}")
-
-                if "close_time" in df.columns:
-                    df["close_time"] = pd.to_datetime(df["close_time"], unit=timestamp_unit, utc=True)
-                    logger.debug(f"Converted close_time: first value = {df['close_time'].iloc[0]} (END of candle)")
-
-                # Verify timestamp semantics are preserved (for debugging)
-                if "open_time" in df.columns and "close_time" in df.columns and len(df) > 0:
-                    first_open = df["open_time"].iloc[0]
-                    first_close = df["close_time"].iloc[0]
-                    time_diff = (first_close - first_open).total_seconds()
-
-                    # Calculate expected difference based on interval
-                    # For 1s interval, close should be 0.999 seconds after open
-                    # For 1m interval, close should be 59.999 seconds after open, etc.
-                    expected_diff = get_interval_seconds(interval_str) - 0.001
-
-                    logger.debug(
-                        f"Time difference between first open_time and close_time: {time_diff:.3f}s "
-                        f"(expected ~{expected_diff:.3f}s for {interval_str} interval)"
-                    )
-
-                    # Verify the time difference is within expected range
-                    # Allow for a small tolerance to account for precision differences
-                    tolerance = 0.1  # 100ms tolerance
-                    if abs(time_diff - expected_diff) > tolerance:
-                        logger.warning(
-                            f"Unexpected time difference between open_time and close_time: "
-                            f"{time_diff:.3f}s vs expected {expected_diff:.3f}s for {interval_str} interval. "
-                            f"This could indicate a timestamp interpretation issue."
-                        )
-                    else:
-                        logger.debug(
-                            f"Time difference between open_time and close_time is as expected "
-                            f"({time_diff:.3f}s) for {interval_str} interval."
-                        )
-
-                    logger.debug(
-                        "Timestamps converted preserving their semantic meaning: open_time=BEGINNING of candle, close_time=END of candle"
-                    )
-
-            except ValueError as e:
-                logger.warning(f"Error detecting timestamp unit: {e}")
-                # Fall back to default handling with microseconds as unit
-                logger.warning("Falling back to microseconds as the timestamp unit")
-                if "open_time" in df.columns:
-                    df["open_time"] = pd.to_datetime(df["open_time"], unit="us", utc=True)
-                    logger.debug(
-                        f"Converted open_time using fallback method: first value = {df['open_time'].iloc[0]} (BEGINNING of candle)"
-                    )
-                if "close_time" in df.columns:
-                    df["close_time"] = pd.to_datetime(df["close_time"], unit="us", utc=True)
-                    logger.debug(f"Converted close_time using fallback method: first value = {df['close_time'].iloc[0]} (END of candle)")
-
-        # Debug: Log output from timestamp processing
-        logger.debug(f"[TIMESTAMP TRACE] After process_timestamp_columns: {len(df)} rows")
-        if len(df) > 0 and "open_time" in df.columns:
-            for i in range(min(3, len(df))):
-                logger.debug(f"[TIMESTAMP TRACE] Processed row {i}: open_time={df['open_time'].iloc[i]}, close={df.iloc[i, 4]}")
-
-    except (ValueError, TypeError, KeyError) as e:
+    try:
+        timestamp_unit = detect_timestamp_unit(first_ts)
+    except ValueError as e:
+        logger.warning(f"Error detecting timestamp unit: {e}")
+        logger.warning("Falling back to microseconds as the timestamp unit")
+        timestamp_unit = "us"
+    logger.debug("First timestamp: {} ({})", first_ts, timestamp_unit)
+
+    try:
+        raw = pl.DataFrame({col: df[col].to_numpy() for col in time_columns})
+        exprs = [vision_epoch_expr(col, timestamp_unit) for col in time_columns]
+        if keep_original_timestamp and "original_timestamp" not in df.columns:
+            exprs.append(pl.col(time_columns[0]).cast(pl.String).alias("original_timestamp"))
+        converted = raw.select(exprs).to_pandas()
+    except (pl.exceptions.PolarsError, ValueError, TypeError) as e:
         logger.error(f"Error processing timestamp columns: {e}")
+        return df
+
+    converted.index = df.index
+    for col in converted.columns:
+        df[col] = converted[col]
+
+    # Verify timestamp semantics are preserved
+    if CANONICAL_INDEX_NAME in df.columns and CANONICAL_CLOSE_TIME in df.columns:
+        time_diff = (df[CANONICAL_CLOSE_TIME].iloc[0] - df[CANONICAL_INDEX_NAME].iloc[0]).total_seconds()
+
+        # For 1s interval, close should be 0.999 seconds after open
+        # For 1m interval, close should be 59.999 seconds after open, etc.
+        expected_diff = get_interval_seconds(interval_str) - 0.001
+
+        # Allow for a small tolerance to account for precision differences
+        tolerance = 0.1  # 100ms tolerance
+        if abs(time_diff - expected_diff) > tolerance:
+            logger.warning(
+                f"Unexpected time difference between open_time and close_time: "
+                f"{time_diff:.3f}s vs expected {expected_diff:.3f}s for {interval_str} interval. "
+                f"This could indicate a timestamp interpretation issue."
+            )
+
+    if trace and CANONICAL_INDEX_NAME in df.columns:
+        logger.debug("[TIMESTAMP TRACE] After process_timestamp_columns: {} rows", len(df))
+        for i in range(min(3, len(df))):
+            logger.debug(
+                "[TIMESTAMP TRACE] Processed row {}: open_time={}, close={}", i, df[CANONICAL_INDEX_NAME].iloc[i], _trace_close(df, i)
+            )
 
     return df
 
@@ -193,7 +196,7 @@ def parse_interval(interval_str: str) -> Interval:
             except KeyError as e:
                 raise ValueError(f"Invalid interval: {interval_str}") from e
 
-        logger.debug(f"Using interval {interval_obj.name} ({interval_obj.value})")
+        logger.debug("Using interval {} ({})", interval_obj.name, interval_obj.value)
 
         return interval_obj
     except (ValueError, KeyError, StopIteration) as e:
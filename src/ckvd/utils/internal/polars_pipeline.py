@@ -18,19 +18,35 @@ Usage:
     pipeline.add_source(vision_lf, "VISION")
     pipeline.add_source(rest_lf, "REST")
     df = pipeline.collect_pandas()  # Or collect_polars() for zero-copy output
+    df = pipeline.collect_pandas(dtype_backend="pyarrow")  # pd.ArrowDtype, no NumPy copy
+
+    # Compact profile: Float32/Int32/ms timestamps/Enum source, cast in the scan plan
+    pipeline = PolarsDataPipeline(schema_profile="compact")
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Literal
 
 import polars as pl
 
 from ckvd.utils.loguru_setup import logger
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     import pandas as pd
 
+    from ckvd.utils.market_constraints import Interval
+
+# Pandas output backends: "numpy" (classic dtypes) or "pyarrow" (pd.ArrowDtype)
+DtypeBackend = Literal["numpy", "pyarrow"]
+
+# Output schema profiles: "standard" (Float64/Int64/us timestamps/String source)
+# or "compact" (Float32/Int32/ms timestamps/Enum source)
+SchemaProfile = Literal["standard", "compact"]
+
 
 # Source priority for FCP conflict resolution
 # Higher number = higher priority (kept when duplicates exist)
@@ -42,6 +58,107 @@ SOURCE_PRIORITY = {
     "REST": 3,
 }
 
+# Output dtype contract for dtype_backend="pyarrow" (Polars types after
+# _standardize_schema). Each maps 1:1 to a pd.ArrowDtype:
+#   Datetime("us", "UTC") -> timestamp[us, tz=UTC][pyarrow]
+#   Float64 -> double[pyarrow], Int64 -> int64[pyarrow], String -> large_string[pyarrow]
+ARROW_OUTPUT_SCHEMA: dict[str, pl.DataType] = {
+    "open_time": pl.Datetime("us", "UTC"),
+    "open": pl.Float64(),
+    "high": pl.Float64(),
+    "low": pl.Float64(),
+    "close": pl.Float64(),
+    "volume": pl.Float64(),
+    "close_time": pl.Datetime("us", "UTC"),
+    "quote_asset_volume": pl.Float64(),
+    "count": pl.Int64(),
+    "taker_buy_volume": pl.Float64(),
+    "taker_buy_quote_volume": pl.Float64(),
+    "_data_source": pl.String(),
+}
+
+# _data_source categories of the compact profile, in SOURCE_PRIORITY order
+SOURCE_ENUM = pl.Enum(list(SOURCE_PRIORITY))
+
+# Output dtype contract for schema_profile="compact". Timestamps stay Datetime
+# (epoch int64 physically) at millisecond resolution, the resolution Binance
+# publishes; prices and volumes are Float32, trade counts Int32.
+COMPACT_OUTPUT_SCHEMA: dict[str, pl.DataType] = {
+    "open_time": pl.Datetime("ms", "UTC"),
+    "open": pl.Float32(),
+    "high": pl.Float32(),
+    "low": pl.Float32(),
+    "close": pl.Float32(),
+    "volume": pl.Float32(),
+    "close_time": pl.Datetime("ms", "UTC"),
+    "quote_asset_volume": pl.Float32(),
+    "count": pl.Int32(),
+    "taker_buy_volume": pl.Float32(),
+    "taker_buy_quote_volume": pl.Float32(),
+    "_data_source": SOURCE_ENUM,
+}
+
+_PROFILE_SCHEMAS: dict[str, dict[str, pl.DataType]] = {
+    "standard": ARROW_OUTPUT_SCHEMA,
+    "compact": COMPACT_OUTPUT_SCHEMA,
+}
+
+
+def to_arrow_pandas(pl_df: pl.DataFrame) -> pd.DataFrame:
+    """Convert a Polars DataFrame to pandas with ``pd.ArrowDtype`` columns.
+
+    The pandas columns wrap the Arrow buffers exported by Polars, so values are
+    not copied into NumPy arrays and no dtype casts are applied. ``open_time``
+    becomes the index, matching the classic output layout.
+
+    Args:
+        pl_df: Collected Polars DataFrame (see ``ARROW_OUTPUT_SCHEMA``)
+
+    Returns:
+        Arrow-backed pandas DataFrame indexed by ``open_time``.
+    """
+    pd_df = pl_df.to_pandas(use_pyarrow_extension_array=True)
+    if "open_time" in pd_df.columns:
+        pd_df = pd_df.set_index("open_time")
+    return pd_df
+
+
+def reindex_polars(
+    pl_df: pl.DataFrame,
+    start_time: datetime,
+    end_time: datetime,
+    interval: Interval,
+) -> pl.DataFrame:
+    """Reindex to a complete ``[start_time, end_time)`` grid, leaving gaps as nulls.
+
+    Polars counterpart of ``safely_reindex_dataframe`` for Arrow-backed output.
+
+    Args:
+        pl_df: DataFrame with an ``open_time`` column
+        start_time: First expected open_time (inclusive)
+        end_time: End of the range (exclusive)
+        interval: Candle interval defining the grid step
+
+    Returns:
+        DataFrame with one row per expected open_time, sorted ascending.
+    """
+    every = "1mo" if interval.value.endswith("M") else f"{interval.to_seconds()}s"
+    time_unit = pl_df.schema["open_time"].time_unit
+    grid = pl.DataFrame(
+        {
+            "open_time": pl.datetime_range(
+                start_time,
+                end_time,
+                interval=every,
+                closed="left",
+                time_unit=time_unit,
+                time_zone="UTC",
+                eager=True,
+            )
+        }
+    )
+    return grid.join(pl_df, on="open_time", how="left").sort("open_time")
+
 
 class PolarsDataPipeline:
     """Polars-native FCP data pipeline with streaming support.
@@ -54,9 +171,24 @@ class PolarsDataPipeline:
     (USE_POLARS_PIPELINE flag was removed in v3.1.0).
     """
 
-    def __init__(self) -> None:
-        """Initialize empty pipeline."""
+    def __init__(self, schema_profile: SchemaProfile = "standard") -> None:
+        """Initialize empty pipeline.
+
+        Args:
+            schema_profile: Column types of the merged result. "standard" uses
+                ``ARROW_OUTPUT_SCHEMA``; "compact" uses ``COMPACT_OUTPUT_SCHEMA``
+                and drops the per-row ``original_timestamp`` strings. The casts
+                are part of each source's lazy plan, so cache scans decode
+                straight into the compact types.
+
+        Raises:
+            ValueError: If schema_profile is unknown
+        """
+        if schema_profile not in _PROFILE_SCHEMAS:
+            raise ValueError(f"schema_profile must be one of {list(_PROFILE_SCHEMAS)}, got {schema_profile!r}")
         self._lazy_frames: list[pl.LazyFrame] = []
+        self.schema_profile = schema_profile
+        self.output_schema = _PROFILE_SCHEMAS[schema_profile]
 
     def add_source(
         self,
@@ -84,7 +216,7 @@ class PolarsDataPipeline:
             lf = lf.with_columns(pl.lit(source).alias("_data_source"))
 
         self._lazy_frames.append(lf)
-        logger.debug(f"Added {source} source to pipeline")
+        logger.debug("Added {} source to pipeline", source)
         return self
 
     def add_pandas(
@@ -105,7 +237,7 @@ class PolarsDataPipeline:
             Self for method chaining.
         """
         if df.empty:
-            logger.debug(f"Skipping empty pandas DataFrame from {source}")
+            logger.debug("Skipping empty pandas DataFrame from {}", source)
             return self
 
         # Handle index - if open_time is index, reset it
@@ -127,7 +259,8 @@ class PolarsDataPipeline:
         - volume: Int64 vs Float64
         - Extra columns in some files
 
-        This method ensures all LazyFrames have consistent types before concat.
+        This method ensures all LazyFrames have the types of the pipeline's
+        schema profile before concat.
 
         Args:
             lf: LazyFrame to standardize
@@ -136,17 +269,21 @@ class PolarsDataPipeline:
             LazyFrame with standardized schema
         """
         schema = lf.collect_schema()
+        compact = self.schema_profile == "compact"
+        time_dtype = self.output_schema["open_time"]
+        float_dtype = pl.Float32 if compact else pl.Float64
+        count_dtype = self.output_schema["count"]
 
-        # Cast timestamp columns to consistent resolution (Microseconds UTC)
+        # Cast timestamp columns to consistent resolution (Microseconds UTC,
+        # Milliseconds UTC in the compact profile)
         time_cols = ["open_time", "close_time"]
         casts = []
 
         for col in time_cols:
             if col in schema:
-                # Cast to Datetime with microseconds and UTC timezone
-                casts.append(pl.col(col).cast(pl.Datetime("us", "UTC")).alias(col))
+                casts.append(pl.col(col).cast(time_dtype).alias(col))
 
-        # Cast numeric columns to Float64 for consistency
+        # Cast numeric columns to Float64 (Float32 when compact) for consistency
         # Include 'ignore' column which may have inconsistent types across cache files
         numeric_cols = [
             "open",
@@ -163,11 +300,11 @@ class PolarsDataPipeline:
 
         for col in numeric_cols:
             if col in schema:
-                casts.append(pl.col(col).cast(pl.Float64).alias(col))
+                casts.append(pl.col(col).cast(float_dtype).alias(col))
 
-        # Cast count to Int64
+        # Cast count to Int64 (Int32 when compact)
         if "count" in schema:
-            casts.append(pl.col("count").cast(pl.Int64).alias("count"))
+            casts.append(pl.col("count").cast(count_dtype).alias("count"))
 
         # Cast __index_level_0__ to Int64 for consistency (from pandas index)
         if "__index_level_0__" in schema:
@@ -175,12 +312,19 @@ class PolarsDataPipeline:
 
         # Cast original_timestamp to String for consistency
         # Some sources may have Null, others String
-        if "original_timestamp" in schema:
+        if "original_timestamp" in schema and not compact:
             casts.append(pl.col("original_timestamp").cast(pl.String).alias("original_timestamp"))
 
+        # The compact profile stores the source tag as an Enum (one byte per row)
+        if "_data_source" in schema and compact:
+            casts.append(pl.col("_data_source").cast(SOURCE_ENUM).alias("_data_source"))
+
         if casts:
             lf = lf.with_columns(casts)
 
+        if compact and "original_timestamp" in schema:
+            lf = lf.drop("original_timestamp")
+
         return lf
 
     def _merge_with_priority(self) -> pl.LazyFrame:
@@ -205,7 +349,7 @@ class PolarsDataPipeline:
             logger.debug("Single source in pipeline, returning directly")
             return self._standardize_schema(self._lazy_frames[0])
 
-        logger.debug(f"Merging {len(self._lazy_frames)} sources with priority resolution")
+        logger.debug("Merging {} sources with priority resolution", len(self._lazy_frames))
 
         # Standardize schemas before concat to avoid type mismatches
         standardized = [self._standardize_schema(lf) for lf in self._lazy_frames]
@@ -222,7 +366,7 @@ class PolarsDataPipeline:
             .sort("open_time")
         )
 
-    def collect_polars(self, use_streaming: bool = True) -> pl.DataFrame:
+    def collect_polars(self, use_streaming: bool = True, columns: Sequence[str] | None = None) -> pl.DataFrame:
         """Collect merged data as Polars DataFrame.
 
         Uses the new streaming engine (Polars 1.31+) for better memory
@@ -231,19 +375,30 @@ class PolarsDataPipeline:
         Args:
             use_streaming: Whether to use streaming engine for collection.
                           Defaults to True for memory efficiency.
+            columns: Optional column projection applied to the lazy plan before
+                     collection (``_data_source`` is kept when present).
 
         Returns:
             Merged Polars DataFrame with duplicates resolved by priority.
         """
         lf = self._merge_with_priority()
 
+        if columns is not None:
+            schema = lf.collect_schema()
+            lf = lf.select([col for col in [*columns, "_data_source"] if col in schema])
+
         if use_streaming:
             logger.debug("Collecting with streaming engine")
             return lf.collect(engine="streaming")
         logger.debug("Collecting with in-memory engine")
         return lf.collect()
 
-    def collect_pandas(self, use_streaming: bool = True) -> pd.DataFrame:
+    def collect_pandas(
+        self,
+        use_streaming: bool = True,
+        columns: Sequence[str] | None = None,
+        dtype_backend: DtypeBackend = "numpy",
+    ) -> pd.DataFrame:
         """Collect merged data as pandas DataFrame.
 
         This is the backward-compatible output format for existing consumers.
@@ -253,17 +408,31 @@ class PolarsDataPipeline:
         Args:
             use_streaming: Whether to use streaming engine for collection.
                           Defaults to True for memory efficiency.
+            columns: Optional column projection, applied before the pandas
+                     conversion so only requested columns are copied.
+            dtype_backend: "numpy" (default) converts to NumPy-backed dtypes.
+                          "pyarrow" returns ``pd.ArrowDtype`` columns sharing the
+                          Polars buffers, restricted to the standard kline columns
+                          (see ``ARROW_OUTPUT_SCHEMA`` / ``COMPACT_OUTPUT_SCHEMA``).
 
         Returns:
             Merged pandas DataFrame with duplicates resolved by priority.
         """
+        if dtype_backend == "pyarrow":
+            if columns is None:
+                columns = [col for col in self.output_schema if col != "_data_source"]
+            if self.is_empty():
+                schema = {col: self.output_schema[col] for col in [*columns, "_data_source"]}
+                return to_arrow_pandas(pl.DataFrame(schema=schema))
+            return to_arrow_pandas(self.collect_polars(use_streaming=use_streaming, columns=columns))
+
         if self.is_empty():
             logger.warning("Pipeline is empty, returning empty pandas DataFrame")
             from ckvd.utils.config import create_empty_dataframe
 
             return create_empty_dataframe()
 
-        pl_df = self.collect_polars(use_streaming=use_streaming)
+        pl_df = self.collect_polars(use_streaming=use_streaming, columns=columns)
 
         if pl_df.is_empty():
             from ckvd.utils.config import create_empty_dataframe
@@ -277,11 +446,10 @@ class PolarsDataPipeline:
         if "open_time" in pd_df.columns:
             pd_df = pd_df.set_index("open_time")
 
-        # Log merge statistics
-        if "_data_source" in pd_df.columns and not pd_df.empty:
-            source_counts = pd_df["_data_source"].value_counts()
-            for source, count in source_counts.items():
+        # Log merge statistics (value_counts is skipped unless DEBUG is on)
+        if logger.enabled("DEBUG") and "_data_source" in pd_df.columns and not pd_df.empty:
+            for source, count in pd_df["_data_source"].value_counts().items():
                 percentage = (count / len(pd_df)) * 100
-                logger.debug(f"Polars pipeline result: {count} records ({percentage:.1f}%) from {source}")
+                logger.debug("Polars pipeline result: {} records ({:.1f}%) from {}", count, percentage, source)
 
         return pd_df
@@ -29,6 +29,12 @@ Basic Usage Examples:
     logger.error("Error message")
     logger.critical("Critical message")
 
+    # Hot paths: defer formatting with {} arguments, and skip diagnostics
+    # that only feed a log line when the level is disabled
+    logger.debug("Fetched {} rows for {}", len(df), symbol)
+    if logger.enabled("DEBUG"):
+        logger.debug("Sources: {}", df["_data_source"].value_counts().to_dict())
+
     # Rich formatting works automatically
     logger.info("Status: <green>SUCCESS</green>")
     logger.error("Error: <red>FAILED</red>")
@@ -51,7 +57,6 @@ import os
 import sys
 from pathlib import Path
 
-import pendulum
 from loguru import logger as _loguru_logger
 
 # Remove default loguru handler to have full control
@@ -73,6 +78,39 @@ LOG_FORMAT = (
 # Simple format for when colors are disabled
 SIMPLE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
 
+# Loguru severities for the level-gated fast path
+_LEVEL_NUMBERS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+_LOGGING_LEVEL_NAMES = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
+
+
+class _AlwaysEnabledCore:
+    """Stand-in for a loguru core without ``min_level``: every level reaches loguru, which filters."""
+
+    min_level = 0
+
+
+def _resolve_loguru_core(loguru_logger: object) -> object:
+    """Return loguru's core if it exposes ``min_level``, otherwise an always-enabled stand-in.
+
+    ``_core.min_level`` is private (present since loguru 0.7.0); a release that
+    drops or renames it only costs the fast path, not log output.
+
+    Args:
+        loguru_logger: The loguru logger
+
+    Returns:
+        Object whose ``min_level`` is the lowest severity any sink accepts
+    """
+    core = getattr(loguru_logger, "_core", None)
+    if isinstance(getattr(core, "min_level", None), (int, float)):
+        return core
+    return _AlwaysEnabledCore()
+
+
+# Loguru keeps the lowest level accepted by any sink (ours or one added by the
+# application) on its core; comparing against it is the cheapest possible guard.
+_LOGURU_CORE = _resolve_loguru_core(_loguru_logger)
+
 
 class CKVDLogger:
     """Simple wrapper around loguru that provides easy configuration and compatibility."""
@@ -157,20 +195,38 @@ class CKVDLogger:
         self._setup_logger()
         return self
 
-    # Delegate all logging methods to loguru
+    def enabled(self, level: str) -> bool:
+        """Whether a message at ``level`` would reach any sink.
+
+        Guard diagnostics that exist only for a log line (value counts, row
+        dumps) so they are skipped entirely when the level is disabled.
+
+        Args:
+            level: Level name (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+        Returns:
+            True if at least one sink accepts the level
+        """
+        return _LEVEL_NUMBERS[level.upper()] >= _LOGURU_CORE.min_level
+
+    # Delegate all logging methods to loguru. Disabled levels return before
+    # loguru is touched; {}-style arguments are only formatted when emitted.
     def debug(self, message: str, *args, **kwargs):
         """Log a debug message."""
-        _loguru_logger.opt(depth=1).debug(message, *args, **kwargs)
+        if _LOGURU_CORE.min_level <= _LEVEL_NUMBERS["DEBUG"]:
+            _loguru_logger.opt(depth=1).debug(message, *args, **kwargs)
         return self
 
     def info(self, message: str, *args, **kwargs):
         """Log an info message."""
-        _loguru_logger.opt(depth=1).info(message, *args, **kwargs)
+        if _LOGURU_CORE.min_level <= _LEVEL_NUMBERS["INFO"]:
+            _loguru_logger.opt(depth=1).info(message, *args, **kwargs)
         return self
 
     def warning(self, message: str, *args, **kwargs):
         """Log a warning message."""
-        _loguru_logger.opt(depth=1).warning(message, *args, **kwargs)
+        if _LOGURU_CORE.min_level <= _LEVEL_NUMBERS["WARNING"]:
+            _loguru_logger.opt(depth=1).warning(message, *args, **kwargs)
         return self
 
     def error(self, message: str, *args, **kwargs):
@@ -193,8 +249,7 @@ class CKVDLogger:
         """Set log level (compatibility method)."""
         if isinstance(level, int):
             # Convert numeric levels to string
-            level_map = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
-            level = level_map.get(level, "INFO")
+            level = _LOGGING_LEVEL_NAMES.get(level, "INFO")
         return self.configure_level(level)
 
     def getEffectiveLevel(self) -> str:
@@ -204,13 +259,8 @@ class CKVDLogger:
     def isEnabledFor(self, level: str | int) -> bool:
         """Check if logging is enabled for the given level."""
         if isinstance(level, int):
-            level_map = {10: "DEBUG", 20: "INFO", 30: "WARNING", 40: "ERROR", 50: "CRITICAL"}
-            level = level_map.get(level, "INFO")
-
-        level_hierarchy = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        current_index = level_hierarchy.index(self._current_level)
-        check_index = level_hierarchy.index(level.upper())
-        return check_index >= current_index
+            level = _LOGGING_LEVEL_NAMES.get(level, "INFO")
+        return _LEVEL_NUMBERS[level.upper()] >= _LEVEL_NUMBERS[self._current_level]
 
     # Expose loguru's advanced features
     def bind(self, **kwargs):
@@ -282,6 +332,8 @@ def configure_session_logging(session_name: str, log_level: str = "DEBUG"):
         tuple: (main_log_path, error_log_path, timestamp) for reference
     """
     # Generate timestamp for consistent filenames
+    import pendulum
+
     timestamp = pendulum.now("UTC").format("YYYYMMDD_HHmmss")
 
     # Create log directories in workspace root
@@ -2,8 +2,6 @@
 # ADR: docs/adr/2026-01-30-claude-code-infrastructure.md
 """Market type utility functions."""
 
-from rich import print
-
 from ckvd.utils.market_constraints import MarketType
 
 
@@ -32,6 +30,8 @@ def get_market_type_str(market_type: MarketType) -> str:
 
 # Unit tests
 if __name__ == "__main__":
+    from rich import print
+
     # Test the get_market_type_str function with all market types
     market_types = [
         (MarketType.SPOT, "spot"),
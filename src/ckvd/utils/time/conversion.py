@@ -13,7 +13,6 @@ ensuring timezone awareness.
 from datetime import datetime, timezone
 from typing import Literal
 
-import numpy as np
 import pandas as pd
 
 from ckvd.utils.config import (
@@ -109,60 +108,22 @@ def standardize_timestamp_precision(df: pd.DataFrame) -> pd.DataFrame:
     # Source: docs/adr/2026-01-30-claude-code-infrastructure.md (memory efficiency refactoring)
     result_df = df
 
-    # Process DatetimeIndex if present
+    # Process DatetimeIndex if present. Truncation is vectorised and skipped when
+    # the values already sit on the target precision (e.g. Vision frames, which are
+    # normalised at decode time, and REST frames).
     if isinstance(result_df.index, pd.DatetimeIndex):
-        logger.debug(f"Processing DatetimeIndex in standardize_timestamp_precision, target precision: {TIMESTAMP_PRECISION}")
-
-        # Get a sample timestamp to determine current precision
-        sample_ts = result_df.index[0].value
-        current_precision = "us" if len(str(abs(sample_ts))) > MILLISECOND_DIGITS else "ms"
-
-        # Only convert if current precision doesn't match target
-        if current_precision != TIMESTAMP_PRECISION:
-            logger.debug(f"Converting index from {current_precision} to {TIMESTAMP_PRECISION} precision")
-
-            if current_precision == "us" and TIMESTAMP_PRECISION == "ms":
-                # Convert from microseconds to milliseconds (truncate)
-                # Use numpy array with pd.to_datetime to avoid N Timestamp object allocations
-                timestamps_ms = np.array([int(ts.timestamp() * 1000) for ts in result_df.index], dtype="int64")
-                new_index = pd.to_datetime(timestamps_ms, unit="ms", utc=True)
-                new_index.name = result_df.index.name
-                result_df.index = new_index
-
-            elif current_precision == "ms" and TIMESTAMP_PRECISION == "us":
-                # Convert from milliseconds to microseconds (add zeros)
-                # Use numpy array with pd.to_datetime to avoid N Timestamp object allocations
-                timestamps_us = np.array([int(ts.timestamp() * 1000000) for ts in result_df.index], dtype="int64")
-                new_index = pd.to_datetime(timestamps_us, unit="us", utc=True)
-                new_index.name = result_df.index.name
-                result_df.index = new_index
+        truncated = result_df.index.floor(TIMESTAMP_PRECISION)
+        if not truncated.equals(result_df.index):
+            logger.debug("Truncating DatetimeIndex to {} precision", TIMESTAMP_PRECISION)
+            result_df.index = truncated
 
     # Process timestamp columns
-    time_columns = [CANONICAL_INDEX_NAME, CANONICAL_CLOSE_TIME]
-    for col in time_columns:
-        if col in result_df.columns and pd.api.types.is_datetime64_dtype(result_df[col]):
-            logger.debug(f"Processing timestamp column {col}")
-
-            # Get a sample to determine current precision
-            if len(result_df) > 0:
-                sample_ts = result_df[col].iloc[0].value
-                current_precision = "us" if len(str(abs(sample_ts))) > MILLISECOND_DIGITS else "ms"
-
-                # Only convert if current precision doesn't match target
-                if current_precision != TIMESTAMP_PRECISION:
-                    logger.debug(f"Converting column {col} from {current_precision} to {TIMESTAMP_PRECISION} precision")
-
-                    if current_precision == "us" and TIMESTAMP_PRECISION == "ms":
-                        # Convert from microseconds to milliseconds (truncate)
-                        result_df[col] = pd.to_datetime(
-                            (result_df[col].astype(np.int64) // 1000000) * 1000,
-                            unit="ms",
-                            utc=True,
-                        )
-
-                    elif current_precision == "ms" and TIMESTAMP_PRECISION == "us":
-                        # Convert from milliseconds to microseconds (add zeros)
-                        result_df[col] = pd.to_datetime(result_df[col].astype(np.int64) * 1000, unit="us", utc=True)
+    for col in (CANONICAL_INDEX_NAME, CANONICAL_CLOSE_TIME):
+        if col in result_df.columns and pd.api.types.is_datetime64_any_dtype(result_df[col]):
+            truncated = result_df[col].dt.floor(TIMESTAMP_PRECISION)
+            if not truncated.equals(result_df[col]):
+                logger.debug("Truncating column {} to {} precision", col, TIMESTAMP_PRECISION)
+                result_df[col] = truncated
 
     return result_df
 
@@ -85,8 +85,8 @@ def filter_dataframe_by_time(
     start_time = enforce_utc_timezone(start_time)
     end_time = enforce_utc_timezone(end_time)
 
-    logger.debug(f"Filtering DataFrame by time: {start_time} to {end_time}")
-    logger.debug(f"Before filtering: {len(df)} rows")
+    logger.debug("Filtering DataFrame by time: {} to {}", start_time, end_time)
+    logger.debug("Before filtering: {} rows", len(df))
 
     # FAIL-FAST: Timezone-aware timestamp debugging with rich exception context
     from ckvd.utils.time.timestamp_debug import (
@@ -108,7 +108,7 @@ def filter_dataframe_by_time(
             # IMPORTANT: Use >= for start_time and <= for end_time to ensure
             # exact interval boundaries are included correctly
             logger.debug(
-                f"Filtering on index reset as column, using criteria: {time_column} >= {start_time} AND {time_column} <= {end_time}"
+                "Filtering on index reset as column, using criteria: {} >= {} AND {} <= {}", time_column, start_time, time_column, end_time
             )
 
             # MEMORY OPTIMIZATION: Boolean indexing returns view, copy only if requested
@@ -127,7 +127,7 @@ def filter_dataframe_by_time(
         # Filter dataframe using the time column, preserving exact timestamps
         # IMPORTANT: Use >= for start_time and <= for end_time to include timestamps
         # exactly at the interval boundaries
-        logger.debug(f"Filtering on column, using criteria: {time_column} >= {start_time} AND {time_column} <= {end_time}")
+        logger.debug("Filtering on column, using criteria: {} >= {} AND {} <= {}", time_column, start_time, time_column, end_time)
 
         # MEMORY OPTIMIZATION: Boolean indexing returns view, copy only if requested
         filtered_df = df[(df[time_column] >= start_time) & (df[time_column] <= end_time)]
@@ -141,29 +141,31 @@ def filter_dataframe_by_time(
     if len(filtered_df) == 0:
         logger.warning(f"No data within time range {start_time} to {end_time}")
     else:
-        logger.debug(f"After filtering: {len(filtered_df)} rows")
+        logger.debug("After filtering: {} rows", len(filtered_df))
         if len(filtered_df) > 0:
             # Log the min and max timestamps in the filtered data
             if time_column in filtered_df.columns:
                 min_ts = filtered_df[time_column].min()
                 max_ts = filtered_df[time_column].max()
-                logger.debug(f"First timestamp: {min_ts} (represents BEGINNING of candle)")
-                logger.debug(f"Last timestamp: {max_ts} (represents BEGINNING of candle)")
+                logger.debug("First timestamp: {} (represents BEGINNING of candle)", min_ts)
+                logger.debug("Last timestamp: {} (represents BEGINNING of candle)", max_ts)
 
                 # Check if the first expected timestamp is present
                 if min_ts > start_time:
                     time_diff = (min_ts - start_time).total_seconds()
-                    logger.debug(f"First timestamp ({min_ts}) is later than requested start time ({start_time}), diff: {time_diff} seconds")
+                    logger.debug(
+                        "First timestamp ({}) is later than requested start time ({}), diff: {} seconds", min_ts, start_time, time_diff
+                    )
                     logger.debug("First candle is missing from result! This may indicate a timestamp interpretation issue.")
 
                 # Check if the last expected timestamp is present
                 if max_ts < end_time:
-                    logger.debug(f"Last timestamp ({max_ts}) is earlier than requested end time ({end_time})")
+                    logger.debug("Last timestamp ({}) is earlier than requested end time ({})", max_ts, end_time)
             elif isinstance(filtered_df.index, pd.DatetimeIndex):
                 min_ts = filtered_df.index.min()
                 max_ts = filtered_df.index.max()
-                logger.debug(f"First timestamp: {min_ts} (represents BEGINNING of candle)")
-                logger.debug(f"Last timestamp: {max_ts} (represents BEGINNING of candle)")
+                logger.debug("First timestamp: {} (represents BEGINNING of candle)", min_ts)
+                logger.debug("Last timestamp: {} (represents BEGINNING of candle)", max_ts)
 
     # FAIL-FAST: Timezone-aware validation of filtering results
     compare_filtered_results(df, filtered_df, start_time, end_time, time_column)
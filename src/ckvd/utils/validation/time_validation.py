@@ -16,12 +16,15 @@ Related modules:
 
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from ckvd.utils.api_boundary_validator import ApiBoundaryValidator
 from ckvd.utils.loguru_setup import logger
 from ckvd.utils.market_constraints import Interval
 
+if TYPE_CHECKING:
+    # Type-only: the validator module imports the HTTP stack
+    from ckvd.utils.api_boundary_validator import ApiBoundaryValidator
+
 # Re-export from new modules for backward compatibility
 from ckvd.utils.validation.availability_validation import (
     is_data_likely_available,
@@ -54,7 +57,7 @@ class ValidationError(Exception):
 class DataValidation:
     """Centralized data validation utilities for time, dates, and symbols."""
 
-    def __init__(self, api_boundary_validator: ApiBoundaryValidator | None = None) -> None:
+    def __init__(self, api_boundary_validator: "ApiBoundaryValidator | None" = None) -> None:
         """Initialize the DataValidation class.
 
         Args:
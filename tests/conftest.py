@@ -179,3 +179,22 @@ def sample_symbol():
 def sample_coin_symbol():
     """Standard test symbol for coin-margined futures."""
     return "BTCUSD_PERP"
+
+
+# =============================================================================
+# Isolation Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def isolated_rate_limit_state(tmp_path_factory, monkeypatch):
+    """Keep the host-wide REST weight budgets out of the user's cache.
+
+    Every test gets fresh per-host schedulers whose shared state lives in a
+    temporary directory, so fake clocks and recorded Retry-After blocks never
+    throttle other tests or real processes.
+    """
+    from ckvd.utils.for_core import rest_scheduler
+
+    monkeypatch.setenv("CKVD_RATE_LIMIT_DIR", str(tmp_path_factory.mktemp("rate_limits")))
+    monkeypatch.setattr(rest_scheduler, "_SCHEDULERS", {})
@@ -0,0 +1,292 @@
+"""Tests for AsyncCryptoKlineVisionData.
+
+Vision and REST are served by an ``httpx.MockTransport``, so the async FCP
+(cache reads in the thread pool, concurrent Vision days and REST chunks,
+shared day downloads, cancellation) runs end to end without network access.
+"""
+
+import asyncio
+import hashlib
+import io
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pandas as pd
+import pytest
+
+from ckvd import AsyncCryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.utils.for_core.vision_listing import VISION_LISTINGS
+
+DAY = datetime(2024, 1, 15, tzinfo=timezone.utc)
+HOUR_MS = 3_600_000
+
+
+def _kline_row(open_ms: int, interval_ms: int) -> list:
+    """One kline in the Binance REST / Vision CSV layout."""
+    return [open_ms, "100.0", "101.0", "99.0", "100.5", "10.0", open_ms + interval_ms - 1, "1005.0", 7, "5.0", "502.5", "0"]
+
+
+def _day_archive(day: datetime) -> bytes:
+    """Zipped Vision CSV with 24 hourly klines."""
+    start_ms = int(day.timestamp() * 1000)
+    csv = "\n".join(",".join(str(v) for v in _kline_row(start_ms + i * HOUR_MS, HOUR_MS)) for i in range(24)) + "\n"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(f"BTCUSDT-1h-{day:%Y-%m-%d}.csv", csv)
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_vision_listings():
+    VISION_LISTINGS.clear()
+    yield
+    VISION_LISTINGS.clear()
+
+
+class FakeBinance:
+    """MockTransport handler for Vision archives, their S3 listing and REST klines."""
+
+    def __init__(self, vision_days=(), delay: float = 0.0):
+        self.archives = {day.strftime("%Y-%m-%d"): _day_archive(day) for day in vision_days}
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if request.url.params.get("list-type") == "2":
+            return self._listing(request.url.params["prefix"])
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request.url.host == "data.binance.vision":
+            day = path.rsplit("-", 3)[-3:]
+            archive = self.archives.get("-".join(day).split(".")[0])
+            if archive is None:
+                return httpx.Response(404)
+            if path.endswith(".CHECKSUM"):
+                return httpx.Response(200, content=f"{hashlib.sha256(archive).hexdigest()}  file.zip".encode())
+            return httpx.Response(200, content=archive)
+        params = request.url.params
+        start, end, limit = int(params["startTime"]), int(params["endTime"]), int(params["limit"])
+        interval_ms = 60_000 if params["interval"] == "1m" else HOUR_MS
+        rows = [_kline_row(ms, interval_ms) for ms in range(start, end + 1, interval_ms)][:limit]
+        return httpx.Response(200, json=rows)
+
+    def _listing(self, prefix: str) -> httpx.Response:
+        """S3 ListObjectsV2 page of the archives under ``prefix`` (``...-YYYY-MM-``)."""
+        contents = "".join(
+            f"<Contents><Key>{prefix}{day[8:]}.zip</Key><Size>{len(archive)}</Size></Contents>"
+            f"<Contents><Key>{prefix}{day[8:]}.zip.CHECKSUM</Key><Size>105</Size></Contents>"
+            for day, archive in self.archives.items()
+            if prefix.endswith(day[:8])
+        )
+        return httpx.Response(200, content=f"<ListBucketResult><IsTruncated>false</IsTruncated>{contents}</ListBucketResult>".encode())
+
+    def count(self, suffix: str) -> int:
+        return sum(1 for r in self.requests if r.url.path.endswith(suffix))
+
+
+def _manager(tmp_path, handler, **kwargs) -> AsyncCryptoKlineVisionData:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncCryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path, http_client=client, **kwargs)
+
+
+class TestGetData:
+    """Async FCP."""
+
+    def test_vision_then_cache(self, tmp_path):
+        handler = FakeBinance(vision_days=[DAY])
+
+        async def run():
+            async with _manager(tmp_path, handler) as manager:
+                first = await manager.get_data("BTCUSDT", DAY, DAY + timedelta(hours=23), Interval.HOUR_1)
+                second = await manager.get_data("BTCUSDT", DAY, DAY + timedelta(hours=23), Interval.HOUR_1)
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert len(first) == 23  # end_time is exclusive
+        assert set(first["_data_source"]) == {"VISION"}
+        assert first["close"].iloc[0] == 100.5
+        assert set(second["_data_source"]) == {"CACHE"}
+        pd.testing.assert_index_equal(first.index, second.index)
+        assert first["close"].tolist() == second["close"].tolist()
+        assert handler.count(".zip") == 1
+
+    def test_rest_fallback_fetches_chunks(self, tmp_path):
+        handler = FakeBinance()
+        start = DAY
+        end = DAY + timedelta(minutes=2499)
+
+        async def run():
+            async with _manager(tmp_path, handler, use_cache=False) as manager:
+                return await manager.get_data("BTCUSDT", start, end, Interval.MINUTE_1, columns=["close"])
+
+        df = asyncio.run(run())
+        assert len(df) == 2499
+        assert list(df.columns) == ["close", "_data_source"]
+        assert df.index.name == "open_time"
+        assert set(df["_data_source"]) == {"REST"}
+        assert handler.count("/klines") == 3
+
+    def test_compact_schema_profile(self, tmp_path):
+        handler = FakeBinance(vision_days=[DAY])
+
+        async def run():
+            async with _manager(tmp_path, handler) as manager:
+                return [
+                    await manager.get_data("BTCUSDT", DAY, DAY + timedelta(hours=23), Interval.HOUR_1, schema_profile="compact", **kwargs)
+                    for kwargs in ({}, {"return_polars": True})
+                ]
+
+        pandas_df, polars_df = asyncio.run(run())
+        assert pandas_df["close"].dtype == "float32"
+        assert str(pandas_df.index.dtype) == "datetime64[ms, UTC]"
+        assert isinstance(pandas_df["_data_source"].dtype, pd.CategoricalDtype)
+        assert str(polars_df.schema["close"]) == "Float32"
+        assert polars_df.schema["_data_source"].categories.to_list() == ["UNKNOWN", "VISION", "CACHE", "REST"]
+
+    def test_rate_limit_keeps_the_cached_rows(self, tmp_path):
+        handler = FakeBinance(vision_days=[DAY])
+
+        async def rate_limited(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/klines"):
+                return httpx.Response(429, headers={"Retry-After": "1"})
+            return await handler(request)
+
+        async def run():
+            async with _manager(tmp_path, handler) as manager:
+                await manager.get_data("BTCUSDT", DAY, DAY + timedelta(days=1), Interval.HOUR_1)
+            async with _manager(tmp_path, rate_limited) as manager:
+                return await manager.get_data("BTCUSDT", DAY, DAY + timedelta(days=2), Interval.HOUR_1, dtype_backend="pyarrow")
+
+        df = asyncio.run(run())
+        assert df.attrs["_rate_limited"]
+        assert len(df) == 48
+        assert df["close"].iloc[:24].tolist() == [100.5] * 24
+        assert df["close"].iloc[24:].isna().all()
+
+    def test_get_data_many_shares_day_downloads(self, tmp_path):
+        handler = FakeBinance(vision_days=[DAY], delay=0.05)
+
+        async def run():
+            async with _manager(tmp_path, handler, use_cache=False) as manager:
+                same = await asyncio.gather(
+                    *(manager.get_data("BTCUSDT", DAY, DAY + timedelta(hours=23), Interval.HOUR_1) for _ in range(10))
+                )
+                many = await manager.get_data_many(["BTCUSDT", "ETHUSDT"], DAY, DAY + timedelta(hours=23), Interval.HOUR_1)
+            return same, many
+
+        same, many = asyncio.run(run())
+        assert all(len(df) == 23 for df in same)
+        assert handler.count(".zip") == 3  # one shared download for the 10 calls, one per symbol after
+        assert sorted(many) == ["BTCUSDT", "ETHUSDT"]
+
+    def test_invalid_symbol(self, tmp_path):
+        async def run():
+            async with _manager(tmp_path, FakeBinance()) as manager:
+                await manager.get_data("../ETC", DAY, DAY + timedelta(hours=1), Interval.HOUR_1)
+
+        with pytest.raises(RuntimeError, match="invalid characters"):
+            asyncio.run(run())
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """REST scheduler on a fake clock; async pauses are recorded and advance it."""
+    from ckvd.utils.for_core import rest_scheduler
+
+    clock = [datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp()]
+    sleeps: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr(rest_scheduler.time, "time", lambda: clock[0])
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return clock, sleeps
+
+
+def _reject_chunk(start_ms: int, handler: FakeBinance, times: int = 1_000):
+    """Handler answering the REST chunk starting at ``start_ms`` with 429 ``times`` times."""
+    rejected = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/klines") and int(request.url.params["startTime"]) == start_ms and len(rejected) < times:
+            rejected.append(start_ms)
+            return httpx.Response(429, headers={"Retry-After": "7"})
+        return await handler(request)
+
+    return handle
+
+
+class TestRestRateLimitOptions:
+    """The wrapped manager's wait_on_rate_limit and rest_resume_dir apply to async REST."""
+
+    START_MS = int(DAY.timestamp() * 1000)
+    SECOND_CHUNK_MS = START_MS + 1000 * 60_000
+
+    def _get(self, tmp_path, handler, **kwargs):
+        async def run():
+            async with _manager(tmp_path, handler, use_cache=False, **kwargs) as manager:
+                return await manager.get_data("BTCUSDT", DAY, DAY + timedelta(minutes=2499), Interval.MINUTE_1)
+
+        return asyncio.run(run())
+
+    def test_wait_on_rate_limit_retries_the_rejected_chunk(self, tmp_path, fake_clock):
+        _, sleeps = fake_clock
+        handler = FakeBinance()
+
+        df = self._get(tmp_path, _reject_chunk(self.SECOND_CHUNK_MS, handler, times=1), wait_on_rate_limit=True)
+
+        assert "_rate_limited" not in df.attrs
+        assert len(df) == 2499
+        assert handler.count("/klines") == 3  # plus the rejected request
+        assert sleeps == [7.0]
+
+    def test_resume_token_skips_fetched_chunks(self, tmp_path, fake_clock):
+        clock, _ = fake_clock
+        resume_dir = tmp_path / "resume"
+        first = FakeBinance()
+
+        partial = self._get(tmp_path, _reject_chunk(self.SECOND_CHUNK_MS, first), rest_resume_dir=resume_dir)
+
+        assert partial.attrs["_rate_limited"]
+        assert partial["close"].notna().sum() == 1000  # rows up to the rejected chunk
+        assert len(list(resume_dir.iterdir())) == 1
+
+        clock[0] += 60  # the Retry-After block is over
+        second = FakeBinance()
+        df = self._get(tmp_path, second, rest_resume_dir=resume_dir)
+
+        assert df["close"].notna().sum() == 2499
+        assert sorted(int(r.url.params["startTime"]) for r in second.requests) == [
+            self.SECOND_CHUNK_MS,
+            self.SECOND_CHUNK_MS + 1000 * 60_000,
+        ]
+        assert not list(resume_dir.iterdir())
+
+
+class TestCancellation:
+    """Cancelling a request cancels its downloads."""
+
+    def test_cancel_in_flight_request(self, tmp_path):
+        handler = FakeBinance(vision_days=[DAY], delay=30)
+
+        async def run():
+            async with _manager(tmp_path, handler, use_cache=False) as manager:
+                task = asyncio.create_task(manager.get_data("BTCUSDT", DAY, DAY + timedelta(days=2), Interval.HOUR_1))
+                await asyncio.sleep(0.2)
+                assert manager._day_downloads
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                await asyncio.sleep(0.05)
+                # The downloads nobody waits for any more are gone before aclose()
+                assert not manager._day_downloads
+                assert not [other for other in asyncio.all_tasks() if other is not asyncio.current_task() and not other.done()]
+
+        asyncio.run(asyncio.wait_for(run(), timeout=5))
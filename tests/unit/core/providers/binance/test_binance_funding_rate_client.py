@@ -0,0 +1,46 @@
+"""Tests for BinanceFundingRateClient's cache reuse.
+
+The API call (``_fetch_funding_rate``) is mocked; the UnifiedCacheManager
+cache under tmp_path runs for real.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from ckvd.core.providers.binance.binance_funding_rate_client import BinanceFundingRateClient
+from ckvd.utils.market_constraints import Interval, MarketType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _rates(_symbol: str, start_time: datetime, end_time: datetime) -> pd.DataFrame:
+    """Funding rates every 8h in [start_time, end_time)."""
+    times = pd.date_range(start_time, end_time, freq="8h", inclusive="left")
+    return pd.DataFrame({"symbol": "BTCUSDT", "funding_time": times, "funding_rate": 0.0001, "interval": "8h"})
+
+
+@pytest.fixture
+def client(tmp_path):
+    with BinanceFundingRateClient("BTCUSDT", Interval.HOUR_8, MarketType.FUTURES_USDT, cache_dir=tmp_path) as funding_client:
+        yield funding_client
+
+
+class TestFundingCache:
+    def test_cached_range_is_reused(self, client):
+        with patch.object(client, "_fetch_funding_rate", side_effect=_rates) as api:
+            client.fetch("BTCUSDT", "8h", BASE, BASE + timedelta(days=2))
+            df = client.fetch("BTCUSDT", "8h", BASE + timedelta(hours=8), BASE + timedelta(days=1))
+
+        assert api.call_count == 1
+        assert df["funding_time"].min() == BASE + timedelta(hours=8)
+
+    def test_longer_range_than_cached_is_refetched(self, client):
+        with patch.object(client, "_fetch_funding_rate", side_effect=_rates) as api:
+            client.fetch("BTCUSDT", "8h", BASE, BASE + timedelta(days=1))
+            df = client.fetch("BTCUSDT", "8h", BASE, BASE + timedelta(days=3))
+
+        assert api.call_count == 2
+        assert len(df) == 9
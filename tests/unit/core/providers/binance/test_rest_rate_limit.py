@@ -187,3 +187,151 @@ class TestPartialChunksOnRateLimit:
         assert isinstance(df, pd.DataFrame)
         assert len(df) > 0
         assert "_rate_limited" not in df.attrs
+
+
+@pytest.fixture
+def fresh_schedulers(tmp_path):
+    """Isolated per-host schedulers on a fake clock; pauses are recorded and advance the clock."""
+    from ckvd.utils.for_core import rest_scheduler
+
+    clock = [datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp()]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    with (
+        patch.dict(rest_scheduler._SCHEDULERS, clear=True),
+        patch.object(rest_scheduler, "get_cache_dir", return_value=tmp_path),
+        patch.object(rest_scheduler.time, "time", side_effect=lambda: clock[0]),
+        patch.object(rest_scheduler.time, "sleep", side_effect=sleep),
+    ):
+        yield sleeps
+
+
+def _ninety_days_side_effect(fail_at: set[int]):
+    """fetch_chunk stand-in returning 10 rows per call and a 429 on the given call numbers."""
+    base_ms = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    calls = []
+
+    def _side_effect(_client, _endpoint, params, *_args):
+        calls.append(params["startTime"])
+        if len(calls) in fail_at:
+            raise RateLimitError(retry_after=7)
+        return [_make_kline_row(params["startTime"] + i * 3600000) for i in range(10)]
+
+    return _side_effect, calls, base_ms
+
+
+class TestWaitOnRateLimit:
+    """wait_on_rate_limit=True pauses and resumes the rejected chunk."""
+
+    @patch("ckvd.core.providers.binance.rest_data_client.fetch_chunk")
+    @patch("ckvd.core.providers.binance.rest_data_client.create_optimized_client")
+    def test_pauses_for_retry_after_and_completes(self, mock_create_client, mock_fetch_chunk, fresh_schedulers):
+        mock_create_client.return_value = MagicMock()
+        side_effect, calls, _ = _ninety_days_side_effect(fail_at={2})
+        mock_fetch_chunk.side_effect = side_effect
+
+        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            df = rest_client.fetch("BTCUSDT", "1h", start_time, start_time + timedelta(days=90), wait_on_rate_limit=True)
+
+        assert "_rate_limited" not in df.attrs
+        assert len(df) == 30  # 3 chunks of 10 rows
+        assert calls[1] == calls[2]  # the rejected chunk was fetched again
+        assert fresh_schedulers == [7.0]
+
+    @patch("ckvd.core.providers.binance.rest_data_client.fetch_chunk")
+    @patch("ckvd.core.providers.binance.rest_data_client.create_optimized_client")
+    def test_gives_up_after_max_waits(self, mock_create_client, mock_fetch_chunk, fresh_schedulers):
+        from ckvd.utils.config import REST_MAX_RATE_LIMIT_WAITS
+
+        mock_create_client.return_value = MagicMock()
+        side_effect, _, _ = _ninety_days_side_effect(fail_at=set(range(2, 100)))
+        mock_fetch_chunk.side_effect = side_effect
+
+        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            df = rest_client.fetch("BTCUSDT", "1h", start_time, start_time + timedelta(days=90), wait_on_rate_limit=True)
+
+        assert df.attrs.get("_rate_limited") is True
+        assert len(fresh_schedulers) == REST_MAX_RATE_LIMIT_WAITS
+
+    @patch("ckvd.core.providers.binance.rest_data_client.create_optimized_client")
+    def test_long_ban_raises_without_sleeping(self, mock_create_client, fresh_schedulers):
+        from ckvd.utils.for_core.rest_scheduler import get_rest_scheduler
+
+        client = mock_create_client.return_value = MagicMock()
+        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            get_rest_scheduler(rest_client._endpoint).record_rate_limit(3600)  # 418 ban from another worker
+            for wait_on_rate_limit in (False, True):
+                with pytest.raises(RateLimitError):
+                    rest_client.fetch("BTCUSDT", "1h", start_time, start_time + timedelta(days=90), wait_on_rate_limit=wait_on_rate_limit)
+
+        client.get.assert_not_called()
+        assert fresh_schedulers == []
+
+
+class TestResumeToken:
+    """resume_token persists completed chunks across runs."""
+
+    @patch("ckvd.core.providers.binance.rest_data_client.fetch_chunk")
+    @patch("ckvd.core.providers.binance.rest_data_client.create_optimized_client")
+    def test_restart_fetches_only_remaining_chunks(self, mock_create_client, mock_fetch_chunk, tmp_path):
+        mock_create_client.return_value = MagicMock()
+        token = tmp_path / "resume.jsonl"
+        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end_time = start_time + timedelta(days=90)
+
+        side_effect, first_calls, _ = _ninety_days_side_effect(fail_at={2})
+        mock_fetch_chunk.side_effect = side_effect
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            partial = rest_client.fetch("BTCUSDT", "1h", start_time, end_time, resume_token=token)
+        assert partial.attrs.get("_rate_limited") is True
+        assert token.exists()
+
+        side_effect, second_calls, _ = _ninety_days_side_effect(fail_at=set())
+        mock_fetch_chunk.side_effect = side_effect
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            df = rest_client.fetch("BTCUSDT", "1h", start_time, end_time, resume_token=token)
+
+        assert len(df) == 30
+        assert first_calls[0] not in second_calls
+        assert len(second_calls) == 2
+        assert not token.exists()
+
+    @patch("ckvd.core.providers.binance.rest_data_client.fetch_chunk")
+    @patch("ckvd.core.providers.binance.rest_data_client.create_optimized_client")
+    def test_token_for_other_request_is_ignored(self, mock_create_client, mock_fetch_chunk, tmp_path):
+        mock_create_client.return_value = MagicMock()
+        token = tmp_path / "resume.jsonl"
+        start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        side_effect, _, _ = _ninety_days_side_effect(fail_at={2})
+        mock_fetch_chunk.side_effect = side_effect
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            rest_client.fetch("ETHUSDT", "1h", start_time, start_time + timedelta(days=90), resume_token=token)
+
+        side_effect, calls, _ = _ninety_days_side_effect(fail_at=set())
+        mock_fetch_chunk.side_effect = side_effect
+        with RestDataClient(market_type=MarketType.SPOT) as rest_client:
+            df = rest_client.fetch("BTCUSDT", "1h", start_time, start_time + timedelta(days=90), resume_token=token)
+
+        assert len(calls) == 3
+        assert len(df) == 30
+
+
+class TestManagerRateLimitOptions:
+    """The manager's REST rate-limit options are accepted by create() as well as __init__."""
+
+    def test_create_forwards_rate_limit_options(self, tmp_path):
+        from ckvd import CryptoKlineVisionData, DataProvider
+
+        with CryptoKlineVisionData.create(
+            DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path, wait_on_rate_limit=True, rest_resume_dir=str(tmp_path / "resume")
+        ) as manager:
+            assert manager.wait_on_rate_limit is True
+            assert manager.rest_resume_dir == tmp_path / "resume"
@@ -0,0 +1,140 @@
+"""Unit tests for Arrow-backed pandas output (get_data(dtype_backend="pyarrow")).
+
+Tests:
+1. Cache-backed get_data() returns pd.ArrowDtype columns indexed by open_time
+2. auto_reindex=False trims to the exact requested range
+3. include_source_info / columns are honoured without the NumPy path
+4. Rows no source step tagged still come back Arrow-backed
+5. The cache step finds missing ranges without a NumPy-backed copy
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.core.sync.ckvd_types import DataSource, FCPRequest
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+from ckvd.utils.internal.polars_pipeline import PolarsDataPipeline
+from ckvd.utils.market_constraints import ChartType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Test Data Fixtures
+# =============================================================================
+
+
+def _make_day(day_start, close=100.5):
+    """One full day of 1h klines."""
+    times = pd.DatetimeIndex([day_start + timedelta(hours=i) for i in range(24)], tz="UTC")
+    n = len(times)
+    return pd.DataFrame(
+        {
+            "open_time": times,
+            "open": [100.0] * n,
+            "high": [101.0] * n,
+            "low": [99.0] * n,
+            "close": [close] * n,
+            "volume": [10.0] * n,
+            "close_time": times + pd.Timedelta(milliseconds=3_599_999),
+            "quote_asset_volume": [1000.0] * n,
+            "count": [7] * n,
+            "taker_buy_volume": [5.0] * n,
+            "taker_buy_quote_volume": [500.0] * n,
+        }
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory holding one full day of BTCUSDT 1h data."""
+    assert save_to_cache(_make_day(BASE), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+    return tmp_path
+
+
+def _get(cache_dir, start=BASE, end=BASE + timedelta(days=1), **kwargs):
+    manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+    return manager.get_data(
+        "BTCUSDT",
+        start,
+        end,
+        Interval.HOUR_1,
+        enforce_source=DataSource.CACHE,
+        dtype_backend="pyarrow",
+        **kwargs,
+    )
+
+
+# =============================================================================
+# get_data(dtype_backend="pyarrow")
+# =============================================================================
+
+
+class TestArrowBackedGetData:
+    """Tests for the Arrow-backed pandas output mode."""
+
+    def test_dtype_contract(self, cache_dir):
+        df = _get(cache_dir)
+
+        assert df.index.name == "open_time"
+        assert str(df.index.dtype) == "timestamp[us, tz=UTC][pyarrow]"
+        assert str(df["close"].dtype) == "double[pyarrow]"
+        assert str(df["count"].dtype) == "int64[pyarrow]"
+        assert str(df["close_time"].dtype) == "timestamp[us, tz=UTC][pyarrow]"
+        assert len(df) == 24
+
+    def test_exact_range_without_reindex(self, cache_dir):
+        df = _get(cache_dir, start=BASE + timedelta(hours=2), end=BASE + timedelta(hours=5), auto_reindex=False)
+
+        # Cache scans treat end_time as exclusive (02:00, 03:00, 04:00)
+        assert len(df) == 3
+        assert df.index[0] == pd.Timestamp(BASE + timedelta(hours=2))
+
+    def test_source_info_and_projection(self, cache_dir):
+        df = _get(cache_dir, auto_reindex=False, include_source_info=False, columns=["close"])
+
+        assert list(df.columns) == ["close"]
+        assert isinstance(df["close"].dtype, pd.ArrowDtype)
+
+    def test_untracked_rows_keep_the_arrow_schema(self, cache_dir):
+        end = BASE + timedelta(hours=3)
+        times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(3)], tz="UTC")
+        result_df = pd.DataFrame({"open_time": times, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 3.0})
+        request = FCPRequest(
+            "BTCUSDT", BASE, end, BASE, end, Interval.HOUR_1, ChartType.KLINES, auto_reindex=False, dtype_backend="pyarrow"
+        )
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+
+        df = manager._finalize_result(request, result_df, PolarsDataPipeline(), [])
+
+        assert len(df) == 3
+        assert str(df.index.dtype) == "timestamp[us, tz=UTC][pyarrow]"
+        assert str(df["close"].dtype) == "double[pyarrow]"
+        assert str(df["_data_source"].dtype) == "large_string[pyarrow]"
+
+    def test_cache_coverage_skips_the_numpy_copy(self, cache_dir, monkeypatch):
+        def no_numpy_copy(self, *args, **kwargs):
+            raise AssertionError("collect_pandas called on the pyarrow path")
+
+        requested = []
+
+        def fake_rest(symbol, start_time, end_time, interval, columns=None):
+            requested.append((start_time, end_time))
+            return _make_day(BASE + timedelta(days=1), close=200.5)
+
+        monkeypatch.setattr(PolarsDataPipeline, "collect_pandas", no_numpy_copy)
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+        monkeypatch.setattr(manager, "_fetch_from_vision", lambda *args, **kwargs: pd.DataFrame())
+        monkeypatch.setattr(manager, "_fetch_from_rest", fake_rest)
+
+        df = manager.get_data("BTCUSDT", BASE, BASE + timedelta(days=2), Interval.HOUR_1, dtype_backend="pyarrow", include_source_info=True)
+
+        assert [start for start, _ in requested] == [BASE + timedelta(days=1)]
+        assert len(df) == 48
+        assert df["close"].tolist() == [100.5] * 24 + [200.5] * 24
+        assert df["_data_source"].tolist() == ["CACHE"] * 24 + ["REST"] * 24
@@ -0,0 +1,211 @@
+"""Tests for the cache backfill engine and ``ckvd backfill``.
+
+Network access is replaced by a fake day fetcher; planning, the bounded
+fetch/write pools, cache writes, checkpoints and the CLI run for real.
+"""
+
+import json
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from ckvd import Interval, MarketType
+from ckvd.cli import main
+from ckvd.core.sync.backfill import BackfillEngine, BackfillTask
+from ckvd.utils.cache.index import CacheIndex
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+from ckvd.utils.for_core.rest_exceptions import RateLimitError, RestAPIError
+from ckvd.utils.for_core.vision_exceptions import VisionAPIError
+
+START = date(2024, 1, 15)
+END = date(2024, 1, 17)
+
+
+def _make_day(day: date, interval_hours: int = 1) -> pd.DataFrame:
+    """A full day of klines."""
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    times = [start + timedelta(hours=interval_hours * i) for i in range(24 // interval_hours)]
+    return pd.DataFrame({"open_time": pd.DatetimeIndex(times), "open": 1.0, "close": 2.0, "volume": 3.0})
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine on a temporary cache root."""
+    with BackfillEngine(MarketType.SPOT, tmp_path, download_workers=3, write_workers=2) as engine:
+        yield engine
+
+
+class TestPlan:
+    """Grid planning."""
+
+    def test_grid(self, engine):
+        plan = engine.plan(["btcusdt", "ETHUSDT"], [Interval.HOUR_1, "1m"], START, END)
+        assert plan.grid_size == 12
+        assert len(plan.tasks) == 12
+        assert plan.tasks[0] == BackfillTask("BTCUSDT", "1h", START)
+
+    def test_skips_fully_cached_days(self, engine, tmp_path):
+        save_to_cache(_make_day(START), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        save_to_cache(_make_day(END).iloc[:12], "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)  # partial day
+
+        plan = engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, END)
+        assert [task.day for task in plan.tasks] == [date(2024, 1, 16), END]
+        assert plan.cached == 1
+        assert len(engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, END, force=True).tasks) == 3
+
+    def test_rejects_invalid_ranges(self, engine):
+        with pytest.raises(ValueError):
+            engine.plan(["BTCUSDT"], [Interval.HOUR_1], END, START)
+        with pytest.raises(ValueError):
+            engine.plan(["BTCUSDT"], [Interval.WEEK_1], START, END)
+
+
+class TestRun:
+    """Running a plan."""
+
+    def test_run_caches_checkpoints_and_resumes(self, engine, tmp_path, monkeypatch):
+        def fake_fetch(task):
+            if task.day == date(2024, 1, 16):
+                return pd.DataFrame(), "VISION"
+            if task.day == END:
+                raise OSError("connection reset")
+            return _make_day(task.day), "VISION"
+
+        monkeypatch.setattr(engine, "_fetch_day", fake_fetch)
+        report = engine.run(engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, END))
+
+        assert (report.completed, report.empty, report.failed) == (1, 1, 1)
+        assert report.rows == 24
+        assert report.bytes_written > 0
+        assert report.failures[0][0].day == END
+        assert "1 failed" in report.summary()
+
+        entries = CacheIndex.for_cache_dir(tmp_path).get_entries(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1)
+        assert [entry.date for entry in entries] == ["2024-01-15"]
+
+        lines = [json.loads(line) for line in engine.checkpoint.path.read_text().splitlines()]
+        assert sorted(line["status"] for line in lines) == ["done", "empty", "failed"]
+
+        resumed = engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, END)
+        assert [task.day for task in resumed.tasks] == [END]
+        assert (resumed.cached, resumed.checkpointed) == (1, 1)
+        assert len(engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, END, resume=False).tasks) == 2
+
+    def test_rest_tail_and_rate_limited_days_are_refetched_on_resume(self, engine, monkeypatch):
+        today = datetime.now(timezone.utc).date()
+
+        def fake_fetch(task):
+            df = _make_day(task.day).iloc[:6]  # REST only reaches "now" / stopped at the rate limit
+            if task.day != today:
+                df.attrs["_rate_limited"] = True
+            return df, "REST"
+
+        monkeypatch.setattr(engine, "_fetch_day", fake_fetch)
+        report = engine.run(engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, START))
+        report_today = engine.run(engine.plan(["BTCUSDT"], [Interval.HOUR_1], today, today))
+
+        assert (report.completed, report_today.completed) == (1, 1)
+        lines = [json.loads(line) for line in engine.checkpoint.path.read_text().splitlines()]
+        assert [line["status"] for line in lines] == ["partial", "partial"]
+        assert [task.day for task in engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, START).tasks] == [START]
+        assert [task.day for task in engine.plan(["BTCUSDT"], [Interval.HOUR_1], today, today).tasks] == [today]
+
+    def test_rate_limit_stops_the_run_and_keeps_finished_days(self, tmp_path, monkeypatch):
+        def fake_fetch(task):
+            if task.day == date(2024, 1, 16):
+                raise RateLimitError(retry_after=60)
+            return _make_day(task.day), "VISION"
+
+        with BackfillEngine(MarketType.SPOT, tmp_path, download_workers=1, write_workers=1, max_pending=1) as engine:
+            monkeypatch.setattr(engine, "_fetch_day", fake_fetch)
+            plan = engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, date(2024, 1, 20))
+            report = engine.run(plan)
+
+            assert (report.completed, report.failed, report.finished) == (1, 1, 2)
+            assert (report.rate_limited, report.retry_after) == (True, 60)
+            assert "stopped early by the REST rate limit (retry after 60s)" in report.summary()
+            statuses = {line["key"]: line["status"] for line in map(json.loads, engine.checkpoint.path.read_text().splitlines())}
+            assert statuses == {"SPOT/BTCUSDT/1h/2024-01-15": "done", "SPOT/BTCUSDT/1h/2024-01-16": "failed"}
+
+            resumed = engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, date(2024, 1, 20))
+            assert [task.day for task in resumed.tasks] == [date(2024, 1, 16 + i) for i in range(5)]
+
+    def test_api_errors_fail_only_their_day(self, engine, monkeypatch):
+        def fake_fetch(task):
+            if task.day == START:
+                raise VisionAPIError("checksum mismatch")
+            if task.day == END:
+                raise RestAPIError("HTTP 500")
+            return _make_day(task.day), "VISION"
+
+        monkeypatch.setattr(engine, "_fetch_day", fake_fetch)
+        report = engine.run(engine.plan(["BTCUSDT"], [Interval.HOUR_1], START, END))
+
+        assert (report.completed, report.failed, report.rate_limited) == (1, 2, False)
+
+    def test_pending_days_are_bounded(self, tmp_path, monkeypatch):
+        in_flight = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def fake_fetch(task):
+            with lock:
+                in_flight.append(task)
+                peak[0] = max(peak[0], len(in_flight))
+            time.sleep(0.02)
+            return _make_day(task.day), "VISION"
+
+        def fake_write(task, df, source):
+            time.sleep(0.02)
+            with lock:
+                in_flight.remove(task)
+            return len(df), 1
+
+        with BackfillEngine(MarketType.SPOT, tmp_path, download_workers=4, write_workers=1, max_pending=2) as engine:
+            monkeypatch.setattr(engine, "_fetch_day", fake_fetch)
+            monkeypatch.setattr(engine, "_write_day", fake_write)
+            report = engine.run(engine.plan(["BTCUSDT", "ETHUSDT"], [Interval.HOUR_1], START, END))
+
+        assert report.completed == 6
+        assert peak[0] <= 2
+
+
+class TestCli:
+    """``ckvd backfill`` command line."""
+
+    def test_dry_run(self, tmp_path, capsys):
+        code = main(
+            [
+                *["backfill", "--symbols", "BTCUSDT,ETHUSDT", "--intervals", "1h", "--from", "2024-01-15", "--to", "2024-01-17"],
+                *["--cache-dir", str(tmp_path), "--dry-run"],
+            ]
+        )
+        assert code == 0
+        assert "6 of 6 days to fetch" in capsys.readouterr().out
+
+    def test_invalid_interval(self, tmp_path, capsys):
+        code = main(
+            [
+                *["backfill", "--symbols", "BTCUSDT", "--intervals", "7x", "--from", "2024-01-15", "--to", "2024-01-17"],
+                *["--cache-dir", str(tmp_path)],
+            ]
+        )
+        assert code == 2
+        assert "ckvd backfill:" in capsys.readouterr().out
+
+    def test_rate_limit_returns_the_partial_report(self, tmp_path, capsys, monkeypatch):
+        def fake_fetch(self, task):
+            raise RateLimitError(retry_after=60)
+
+        monkeypatch.setattr(BackfillEngine, "_fetch_day", fake_fetch)
+        code = main(
+            [
+                *["backfill", "--symbols", "BTCUSDT", "--intervals", "1h", "--from", "2024-01-15", "--to", "2024-01-17"],
+                *["--cache-dir", str(tmp_path), "--download-workers", "1", "--max-pending", "1"],
+            ]
+        )
+        assert code == 1
+        assert "stopped early by the REST rate limit" in capsys.readouterr().out
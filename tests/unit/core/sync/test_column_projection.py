@@ -0,0 +1,197 @@
+"""Unit tests for column projection (get_data(columns=...)).
+
+Tests the projection path end to end:
+1. resolve_columns() / project_columns() - validation and selection helpers
+2. get_cache_lazyframes() - projection pushed into the IPC scan
+3. PolarsDataPipeline.collect_polars() - projection on the lazy plan
+4. process_kline_data() - REST projection before the pandas conversion
+5. get_data() - cache-backed request returning only the requested columns
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.core.sync.ckvd_types import DataSource
+from ckvd.utils.dataframe_utils import project_columns, resolve_columns
+from ckvd.utils.for_core.ckvd_cache_utils import get_cache_lazyframes, save_to_cache
+from ckvd.utils.for_core.rest_data_processing import process_kline_data
+from ckvd.utils.internal.polars_pipeline import PolarsDataPipeline
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Test Data Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def full_day_df():
+    """One day of 1h klines with every standard column."""
+    times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(24)], tz="UTC")
+    return pd.DataFrame(
+        {
+            "open_time": times,
+            "open": [100.0 + i for i in range(24)],
+            "high": [101.0 + i for i in range(24)],
+            "low": [99.0 + i for i in range(24)],
+            "close": [100.5 + i for i in range(24)],
+            "volume": [10.0 + i for i in range(24)],
+            "close_time": times + pd.Timedelta(milliseconds=3_599_999),
+            "quote_asset_volume": [1000.0 + i for i in range(24)],
+            "count": list(range(24)),
+            "taker_buy_volume": [5.0 + i for i in range(24)],
+            "taker_buy_quote_volume": [500.0 + i for i in range(24)],
+        }
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, full_day_df):
+    """Cache directory holding one full day of BTCUSDT 1h data."""
+    assert save_to_cache(full_day_df, "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+    return tmp_path
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+class TestResolveColumns:
+    """Tests for projection validation."""
+
+    def test_none_means_all_columns(self):
+        assert resolve_columns(None) is None
+
+    def test_open_time_always_first(self):
+        assert resolve_columns(["close", "volume"]) == ["open_time", "close", "volume"]
+
+    def test_duplicates_and_explicit_open_time(self):
+        assert resolve_columns(["close", "open_time", "close"]) == ["open_time", "close"]
+
+    def test_single_string(self):
+        assert resolve_columns("close") == ["open_time", "close"]
+
+    def test_unknown_column_raises(self):
+        with pytest.raises(ValueError, match="Unknown columns"):
+            resolve_columns(["close", "vwap"])
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError, match="must not be empty"):
+            resolve_columns([])
+
+
+class TestProjectColumns:
+    """Tests for DataFrame projection."""
+
+    def test_keeps_requested_order_and_source(self, full_day_df):
+        df = full_day_df.assign(_data_source="CACHE")
+        result = project_columns(df, ["open_time", "volume", "close"])
+        assert list(result.columns) == ["open_time", "volume", "close", "_data_source"]
+
+    def test_none_is_identity(self, full_day_df):
+        assert project_columns(full_day_df, None) is full_day_df
+
+
+# =============================================================================
+# Pushdown into readers
+# =============================================================================
+
+
+class TestCacheScanProjection:
+    """Tests for projection in get_cache_lazyframes()."""
+
+    def test_scan_only_reads_requested_columns(self, cache_dir):
+        lfs = get_cache_lazyframes(
+            symbol="BTCUSDT",
+            start_time=BASE,
+            end_time=BASE + timedelta(days=1),
+            interval=Interval.HOUR_1,
+            cache_dir=cache_dir,
+            market_type=MarketType.SPOT,
+            columns=["open_time", "close"],
+        )
+
+        assert len(lfs) == 1
+        assert lfs[0].collect_schema().names() == ["open_time", "close", "_data_source"]
+        assert len(lfs[0].collect()) == 24
+
+
+class TestPipelineProjection:
+    """Tests for PolarsDataPipeline collection with a projection."""
+
+    def test_collect_polars_projects(self, full_day_df):
+        pipeline = PolarsDataPipeline().add_pandas(full_day_df, "VISION")
+
+        result = pipeline.collect_polars(columns=["open_time", "volume"])
+
+        assert result.columns == ["open_time", "volume", "_data_source"]
+        assert isinstance(result, pl.DataFrame)
+
+
+class TestRestProjection:
+    """Tests for projection in process_kline_data()."""
+
+    def test_process_kline_data_projects_before_conversion(self):
+        raw = [[1705276800000, "1", "2", "0.5", "1.5", "10", 1705280399999, "15", 7, "4", "6", "0"]]
+
+        result = process_kline_data(raw, columns=["open_time", "close"])
+
+        assert list(result.columns) == ["open_time", "close"]
+        assert result["close"].iloc[0] == 1.5
+
+
+# =============================================================================
+# get_data()
+# =============================================================================
+
+
+class TestGetDataColumns:
+    """Tests for get_data(columns=...)."""
+
+    def test_cache_hit_returns_projection(self, cache_dir):
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+
+        df = manager.get_data(
+            "BTCUSDT",
+            BASE,
+            BASE + timedelta(days=1),
+            Interval.HOUR_1,
+            enforce_source=DataSource.CACHE,
+            columns=["volume", "close"],
+        )
+
+        assert df.index.name == "open_time"
+        assert list(df.columns) == ["volume", "close", "_data_source"]
+        assert len(df) == 24
+        assert df["close"].iloc[0] == 100.5
+
+    def test_polars_output_projection(self, cache_dir):
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+
+        df = manager.get_data(
+            "BTCUSDT",
+            BASE,
+            BASE + timedelta(days=1),
+            Interval.HOUR_1,
+            enforce_source=DataSource.CACHE,
+            include_source_info=False,
+            return_polars=True,
+            columns=["close"],
+        )
+
+        assert df.columns[:2] == ["open_time", "close"]
+        assert "volume" not in df.columns
+
+    def test_unknown_column_rejected_before_fetching(self, cache_dir):
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+
+        with pytest.raises(ValueError, match="Unknown columns"):
+            manager.get_data("BTCUSDT", BASE, BASE + timedelta(days=1), Interval.HOUR_1, columns=["vwap"])
@@ -0,0 +1,187 @@
+"""Unit tests for the compact output profile (get_data(schema_profile="compact")).
+
+Tests:
+1. Polars, NumPy-backed pandas and Arrow-backed pandas outputs use compact dtypes
+2. Compact values match the standard profile at float32 precision
+3. compact_dataframe() keeps reindexed gaps as float32 NaN
+4. Compact and Polars outputs skip the Float64 pandas intermediate (peak memory)
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import gc
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.core.sync import crypto_kline_vision_data
+from ckvd.core.sync.ckvd_types import DataSource, FCPRequest
+from ckvd.utils.dataframe_utils import compact_dataframe
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+from ckvd.utils.internal.polars_pipeline import PolarsDataPipeline
+from ckvd.utils.market_constraints import ChartType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory holding one full day of BTCUSDT 1h data."""
+    times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(24)], tz="UTC")
+    n = len(times)
+    df = pd.DataFrame(
+        {
+            "open_time": times,
+            "open": [42000.5 + i for i in range(n)],
+            "high": [42100.0] * n,
+            "low": [41900.0] * n,
+            "close": [42050.25 + i for i in range(n)],
+            "volume": [10.125] * n,
+            "close_time": times + pd.Timedelta(milliseconds=3_599_999),
+            "quote_asset_volume": [1000.0] * n,
+            "count": [7] * n,
+            "taker_buy_volume": [5.0] * n,
+            "taker_buy_quote_volume": [500.0] * n,
+        }
+    )
+    assert save_to_cache(df, "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def minute_cache_dir(tmp_path):
+    """Cache directory holding three full days of BTCUSDT 1m data."""
+    for day in range(3):
+        times = pd.date_range(BASE + timedelta(days=day), periods=1440, freq="1min")
+        values = np.arange(len(times), dtype=np.float64)
+        df = pd.DataFrame(
+            {
+                "open_time": times,
+                "open": values,
+                "high": values + 1,
+                "low": values - 1,
+                "close": values + 0.5,
+                "volume": values * 2,
+                "close_time": times + pd.Timedelta(milliseconds=59_999),
+                "quote_asset_volume": values * 3,
+                "count": np.arange(len(times)),
+                "taker_buy_volume": values,
+                "taker_buy_quote_volume": values * 1.5,
+            }
+        )
+        assert save_to_cache(df, "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+    return tmp_path
+
+
+def _peak_bytes(manager, **kwargs):
+    """Peak Python/NumPy allocation of one 3-day 1m get_data() call."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        manager.get_data("BTCUSDT", BASE, BASE + timedelta(days=3), Interval.MINUTE_1, enforce_source=DataSource.CACHE, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _get(cache_dir, end=BASE + timedelta(days=1), **kwargs):
+    manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+    return manager.get_data("BTCUSDT", BASE, end, Interval.HOUR_1, enforce_source=DataSource.CACHE, **kwargs)
+
+
+class TestCompactGetData:
+    """Tests for the compact output profile."""
+
+    def test_polars_output(self, cache_dir):
+        df = _get(cache_dir, return_polars=True, schema_profile="compact")
+
+        assert df.schema["open_time"] == pl.Datetime("ms", "UTC")
+        assert df.schema["close_time"] == pl.Datetime("ms", "UTC")
+        assert df.schema["close"] == pl.Float32
+        assert df.schema["count"] == pl.Int32
+        assert isinstance(df.schema["_data_source"], pl.Enum)
+        assert df.height == 24
+
+    def test_numpy_pandas_output(self, cache_dir):
+        df = _get(cache_dir, schema_profile="compact")
+
+        assert df["close"].dtype == np.float32
+        assert df["count"].dtype == np.int32
+        assert str(df["close_time"].dtype) == "datetime64[ms, UTC]"
+        assert df["_data_source"].dtype == _get(cache_dir, schema_profile="compact", return_polars=True)["_data_source"].to_pandas().dtype
+        assert df["_data_source"].dtype.ordered  # same as the Polars Enum
+        assert set(df["_data_source"]) == {"CACHE"}
+
+    def test_arrow_pandas_output(self, cache_dir):
+        df = _get(cache_dir, dtype_backend="pyarrow", schema_profile="compact")
+
+        assert str(df.index.dtype) == "timestamp[ms, tz=UTC][pyarrow]"
+        assert str(df["close"].dtype) == "float[pyarrow]"
+        assert str(df["count"].dtype) == "int32[pyarrow]"
+
+    def test_values_match_the_standard_profile(self, cache_dir):
+        standard = _get(cache_dir, return_polars=True)
+        compact = _get(cache_dir, return_polars=True, schema_profile="compact")
+
+        assert compact["open_time"].dt.epoch("ms").to_list() == standard["open_time"].dt.epoch("ms").to_list()
+        np.testing.assert_allclose(compact["close"].to_numpy(), standard["close"].to_numpy(), rtol=1e-7)
+        assert compact.estimated_size() < standard.estimated_size()
+
+    def test_reindexed_gaps_keep_float_counts(self):
+        times = pd.DatetimeIndex([BASE, BASE + timedelta(hours=1)], name="open_time")
+        df = pd.DataFrame({"close": [1.0, np.nan], "count": [7.0, np.nan], "_data_source": ["CACHE", np.nan]}, index=times)
+
+        compact = compact_dataframe(df)
+
+        assert compact["count"].dtype == np.float32
+        assert str(compact.index.dtype) == "datetime64[ms, UTC]"
+        assert compact["_data_source"].dtype == pd.CategoricalDtype(["UNKNOWN", "VISION", "CACHE", "REST"], ordered=True)
+        assert df["close"].dtype == np.float64  # input is not modified
+
+    def test_reindexed_pipeline_output_keeps_compact_dtypes(self, cache_dir):
+        end = BASE + timedelta(hours=6)
+        request = FCPRequest("BTCUSDT", BASE, end, BASE, end, Interval.HOUR_1, ChartType.KLINES, schema_profile="compact")
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir)
+        times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(3)], tz="UTC")
+        pipeline = PolarsDataPipeline(schema_profile="compact").add_pandas(
+            pd.DataFrame({"open_time": times, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 3.0, "count": 7}), "CACHE"
+        )
+
+        df = manager._finalize_result(request, pd.DataFrame({"open_time": times}), pipeline, [])
+
+        assert len(df) == 6
+        assert str(df.index.dtype) == "datetime64[ms, UTC]"
+        assert df["close"].dtype == np.float32
+        assert df["count"].dtype == np.float32  # gaps are NaN
+        assert df["close"].isna().sum() == 3
+
+
+class TestCompactMemory:
+    """The compact and Polars outputs never build the Float64 pandas frame."""
+
+    def test_no_float64_standardization(self, minute_cache_dir, monkeypatch):
+        def no_standardization(*args, **kwargs):
+            raise AssertionError("standardize_columns called for a pipeline output")
+
+        monkeypatch.setattr(crypto_kline_vision_data, "standardize_columns", no_standardization)
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=minute_cache_dir)
+
+        for kwargs in ({"schema_profile": "compact"}, {"return_polars": True}, {"return_polars": True, "schema_profile": "compact"}):
+            df = manager.get_data("BTCUSDT", BASE, BASE + timedelta(days=3), Interval.MINUTE_1, enforce_source=DataSource.CACHE, **kwargs)
+            assert len(df) == 3 * 1440
+
+    def test_peak_memory_below_the_standard_pandas_path(self, minute_cache_dir):
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=minute_cache_dir)
+        _peak_bytes(manager)  # warm up imports and caches
+
+        standard = _peak_bytes(manager)
+
+        # The Float64 frame alone is about half of the standard path's peak
+        assert _peak_bytes(manager, schema_profile="compact") < 0.6 * standard
+        assert _peak_bytes(manager, return_polars=True, schema_profile="compact") < 0.6 * standard
@@ -0,0 +1,136 @@
+"""Tests for the hive-partitioned Parquet export and ``ckvd export``.
+
+Cache files are written with the real cache writer; the export, manifest and
+CLI run for real against temporary directories.
+"""
+
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import Interval, MarketType
+from ckvd.cli import main
+from ckvd.core.sync.export import export_parquet_dataset, partition_path
+from ckvd.utils.config import EXPORT_MANIFEST_FILENAME
+from ckvd.utils.for_core.ckvd_cache_utils import find_cache_files, save_to_cache
+
+START = date(2024, 1, 15)
+END = date(2024, 1, 16)
+
+
+def _make_day(day: date, close: float = 2.0) -> pd.DataFrame:
+    """A full day of 1h klines."""
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    times = [start + timedelta(hours=i) for i in range(24)]
+    return pd.DataFrame({"open_time": pd.DatetimeIndex(times), "open": 1.0, "close": close, "volume": 3.0})
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache root holding two days of BTCUSDT and one of ETHUSDT 1h klines."""
+    root = tmp_path / "cache"
+    for day in (START, END):
+        assert save_to_cache(_make_day(day), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, root)
+    assert save_to_cache(_make_day(START), "ETHUSDT", Interval.HOUR_1, MarketType.SPOT, root)
+    return root
+
+
+def _export(cache_dir, output, **kwargs):
+    return export_parquet_dataset(output, ["BTCUSDT", "ETHUSDT"], [Interval.HOUR_1], START, END, MarketType.SPOT, cache_dir, **kwargs)
+
+
+class TestExport:
+    """Partition layout and incremental runs."""
+
+    def test_writes_hive_partitions(self, cache_dir, tmp_path):
+        output = tmp_path / "dataset"
+
+        report = _export(cache_dir, output)
+
+        assert (report.exported, report.skipped, report.failed) == (3, 0, 0)
+        assert (output / partition_path(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1, "2024-01-16")).exists()
+        dataset = pl.scan_parquet(output / "**/*.parquet", hive_partitioning=True).collect()
+        assert len(dataset) == 72
+        assert dataset.group_by("symbol").len().sort("symbol").rows() == [("BTCUSDT", 48), ("ETHUSDT", 24)]
+        assert dataset["date"].cast(pl.String).unique().sort().to_list() == ["2024-01-15", "2024-01-16"]
+
+    def test_rerun_skips_unchanged_partitions(self, cache_dir, tmp_path):
+        output = tmp_path / "dataset"
+        _export(cache_dir, output)
+
+        report = _export(cache_dir, output)
+
+        assert (report.exported, report.skipped) == (0, 3)
+
+    def test_changed_source_is_reexported(self, cache_dir, tmp_path):
+        output = tmp_path / "dataset"
+        _export(cache_dir, output)
+        [(_, source)] = find_cache_files(
+            "BTCUSDT",
+            datetime(2024, 1, 16, tzinfo=timezone.utc),
+            datetime(2024, 1, 16, tzinfo=timezone.utc),
+            Interval.HOUR_1,
+            cache_dir,
+            MarketType.SPOT,
+        )
+        assert save_to_cache(_make_day(END, close=5.0), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, cache_dir)
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        report = _export(cache_dir, output)
+
+        assert (report.exported, report.skipped) == (1, 2)
+        updated = pl.read_parquet(output / partition_path(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1, "2024-01-16"))
+        assert updated["close"].unique().to_list() == [5.0]
+
+    def test_force_and_missing_output_rewrite(self, cache_dir, tmp_path):
+        output = tmp_path / "dataset"
+        _export(cache_dir, output)
+        (output / partition_path(MarketType.SPOT, "ETHUSDT", Interval.HOUR_1, "2024-01-15")).unlink()
+
+        assert _export(cache_dir, output).exported == 1
+        assert _export(cache_dir, output, force=True).exported == 3
+
+    def test_market_types_share_a_root(self, cache_dir, tmp_path):
+        output = tmp_path / "dataset"
+        assert save_to_cache(_make_day(START, close=7.0), "BTCUSDT", Interval.HOUR_1, MarketType.FUTURES_USDT, cache_dir)
+        _export(cache_dir, output)
+
+        report = export_parquet_dataset(output, ["BTCUSDT"], [Interval.HOUR_1], START, END, MarketType.FUTURES_USDT, cache_dir)
+
+        assert (report.exported, report.skipped) == (1, 0)
+        spot = pl.read_parquet(output / partition_path(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1, "2024-01-15"))
+        futures = pl.read_parquet(output / partition_path(MarketType.FUTURES_USDT, "BTCUSDT", Interval.HOUR_1, "2024-01-15"))
+        assert (spot["close"].unique().to_list(), futures["close"].unique().to_list()) == ([2.0], [7.0])
+        assert _export(cache_dir, output).skipped == 3
+
+    def test_no_temporary_files_left(self, cache_dir, tmp_path):
+        output = tmp_path / "dataset"
+        _export(cache_dir, output)
+
+        leftovers = [p for p in output.rglob("*") if p.is_file() and p.suffix != ".parquet"]
+        assert leftovers == [output / EXPORT_MANIFEST_FILENAME]
+
+
+class TestCli:
+    """``ckvd export`` wiring."""
+
+    def test_export_command(self, cache_dir, tmp_path, capsys):
+        output = tmp_path / "dataset"
+        argv = ["export", "--symbols", "BTCUSDT,ETHUSDT", "--intervals", "1h", "--from", "2024-01-15", "--to", "2024-01-16"]
+        argv += ["--output", str(output), "--cache-dir", str(cache_dir)]
+
+        assert main(argv) == 0
+        assert "3 partitions exported" in capsys.readouterr().out
+        assert main(argv) == 0
+        assert "0 partitions exported, 3 unchanged" in capsys.readouterr().out
+
+    def test_invalid_interval(self, cache_dir, tmp_path, capsys):
+        argv = ["export", "--symbols", "BTCUSDT", "--intervals", "7m", "--from", "2024-01-15", "--to", "2024-01-16"]
+        argv += ["--output", str(tmp_path / "dataset"), "--cache-dir", str(cache_dir)]
+
+        assert main(argv) == 2
+        assert "ckvd export" in capsys.readouterr().out
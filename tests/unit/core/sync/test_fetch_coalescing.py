@@ -0,0 +1,105 @@
+"""Tests for coalescing concurrent Vision fetches of the same days.
+
+Ten threads asking CryptoKlineVisionData for the same uncached day should
+produce one Vision download and one cache write; the other threads wait on
+the day's advisory lock and then read the cached file.
+
+Related: tests/stress/test_concurrent_ckvd.py
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _make_day(start: datetime) -> pd.DataFrame:
+    """One day of hourly klines."""
+    return pd.DataFrame(
+        {
+            "open_time": pd.DatetimeIndex([start + timedelta(hours=i) for i in range(24)]),
+            "open": [42000.0 + i for i in range(24)],
+            "close": [42050.0 + i for i in range(24)],
+            "volume": [1000.0 + i for i in range(24)],
+        }
+    )
+
+
+class TestVisionFetchCoalescing:
+    """Concurrent identical Vision fetches share one download and cache write."""
+
+    def test_threads_share_one_fetch(self, tmp_path):
+        mgr = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path)
+        downloads = []
+
+        def fake_fetch_from_vision(**kwargs):
+            downloads.append(kwargs["symbol"])
+            time.sleep(0.3)
+            df = _make_day(BASE)
+            kwargs["save_to_cache_func"](df.copy(), kwargs["symbol"], kwargs["interval"], source="VISION")
+            df["_data_source"] = "VISION"
+            return df
+
+        results = [None] * 10
+        barrier = threading.Barrier(10)
+
+        def worker(i):
+            barrier.wait()
+            results[i] = mgr._fetch_from_vision("BTCUSDT", BASE, BASE + timedelta(hours=23), Interval.HOUR_1)
+
+        with patch("ckvd.core.sync.crypto_kline_vision_data.fetch_from_vision", side_effect=fake_fetch_from_vision):
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=30)
+
+        assert downloads == ["BTCUSDT"]
+        assert all(len(df) == 24 for df in results)
+        assert sorted(df["_data_source"].iloc[0] for df in results) == ["CACHE"] * 9 + ["VISION"]
+        mgr.close()
+
+    def test_long_ranges_are_locked_in_day_batches(self, tmp_path):
+        from ckvd.utils.cache import single_flight
+        from ckvd.utils.config import VISION_LOCK_BATCH_DAYS
+
+        mgr = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path)
+        batches = []
+        lock_counts = []
+        real_locks = single_flight.cache_file_locks
+
+        def counting_locks(cache_dir, paths, timeout=None):
+            lock_counts.append(len(paths))
+            return real_locks(cache_dir, paths, timeout)
+
+        def fake_fetch_from_vision(**kwargs):
+            batches.append((kwargs["start_time"], kwargs["end_time"]))
+            day = kwargs["start_time"].replace(hour=0)
+            return pd.concat([_make_day(day + timedelta(days=i)) for i in range((kwargs["end_time"] - day).days + 1)])
+
+        end = BASE + timedelta(days=20, hours=23)
+        with (
+            patch("ckvd.core.sync.crypto_kline_vision_data.fetch_from_vision", side_effect=fake_fetch_from_vision),
+            patch.object(single_flight, "cache_file_locks", side_effect=counting_locks),
+        ):
+            df = mgr._fetch_from_vision("BTCUSDT", BASE, end, Interval.HOUR_1)
+
+        assert lock_counts == [VISION_LOCK_BATCH_DAYS] * 3
+        assert batches[0] == (BASE, BASE + timedelta(days=VISION_LOCK_BATCH_DAYS) - timedelta(hours=1))
+        assert batches[-1][1] == end
+        assert len(df) == 21 * 24
+        mgr.close()
+
+    def test_no_locking_without_cache(self, tmp_path):
+        mgr = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path, use_cache=False)
+        with patch("ckvd.core.sync.crypto_kline_vision_data.fetch_from_vision", return_value=_make_day(BASE)) as fetch:
+            mgr._fetch_from_vision("BTCUSDT", BASE, BASE + timedelta(hours=23), Interval.HOUR_1)
+        fetch.assert_called_once()
+        assert not (tmp_path / ".locks").exists()
+        mgr.close()
@@ -0,0 +1,100 @@
+"""Tests for CryptoKlineVisionData.get_data_with_funding() and join_funding_asof().
+
+Klines come from the cache and funding rates from a mocked
+BinanceFundingRateClient, so the as-of join runs without network access.
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, DataSource, Interval, MarketType
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+from ckvd.utils.for_core.ckvd_funding_utils import join_funding_asof
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _hourly_klines(hours: int = 24) -> pd.DataFrame:
+    times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(hours)])
+    return pd.DataFrame({"open_time": times, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0})
+
+
+def _funding(symbol: str, start: datetime, rates: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "symbol": symbol,
+            "funding_time": pd.DatetimeIndex([start + timedelta(hours=8 * i) for i in range(len(rates))]),
+            "funding_rate": rates,
+            "interval": "8h",
+        }
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        assert save_to_cache(_hourly_klines(), symbol, Interval.HOUR_1, MarketType.FUTURES_USDT, tmp_path)
+    mgr = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.FUTURES_USDT, cache_dir=tmp_path)
+    yield mgr
+    mgr.close()
+
+
+class TestJoinFundingAsof:
+    def test_each_bar_gets_the_latest_rate_at_or_before_it(self):
+        klines = pl.DataFrame(
+            {"open_time": [BASE + timedelta(hours=h) for h in (0, 7, 8, 9)], "symbol": "BTCUSDT", "close": [1.0, 2.0, 3.0, 4.0]}
+        )
+        funding = pl.from_pandas(_funding("BTCUSDT", BASE - timedelta(hours=8), [0.1, 0.2, 0.3]).drop(columns="interval"))
+
+        joined = join_funding_asof(klines, funding)
+
+        assert joined["funding_rate"].to_list() == [0.2, 0.2, 0.3, 0.3]
+        assert joined["funding_time"][0] == BASE
+
+    def test_bars_before_any_funding_get_null(self):
+        klines = pl.DataFrame({"open_time": [BASE, BASE + timedelta(hours=9)], "symbol": "BTCUSDT"})
+        funding = pl.from_pandas(_funding("BTCUSDT", BASE + timedelta(hours=8), [0.5]).drop(columns="interval"))
+
+        assert join_funding_asof(klines, funding)["funding_rate"].to_list() == [None, 0.5]
+
+
+class TestGetDataWithFunding:
+    @patch("ckvd.core.sync.crypto_kline_vision_data.BinanceFundingRateClient")
+    def test_joins_cached_klines_with_funding_per_symbol(self, funding_client_cls, manager):
+        funding_client = MagicMock()
+        funding_client.fetch.side_effect = lambda symbol, **_: _funding(
+            symbol, BASE - timedelta(hours=8), [0.1, 0.2, 0.3, 0.4] if symbol == "BTCUSDT" else [-0.1, -0.2, -0.3, -0.4]
+        )
+        funding_client_cls.return_value = funding_client
+
+        df = manager.get_data_with_funding(
+            ["btcusdt", "ETHUSDT"], BASE, BASE + timedelta(days=1), Interval.HOUR_1, enforce_source=DataSource.CACHE
+        )
+
+        assert funding_client_cls.call_count == 1  # one funding client for all symbols
+        assert funding_client.fetch.call_args.kwargs["start_time"] == BASE - timedelta(hours=8)
+        assert df.height == 48
+        assert df["symbol"].unique(maintain_order=True).to_list() == ["BTCUSDT", "ETHUSDT"]
+        btc = df.filter(pl.col("symbol") == "BTCUSDT")
+        assert btc["funding_rate"].to_list() == [0.2] * 8 + [0.3] * 8 + [0.4] * 8
+        assert set(df["_data_source"].to_list()) == {"CACHE"}
+
+    @patch("ckvd.core.sync.crypto_kline_vision_data.BinanceFundingRateClient")
+    def test_no_funding_leaves_rates_null(self, funding_client_cls, manager):
+        funding_client_cls.return_value.fetch.return_value = pd.DataFrame()
+
+        df = manager.get_data_with_funding("BTCUSDT", BASE, BASE + timedelta(hours=4), Interval.HOUR_1, enforce_source=DataSource.CACHE)
+
+        assert df.height == 4
+        assert df["funding_rate"].null_count() == 4
+
+    def test_spot_market_is_rejected(self, tmp_path):
+        with CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path) as spot:
+            with pytest.raises(ValueError, match="futures"):
+                spot.get_data_with_funding("BTCUSDT", BASE, BASE + timedelta(hours=4), Interval.HOUR_1)
@@ -0,0 +1,163 @@
+"""Unit tests for the streaming iterators (iter_data / iter_data_many).
+
+Tests:
+1. split_time_range() - UTC-aligned slicing and batch validation
+2. iter_data() - one Polars frame per slice, prefetch window, early close
+3. iter_data_many() - per-slice symbol dictionaries
+4. iter_data() over a cache-backed range end to end
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.core.sync.ckvd_types import DataSource
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+from ckvd.utils.for_core.ckvd_time_range_utils import split_time_range
+
+BASE = datetime(2024, 1, 15, tzinfo=timezone.utc)
+
+
+def _slice_frame(symbol: str, start: datetime, end: datetime, *_args, **_kwargs) -> pl.DataFrame:
+    """Stand-in for get_data: one row per hour of the slice."""
+    hours = int((end - start) / timedelta(hours=1))
+    return pl.DataFrame({"open_time": [start + timedelta(hours=i) for i in range(hours)], "symbol": [symbol] * hours})
+
+
+@pytest.fixture
+def manager():
+    manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT)
+    yield manager
+    manager.close()
+
+
+class TestSplitTimeRange:
+    def test_slices_align_to_utc_days_and_clip(self):
+        slices = split_time_range(BASE + timedelta(hours=6), BASE + timedelta(days=2, hours=3), "1D", Interval.HOUR_1)
+
+        assert slices == [
+            (BASE + timedelta(hours=6), BASE + timedelta(days=1)),
+            (BASE + timedelta(days=1), BASE + timedelta(days=2)),
+            (BASE + timedelta(days=2), BASE + timedelta(days=2, hours=3)),
+        ]
+
+    def test_accepts_timedelta(self):
+        assert len(split_time_range(BASE, BASE + timedelta(days=1), timedelta(hours=6), Interval.MINUTE_1)) == 4
+
+    @pytest.mark.parametrize("batch", ["0D", "90min"])
+    def test_rejects_batch_not_multiple_of_interval(self, batch):
+        with pytest.raises(ValueError, match="multiple"):
+            split_time_range(BASE, BASE + timedelta(days=1), batch, Interval.HOUR_1)
+
+
+class TestIterData:
+    def test_yields_one_polars_frame_per_slice(self, manager):
+        with patch.object(manager, "get_data", side_effect=_slice_frame) as get_data:
+            frames = list(manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=3), Interval.HOUR_1, columns=["close"]))
+
+        assert [len(frame) for frame in frames] == [24, 24, 24]
+        assert pl.concat(frames)["open_time"].is_sorted()
+        for call in get_data.call_args_list:
+            assert call.kwargs == {"columns": ["close"], "return_polars": True}
+
+    def test_skips_empty_slices(self, manager):
+        def sparse(symbol, start, end, *args, **kwargs):
+            return pl.DataFrame() if start.day == 16 else _slice_frame(symbol, start, end)
+
+        with patch.object(manager, "get_data", side_effect=sparse):
+            frames = list(manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=3), Interval.HOUR_1))
+
+        assert len(frames) == 2
+
+    def test_next_slice_is_fetched_while_consuming(self, manager):
+        second_started = threading.Event()
+
+        def fetch(symbol, start, end, *args, **kwargs):
+            if start == BASE + timedelta(days=1):
+                second_started.set()
+            return _slice_frame(symbol, start, end)
+
+        with patch.object(manager, "get_data", side_effect=fetch):
+            frames = manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=3), Interval.HOUR_1)
+            next(frames)
+            assert second_started.wait(timeout=5)
+            frames.close()
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_slices_held_are_bounded_by_prefetch(self, manager, prefetch):
+        lock = threading.Lock()
+        outstanding = 0
+        peak = 0
+
+        def fetch(symbol, start, end, *args, **kwargs):
+            nonlocal outstanding, peak
+            with lock:
+                outstanding += 1
+                peak = max(peak, outstanding)
+            return _slice_frame(symbol, start, end)
+
+        with patch.object(manager, "get_data", side_effect=fetch):
+            for _frame in manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=10), Interval.HOUR_1, prefetch=prefetch):
+                with lock:
+                    outstanding -= 1
+
+        assert peak <= prefetch + 1
+
+    def test_early_close_stops_fetching(self, manager):
+        with patch.object(manager, "get_data", side_effect=_slice_frame) as get_data:
+            for _frame in manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=30), Interval.HOUR_1, prefetch=2):
+                break
+
+        assert get_data.call_count <= 3
+
+    def test_rejects_negative_prefetch(self, manager):
+        with pytest.raises(ValueError, match="prefetch"):
+            next(manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=1), Interval.HOUR_1, prefetch=-1))
+
+
+class TestIterDataMany:
+    def test_yields_symbol_frames_per_slice(self, manager):
+        with patch.object(manager, "get_data", side_effect=_slice_frame):
+            batches = list(manager.iter_data_many(["BTCUSDT", "ETHUSDT"], BASE, BASE + timedelta(days=2), Interval.HOUR_1))
+
+        assert len(batches) == 2
+        for batch in batches:
+            assert list(batch) == ["BTCUSDT", "ETHUSDT"]
+            assert batch["ETHUSDT"]["symbol"].unique().to_list() == ["ETHUSDT"]
+
+
+class TestIterDataFromCache:
+    def test_streams_cached_days(self, tmp_path):
+        for day in range(2):
+            times = pd.date_range(BASE + timedelta(days=day), periods=24, freq="1h", tz="UTC")
+            df = pd.DataFrame(
+                {
+                    "open_time": times,
+                    "open": 1.0,
+                    "high": 1.0,
+                    "low": 1.0,
+                    "close": float(day),
+                    "volume": 1.0,
+                    "close_time": times + pd.Timedelta(milliseconds=3_599_999),
+                    "quote_asset_volume": 1.0,
+                    "count": 1,
+                    "taker_buy_volume": 1.0,
+                    "taker_buy_quote_volume": 1.0,
+                }
+            )
+            assert save_to_cache(df, "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+
+        manager = CryptoKlineVisionData(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path)
+        frames = list(manager.iter_data("BTCUSDT", BASE, BASE + timedelta(days=2), Interval.HOUR_1, enforce_source=DataSource.CACHE))
+        manager.close()
+
+        assert [len(frame) for frame in frames] == [24, 24]
+        assert all(isinstance(frame, pl.DataFrame) for frame in frames)
+        assert [frame["close"].unique().to_list() for frame in frames] == [[0.0], [1.0]]
@@ -0,0 +1,130 @@
+"""Tests for CryptoKlineVisionData.get_panel() and build_panel().
+
+Panels are built from klines saved to a temporary cache, so the lazy scans,
+streaming collect and scatter onto the time grid run without network access.
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, Interval, MarketType
+from ckvd.core.sync.panel import PanelMatrix, build_panel
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _klines(start: datetime, minutes: int, close: float) -> pd.DataFrame:
+    times = pd.DatetimeIndex([start + timedelta(minutes=i) for i in range(minutes)])
+    return pd.DataFrame(
+        {"open_time": times, "open": 1.0, "high": 1.0, "low": 1.0, "close": [close + i for i in range(minutes)], "volume": 1.0}
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    # BTCUSDT: two full days; ETHUSDT: the first 10 minutes of day two only
+    assert save_to_cache(_klines(BASE, 1440, 100.0), "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+    assert save_to_cache(_klines(BASE + timedelta(days=1), 1440, 200.0), "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+    assert save_to_cache(_klines(BASE + timedelta(days=1), 10, 5.0), "ETHUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+    return tmp_path
+
+
+class TestBuildPanel:
+    def test_symbols_are_aligned_on_the_time_grid(self, cache_dir):
+        start = BASE + timedelta(days=1) - timedelta(minutes=2)
+        panel = build_panel(
+            ["BTCUSDT", "ethusdt"],
+            "close",
+            start,
+            start + timedelta(minutes=5),
+            Interval.MINUTE_1,
+            cache_dir,
+            MarketType.SPOT,
+            as_numpy=True,
+        )
+
+        assert isinstance(panel, PanelMatrix)
+        assert panel.symbols == ("BTCUSDT", "ETHUSDT")
+        assert panel.matrix.shape == (5, 2)
+        assert panel.matrix.flags["C_CONTIGUOUS"]
+        assert panel.times[0] == np.datetime64(start.replace(tzinfo=None), "ms")
+        np.testing.assert_array_equal(panel.matrix[:, 0], [1538.0, 1539.0, 200.0, 201.0, 202.0])
+        np.testing.assert_array_equal(panel.matrix[:, 1], [np.nan, np.nan, 5.0, 6.0, 7.0])
+
+    def test_polars_output_has_a_column_per_symbol(self, cache_dir):
+        df = build_panel(["BTCUSDT", "ETHUSDT"], "close", BASE, BASE + timedelta(days=2), Interval.MINUTE_1, cache_dir, MarketType.SPOT)
+
+        assert df.columns == ["open_time", "BTCUSDT", "ETHUSDT"]
+        assert df.height == 2880
+        assert str(df.schema["open_time"].time_zone) == "UTC"
+        assert df["ETHUSDT"].is_not_nan().sum() == 10
+
+    def test_float32_and_uncached_symbols(self, cache_dir):
+        panel = build_panel(
+            ["SOLUSDT"],
+            "volume",
+            BASE,
+            BASE + timedelta(hours=1),
+            Interval.MINUTE_1,
+            cache_dir,
+            MarketType.SPOT,
+            as_numpy=True,
+            dtype=np.float32,
+        )
+
+        assert panel.matrix.dtype == np.float32
+        assert np.isnan(panel.matrix).all()
+
+    def test_collects_one_narrow_frame_per_symbol(self, cache_dir, monkeypatch):
+        collected = []
+        collect = pl.LazyFrame.collect
+
+        def recording_collect(self, *args, **kwargs):
+            frame = collect(self, *args, **kwargs)
+            collected.append(frame.schema)
+            return frame
+
+        monkeypatch.setattr(pl.LazyFrame, "collect", recording_collect)
+        panel = build_panel(
+            ["BTCUSDT", "ETHUSDT"],
+            "close",
+            BASE,
+            BASE + timedelta(days=2),
+            Interval.MINUTE_1,
+            cache_dir,
+            MarketType.SPOT,
+            as_numpy=True,
+            dtype=np.float32,
+        )
+
+        assert [dict(schema) for schema in collected] == [{"row": pl.Int64, "value": pl.Float32}] * 2
+        assert panel.matrix[1440, 0] == 200.0
+        assert np.count_nonzero(~np.isnan(panel.matrix[:, 1])) == 10
+
+    @pytest.mark.parametrize(
+        ("symbols", "dtype", "match"),
+        [(["BTCUSDT", "btcusdt"], np.float64, "unique"), (["BTCUSDT"], np.int64, "float")],
+    )
+    def test_invalid_arguments(self, cache_dir, symbols, dtype, match):
+        with pytest.raises(ValueError, match=match):
+            build_panel(symbols, "close", BASE, BASE + timedelta(hours=1), Interval.MINUTE_1, cache_dir, MarketType.SPOT, dtype=dtype)
+
+
+class TestGetPanel:
+    def test_manager_reads_its_cache(self, cache_dir):
+        with CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir) as manager:
+            df = manager.get_panel(["BTCUSDT"], "close", BASE, BASE + timedelta(minutes=3))
+
+        assert df["BTCUSDT"].to_list() == [100.0, 101.0, 102.0]
+
+    def test_requires_the_cache(self, tmp_path):
+        with CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path, use_cache=False) as manager:
+            with pytest.raises(ValueError, match="use_cache"):
+                manager.get_panel(["BTCUSDT"], "close", BASE, BASE + timedelta(minutes=3))
@@ -0,0 +1,123 @@
+"""Tests for CryptoKlineVisionData.plan()/explain() and plan-driven get_data.
+
+The plan runs the FCP decisions (cache coverage, Vision freshness window,
+REST chunking and weight) without I/O, and get_data executes that plan.
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import attr
+import pandas as pd
+import pytest
+
+from ckvd import ChartType, CryptoKlineVisionData, DataProvider, DataSource, Interval, MarketType
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+from ckvd.core.sync.plan import _subtract_ranges
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def _make_klines(start: datetime, minutes: int) -> pd.DataFrame:
+    """``minutes`` consecutive 1m klines."""
+    times = pd.DatetimeIndex([start + timedelta(minutes=i) for i in range(minutes)])
+    return pd.DataFrame({"open_time": times, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0})
+
+
+@pytest.fixture
+def manager(tmp_path):
+    mgr = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=tmp_path)
+    yield mgr
+    mgr.close()
+
+
+class TestPlan:
+    def test_historical_range_is_planned_for_vision(self, manager):
+        plan = manager.plan("btcusdt", BASE, BASE + timedelta(days=3) - timedelta(minutes=1), Interval.MINUTE_1)
+
+        assert plan.request.symbol == "BTCUSDT"
+        assert (plan.read_cache, plan.use_vision, plan.use_rest) == (True, True, True)
+        assert plan.cache_files == ()
+        assert [day.isoformat() for day in plan.vision_days] == ["2024-01-15", "2024-01-16", "2024-01-17"]
+        assert plan.vision_fresh_days == ()
+        assert (plan.rest_chunks, plan.rest_weight) == (0, 0)
+        assert plan.estimated_seconds > 0
+
+    def test_recent_range_goes_to_rest(self, manager):
+        end = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        plan = manager.plan("BTCUSDT", end - timedelta(minutes=1500), end, Interval.MINUTE_1)
+
+        assert plan.vision_days
+        assert plan.vision_fresh_days == plan.vision_days  # all within the freshness window: expected 404
+        assert plan.rest_chunks == 2  # 1500 one-minute klines, 1000 per request
+        assert plan.rest_weight == 4  # spot klines cost 2 each
+
+    def test_cached_days_are_not_fetched(self, manager, tmp_path):
+        assert save_to_cache(_make_klines(BASE, 1440), "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+
+        plan = manager.plan("BTCUSDT", BASE, BASE + timedelta(days=2) - timedelta(minutes=1), Interval.MINUTE_1)
+
+        assert [day for day, _ in plan.cache_files] == ["2024-01-15"]
+        assert plan.missing_ranges == ((BASE + timedelta(days=1), BASE + timedelta(days=2) - timedelta(minutes=1)),)
+        assert [day.isoformat() for day in plan.vision_days] == ["2024-01-16"]
+
+    def test_partial_cache_day_leaves_the_rest_missing(self, manager, tmp_path):
+        assert save_to_cache(_make_klines(BASE, 600), "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+
+        plan = manager.plan("BTCUSDT", BASE, BASE + timedelta(hours=23), Interval.MINUTE_1)
+
+        assert plan.missing_ranges == ((BASE + timedelta(minutes=600), BASE + timedelta(hours=23)),)
+
+    def test_enforce_rest_skips_cache_and_vision(self, manager):
+        plan = manager.plan("BTCUSDT", BASE, BASE + timedelta(days=1), Interval.MINUTE_1, enforce_source=DataSource.REST)
+
+        assert (plan.read_cache, plan.use_vision, plan.use_rest) == (False, False, True)
+        assert plan.rest_chunks == 2
+        assert plan.vision_days == ()
+
+    def test_rejects_funding_rate(self, manager):
+        with pytest.raises(ValueError, match="FUNDING_RATE"):
+            manager.plan("BTCUSDT", BASE, BASE + timedelta(days=1), chart_type=ChartType.FUNDING_RATE)
+
+    def test_explain_lists_each_step(self, manager):
+        text = manager.explain("BTCUSDT", BASE, BASE + timedelta(days=1), Interval.MINUTE_1)
+
+        assert text.startswith("FCP plan for BTCUSDT 1m KLINES")
+        assert "1. Cache:" in text
+        assert "2. Vision: download 2 day(s)" in text
+        assert "3. REST:   nothing expected" in text
+        assert "Estimated time" in text
+
+
+class TestPlanExecution:
+    def test_get_data_runs_the_steps_of_its_plan(self, manager):
+        build_plan = manager._build_plan
+
+        def without_vision(request):
+            return attr.evolve(build_plan(request), use_vision=False)
+
+        rest_df = _make_klines(BASE, 60)
+        with (
+            patch.object(manager, "_build_plan", side_effect=without_vision) as planned,
+            patch.object(manager, "_fetch_from_vision") as vision,
+            patch.object(manager, "_fetch_from_rest", return_value=rest_df) as rest,
+        ):
+            df = manager.get_data("BTCUSDT", BASE, BASE + timedelta(hours=1), Interval.MINUTE_1, auto_reindex=False)
+
+        planned.assert_called_once()
+        vision.assert_not_called()
+        rest.assert_called_once()
+        assert len(df) == 60
+
+
+class TestSubtractRanges:
+    def test_gaps_between_covered_spans(self):
+        hour = timedelta(hours=1)
+        covered = [(BASE + hour, BASE + 2 * hour), (BASE + 3 * hour, BASE + 5 * hour)]
+
+        assert _subtract_ranges(BASE, BASE + 4 * hour, covered) == [(BASE, BASE + hour), (BASE + 2 * hour, BASE + 3 * hour)]
+
+    def test_fully_covered(self):
+        assert _subtract_ranges(BASE, BASE + timedelta(hours=1), [(BASE - timedelta(days=1), BASE + timedelta(days=1))]) == []
@@ -0,0 +1,153 @@
+"""Tests for the local data server (KlineServer / KlineClient / ckvd serve).
+
+The server runs in a background thread on a socket under tmp_path and serves
+klines from a temporary cache, so requests round-trip through the Unix socket
+and Arrow IPC without network access.
+
+ADR: docs/adr/2025-01-30-failover-control-protocol.md
+"""
+
+import io
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from ckvd import CryptoKlineVisionData, DataProvider, DataSource, Interval, MarketType
+from ckvd.cli import main
+from ckvd.core.sync.server import KlineClient, KlineServer, KlineServerError
+from ckvd.utils.for_core.ckvd_cache_utils import save_to_cache
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+END = BASE + timedelta(days=1)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Cache directory holding one full day of BTCUSDT 1h data."""
+    times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(24)])
+    df = pd.DataFrame({"open_time": times, "open": 1.0, "high": 2.0, "low": 0.5, "close": [100.0 + i for i in range(24)], "volume": 3.0})
+    assert save_to_cache(df, "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def server(tmp_path, cache_dir):
+    with KlineServer(tmp_path / "ckvd.sock", cache_dir, shm_dir=tmp_path) as running:
+        yield running
+
+
+def _client(server, **kwargs):
+    return KlineClient(DataProvider.BINANCE, MarketType.SPOT, socket_path=server.socket_path, **kwargs)
+
+
+class TestKlineClient:
+    def test_pandas_result_matches_the_manager(self, server, cache_dir):
+        df = _client(server).get_data("BTCUSDT", BASE, END, Interval.HOUR_1, enforce_source=DataSource.CACHE)
+
+        with CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir=cache_dir) as manager:
+            expected = manager.get_data("BTCUSDT", BASE, END, Interval.HOUR_1, enforce_source=DataSource.CACHE)
+        pd.testing.assert_frame_equal(df, expected, check_freq=False)  # index freq is not carried by Arrow
+
+    def test_polars_and_arrow_backed_results(self, server):
+        client = _client(server)
+
+        pl_df = client.get_data("BTCUSDT", BASE, END, Interval.HOUR_1, return_polars=True, columns=["close"], schema_profile="compact")
+        arrow_df = client.get_data("BTCUSDT", BASE, END, Interval.HOUR_1, dtype_backend="pyarrow", enforce_source=DataSource.CACHE)
+
+        assert pl_df.columns == ["open_time", "close", "_data_source"]
+        assert pl_df.schema["close"] == pl.Float32
+        assert str(arrow_df["close"].dtype) == "double[pyarrow]"
+        assert arrow_df.index.name == "open_time"
+
+    def test_shared_memory_result_is_mapped_and_unlinked(self, server, tmp_path):
+        df = _client(server, shared_memory=True).get_data("BTCUSDT", BASE, END, Interval.HOUR_1, return_polars=True)
+
+        assert df["close"].to_list() == [100.0 + i for i in range(24)]
+        assert not list(tmp_path.glob("ckvd-*.arrow"))
+
+    def test_invalid_arguments_raise_value_error(self, server):
+        with pytest.raises(ValueError, match="nope"):
+            _client(server).get_data("BTCUSDT", BASE, END, Interval.HOUR_1, columns=["nope"])
+
+    def test_failures_keep_the_server_error_type(self, server):
+        with pytest.raises(KlineServerError, match="must be before"):
+            _client(server).get_data("BTCUSDT", END, BASE, Interval.HOUR_1)
+
+    def test_concurrent_clients_share_one_manager(self, server):
+        client = _client(server)
+        results = []
+
+        def worker():
+            results.append(len(client.get_data("BTCUSDT", BASE, END, Interval.HOUR_1, return_polars=True)))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        assert results == [24] * 4
+        status = client.status()
+        assert status["managers"] == ["BINANCE/SPOT"]
+        assert status["requests"] == 5
+
+
+class TestKlineServer:
+    def test_stale_socket_is_replaced_and_removed_on_shutdown(self, tmp_path, cache_dir):
+        socket_path = tmp_path / "ckvd.sock"
+        socket_path.touch()
+
+        with KlineServer(socket_path, cache_dir) as server:
+            assert _client(server).status()["requests"] == 1
+
+        assert not socket_path.exists()
+
+    def test_refuses_a_socket_in_use(self, server, capsys):
+        assert main(["serve", "--socket", str(server.socket_path)]) == 1
+        assert "already listening" in capsys.readouterr().out
+
+    def test_undelivered_shared_memory_result_is_unlinked(self, server, tmp_path):
+        class ClosedConnection(io.BytesIO):
+            def write(self, _data):
+                raise BrokenPipeError("client gone")
+
+        request = {
+            "op": "get_data",
+            "provider": "BINANCE",
+            "market_type": "SPOT",
+            "symbol": "BTCUSDT",
+            "start_time": BASE.isoformat(),
+            "end_time": END.isoformat(),
+            "interval": "1h",
+            "shared_memory": True,
+            "options": {
+                "include_source_info": True,
+                "enforce_source": "CACHE",
+                "auto_reindex": True,
+                "return_polars": True,
+                "dtype_backend": "numpy",
+                "schema_profile": "standard",
+            },
+        }
+
+        with pytest.raises(BrokenPipeError):
+            server.respond(request, ClosedConnection())
+        assert not list(tmp_path.glob("ckvd-*.arrow"))
+
+    def test_stale_shared_memory_results_are_swept(self, tmp_path, cache_dir):
+        dead = tmp_path / "ckvd-999999999-0000-dead.arrow"
+        legacy = tmp_path / "ckvd-abc123.arrow"
+        other_server = tmp_path / f"ckvd-{os.getpid()}-ffff-live.arrow"
+        for path in (dead, legacy, other_server):
+            path.touch()
+
+        with KlineServer(tmp_path / "ckvd.sock", cache_dir, shm_dir=tmp_path) as server:
+            assert sorted(tmp_path.glob("ckvd-*.arrow")) == [other_server]
+            own = tmp_path / f"{server._shm_prefix}undelivered.arrow"
+            own.touch()
+
+        assert sorted(tmp_path.glob("ckvd-*.arrow")) == [other_server]
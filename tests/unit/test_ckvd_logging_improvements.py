@@ -197,6 +197,85 @@ class TestCleanLoggingUtilities:
             mock_httpx_logger.setLevel.assert_called_with(logging.WARNING)
 
 
+class TestLevelGatedLogging:
+    """Disabled levels cost neither formatting nor diagnostics."""
+
+    @pytest.fixture
+    def warning_level(self):
+        """Run at WARNING and restore the previous level afterwards."""
+        from ckvd.utils.loguru_setup import logger
+
+        previous = logger.getEffectiveLevel()
+        logger.configure_level("WARNING")
+        yield logger
+        logger.configure_level(previous)
+
+    def test_enabled_follows_level(self, warning_level):
+        assert not warning_level.enabled("DEBUG")
+        assert not warning_level.enabled("info")
+        assert warning_level.enabled("WARNING")
+        assert warning_level.enabled("ERROR")
+
+    def test_enabled_honours_extra_sinks(self, warning_level):
+        from ckvd.utils.loguru_setup import _loguru_logger
+
+        messages = []
+        sink_id = _loguru_logger.add(messages.append, level="DEBUG", format="{message}")
+        try:
+            assert warning_level.enabled("DEBUG")
+            warning_level.debug("rows={}", 3)
+        finally:
+            _loguru_logger.remove(sink_id)
+        assert [m.strip() for m in messages] == ["rows=3"]
+
+    def test_installed_loguru_exposes_min_level(self):
+        from ckvd.utils.loguru_setup import _LOGURU_CORE, _AlwaysEnabledCore, _loguru_logger
+
+        assert _LOGURU_CORE is _loguru_logger._core
+        assert not isinstance(_LOGURU_CORE, _AlwaysEnabledCore)
+
+    def test_missing_min_level_falls_back_to_always_enabled(self, warning_level, monkeypatch):
+        from ckvd.utils import loguru_setup
+
+        core = loguru_setup._resolve_loguru_core(MagicMock(_core=object()))
+        assert isinstance(core, loguru_setup._AlwaysEnabledCore)
+        monkeypatch.setattr(loguru_setup, "_LOGURU_CORE", core)
+
+        messages = []
+        sink_id = loguru_setup._loguru_logger.add(messages.append, level="INFO", format="{message}")
+        try:
+            assert warning_level.enabled("DEBUG")
+            warning_level.debug("dropped by loguru")
+            warning_level.info("rows={}", 3)
+        finally:
+            loguru_setup._loguru_logger.remove(sink_id)
+        assert [m.strip() for m in messages] == ["rows=3"]
+
+    def test_disabled_level_does_not_format_arguments(self, warning_level):
+        class Unformattable:
+            def __format__(self, spec):
+                raise AssertionError("formatted while DEBUG is disabled")
+
+            __str__ = __repr__ = __format__
+
+        warning_level.debug("value={}", Unformattable())
+        warning_level.info("value={}", Unformattable())
+
+    def test_merge_diagnostics_skipped_when_disabled(self, warning_level):
+        import pandas as pd
+
+        from ckvd.utils.for_core.ckvd_time_range_utils import merge_dataframes
+
+        times = pd.date_range("2024-01-01", periods=4, freq="1h", tz="UTC")
+        frames = [
+            pd.DataFrame({"open_time": times[:2], "close": 1.0, "_data_source": "CACHE"}),
+            pd.DataFrame({"open_time": times[2:], "close": 2.0, "_data_source": "REST"}),
+        ]
+        with patch.object(pd.Series, "value_counts", side_effect=AssertionError("diagnostics ran")):
+            merged = merge_dataframes(frames)
+        assert len(merged) == 4
+
+
 class TestBackwardCompatibility:
     """Test that existing code continues to work."""
 
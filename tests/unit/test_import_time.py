@@ -0,0 +1,67 @@
+"""Cold-import budget for ``ckvd``.
+
+Short-lived batch workers import the package on every launch, so the HTTP,
+S3 and Polars stacks are loaded on first use rather than at import or
+manager construction. Each check runs in a fresh interpreter.
+
+Profile with ``python scripts/dev/import_time_report.py``.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Loaded only once a client or the Polars pipeline is first used
+DEFERRED_MODULES = ["fsspec", "httpx", "polars", "requests", "tenacity"]
+
+# Generous wall-clock backstop (pandas alone is most of it); the module checks
+# are the precise regression guard. Override on slow machines.
+IMPORT_BUDGET_SECONDS = float(os.environ.get("CKVD_IMPORT_BUDGET_SECONDS", "2.0"))
+
+
+def _run_cold(code: str) -> dict:
+    """Run ``code`` in a fresh interpreter and return what it prints as JSON."""
+    probe = f"""
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": sorted(m for m in {DEFERRED_MODULES!r} if m in sys.modules)}}))
+"""
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestColdImport:
+    """Importing and constructing the manager stays cheap."""
+
+    def test_package_import_is_lazy(self):
+        assert _run_cold("import ckvd")["loaded"] == []
+
+    def test_manager_import_defers_heavy_dependencies(self):
+        assert _run_cold("from ckvd import CryptoKlineVisionData")["loaded"] == []
+
+    def test_manager_construction_builds_no_clients(self, tmp_path):
+        code = (
+            "from ckvd import CryptoKlineVisionData, DataProvider, MarketType\n"
+            f"manager = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir={str(tmp_path)!r})\n"
+            "manager.close()"
+        )
+        assert _run_cold(code)["loaded"] == []
+
+    def test_clients_are_built_on_first_access(self, tmp_path):
+        code = (
+            "from ckvd import CryptoKlineVisionData, DataProvider, MarketType\n"
+            f"manager = CryptoKlineVisionData.create(DataProvider.BINANCE, MarketType.SPOT, cache_dir={str(tmp_path)!r})\n"
+            "assert type(manager.rest_client).__name__ == 'RestDataClient'\n"
+            "manager.close()"
+        )
+        assert {"httpx", "requests"} <= set(_run_cold(code)["loaded"])
+
+    @pytest.mark.serial
+    def test_import_budget(self):
+        elapsed = min(_run_cold("from ckvd import CryptoKlineVisionData")["elapsed"] for _ in range(3))
+        assert elapsed < IMPORT_BUDGET_SECONDS, f"cold import took {elapsed:.2f}s (budget {IMPORT_BUDGET_SECONDS}s)"
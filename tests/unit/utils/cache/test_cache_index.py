@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""Unit tests for the unified SQLite cache index.
+
+Tests:
+1. CacheIndex schema, WAL mode, upserts and queries
+2. Migration of path-only legacy indexes
+3. rebuild_from_disk() / ckvd reindex for existing cache roots
+4. Writers recording files: save_to_cache, UnifiedCacheManager
+5. Readers using the index: ArrowCacheReader, get_cache_lazyframes
+"""
+
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+import ckvd.core  # noqa: F401 - loads core before utils (core <-> utils import cycle)
+from ckvd.cli import main
+from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
+from ckvd.core.providers.binance.vision_path_mapper import FSSpecVisionHandler
+from ckvd.utils.arrow_cache_reader import ArrowCacheReader
+from ckvd.utils.cache.compression import set_cache_compression
+from ckvd.utils.cache.index import CacheIndex, CacheIndexEntry
+from ckvd.utils.cache.validator import CacheValidator
+from ckvd.utils.config import CACHE_INDEX_FILENAME
+from ckvd.utils.for_core.ckvd_cache_utils import get_cache_lazyframes, save_to_cache
+from ckvd.utils.market_constraints import Interval, MarketType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Test Data Fixtures
+# =============================================================================
+
+
+def make_klines(days: int = 1) -> pd.DataFrame:
+    """Hourly klines starting at BASE."""
+    times = pd.DatetimeIndex([BASE + timedelta(hours=i) for i in range(24 * days)], tz="UTC")
+    return pd.DataFrame(
+        {
+            "open_time": times,
+            "open": [100.0 + i for i in range(len(times))],
+            "close": [100.5 + i for i in range(len(times))],
+            "volume": [float(i) for i in range(len(times))],
+        }
+    )
+
+
+def make_entry(day: str, market_type: str = "SPOT", symbol: str = "BTCUSDT") -> CacheIndexEntry:
+    """Index entry without a backing file."""
+    return CacheIndexEntry(
+        provider="BINANCE",
+        chart_type="KLINES",
+        market_type=market_type,
+        symbol=symbol,
+        interval="1h",
+        date=day,
+        path=f"/cache/{market_type}/{symbol}/{day}.arrow",
+        file_size=1000,
+        num_records=24,
+    )
+
+
+# =============================================================================
+# CacheIndex
+# =============================================================================
+
+
+class TestCacheIndex:
+    """Tests for the CacheIndex database."""
+
+    def test_wal_mode(self, tmp_path):
+        index = CacheIndex.for_cache_dir(tmp_path)
+        conn = index.connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+        assert index.db_path == tmp_path / CACHE_INDEX_FILENAME
+
+    def test_record_and_query_range(self, tmp_path):
+        index = CacheIndex.for_cache_dir(tmp_path)
+        assert index.record_files([make_entry(f"2024-01-{d:02d}") for d in range(10, 20)]) == 10
+
+        entries = index.get_entries(MarketType.SPOT, "btcusdt", Interval.HOUR_1, "2024-01-12", "2024-01-14")
+        assert [e.date for e in entries] == ["2024-01-12", "2024-01-13", "2024-01-14"]
+        assert index.get_entries(MarketType.FUTURES_USDT, "BTCUSDT", "1h") == []
+
+    def test_upsert_replaces_same_day(self, tmp_path):
+        index = CacheIndex.for_cache_dir(tmp_path)
+        index.record_files([make_entry("2024-01-15")])
+        index.record_files([replace(make_entry("2024-01-15"), num_records=12)])
+
+        entries = index.get_entries("SPOT", "BTCUSDT", "1h")
+        assert len(entries) == 1
+        assert entries[0].num_records == 12
+
+    def test_coin_margined_symbols_normalized(self, tmp_path):
+        index = CacheIndex.for_cache_dir(tmp_path)
+        index.record_files([make_entry("2024-01-15", "FUTURES_COIN", "BTCUSD_PERP")])
+        assert len(index.get_entries(MarketType.FUTURES_COIN, "BTCUSD", "1h")) == 1
+
+    def test_statistics(self, tmp_path):
+        index = CacheIndex.for_cache_dir(tmp_path)
+        index.record_files([make_entry("2024-01-15"), make_entry("2024-01-15", "FUTURES_USDT", "ETHUSDT")])
+
+        stats = index.get_statistics()
+        assert stats["total_entries"] == 2
+        assert stats["total_symbols"] == 2
+        assert stats["total_records"] == 48
+        assert stats["total_size_bytes"] == 2000
+        assert stats["market_type_counts"] == {"SPOT": 1, "FUTURES_USDT": 1}
+
+    def test_missing_index_returns_no_entries(self, tmp_path):
+        index = CacheIndex.for_cache_dir(tmp_path)
+        assert index.get_entries("SPOT", "BTCUSDT", "1h") == []
+        assert not index.exists()
+
+
+class TestLegacyMigration:
+    """Indexes written by older cache builder versions are migrated in place."""
+
+    def test_path_only_schema_migrated(self, tmp_path):
+        db_path = tmp_path / "cache_index.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE cache_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol TEXT, interval TEXT, date TEXT, file_size INTEGER,
+                num_records INTEGER, last_updated TEXT, path TEXT,
+                UNIQUE(symbol, interval, date)
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO cache_entries (symbol, interval, date, file_size, num_records, last_updated, path) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("BTCUSDT", "1h", "2024-01-15", 10, 24, "", "cache/BINANCE/KLINES/spot/BTCUSDT/1h/2024-01-15.arrow"),
+                ("ETHUSDT", "1h", "2024-01-15", 10, 24, "", "cache/BINANCE/KLINES/futures_um/ETHUSDT/1h/2024-01-15.arrow"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        reader = ArrowCacheReader(cache_db_path=db_path)
+        assert reader.list_available_symbols(MarketType.FUTURES_USDT) == ["ETHUSDT"]
+        assert sorted(reader.list_available_market_types()) == ["FUTURES_USDT", "SPOT"]
+        assert reader.check_availability("BTCUSDT", "1h", "2024-01-15", "2024-01-15")["total_records"] == 24
+
+
+# =============================================================================
+# Writers
+# =============================================================================
+
+
+class TestWritersRecordFiles:
+    """Every cache write path keeps the index current."""
+
+    def test_save_to_cache_records_files(self, tmp_path):
+        set_cache_compression(tmp_path, "zstd")
+        assert save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+
+        entries = CacheIndex.for_cache_dir(tmp_path).get_entries(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1)
+        assert [e.date for e in entries] == ["2024-01-15", "2024-01-16"]
+        for entry in entries:
+            assert entry.num_records == 24
+            assert entry.compression == "zstd"
+            assert entry.checksum == CacheValidator.calculate_checksum(entry.path)
+        assert entries[0].start_time_ms == int(BASE.timestamp() * 1000)
+        assert entries[0].end_time_ms == int((BASE + timedelta(hours=23)).timestamp() * 1000)
+
+    def test_first_indexed_write_does_not_scan_the_root(self, tmp_path, monkeypatch):
+        save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        (tmp_path / CACHE_INDEX_FILENAME).unlink()
+
+        def fail_rebuild(*_args, **_kwargs):
+            raise AssertionError("cache root rebuilt during a write")
+
+        monkeypatch.setattr(CacheIndex, "rebuild_from_disk", fail_rebuild)
+        later = make_klines(days=3).iloc[48:]
+        save_to_cache(later, "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+
+        entries = CacheIndex.for_cache_dir(tmp_path).get_entries(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1)
+        assert [entry.date for entry in entries] == ["2024-01-17"]
+
+    def test_unified_cache_manager_records_files(self, tmp_path):
+        manager = UnifiedCacheManager(tmp_path)
+        assert manager.save_to_cache(make_klines(), "BTCUSD", "1h", BASE, market_type="cm")
+
+        entries = manager.index.get_entries(MarketType.FUTURES_COIN, "BTCUSD_PERP", "1h")
+        assert len(entries) == 1
+        assert entries[0].num_records == 24
+
+    def test_rebuild_from_disk(self, tmp_path):
+        save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        UnifiedCacheManager(tmp_path).save_to_cache(make_klines(), "ETHUSDT", "1h", BASE, market_type="um")
+        (tmp_path / CACHE_INDEX_FILENAME).unlink()
+
+        index = CacheIndex.for_cache_dir(tmp_path)
+        assert index.rebuild_from_disk() == 3
+        entries = index.get_entries(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1)
+        assert [(entry.num_records, entry.checksum) for entry in entries] == [(24, None), (24, None)]
+        assert len(index.get_entries(MarketType.FUTURES_USDT, "ETHUSDT", Interval.HOUR_1)) == 1
+
+    def test_reindex_command(self, tmp_path, capsys):
+        save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        (tmp_path / CACHE_INDEX_FILENAME).unlink()
+
+        assert main(["reindex", "--cache-dir", str(tmp_path)]) == 0
+        assert "Indexed 2 cache files" in capsys.readouterr().out
+        assert len(CacheIndex.for_cache_dir(tmp_path).get_entries(MarketType.SPOT, "BTCUSDT", Interval.HOUR_1)) == 2
+
+
+# =============================================================================
+# Readers
+# =============================================================================
+
+
+class TestReadersUseIndex:
+    """ArrowCacheReader and the FCP cache step read the runtime index."""
+
+    def test_arrow_cache_reader_sees_runtime_writes(self, tmp_path):
+        save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+
+        reader = ArrowCacheReader(cache_dir=tmp_path)
+        availability = reader.check_availability("BTCUSDT", Interval.HOUR_1, "2024-01-14", "2024-01-16")
+        assert availability["available_dates"] == ["2024-01-15", "2024-01-16"]
+        assert availability["missing_dates"] == ["2024-01-14"]
+        assert availability["total_records"] == 48
+        assert set(availability["checksums"]) == {"2024-01-15", "2024-01-16"}
+        assert len(reader.read_symbol_data("BTCUSDT", Interval.HOUR_1, "2024-01-15", "2024-01-16")) == 48
+        assert reader.get_cache_statistics()["total_entries"] == 2
+
+    def test_missing_database_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ArrowCacheReader(cache_dir=tmp_path).get_cache_statistics()
+
+    def test_planner_skips_probing_indexed_days(self, tmp_path, monkeypatch):
+        save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        probed = []
+
+        def record_probe(_self, path):
+            probed.append(path.name)
+            return False
+
+        monkeypatch.setattr(FSSpecVisionHandler, "exists", record_probe)
+        frames = get_cache_lazyframes(
+            "BTCUSDT", BASE - timedelta(days=1), BASE + timedelta(days=2), Interval.HOUR_1, tmp_path, MarketType.SPOT
+        )
+        assert sum(len(lf.collect()) for lf in frames) == 48
+        assert probed == ["BTCUSDT-1h-2024-01-14.arrow", "BTCUSDT-1h-2024-01-17.arrow"]
+
+    def test_planner_probes_days_missing_from_the_index(self, tmp_path):
+        save_to_cache(make_klines(days=2), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        (tmp_path / CACHE_INDEX_FILENAME).unlink()
+        save_to_cache(make_klines(days=3).iloc[48:], "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+
+        frames = get_cache_lazyframes("BTCUSDT", BASE, BASE + timedelta(days=3), Interval.HOUR_1, tmp_path, MarketType.SPOT)
+        assert sum(len(lf.collect()) for lf in frames) == 72
+
+    def test_planner_probes_without_index(self, tmp_path):
+        save_to_cache(make_klines(), "BTCUSDT", Interval.HOUR_1, MarketType.SPOT, tmp_path)
+        (tmp_path / CACHE_INDEX_FILENAME).unlink()
+
+        frames = get_cache_lazyframes("BTCUSDT", BASE, BASE + timedelta(days=1), Interval.HOUR_1, tmp_path, MarketType.SPOT)
+        assert sum(len(lf.collect()) for lf in frames) == 24
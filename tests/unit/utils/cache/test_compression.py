@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Unit tests for Arrow IPC cache compression.
+
+Tests:
+1. Per-cache-root codec settings (get/set_cache_compression)
+2. write_ipc_table() codecs and schema metadata
+3. Readers handling mixed compressed/uncompressed files:
+   _scan_cache_file, SafeMemoryMap, ArrowCacheReader, UnifiedCacheManager
+4. save_to_cache() honouring the cache root setting
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+import ckvd.core  # noqa: F401 - loads core before utils (core <-> utils import cycle)
+from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
+from ckvd.utils.arrow_cache_reader import ArrowCacheReader
+from ckvd.utils.cache.compression import (
+    get_cache_compression,
+    read_ipc_compression,
+    set_cache_compression,
+    write_ipc_table,
+)
+from ckvd.utils.cache.memory_map import SafeMemoryMap
+from ckvd.utils.config import CACHE_SETTINGS_FILENAME
+from ckvd.utils.for_core.ckvd_cache_utils import _scan_cache_file, save_to_cache
+from ckvd.utils.market_constraints import Interval, MarketType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+CODECS = [None, "lz4", "zstd"]
+
+
+# =============================================================================
+# Test Data Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def kline_df():
+    """One day of 1m klines."""
+    times = pd.DatetimeIndex([BASE + timedelta(minutes=i) for i in range(1440)], tz="UTC")
+    return pd.DataFrame(
+        {
+            "open_time": times,
+            "open": [100.0 + i % 7 for i in range(1440)],
+            "close": [100.5 + i % 7 for i in range(1440)],
+            "volume": [float(i % 13) for i in range(1440)],
+        }
+    )
+
+
+@pytest.fixture
+def mixed_files(tmp_path, kline_df):
+    """The same table written with every codec."""
+    table = pa.Table.from_pandas(kline_df)
+    paths = {}
+    for codec in CODECS:
+        path = tmp_path / f"{codec or 'none'}.arrow"
+        write_ipc_table(table, path, codec)
+        paths[codec] = path
+    return paths
+
+
+# =============================================================================
+# Settings
+# =============================================================================
+
+
+class TestCacheRootSettings:
+    """Tests for per-cache-root codec settings."""
+
+    def test_default_is_uncompressed(self, tmp_path):
+        assert get_cache_compression(tmp_path) is None
+
+    @pytest.mark.parametrize("codec", ["lz4", "zstd", "LZ4_FRAME"])
+    def test_round_trip(self, tmp_path, codec):
+        set_cache_compression(tmp_path, codec)
+        assert get_cache_compression(tmp_path) == codec.lower().replace("_frame", "")
+
+    def test_none_disables_compression(self, tmp_path):
+        set_cache_compression(tmp_path, "zstd")
+        set_cache_compression(tmp_path, "none")
+        assert get_cache_compression(tmp_path) is None
+
+    def test_unknown_codec_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported cache compression"):
+            set_cache_compression(tmp_path, "snappy")
+
+    def test_corrupt_settings_fall_back_to_uncompressed(self, tmp_path):
+        (tmp_path / CACHE_SETTINGS_FILENAME).write_text("{not json")
+        assert get_cache_compression(tmp_path) is None
+
+
+# =============================================================================
+# Writers and readers
+# =============================================================================
+
+
+class TestMixedCodecReaders:
+    """Every reader returns identical data regardless of codec."""
+
+    def test_codec_recorded_in_metadata(self, mixed_files):
+        for codec, path in mixed_files.items():
+            assert read_ipc_compression(path) == codec
+
+    def test_compressed_files_are_smaller(self, mixed_files):
+        plain = mixed_files[None].stat().st_size
+        assert mixed_files["lz4"].stat().st_size < plain
+        assert mixed_files["zstd"].stat().st_size < plain
+
+    def test_scan_cache_file(self, mixed_files):
+        frames = [_scan_cache_file(path).collect() for path in mixed_files.values()]
+        for frame in frames[1:]:
+            assert frame.equals(frames[0])
+
+    def test_safe_memory_map(self, mixed_files):
+        counts = set()
+        for path in mixed_files.values():
+            with SafeMemoryMap(path) as source, pa.ipc.open_file(source) as reader:
+                counts.add(reader.read_all().num_rows)
+        assert counts == {1440}
+
+    def test_arrow_cache_reader(self, mixed_files):
+        reader = ArrowCacheReader()
+        frames = [reader._read_arrow_file_polars(path) for path in mixed_files.values()]
+        for frame in frames[1:]:
+            assert frame.equals(frames[0])
+        assert isinstance(frames[0], pl.DataFrame)
+
+
+class TestWritersHonourRootSetting:
+    """Writers pick up the codec configured for their cache root."""
+
+    def test_save_to_cache(self, tmp_path, kline_df):
+        set_cache_compression(tmp_path, "zstd")
+
+        assert save_to_cache(kline_df, "BTCUSDT", Interval.MINUTE_1, MarketType.SPOT, tmp_path)
+
+        files = list(tmp_path.rglob("*.arrow"))
+        assert len(files) == 1
+        assert read_ipc_compression(files[0]) == "zstd"
+        assert len(_scan_cache_file(files[0]).collect()) == 1440
+
+    def test_unified_cache_manager_mixed_codecs(self, tmp_path, kline_df):
+        manager = UnifiedCacheManager(tmp_path)
+        assert manager.save_to_cache(kline_df, "BTCUSDT", "1m", BASE)
+
+        set_cache_compression(tmp_path, "lz4")
+        lz4_manager = UnifiedCacheManager(tmp_path)
+        assert lz4_manager.save_to_cache(kline_df, "ETHUSDT", "1m", BASE)
+
+        btc = lz4_manager.load_from_cache("BTCUSDT", "1m", BASE)
+        eth = lz4_manager.load_from_cache("ETHUSDT", "1m", BASE)
+        assert len(btc) == len(eth) == 1440
+        assert lz4_manager.compression == "lz4"
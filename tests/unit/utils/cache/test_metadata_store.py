@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Unit tests for the incremental cache metadata store.
+
+Tests:
+1. CacheMetadataStore put/get/update and Mapping behaviour
+2. Batched last_accessed updates (count, flush, garbage collection)
+3. Import of legacy whole-file cache_metadata.json
+4. UnifiedCacheManager using the store
+"""
+
+import gc
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+import ckvd.core  # noqa: F401 - loads core before utils (core <-> utils import cycle)
+from ckvd.core.providers.binance.cache_manager import UnifiedCacheManager
+from ckvd.utils.cache import metadata_store
+from ckvd.utils.cache.metadata_store import CacheMetadataStore
+from ckvd.utils.config import CACHE_METADATA_FILENAME
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def stored_access_time(db_path, key):
+    """Read last_accessed straight from the database (bypassing the buffer)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT last_accessed FROM cache_metadata WHERE cache_key = ?", (key,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Store in a temporary directory."""
+    store = CacheMetadataStore(tmp_path / CACHE_METADATA_FILENAME)
+    yield store
+    store.close()
+
+
+class TestCacheMetadataStore:
+    """Basic store behaviour."""
+
+    def test_empty_store_creates_no_file(self, tmp_path):
+        store = CacheMetadataStore(tmp_path / CACHE_METADATA_FILENAME)
+        assert len(store) == 0
+        assert "missing" not in store
+        assert store.get("missing") is None
+        assert not (tmp_path / CACHE_METADATA_FILENAME).exists()
+
+    def test_put_get_update(self, store):
+        store.put("k1", {"rows": 10, "is_invalid": False})
+        store.put("k2", {"rows": 20})
+
+        assert store["k1"] == {"rows": 10, "is_invalid": False}
+        assert store.update("k1", is_invalid=True, invalid_reason="Empty DataFrame")
+        assert store["k1"]["is_invalid"] is True
+        assert not store.update("missing", is_invalid=True)
+        assert sorted(store) == ["k1", "k2"]
+        assert len(store) == 2
+        with pytest.raises(KeyError):
+            store["missing"]
+
+    def test_put_does_not_rewrite_other_rows(self, store):
+        store.put("k1", {"rows": 10})
+        conn = sqlite3.connect(store.db_path)
+        rowid_before = conn.execute("SELECT rowid FROM cache_metadata WHERE cache_key = 'k1'").fetchone()[0]
+        store.put("k2", {"rows": 20})
+        rowid_after = conn.execute("SELECT rowid FROM cache_metadata WHERE cache_key = 'k1'").fetchone()[0]
+        conn.close()
+        assert rowid_before == rowid_after
+
+
+class TestBatchedAccessTimes:
+    """last_accessed updates are buffered and written in batches."""
+
+    def test_touch_is_buffered_until_flush(self, store):
+        store.put("k1", {"rows": 10})
+        store.touch("k1")
+
+        assert stored_access_time(store.db_path, "k1") is None
+        assert "last_accessed" in store["k1"]  # visible before the flush
+
+        store.flush()
+        assert stored_access_time(store.db_path, "k1") == store["k1"]["last_accessed"]
+
+    def test_batch_size_triggers_flush(self, store, monkeypatch):
+        monkeypatch.setattr(metadata_store, "CACHE_METADATA_ACCESS_BATCH", 3)
+        for key in ("k1", "k2", "k3"):
+            store.put(key, {})
+
+        store.touch("k1")
+        store.touch("k2")
+        assert stored_access_time(store.db_path, "k1") is None
+        store.touch("k3")
+        assert stored_access_time(store.db_path, "k1") is not None
+
+    def test_garbage_collection_flushes(self, tmp_path):
+        db_path = tmp_path / CACHE_METADATA_FILENAME
+        store = CacheMetadataStore(db_path)
+        store.put("k1", {})
+        store.touch("k1")
+        del store
+        gc.collect()
+        assert stored_access_time(db_path, "k1") is not None
+
+
+class TestLegacyJsonImport:
+    """A cache_metadata.json from earlier versions is imported once."""
+
+    def test_import_and_rename(self, tmp_path):
+        legacy = tmp_path / "cache_metadata.json"
+        legacy.write_text(json.dumps({"k1": {"rows": 10, "last_accessed": "2024-01-01T00:00:00+00:00"}}, indent=2))
+
+        store = CacheMetadataStore(tmp_path / CACHE_METADATA_FILENAME, legacy_json_path=legacy)
+        assert store["k1"] == {"rows": 10, "last_accessed": "2024-01-01T00:00:00+00:00"}
+        assert not legacy.exists()
+        assert (tmp_path / "cache_metadata.json.migrated").exists()
+        store.close()
+
+
+class TestUnifiedCacheManagerMetadata:
+    """UnifiedCacheManager writes single rows and batches access times."""
+
+    def test_save_load_and_invalidate(self, tmp_path):
+        df = pd.DataFrame({"open_time": [BASE + timedelta(minutes=i) for i in range(5)], "close": [1.0] * 5})
+        manager = UnifiedCacheManager(tmp_path)
+        assert manager.save_to_cache(df, "BTCUSDT", "1m", BASE)
+        key = manager.get_cache_key("BTCUSDT", "1m", BASE)
+
+        assert manager.metadata[key]["rows"] == 5
+        assert len(manager.load_from_cache("BTCUSDT", "1m", BASE)) == 5
+        manager.flush_metadata()
+        assert stored_access_time(tmp_path / CACHE_METADATA_FILENAME, key) is not None
+
+        manager._mark_cache_invalid(key, "test")
+        reopened = UnifiedCacheManager(tmp_path)
+        assert reopened.metadata[key]["is_invalid"] is True
+        assert reopened.load_from_cache("BTCUSDT", "1m", BASE) is None
+        assert not (tmp_path / "cache_metadata.json").exists()
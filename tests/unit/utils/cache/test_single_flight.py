@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Unit tests for request coalescing.
+
+Tests:
+1. SingleFlight sharing one call between concurrent callers
+2. Advisory cache file locks (threads and processes)
+3. Atomic cache file writes
+4. VisionDataClient coalescing identical day downloads
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import ckvd.core  # noqa: F401 - loads core before utils (core <-> utils import cycle)
+from ckvd.core.providers.binance.vision_data_client import VisionDataClient
+from ckvd.utils.cache.compression import read_ipc_polars, write_ipc_table
+from ckvd.utils.cache.single_flight import SingleFlight, cache_file_lock, cache_file_locks
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+def run_concurrently(fn, count: int = 5) -> list:
+    """Call fn from count threads released together; return the results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        results[i] = fn()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+class TestSingleFlight:
+    """Concurrent callers with the same key share one call."""
+
+    def test_concurrent_calls_coalesce(self):
+        flights = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.2)
+            return "result"
+
+        results = run_concurrently(lambda: flights.do("day", work))
+        assert len(calls) == 1
+        assert [value for value, _ in results] == ["result"] * 5
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        assert flights.in_flight() == 0
+
+    def test_exception_reaches_waiters(self):
+        flights = SingleFlight()
+        errors = []
+
+        def work():
+            time.sleep(0.2)
+            raise OSError("download failed")
+
+        def call():
+            try:
+                flights.do("day", work)
+            except OSError as e:
+                errors.append(str(e))
+
+        run_concurrently(call, count=3)
+        assert errors == ["download failed"] * 3
+        assert flights.in_flight() == 0
+
+    def test_results_are_not_cached(self):
+        flights = SingleFlight()
+        assert flights.do("day", lambda: 1) == (1, False)
+        assert flights.do("day", lambda: 2) == (2, False)
+
+
+class TestCacheFileLocks:
+    """Advisory locks keyed by cache file."""
+
+    def test_lock_excludes_other_holders(self, tmp_path):
+        cache_path = tmp_path / "data" / "BTCUSDT-1h-2024-01-15.arrow"
+        with cache_file_lock(tmp_path, cache_path) as held:
+            assert held
+            with cache_file_lock(tmp_path, cache_path, timeout=0.1) as second:
+                assert not second
+        with cache_file_lock(tmp_path, cache_path, timeout=0.1) as held_again:
+            assert held_again
+        assert len(list((tmp_path / ".locks").glob("*.lock"))) == 1
+
+    def test_lock_excludes_other_processes(self, tmp_path):
+        cache_path = tmp_path / "day.arrow"
+        probe = (
+            "import ckvd.core\n"
+            "from ckvd.utils.cache.single_flight import cache_file_lock\n"
+            f"with cache_file_lock({str(tmp_path)!r}, {str(cache_path)!r}, timeout=0.1) as held:\n"
+            "    print(held)\n"
+        )
+        with cache_file_lock(tmp_path, cache_path):
+            locked = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        unlocked = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        assert locked.stdout.strip() == "False"
+        assert unlocked.stdout.strip() == "True"
+
+    def test_multiple_locks_serialize_overlapping_ranges(self, tmp_path):
+        days = [tmp_path / f"{day}.arrow" for day in ("2024-01-15", "2024-01-16", "2024-01-17")]
+        active = []
+        overlaps = []
+
+        def fetch(paths):
+            with cache_file_locks(tmp_path, paths):
+                if active:
+                    overlaps.append(True)
+                active.append(1)
+                time.sleep(0.1)
+                active.pop()
+
+        threads = [
+            threading.Thread(target=fetch, args=(days[:2],)),
+            threading.Thread(target=fetch, args=(list(reversed(days[1:])),)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert not overlaps
+
+    def test_timeout_bounds_the_whole_set(self, tmp_path):
+        days = [tmp_path / f"2024-01-{day}.arrow" for day in range(10, 20)]
+        with cache_file_locks(tmp_path, days):
+            started = time.monotonic()
+            with cache_file_locks(tmp_path, days, timeout=0.2) as held:
+                assert not held
+            assert time.monotonic() - started < 1.0  # not 10 x 0.2s
+
+
+class TestAtomicWrites:
+    """Cache files are renamed into place."""
+
+    def test_write_leaves_no_temporary_files(self, tmp_path):
+        path = tmp_path / "day.arrow"
+        write_ipc_table(pa.table({"x": [1, 2, 3]}), path)
+        write_ipc_table(pa.table({"x": [4, 5]}), path, "zstd")
+        assert [p.name for p in tmp_path.iterdir()] == ["day.arrow"]
+        assert read_ipc_polars(path)["x"].to_list() == [4, 5]
+
+
+class TestVisionDownloadCoalescing:
+    """Identical day downloads in flight are shared between threads."""
+
+    @pytest.fixture
+    def client(self):
+        client = VisionDataClient(symbol="BTCUSDT", interval="1h")
+        yield client
+        client.close()
+
+    def test_identical_downloads_coalesce(self, client, monkeypatch):
+        calls = []
+
+        def download(date, columns=None):
+            calls.append((date, columns))
+            time.sleep(0.2)
+            return pd.DataFrame({"open_time": [date], "close": [1.0]}), None
+
+        monkeypatch.setattr(client, "_download_day_file", download)
+        results = run_concurrently(lambda: client._download_file(BASE))
+
+        assert len(calls) == 1
+        frames = [df for df, _ in results]
+        assert all(len(df) == 1 for df in frames)
+        assert len({id(df) for df in frames}) == 5  # waiters get copies
+
+    def test_different_projections_do_not_coalesce(self, client, monkeypatch):
+        calls = []
+
+        def download(date, columns=None):
+            calls.append(columns)
+            time.sleep(0.1)
+            return None, "404"
+
+        monkeypatch.setattr(client, "_download_day_file", download)
+        columns = iter([None, ("open_time", "close")])
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                projection = next(columns)
+            return client._download_file(BASE, projection)
+
+        run_concurrently(call, count=2)
+        assert sorted(calls, key=str) == [("open_time", "close"), None]
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Unit tests for time-bucketed record batches in Arrow IPC cache files.
+
+Tests:
+1. write_ipc_table() splitting tables into hourly batches with a time index
+2. read_ipc_time_range() reading only the overlapping batches
+3. Cache readers (_scan_cache_file_range, get_cache_lazyframes) using the index
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import ckvd.core  # noqa: F401 - loads core before utils (core <-> utils import cycle)
+from ckvd.utils.cache.compression import write_ipc_table
+from ckvd.utils.cache.time_batches import (
+    TIME_BATCHES_METADATA_KEY,
+    read_ipc_time_range,
+    read_time_batch_ranges,
+)
+from ckvd.utils.for_core.ckvd_cache_utils import _scan_cache_file_range, get_cache_lazyframes, save_to_cache
+from ckvd.utils.market_constraints import Interval, MarketType
+
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+HOUR_MS = 3_600_000
+
+
+def _second_klines(rows: int = 86_400) -> pd.DataFrame:
+    """One day of 1s klines."""
+    return pd.DataFrame(
+        {
+            "open_time": pd.date_range(BASE, periods=rows, freq="s", tz="UTC"),
+            "close": [float(i) for i in range(rows)],
+        }
+    )
+
+
+@pytest.fixture
+def day_file(tmp_path):
+    path = tmp_path / "2024-01-15.arrow"
+    write_ipc_table(pa.Table.from_pandas(_second_klines()), path)
+    return path
+
+
+def _batch_count(path) -> int:
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).num_record_batches
+
+
+class TestWriteTimeBatches:
+    """Tests for the record-batch layout written by write_ipc_table()."""
+
+    def test_day_is_split_into_hourly_batches(self, day_file):
+        assert _batch_count(day_file) == 24
+
+        with pa.memory_map(str(day_file), "r") as source:
+            ranges = read_time_batch_ranges(pa.ipc.open_file(source).schema)
+        start_ms = int(BASE.timestamp() * 1000)
+        assert ranges[0] == (start_ms, start_ms + HOUR_MS - 1000)
+        assert ranges[-1][1] == start_ms + 24 * HOUR_MS - 1000
+
+    @pytest.mark.parametrize("codec", [None, "zstd"])
+    def test_round_trip_is_unchanged(self, tmp_path, codec):
+        df = _second_klines(7200)
+        path = tmp_path / "day.arrow"
+        write_ipc_table(pa.Table.from_pandas(df), path, codec)
+
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+    def test_unsorted_rows_are_sorted_before_splitting(self, tmp_path):
+        df = _second_klines(7200).iloc[::-1].reset_index(drop=True)
+        path = tmp_path / "day.arrow"
+        write_ipc_table(pa.Table.from_pandas(df), path)
+
+        table = read_ipc_time_range(path, BASE, BASE + timedelta(hours=2))
+        assert table.column("open_time").to_pandas().is_monotonic_increasing
+        assert table.num_rows == 7200
+
+    def test_chunked_tables_get_one_batch_per_range(self, tmp_path):
+        # Chunk boundaries that do not fall on the hour (e.g. a concat of partial-day frames)
+        df = _second_klines(3 * 3600)
+        parts = [pa.Table.from_pandas(df.iloc[i : i + 2500], preserve_index=False) for i in range(0, len(df), 2500)]
+        table = pa.concat_tables(parts)
+        assert table.column("open_time").num_chunks == 5
+        path = tmp_path / "day.arrow"
+        write_ipc_table(table, path)
+
+        assert _batch_count(path) == 3
+        read = read_ipc_time_range(path, BASE + timedelta(hours=1, minutes=5), BASE + timedelta(hours=1, minutes=10))
+        assert read is not None
+        assert read.num_rows == 3600
+
+    def test_tables_without_open_time_are_one_batch(self, tmp_path):
+        path = tmp_path / "plain.arrow"
+        write_ipc_table(pa.table({"x": list(range(10))}), path)
+
+        assert _batch_count(path) == 1
+        assert read_ipc_time_range(path, BASE, BASE + timedelta(hours=1)) is None
+
+    def test_batching_can_be_disabled(self, tmp_path):
+        path = tmp_path / "day.arrow"
+        write_ipc_table(pa.Table.from_pandas(_second_klines(7200)), path, batch_seconds=0)
+
+        assert _batch_count(path) == 1
+        assert read_ipc_time_range(path, BASE, BASE + timedelta(hours=1)) is None
+
+
+class TestReadTimeRange:
+    """Tests for selective batch reads."""
+
+    def test_reads_only_overlapping_batches(self, day_file):
+        table = read_ipc_time_range(day_file, BASE + timedelta(hours=10, minutes=5), BASE + timedelta(hours=10, minutes=20))
+
+        assert table.num_rows == 3600
+        assert table.column("open_time")[0].as_py() == BASE + timedelta(hours=10)
+
+    def test_range_across_batch_boundary(self, day_file):
+        table = read_ipc_time_range(day_file, BASE + timedelta(hours=3, minutes=50), BASE + timedelta(hours=4, minutes=10))
+
+        assert table.num_rows == 2 * 3600
+
+    def test_range_outside_the_file_is_empty(self, day_file):
+        table = read_ipc_time_range(day_file, BASE + timedelta(days=2), BASE + timedelta(days=3))
+
+        assert table.num_rows == 0
+        assert "open_time" in table.column_names
+
+    def test_invalid_index_is_ignored(self, tmp_path):
+        table = pa.table({"x": [1]}).replace_schema_metadata({TIME_BATCHES_METADATA_KEY: json.dumps({"bad": 1}).encode()})
+        path = tmp_path / "bad.arrow"
+        write_ipc_table(table, path)
+
+        assert read_ipc_time_range(path, BASE, BASE + timedelta(hours=1)) is None
+
+
+class TestCacheReaders:
+    """Tests for the cache readers using the batch index."""
+
+    def test_scan_range_returns_candidate_rows_only(self, day_file):
+        df = _scan_cache_file_range(day_file, BASE + timedelta(minutes=5), BASE + timedelta(minutes=20)).collect()
+
+        assert len(df) == 3600
+
+    def test_get_cache_lazyframes_filters_sub_day_range(self, tmp_path):
+        assert save_to_cache(_second_klines(), "BTCUSDT", Interval.SECOND_1, MarketType.SPOT, tmp_path)
+
+        start = BASE + timedelta(hours=12)
+        frames = get_cache_lazyframes("BTCUSDT", start, start + timedelta(minutes=15), Interval.SECOND_1, tmp_path, MarketType.SPOT)
+        df = frames[0].collect()
+
+        assert len(df) == 900
+        assert df["open_time"].min() == start
+        assert df["_data_source"].unique().to_list() == ["CACHE"]
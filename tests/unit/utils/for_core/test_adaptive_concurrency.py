@@ -0,0 +1,160 @@
+"""Tests for the adaptive (AIMD) download concurrency limiter."""
+
+import threading
+from contextlib import ExitStack
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckvd.utils.for_core.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("ckvd.utils.for_core.adaptive_concurrency.time.monotonic", clock):
+        yield clock
+
+
+def _round(limiter: AdaptiveConcurrencyLimiter, clock: FakeClock, latency: float = 0.1, size: int = 1000) -> None:
+    """Run one full round of ``limiter.limit`` concurrent requests with the same latency."""
+    with ExitStack() as stack:
+        slots = [stack.enter_context(limiter.slot()) for _ in range(limiter.limit)]
+        for slot in slots:
+            slot.record_bytes(size)
+        clock.now += latency
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_rejects_inconsistent_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+
+    def test_grows_additively_up_to_max(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8)
+
+        for _ in range(3):
+            _round(limiter, clock)
+        assert limiter.limit == 5
+        for _ in range(20):
+            _round(limiter, clock)
+        assert limiter.limit == 8
+
+    def test_does_not_grow_when_underused(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=50)
+
+        for _ in range(50):
+            with limiter.slot():
+                clock.now += 0.1
+
+        assert limiter.limit == 8
+
+    def test_errors_cut_limit_once_per_cooldown(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=50, min_limit=2)
+        _round(limiter, clock)  # establish a latency estimate (cooldown ~0.1s)
+        before = limiter.limit
+
+        for _ in range(5):
+            with pytest.raises(OSError), limiter.slot():
+                raise OSError("connection reset")
+
+        assert limiter.limit == before // 2
+        assert limiter.metrics()["errors"] == 5
+
+        clock.now += 1.0
+        with pytest.raises(OSError), limiter.slot():
+            raise OSError("connection reset")
+        assert limiter.limit == before // 4
+
+    def test_timeouts_and_overload_are_failures(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, min_limit=2)
+
+        with pytest.raises(TimeoutError), limiter.slot():
+            raise TimeoutError
+        clock.now += 1.0
+        with limiter.slot() as slot:
+            slot.overloaded()
+
+        metrics = limiter.metrics()
+        assert (metrics["timeouts"], metrics["errors"]) == (1, 1)
+        assert limiter.limit == 2
+
+    def test_latency_rise_shrinks_limit(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10, min_limit=1)
+        for _ in range(5):
+            _round(limiter, clock, latency=0.1)
+
+        for _ in range(3):
+            _round(limiter, clock, latency=1.0)
+
+        assert limiter.limit < 10
+        assert limiter.metrics()["short_latency_ms"] > limiter.metrics()["long_latency_ms"]
+
+    def test_never_admits_more_than_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        release = threading.Event()
+
+        def work():
+            nonlocal active, peak
+            with limiter.slot():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                release.wait(timeout=5)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert peak <= 3
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_metrics_report_throughput(self, clock):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+        _round(limiter, clock, latency=1.0, size=500)
+        clock.now += 1.0
+        _round(limiter, clock, latency=1.0, size=500)
+
+        metrics = limiter.metrics()
+        assert metrics["successes"] == 4
+        assert metrics["throughput_bytes_per_second"] > 0
+        assert set(metrics) >= {"limit", "max_limit", "in_flight", "short_latency_ms", "long_latency_ms", "decreases"}
+
+
+class TestVisionDownloadLimiter:
+    def test_server_errors_shrink_the_vision_limit(self):
+        from ckvd.core.providers.binance import vision_data_client
+        from ckvd.core.providers.binance.vision_data_client import VisionDataClient
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=8, min_limit=2)
+        client = VisionDataClient("BTCUSDT", "1h", "spot")
+        client._client = MagicMock()
+        client._client.get.return_value = MagicMock(status_code=503, content=b"")
+        try:
+            with patch.object(vision_data_client, "VISION_DOWNLOAD_LIMITER", limiter):
+                df, warning = client._download_day_file(vision_data_client.datetime(2024, 1, 15, tzinfo=vision_data_client.timezone.utc))
+        finally:
+            client.close()
+
+        assert df is None
+        assert "503" in warning
+        assert limiter.metrics()["errors"] == 1
+        assert limiter.limit == 4
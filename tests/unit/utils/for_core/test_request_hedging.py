@@ -0,0 +1,177 @@
+"""Tests for hedged requests (duplicate slow requests, take the first result)."""
+
+import itertools
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ckvd.utils.for_core.request_hedging import RequestHedger
+
+
+def _primed(budget: float = 0.05, samples: int = 20) -> RequestHedger:
+    """Hedger that has seen ``samples`` instant requests (hedge delay = min_delay)."""
+    hedger = RequestHedger(budget=budget, min_samples=samples, min_delay=0.05)
+    for _ in range(samples):
+        hedger.call(lambda: None)
+    return hedger
+
+
+def _slow_then_fast(slow: float = 2.0, fail_first: bool = False):
+    """Request whose first attempt is slow (or fails) and later attempts are instant."""
+    attempts = itertools.count()
+    release = threading.Event()
+
+    def request():
+        attempt = next(attempts)
+        if attempt == 0:
+            if fail_first:
+                release.wait(0.1)
+                raise OSError("primary failed")
+            release.wait(slow)
+            return "primary"
+        return "hedge"
+
+    return request, release
+
+
+class TestRequestHedger:
+    @pytest.mark.parametrize("kwargs", [{"percentile": 100}, {"percentile": 0}, {"budget": 1.5}])
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            RequestHedger(**kwargs)
+
+    def test_no_hedging_before_min_samples(self):
+        hedger = RequestHedger(min_samples=5)
+        for _ in range(4):
+            hedger.call(lambda: None)
+
+        assert hedger.hedge_delay() is None
+        assert hedger.metrics()["hedged"] == 0
+
+    def test_slow_request_is_hedged_and_hedge_wins(self):
+        hedger = _primed()
+        request, release = _slow_then_fast()
+
+        started = time.monotonic()
+        result = hedger.call(request)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert result == "hedge"
+        assert elapsed < 1.0
+        metrics = hedger.metrics()
+        assert (metrics["hedged"], metrics["hedge_wins"], metrics["win_rate"]) == (1, 1, 1.0)
+        assert metrics["hedge_rate"] == pytest.approx(1 / 21)
+
+    def test_fast_request_is_not_hedged(self):
+        hedger = _primed()
+        calls = []
+
+        assert hedger.call(lambda: calls.append(1) or "ok") == "ok"
+        assert len(calls) == 1
+        assert hedger.metrics()["hedged"] == 0
+
+    def test_budget_caps_hedges(self):
+        hedger = _primed(budget=0.05)
+        first, release_first = _slow_then_fast(slow=0.3)
+        second, release_second = _slow_then_fast(slow=0.3)
+
+        assert hedger.call(first) == "hedge"
+        assert hedger.call(second) == "primary"  # 2 hedges in 22 requests would exceed 5%
+        release_first.set()
+        release_second.set()
+
+        assert hedger.metrics()["hedged"] == 1
+
+    def test_zero_budget_disables_hedging(self):
+        hedger = _primed(budget=0.0)
+        request, _release = _slow_then_fast(slow=0.2)
+
+        assert hedger.call(request) == "primary"
+        assert hedger.metrics()["hedged"] == 0
+
+    def test_failed_primary_falls_back_to_hedge(self):
+        hedger = _primed()
+        request, _release = _slow_then_fast(fail_first=True)
+
+        assert hedger.call(request) == "hedge"
+
+    def test_raises_when_every_attempt_fails(self):
+        hedger = _primed()
+
+        def request():
+            time.sleep(0.1)
+            raise OSError("down")
+
+        with pytest.raises(OSError, match="down"):
+            hedger.call(request)
+
+
+class TestVisionHedging:
+    def test_archive_get_goes_through_hedger_when_enabled(self):
+        from ckvd.core.providers.binance import vision_data_client
+        from ckvd.core.providers.binance.vision_data_client import VisionDataClient
+
+        client = VisionDataClient("BTCUSDT", "1h", "spot")
+        client._client = MagicMock()
+        client._client.get.return_value = MagicMock(status_code=404, content=b"")
+        hedger = _primed()
+        try:
+            with (
+                patch.object(vision_data_client, "VISION_HEDGE_REQUESTS", True),
+                patch.object(vision_data_client, "VISION_REQUEST_HEDGER", hedger),
+            ):
+                df, warning = client._download_day_file(vision_data_client.datetime(2024, 1, 15, tzinfo=vision_data_client.timezone.utc))
+        finally:
+            client.close()
+
+        assert df is None
+        assert warning.startswith("404")
+        assert hedger.metrics()["requests"] == 21
+        assert "hedging" in vision_data_client.get_vision_download_metrics()
+
+    def test_hedge_shares_the_limiter_slot_and_times_only_the_get(self):
+        from ckvd.core.providers.binance import vision_data_client
+        from ckvd.core.providers.binance.vision_data_client import VisionDataClient
+        from ckvd.utils.for_core.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        hedger = _primed()
+        request, release_primary = _slow_then_fast(slow=5.0)
+        client = VisionDataClient("BTCUSDT", "1h", "spot")
+        client._client = MagicMock()
+        client._client.get.side_effect = lambda _url: MagicMock(status_code=200, content=request().encode())
+        release_other = threading.Event()
+        holding = threading.Event()
+
+        def other_download():
+            with limiter.slot():
+                holding.set()
+                release_other.wait(5)
+
+        other = threading.Thread(target=other_download)
+        try:
+            with (
+                patch.object(vision_data_client, "VISION_HEDGE_REQUESTS", True),
+                patch.object(vision_data_client, "VISION_REQUEST_HEDGER", hedger),
+                patch.object(vision_data_client, "VISION_DOWNLOAD_LIMITER", limiter),
+            ):
+                other.start()
+                holding.wait(5)
+                threading.Timer(0.3, release_other.set).start()  # saturated limiter for 0.3s
+                started = time.monotonic()
+                response = client._get_archive("https://data.binance.vision/day.zip")
+                elapsed = time.monotonic() - started
+                recorded = list(hedger._latencies)
+        finally:
+            release_primary.set()
+            release_other.set()
+            other.join()
+            client.close()
+
+        assert response.content == b"hedge"
+        assert 0.3 <= elapsed < 2.0
+        assert max(recorded) < 0.3  # the 0.3s queue wait is not a GET latency
+        assert hedger.metrics()["hedged"] == 1
@@ -0,0 +1,186 @@
+"""Tests for the per-host REST rate-limit scheduler and its shared weight budget."""
+
+import multiprocessing
+from unittest.mock import patch
+
+import pytest
+
+from ckvd.utils.for_core import rest_scheduler
+from ckvd.utils.for_core.rest_exceptions import RateLimitError
+from ckvd.utils.for_core.rest_scheduler import RestRateLimitScheduler, get_rest_scheduler, request_weight, rest_state_dir
+from ckvd.utils.for_core.shared_weight_budget import SharedWeightBudget
+
+
+@pytest.fixture
+def now():
+    """Wall clock pinned 15s into a minute; tests move it by assigning ``now[0]``."""
+    clock = [1_700_000_040.0 + 15.0]
+    with patch.object(rest_scheduler.time, "time", side_effect=lambda: clock[0]):
+        yield clock
+
+
+@pytest.fixture
+def make_scheduler(tmp_path):
+    """Build schedulers whose shared state lives under tmp_path."""
+
+    def make(**kwargs) -> RestRateLimitScheduler:
+        return RestRateLimitScheduler(state_path=tmp_path / "host.weight", **kwargs)
+
+    return make
+
+
+class TestRestRateLimitScheduler:
+    def test_no_delay_below_threshold(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000)
+        scheduler.observe({"x-mbx-used-weight-1m": "899"})
+
+        assert scheduler.delay() == 0
+
+    def test_waits_for_next_minute_near_weight_limit(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000)
+        scheduler.observe({"x-mbx-used-weight-1m": "950"})
+
+        assert scheduler.delay() == pytest.approx(45.0)
+        now[0] += 45.0
+        assert scheduler.delay() == 0
+
+    def test_retry_after_blocks_until_deadline(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000, max_wait=30.0)
+        scheduler.record_rate_limit(12)
+        assert scheduler.delay() == pytest.approx(12.0)
+
+        scheduler.record_rate_limit(120)
+        assert scheduler.delay() == 30.0  # capped by max_wait
+
+    def test_wait_sleeps_and_counts(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000)
+        scheduler.record_rate_limit(5)
+
+        with patch.object(rest_scheduler.time, "sleep") as sleep:
+            assert scheduler.wait() == pytest.approx(5.0)
+        sleep.assert_called_once()
+        assert scheduler.metrics()["pauses"] == 1
+        assert scheduler.metrics()["rate_limits"] == 1
+
+    def test_ignores_missing_or_bad_headers(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000)
+        scheduler.observe({})
+        scheduler.observe({"x-mbx-used-weight-1m": "n/a"})
+
+        assert scheduler.metrics()["used_weight"] == 0
+
+    def test_acquire_reserves_until_window_is_spent(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=10, pause_threshold=1.0)
+
+        assert [scheduler.try_acquire(2) for _ in range(5)] == [0.0] * 5
+        assert scheduler.try_acquire(2) == pytest.approx(45.0)
+        now[0] += 45.0
+        assert scheduler.try_acquire(2) == 0.0
+
+    def test_acquire_raises_while_host_is_blocked(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000)
+        scheduler.record_rate_limit(20)
+
+        with patch.object(rest_scheduler.time, "sleep") as sleep, pytest.raises(RateLimitError) as excinfo:
+            scheduler.acquire(2)
+        sleep.assert_not_called()
+        assert excinfo.value.retry_after == pytest.approx(20.0)
+
+    def test_acquire_waits_out_short_block_when_asked(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000)
+        scheduler.record_rate_limit(20)
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        with patch.object(rest_scheduler.time, "sleep", side_effect=sleep):
+            assert scheduler.acquire(2, wait_on_block=True) == pytest.approx(20.0)
+
+    def test_long_block_raises_even_when_waiting(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=1000, max_wait=300.0)
+        scheduler.record_rate_limit(3600)
+
+        with patch.object(rest_scheduler.time, "sleep") as sleep:
+            with pytest.raises(RateLimitError) as excinfo:
+                scheduler.acquire(2, wait_on_block=True)
+            with pytest.raises(RateLimitError):
+                scheduler.wait()
+        sleep.assert_not_called()
+        assert excinfo.value.retry_after == pytest.approx(3600.0)
+
+    def test_total_wait_is_capped(self, now, make_scheduler):
+        scheduler = make_scheduler(weight_limit=10, pause_threshold=1.0, max_wait=50.0)
+        assert scheduler.acquire(10) == 0.0
+
+        with pytest.raises(RateLimitError):
+            scheduler.try_acquire(2, waited=10.0)  # 45s more would exceed 50s in total
+        assert scheduler.try_acquire(2) == pytest.approx(45.0)
+
+    def test_header_sync_and_retry_after_are_seen_by_other_instances(self, now, tmp_path):
+        first = RestRateLimitScheduler(1000, state_path=tmp_path / "host.weight")
+        second = RestRateLimitScheduler(1000, state_path=tmp_path / "host.weight")
+
+        first.observe({"x-mbx-used-weight-1m": "950"})
+        assert second.delay() == pytest.approx(45.0)
+        now[0] += 60.0
+        first.record_rate_limit(8)
+        assert second.delay() == pytest.approx(8.0)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "limit", "weight"),
+    [
+        ("https://api.binance.com/api/v3/klines", 1000, 2),
+        ("https://fapi.binance.com/fapi/v1/klines", 1000, 5),
+        ("https://fapi.binance.com/fapi/v1/klines", 1500, 10),
+        ("https://dapi.binance.com/dapi/v1/klines", 50, 1),
+        ("https://fapi.binance.com/fapi/v1/fundingRate", 1000, 1),
+    ],
+)
+def test_request_weight(endpoint, limit, weight):
+    assert request_weight(endpoint, {"limit": limit}) == weight
+
+
+def _reserve_all(path: str, now: float, queue) -> None:
+    """Worker process: reserve weight 1 until the shared budget refuses."""
+    budget = SharedWeightBudget(path, weight_limit=200, window_seconds=60.0)
+    granted = 0
+    for _ in range(100):
+        if budget.try_reserve(1, now) == 0:
+            granted += 1
+    queue.put(granted)
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+def test_budget_is_shared_across_processes(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    now = 1_700_000_055.0
+    workers = [ctx.Process(target=_reserve_all, args=(str(tmp_path / "host.weight"), now, queue)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    granted = [queue.get(timeout=30) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert sum(granted) == 200
+    assert SharedWeightBudget(tmp_path / "host.weight", weight_limit=200).used(now) == 200
+
+
+def test_schedulers_are_shared_per_host(tmp_path):
+    with patch.dict(rest_scheduler._SCHEDULERS, clear=True), patch.object(rest_scheduler, "get_cache_dir", return_value=tmp_path):
+        spot = get_rest_scheduler("https://api.binance.com/api/v3/klines")
+        assert get_rest_scheduler("https://api.binance.com/api/v3/time") is spot
+        futures = get_rest_scheduler("https://fapi.binance.com/fapi/v1/klines")
+
+    assert (spot.weight_limit, futures.weight_limit) == (6000, 2400)
+
+
+def test_state_dir_follows_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("CKVD_RATE_LIMIT_DIR", str(tmp_path / "limits"))
+    assert get_rest_scheduler("https://api.binance.com/api/v3/klines").budget.path == tmp_path / "limits" / "api.binance.com.weight"
+
+    monkeypatch.delenv("CKVD_RATE_LIMIT_DIR")
+    with patch.object(rest_scheduler, "get_cache_dir", return_value=tmp_path):
+        assert rest_state_dir() == tmp_path / ".rate_limits"
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Unit tests for Vision day-boundary gap repair.
+
+Tests the boundary gap utilities in vision_file_utils.py:
+1. coalesce_gap_windows() - Minimal REST window planning
+2. fill_boundary_gaps_with_rest() - Batched REST repair
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+import ckvd.core  # noqa: F401 - loads core before vision_file_utils (core <-> utils import cycle)
+from ckvd.utils.for_core.rest_exceptions import RateLimitError
+from ckvd.utils.for_core.vision_file_utils import (
+    coalesce_gap_windows,
+    fill_boundary_gaps_with_rest,
+)
+from ckvd.utils.gap_detector import Gap
+from ckvd.utils.market_constraints import Interval, MarketType
+
+HOUR_MS = 3_600_000
+BASE = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _frame(times: list[datetime], value: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame({"open_time": pd.to_datetime(times, utc=True), "close": [value] * len(times)})
+
+
+def _gap(start: datetime, end: datetime, interval_ms: int = HOUR_MS) -> Gap:
+    start_ms = int(start.timestamp() * 1000)
+    end_ms = int(end.timestamp() * 1000)
+    return Gap(
+        start_time_ms=start_ms,
+        end_time_ms=end_ms,
+        duration_ms=end_ms - start_ms - interval_ms,
+        missing_points=(end_ms - start_ms) // interval_ms - 1,
+        crosses_day_boundary=True,
+    )
+
+
+@pytest.fixture
+def boundary_gap_df():
+    """Two days of 1h data missing the 00:00 candle of the second day."""
+    times = [BASE + timedelta(hours=h) for h in range(48) if h != 24]
+    return _frame(times)
+
+
+# =============================================================================
+# coalesce_gap_windows
+# =============================================================================
+
+
+class TestCoalesceGapWindows:
+    """Tests for REST window coalescing."""
+
+    def test_empty_gaps(self):
+        assert coalesce_gap_windows([], Interval.HOUR_1) == []
+
+    def test_nearby_gaps_share_one_window(self):
+        """Gaps a few candles apart fit in one REST chunk and are merged."""
+        gaps = [
+            _gap(BASE + timedelta(hours=23), BASE + timedelta(hours=25)),
+            _gap(BASE + timedelta(hours=47), BASE + timedelta(hours=49)),
+        ]
+        windows = coalesce_gap_windows(gaps, Interval.HOUR_1)
+
+        assert len(windows) == 1
+        assert windows[0][0] == BASE + timedelta(hours=22, minutes=30)
+        assert windows[0][1] == BASE + timedelta(hours=49, minutes=30)
+
+    def test_distant_gaps_stay_separate(self):
+        """Merging gaps further apart than a chunk would cost extra requests."""
+        gaps = [
+            _gap(BASE + timedelta(hours=23), BASE + timedelta(hours=25)),
+            _gap(BASE + timedelta(days=100, hours=23), BASE + timedelta(days=100, hours=25)),
+        ]
+        windows = coalesce_gap_windows(gaps, Interval.HOUR_1, chunk_size=1000)
+
+        assert len(windows) == 2
+
+    def test_unsorted_input(self):
+        gaps = [
+            _gap(BASE + timedelta(days=100, hours=23), BASE + timedelta(days=100, hours=25)),
+            _gap(BASE + timedelta(hours=23), BASE + timedelta(hours=25)),
+        ]
+        windows = coalesce_gap_windows(gaps, Interval.HOUR_1)
+
+        assert windows[0][0] < windows[1][0]
+
+
+# =============================================================================
+# fill_boundary_gaps_with_rest
+# =============================================================================
+
+
+class TestFillBoundaryGaps:
+    """Tests for batched REST boundary gap repair."""
+
+    def test_no_gaps_returns_input(self, boundary_gap_df):
+        assert fill_boundary_gaps_with_rest(boundary_gap_df, [], "BTCUSDT", Interval.HOUR_1, MarketType.SPOT) is boundary_gap_df
+
+    @patch("ckvd.utils.for_core.vision_file_utils.RestDataClient")
+    def test_gaps_fetched_in_one_batch(self, mock_rest_cls, boundary_gap_df):
+        """All gaps go to REST in a single parallel call."""
+        gaps = [
+            _gap(BASE + timedelta(hours=23), BASE + timedelta(hours=25)),
+            _gap(BASE + timedelta(hours=46), BASE + timedelta(hours=48)),
+        ]
+        rest_df = _frame([BASE + timedelta(hours=24), BASE + timedelta(hours=47)], value=3.0)
+        mock_client = MagicMock()
+        mock_client.fetch_klines_parallel.return_value = [rest_df]
+        mock_rest_cls.return_value = mock_client
+
+        result = fill_boundary_gaps_with_rest(boundary_gap_df, gaps, "BTCUSDT", Interval.HOUR_1, MarketType.SPOT)
+
+        mock_client.fetch_klines_parallel.assert_called_once()
+        mock_client.fetch.assert_not_called()
+        windows = mock_client.fetch_klines_parallel.call_args.args[2]
+        assert len(windows) == 1
+        mock_client.close.assert_called_once()
+        assert len(result) == 48
+
+    @patch("ckvd.utils.for_core.vision_file_utils.RestDataClient")
+    def test_vision_rows_win_over_rest_duplicates(self, mock_rest_cls, boundary_gap_df):
+        """Existing Vision rows keep priority when REST returns overlapping candles."""
+        gap = _gap(BASE + timedelta(hours=23), BASE + timedelta(hours=25))
+        rest_df = _frame([BASE + timedelta(hours=23), BASE + timedelta(hours=24)], value=9.0)
+        mock_client = MagicMock()
+        mock_client.fetch_klines_parallel.return_value = [rest_df]
+        mock_rest_cls.return_value = mock_client
+
+        result = fill_boundary_gaps_with_rest(boundary_gap_df, [gap], "BTCUSDT", Interval.HOUR_1, MarketType.SPOT)
+
+        row_23 = result[result["open_time"] == BASE + timedelta(hours=23)]
+        assert row_23["close"].iloc[0] == 1.0
+
+    @patch("ckvd.utils.for_core.vision_file_utils.RestDataClient")
+    def test_rate_limit_returns_vision_data(self, mock_rest_cls, boundary_gap_df):
+        """A rate-limited REST pass returns the Vision data with its gaps."""
+        gap = _gap(BASE + timedelta(hours=23), BASE + timedelta(hours=25))
+        mock_client = MagicMock()
+        mock_client.fetch_klines_parallel.side_effect = RateLimitError(retry_after=60)
+        mock_rest_cls.return_value = mock_client
+
+        result = fill_boundary_gaps_with_rest(boundary_gap_df, [gap], "BTCUSDT", Interval.HOUR_1, MarketType.SPOT)
+
+        assert result is boundary_gap_df
+        mock_client.close.assert_called_once()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Unit tests for bulk Vision availability discovery via S3 listings.
+
+An ``httpx.MockTransport`` stands in for the S3 ``ListObjectsV2`` endpoint
+and data.binance.vision.
+
+Tests:
+1. VisionListingCache parsing, pagination, TTL reuse and failure fallback
+2. VisionDataClient downloading only listed days and published checksums
+"""
+
+import io
+import zipfile
+from datetime import date, datetime, timezone
+
+import httpx
+import pytest
+
+from ckvd.core.providers.binance.vision_data_client import VisionDataClient
+from ckvd.utils.for_core.vision_listing import VISION_LISTINGS, VisionFile, VisionListingCache
+
+PREFIX = "data/spot/daily/klines/BTCUSDT/1h/BTCUSDT-1h-2024-01-"
+HOUR_MS = 3_600_000
+
+
+def _page(keys: dict[str, int], token: str | None = None) -> bytes:
+    """A ListObjectsV2 response page."""
+    contents = "".join(f"<Contents><Key>{key}</Key><Size>{size}</Size></Contents>" for key, size in keys.items())
+    truncated = f"<IsTruncated>true</IsTruncated><NextContinuationToken>{token}</NextContinuationToken>" if token else ""
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        f"{truncated or '<IsTruncated>false</IsTruncated>'}{contents}</ListBucketResult>"
+    ).encode()
+
+
+def _day_archive(day: datetime) -> bytes:
+    """Zipped Vision CSV with 24 hourly klines."""
+    start_ms = int(day.timestamp() * 1000)
+    rows = [
+        f"{ms},100.0,101.0,99.0,100.5,10.0,{ms + HOUR_MS - 1},1005.0,7,5.0,502.5,0"
+        for ms in range(start_ms, start_ms + 24 * HOUR_MS, HOUR_MS)
+    ]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(f"BTCUSDT-1h-{day:%Y-%m-%d}.csv", "\n".join(rows) + "\n")
+    return buffer.getvalue()
+
+
+class Recorder:
+    """MockTransport handler recording requests and answering them with ``respond``."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.respond(request)
+
+    def listings(self) -> list[httpx.Request]:
+        return [r for r in self.requests if r.url.params.get("list-type") == "2"]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_vision_listings():
+    VISION_LISTINGS.clear()
+    yield
+    VISION_LISTINGS.clear()
+
+
+class TestVisionListingCache:
+    """Listing, caching and fallback."""
+
+    def test_lists_days_with_archive_and_checksum_sizes(self):
+        keys = {f"{PREFIX}15.zip": 1200, f"{PREFIX}15.zip.CHECKSUM": 105, f"{PREFIX}16.zip": 1300}
+        handler = Recorder(lambda request: httpx.Response(200, content=_page(keys)))
+        listings = VisionListingCache(base_url="https://listing.test")
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            files = listings.available_days(client, "BTCUSDT", "1h", "spot", date(2024, 1, 14), date(2024, 1, 16))
+
+        assert files == {
+            date(2024, 1, 15): VisionFile(date(2024, 1, 15), 1200, 105),
+            date(2024, 1, 16): VisionFile(date(2024, 1, 16), 1300, None),
+        }
+        assert handler.requests[0].url.params["prefix"] == PREFIX
+
+    def test_follows_continuation_tokens_and_spans_months(self):
+        def respond(request):
+            prefix = request.url.params["prefix"]
+            if request.url.params.get("continuation-token") == "next":
+                return httpx.Response(200, content=_page({f"{prefix}31.zip": 10}))
+            return httpx.Response(200, content=_page({f"{prefix}01.zip": 10}, token="next" if "2024-01" in prefix else None))
+
+        handler = Recorder(respond)
+        listings = VisionListingCache(base_url="https://listing.test")
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            files = listings.available_days(client, "BTCUSDT", "1h", "spot", date(2024, 1, 1), date(2024, 2, 1))
+
+        assert sorted(files) == [date(2024, 1, 1), date(2024, 1, 31), date(2024, 2, 1)]
+        assert len(handler.requests) == 3
+
+    def test_listing_is_reused_until_the_ttl_expires(self):
+        handler = Recorder(lambda request: httpx.Response(200, content=_page({f"{PREFIX}15.zip": 10})))
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            cached = VisionListingCache(base_url="https://listing.test", ttl=60)
+            cached.available_days(client, "BTCUSDT", "1h", "spot", date(2024, 1, 15), date(2024, 1, 15))
+            cached.available_days(client, "BTCUSDT", "1h", "SPOT", date(2024, 1, 20), date(2024, 1, 21))
+            assert len(handler.requests) == 1
+            assert cached.cached("BTCUSDT", "1h", "spot", date(2024, 1, 3)) == {date(2024, 1, 15): VisionFile(date(2024, 1, 15), 10)}
+
+            expired = VisionListingCache(base_url="https://listing.test", ttl=0)
+            expired.available_days(client, "BTCUSDT", "1h", "spot", date(2024, 1, 15), date(2024, 1, 15))
+            expired.available_days(client, "BTCUSDT", "1h", "spot", date(2024, 1, 15), date(2024, 1, 15))
+            assert len(handler.requests) == 3
+            assert expired.cached("BTCUSDT", "1h", "spot", date(2024, 1, 15)) is None
+
+    @pytest.mark.parametrize("response", [httpx.Response(403), httpx.Response(200, content=b"<html>not a listing</html>")])
+    def test_failed_listing_returns_none_and_is_not_cached(self, response):
+        listings = VisionListingCache(base_url="https://listing.test")
+        with httpx.Client(transport=httpx.MockTransport(lambda request: response)) as client:
+            assert listings.available_days(client, "BTCUSDT", "1h", "spot", date(2024, 1, 15), date(2024, 1, 15)) is None
+        assert listings.cached("BTCUSDT", "1h", "spot", date(2024, 1, 15)) is None
+
+
+class TestVisionClientUsesListing:
+    """VisionDataClient requests only what the listing shows."""
+
+    def test_only_listed_days_and_checksums_are_requested(self):
+        day = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        archive = _day_archive(day)
+
+        def respond(request):
+            if request.url.params.get("list-type") == "2":
+                return httpx.Response(200, content=_page({f"{PREFIX}15.zip": len(archive)}))
+            if request.url.path.endswith("2024-01-15.zip"):
+                return httpx.Response(200, content=archive)
+            return httpx.Response(404)
+
+        handler = Recorder(respond)
+        client = VisionDataClient(symbol="BTCUSDT", interval="1h")
+        client._client.close()
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        try:
+            df = client._download_data(datetime(2024, 1, 14, tzinfo=timezone.utc), datetime(2024, 1, 16, 23, tzinfo=timezone.utc))
+        finally:
+            client.close()
+
+        assert len(df) == 24
+        assert len(handler.listings()) == 1
+        assert [r.url.path.rsplit("/", 1)[-1] for r in handler.requests if r not in handler.listings()] == ["BTCUSDT-1h-2024-01-15.zip"]
@@ -0,0 +1,63 @@
+"""Tests for Polars-native Vision timestamp normalisation."""
+
+import pandas as pd
+import pytest
+
+from ckvd.utils.config import KLINE_COLUMNS
+from ckvd.utils.for_core.vision_timestamp import process_timestamp_columns
+from ckvd.utils.time_utils import standardize_timestamp_precision
+
+# 2025-03-15 00:00 UTC, one minute apart
+OPEN_MS = [1741996800000, 1741996860000]
+
+
+def _raw_frame(unit: str) -> pd.DataFrame:
+    """Raw Vision rows with epoch timestamps in ``unit``."""
+    scale = 1000 if unit == "us" else 1
+    rows = [[ts * scale, 1.0, 1.0, 1.0, 1.0, 1.0, (ts + 59_999) * scale + (scale - 1), 1.0, 1, 1.0, 1.0, 0] for ts in OPEN_MS]
+    return pd.DataFrame(rows, columns=KLINE_COLUMNS)
+
+
+class TestProcessTimestampColumns:
+    @pytest.mark.parametrize("unit", ["ms", "us"])
+    def test_normalises_to_millisecond_utc(self, unit):
+        df = process_timestamp_columns(_raw_frame(unit), "1m")
+
+        assert str(df["open_time"].dtype) == "datetime64[ns, UTC]"
+        assert str(df["close_time"].dtype) == "datetime64[ns, UTC]"
+        assert list(df["open_time"]) == [pd.Timestamp(ts, unit="ms", tz="UTC") for ts in OPEN_MS]
+        # Microsecond close times are truncated to the canonical millisecond precision
+        assert df["close_time"].iloc[0] == pd.Timestamp("2025-03-15 00:00:59.999", tz="UTC")
+
+    def test_microsecond_and_millisecond_files_agree(self):
+        ms = process_timestamp_columns(_raw_frame("ms"), "1m")
+        us = process_timestamp_columns(_raw_frame("us"), "1m")
+        pd.testing.assert_frame_equal(ms, us)
+
+    def test_original_timestamp_is_opt_in(self):
+        assert "original_timestamp" not in process_timestamp_columns(_raw_frame("us"), "1m").columns
+
+        df = process_timestamp_columns(_raw_frame("us"), "1m", keep_original_timestamp=True)
+        assert list(df["original_timestamp"]) == [str(ts * 1000) for ts in OPEN_MS]
+
+    def test_projected_frame_without_close_time(self):
+        df = process_timestamp_columns(_raw_frame("us")[["open_time", "close"]], "1m")
+        assert list(df.columns) == ["open_time", "close"]
+        assert df["open_time"].iloc[1] == pd.Timestamp(OPEN_MS[1], unit="ms", tz="UTC")
+
+
+class TestStandardizeTimestampPrecision:
+    def test_millisecond_index_is_untouched(self):
+        df = process_timestamp_columns(_raw_frame("us"), "1m").set_index("open_time")
+        index = df.index
+        assert standardize_timestamp_precision(df).index is index
+
+    def test_sub_millisecond_values_are_truncated(self):
+        index = pd.DatetimeIndex(["2025-03-15 00:00:00.000999", "2025-03-15 00:01:00.000001"], tz="UTC", name="open_time")
+        df = pd.DataFrame({"close_time": index + pd.Timedelta(microseconds=59_999_999)}, index=index)
+
+        result = standardize_timestamp_precision(df)
+
+        assert list(result.index) == [pd.Timestamp("2025-03-15 00:00", tz="UTC"), pd.Timestamp("2025-03-15 00:01", tz="UTC")]
+        assert result.index.name == "open_time"
+        assert result["close_time"].iloc[0] == pd.Timestamp("2025-03-15 00:01:00.000", tz="UTC")
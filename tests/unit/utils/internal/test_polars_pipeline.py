@@ -20,9 +20,14 @@ import polars as pl
 import pytest
 
 from ckvd.utils.internal.polars_pipeline import (
+    COMPACT_OUTPUT_SCHEMA,
+    SOURCE_ENUM,
     SOURCE_PRIORITY,
     PolarsDataPipeline,
+    reindex_polars,
+    to_arrow_pandas,
 )
+from ckvd.utils.market_constraints import Interval
 
 
 # =============================================================================
@@ -495,6 +500,99 @@ class TestCollectionMethods:
         assert len(result) == 6
 
 
+# =============================================================================
+# Test Class: Arrow-backed pandas output
+# =============================================================================
+
+
+class TestArrowBackedOutput:
+    """Tests for collect_pandas(dtype_backend="pyarrow") and reindex_polars()."""
+
+    def test_dtype_contract(self, sample_polars_df):
+        """Columns come back as pd.ArrowDtype with open_time as the index."""
+        pipeline = PolarsDataPipeline().add_source(sample_polars_df, "CACHE")
+
+        result = pipeline.collect_pandas(dtype_backend="pyarrow")
+
+        assert result.index.name == "open_time"
+        assert str(result.index.dtype) == "timestamp[us, tz=UTC][pyarrow]"
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+        assert str(result["close"].dtype) == "double[pyarrow]"
+        assert list(result.columns) == ["open", "high", "low", "close", "volume", "_data_source"]
+
+    def test_shares_polars_buffers(self, sample_polars_df):
+        """The pandas column wraps the Arrow buffer exported by Polars (no copy)."""
+        pl_df = PolarsDataPipeline().add_source(sample_polars_df, "CACHE").collect_polars()
+
+        result = to_arrow_pandas(pl_df)
+
+        polars_buffer = pl_df["close"].to_arrow().buffers()[1]
+        pandas_buffer = result["close"].array._pa_array.chunk(0).buffers()[1]
+        assert pandas_buffer.address == polars_buffer.address
+
+    def test_empty_pipeline_keeps_contract(self):
+        """An empty pipeline still yields the Arrow-backed schema."""
+        result = PolarsDataPipeline().collect_pandas(dtype_backend="pyarrow", columns=["open_time", "close"])
+
+        assert result.empty
+        assert list(result.columns) == ["close", "_data_source"]
+        assert str(result["close"].dtype) == "double[pyarrow]"
+
+    def test_reindex_polars_fills_grid_with_nulls(self, sample_polars_df, base_time):
+        """Missing candles become null rows on the expected interval grid."""
+        sparse = sample_polars_df.filter(pl.col("open") != 42020.0)
+
+        result = reindex_polars(sparse, base_time, base_time + timedelta(hours=8), Interval.HOUR_1)
+
+        assert len(result) == 8
+        assert result["close"].null_count() == 3
+        assert result["open_time"].is_sorted()
+
+
+# =============================================================================
+# Test Class: Compact schema profile
+# =============================================================================
+
+
+class TestCompactSchemaProfile:
+    """Tests for PolarsDataPipeline(schema_profile="compact")."""
+
+    def test_casts_are_part_of_the_lazy_plan(self, sample_polars_df):
+        """The compact types are resolved from the plan, before collection."""
+        pipeline = PolarsDataPipeline(schema_profile="compact").add_source(sample_polars_df.lazy(), "CACHE")
+
+        schema = pipeline._merge_with_priority().collect_schema()
+
+        assert schema["open_time"] == pl.Datetime("ms", "UTC")
+        assert schema["close"] == pl.Float32
+        assert schema["_data_source"] == SOURCE_ENUM
+
+    def test_priority_merge_with_enum_sources(self, sample_polars_df):
+        """REST still wins over CACHE when the source column is an Enum."""
+        rest = sample_polars_df.head(2).with_columns(pl.col("close") + 1, pl.lit(3).alias("count"))
+        cache = sample_polars_df.with_columns(pl.lit(7).alias("count"), pl.lit("x").alias("original_timestamp"))
+        pipeline = PolarsDataPipeline(schema_profile="compact").add_source(cache, "CACHE").add_source(rest, "REST")
+
+        result = pipeline.collect_polars()
+
+        assert result["_data_source"].to_list() == ["REST", "REST", "CACHE", "CACHE", "CACHE", "CACHE"]
+        assert result["count"].dtype == pl.Int32
+        assert result["close"][0] == 42051.0
+        assert "original_timestamp" not in result.columns
+
+    def test_arrow_pandas_uses_the_compact_contract(self):
+        """Empty Arrow-backed output follows COMPACT_OUTPUT_SCHEMA."""
+        result = PolarsDataPipeline(schema_profile="compact").collect_pandas(dtype_backend="pyarrow")
+
+        assert list(result.columns) == [col for col in COMPACT_OUTPUT_SCHEMA if col != "open_time"]
+        assert str(result["close"].dtype) == "float[pyarrow]"
+        assert str(result["count"].dtype) == "int32[pyarrow]"
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError, match="schema_profile"):
+            PolarsDataPipeline(schema_profile="tiny")
+
+
 # =============================================================================
 # Test Class: Edge Cases
 # =============================================================================